@@ -183,6 +183,34 @@ def main():
             result['relationships'] = rb.get_relationships(result['id'])
     """)
 
+    # Example 6: Local graph analytics
+    print("\n" + "-"*70)
+    print("Example 6: Local Graph Analytics")
+    print("-"*70)
+
+    print("""
+    # DON'T: Walk relationships by hand to find important memories
+    for memory in rb.get_all()['memories']:
+        rels = rb.get_relationships(memory['id'])  # one call per memory
+        ...
+
+    # DO: Load the graph once and analyse it locally (requires numpy)
+    from recallbricks.analytics import GraphAnalytics
+
+    graph = rb.get_graph_context(root_id, depth=3)
+    analytics = GraphAnalytics.from_graph_context(graph)
+
+    hubs = analytics.hubs(top_k=10)          # preload these
+    clusters = analytics.communities()       # topical groups
+
+    # Every memory in a graph context is reachable from its root, so none is
+    # isolated there. To find orphans for cleanup, add all memory IDs:
+    all_ids = [m['id'] for m in rb.get_all()['memories']]
+    edges = [(e['from'], e['to']) for e in graph['edges']]
+    everything = GraphAnalytics.from_edges(edges, memory_ids=all_ids)
+    orphans = everything.isolated()          # no loaded relationships: review these
+    """)
+
     print("\n" + "="*70)
     print("Examples completed!")
     print("="*70)
@@ -193,6 +221,7 @@ def main():
     print("  3. Check response structure before accessing fields")
     print("  4. Be mindful of API call volume")
     print("  5. Use include_relationships parameter for convenience")
+    print("  6. Run graph analytics locally instead of per-memory API calls")
     print()
 
     return 0
@@ -44,6 +44,12 @@ from .exceptions import (
     ValidationError,
     NotFoundError
 )
+from .cache import TTLCache
+from .query_cache import SemanticQueryCache
+from .prefetch import MemoryPrefetcher
+from .graph import MemoryGraph
+from .streaming import RecallStream
+from .results import ResultSet
 from .types import (
     PredictedMemory,
     SuggestedMemory,
@@ -51,6 +57,9 @@ from .types import (
     LearningTrends,
     PatternAnalysis,
     WeightedSearchResult,
+    CompactPredictedMemory,
+    CompactSuggestedMemory,
+    CompactWeightedSearchResult,
     # Phase 2B: Automatic Metatags types
     MemoryMetadata,
     CategorySummary,
@@ -73,6 +82,13 @@ __all__ = [
     "UncertaintyClient",
     "ContextClient",
     "SearchClient",
+    # Client-side performance helpers
+    "TTLCache",
+    "SemanticQueryCache",
+    "MemoryPrefetcher",
+    "MemoryGraph",
+    "RecallStream",
+    "ResultSet",
     # Exceptions
     "RecallBricksError",
     "AuthenticationError",
@@ -87,6 +103,9 @@ __all__ = [
     "LearningTrends",
     "PatternAnalysis",
     "WeightedSearchResult",
+    "CompactPredictedMemory",
+    "CompactSuggestedMemory",
+    "CompactWeightedSearchResult",
     # Phase 2B types
     "MemoryMetadata",
     "CategorySummary",
@@ -0,0 +1,299 @@
+"""
+RecallBricks Aggregation Cache
+Locally maintained bucket counts for dashboard-style polling
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# Memory types reported by MemoryTypesClient.get_statistics()
+STATISTICS_TYPES = ("episodic", "semantic", "procedural")
+
+
+def _field(memory: Dict[str, Any], name: str) -> Any:
+    value = memory.get(name)
+    if value is None:
+        value = (memory.get('metadata') or {}).get(name)
+    return value
+
+
+class AggregationCache:
+    """
+    Shared cache for SearchClient.aggregate() and MemoryTypesClient.get_statistics().
+
+    Results are fetched once per refresh interval no matter how many
+    callers poll them. Clients created with this cache report their own
+    stores and deletes, and count aggregates and statistics are adjusted
+    in place; aggregates that cannot be adjusted locally (filtered by a
+    query, or not a count) are refetched on next read instead.
+
+    Usage:
+        >>> from recallbricks.aggregation import AggregationCache
+        >>> from recallbricks.autonomous import MemoryTypesClient, SearchClient
+        >>> search = SearchClient(api_key="rb_dev_xxx")
+        >>> types = MemoryTypesClient(api_key="rb_dev_xxx")
+        >>> cache = AggregationCache(search, types, refresh_interval=30)
+        >>> types.aggregation_cache = cache   # or MemoryTypesClient(..., aggregation_cache=cache)
+        >>>
+        >>> cache.aggregate("agent_123", group_by="category")   # API call
+        >>> types.store_semantic("agent_123", "...", category="security")
+        >>> cache.aggregate("agent_123", group_by="category")   # local, security + 1
+    """
+
+    def __init__(
+        self,
+        search_client: Any = None,
+        memory_types_client: Any = None,
+        refresh_interval: float = 30.0,
+        max_tracked_memories: int = 10000
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            search_client: SearchClient used for aggregate() (optional)
+            memory_types_client: MemoryTypesClient used for get_statistics() (optional)
+            refresh_interval: Seconds before a cached result is refetched (default: 30)
+            max_tracked_memories: Stored memories remembered so their deletes
+                                  can be counted locally (default: 10000)
+        """
+        if refresh_interval <= 0:
+            raise ValueError("refresh_interval must be positive")
+
+        self.search_client = search_client
+        self.memory_types_client = memory_types_client
+        self.refresh_interval = refresh_interval
+        self.max_tracked_memories = max_tracked_memories
+        # key -> (fetched_at, result)
+        self._entries: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        # memory id -> (agent_id, fields), for deletes
+        self._tracked: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[Hashable, threading.Lock] = {}
+        self._stats = {"hits": 0, "fetches": 0, "incremental_updates": 0}
+
+    # Reads
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove a cached result and its fetch lock unless a fetch holds it (lock held)."""
+        self._entries.pop(key, None)
+        fetch_lock = self._fetch_locks.get(key)
+        if fetch_lock is not None and not fetch_lock.locked():
+            del self._fetch_locks[key]
+
+    def _prune(self) -> None:
+        """Drop results too old to be served, with their fetch locks (lock held)."""
+        now = time.monotonic()
+        for key in [k for k, (fetched_at, _) in self._entries.items()
+                    if now - fetched_at >= self.refresh_interval]:
+            self._drop(key)
+        for key in [k for k, lock in self._fetch_locks.items()
+                    if k not in self._entries and not lock.locked()]:
+            del self._fetch_locks[key]
+
+    def _get(self, key: Hashable, fetch: Any) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.refresh_interval:
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry[1])
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        # One fetch per key at a time; concurrent pollers wait for its result
+        with fetch_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic() - entry[0] < self.refresh_interval:
+                    self._stats["hits"] += 1
+                    return copy.deepcopy(entry[1])
+            result = fetch()
+            with self._lock:
+                self._stats["fetches"] += 1
+                self._prune()
+                if isinstance(result, dict):
+                    self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+        with self._lock:
+            if key not in self._entries:
+                self._drop(key)
+        return result
+
+    def aggregate(
+        self,
+        agent_id: str,
+        group_by: str,
+        query: Optional[str] = None,
+        aggregation: str = "count"
+    ) -> Dict[str, Any]:
+        """
+        Get SearchClient.aggregate() results, from the cache when fresh.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            group_by: Field to group by (category, memory_type, etc.)
+            query: Optional query to filter before aggregation
+            aggregation: Aggregation type (count, avg_score, etc.)
+
+        Returns:
+            Dict containing aggregation results
+        """
+        if self.search_client is None:
+            raise ValueError("search_client is required for aggregate()")
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        key = ("aggregate", agent_id, group_by, query, aggregation)
+        return self._get(key, lambda: self.search_client.aggregate(
+            agent_id, group_by, query=query, aggregation=aggregation
+        ))
+
+    def get_statistics(self, agent_id: str) -> Dict[str, Any]:
+        """
+        Get MemoryTypesClient.get_statistics() results, from the cache when fresh.
+
+        Args:
+            agent_id: Unique identifier for the agent
+
+        Returns:
+            Dict containing counts and statistics by memory type
+        """
+        if self.memory_types_client is None:
+            raise ValueError("memory_types_client is required for get_statistics()")
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        return self._get(("statistics", agent_id),
+                         lambda: self.memory_types_client.get_statistics(agent_id))
+
+    # Incremental updates
+
+    def _apply(self, agent_id: str, memory: Dict[str, Any], delta: int) -> None:
+        """Adjust every cached result for agent_id by one memory (lock held)."""
+        for key in list(self._entries):
+            if key[1] != agent_id:
+                continue
+            fetched_at, result = self._entries[key]
+
+            if key[0] == "statistics":
+                memory_type = memory.get('memory_type')
+                if memory_type not in STATISTICS_TYPES:
+                    continue
+                bucket = result.get(memory_type)
+                if isinstance(bucket, dict) and isinstance(bucket.get('count'), int):
+                    bucket['count'] = max(0, bucket['count'] + delta)
+                    if isinstance(result.get('total'), int):
+                        result['total'] = max(0, result['total'] + delta)
+                    self._stats["incremental_updates"] += 1
+                else:
+                    self._drop(key)
+                continue
+
+            _, _, group_by, query, aggregation = key
+            buckets = result.get('buckets')
+            if query or aggregation != "count" or not isinstance(buckets, list):
+                self._drop(key)
+                continue
+            value = _field(memory, group_by)
+            if value is None:
+                continue
+            for bucket in buckets:
+                if isinstance(bucket, dict) and bucket.get('key') == value:
+                    bucket['count'] = max(0, (bucket.get('count') or 0) + delta)
+                    break
+            else:
+                if delta > 0:
+                    buckets.append({"key": value, "count": delta})
+            if isinstance(result.get('total'), int):
+                result['total'] = max(0, result['total'] + delta)
+            self._stats["incremental_updates"] += 1
+
+    def record_store(self, agent_id: str, memory: Dict[str, Any]) -> None:
+        """
+        Count a memory stored by a client sharing this cache.
+
+        Args:
+            agent_id: Agent the memory was stored for
+            memory: Stored fields (request payload merged with the response)
+        """
+        with self._lock:
+            memory_id = memory.get('id')
+            if memory_id:
+                self._tracked[memory_id] = (agent_id, memory)
+                while len(self._tracked) > self.max_tracked_memories:
+                    self._tracked.popitem(last=False)
+            self._apply(agent_id, memory, +1)
+
+    def record_response(self, agent_id: str, payload: Dict[str, Any], response: Any) -> None:
+        """
+        Count a memory from a store request and its response.
+
+        Args:
+            agent_id: Agent the memory was stored for
+            payload: Store request payload
+            response: Store response; its fields (such as id) override the payload's
+        """
+        memory = dict(payload, **response) if isinstance(response, dict) else dict(payload)
+        self.record_store(agent_id, memory)
+
+    def record_update(self, memory_id: str) -> None:
+        """
+        Note that a memory was changed by a client sharing this cache.
+
+        Its new fields may move it between buckets, so its agent's results
+        (or every result, for a memory this cache did not see stored) are
+        refetched on next read.
+
+        Args:
+            memory_id: ID of the updated memory
+        """
+        with self._lock:
+            tracked = self._tracked.pop(memory_id, None)
+        self.invalidate(tracked[0] if tracked is not None else None)
+
+    def record_delete(self, memory_id: str) -> None:
+        """
+        Uncount a memory deleted by a client sharing this cache.
+
+        Deletes of memories this cache did not see stored cannot be attributed
+        to a bucket, so every cached result is refetched on next read.
+
+        Args:
+            memory_id: ID of the deleted memory
+        """
+        with self._lock:
+            tracked = self._tracked.pop(memory_id, None)
+            if tracked is None:
+                for key in list(self._entries):
+                    self._drop(key)
+                return
+            agent_id, memory = tracked
+            self._apply(agent_id, memory, -1)
+
+    def invalidate(self, agent_id: Optional[str] = None) -> None:
+        """
+        Drop cached results so they are refetched on next read.
+
+        Args:
+            agent_id: Only drop this agent's results (default: all)
+        """
+        with self._lock:
+            for key in [k for k in self._entries if agent_id is None or k[1] == agent_id]:
+                self._drop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cached results, hits, server fetches, incremental
+            updates applied and hit_rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        reads = stats["hits"] + stats["fetches"]
+        stats["hit_rate"] = stats["hits"] / reads if reads else 0.0
+        return stats
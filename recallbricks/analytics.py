@@ -0,0 +1,365 @@
+"""
+RecallBricks Graph Analytics
+Vectorized ranking and clustering of the memory relationship graph
+
+Requires NumPy (pip install recallbricks[analytics]).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for graph analytics. "
+            "Install it with: pip install recallbricks[analytics]"
+        )
+
+
+class GraphAnalytics:
+    """
+    Sparse-matrix analytics over memory relationships.
+
+    The graph is held as edge arrays (COO) over integer node indices, and
+    every algorithm runs as NumPy array operations instead of per-memory
+    Python loops or API calls.
+
+    Usage:
+        >>> from recallbricks import RecallBricks, MemoryGraph
+        >>> from recallbricks.analytics import GraphAnalytics
+        >>> rb = RecallBricks(api_key="rb_dev_xxx")
+        >>> graph = MemoryGraph(rb)
+        >>> graph.k_hop("mem_123", k=3)
+        >>>
+        >>> analytics = GraphAnalytics.from_graph(graph)
+        >>> hubs = analytics.hubs(top_k=10)       # candidates for preloading
+        >>> orphans = analytics.isolated()        # candidates for cleanup
+    """
+
+    def __init__(
+        self,
+        memory_ids: List[str],
+        sources: Iterable[int],
+        targets: Iterable[int],
+        weights: Optional[Iterable[float]] = None
+    ):
+        """
+        Initialize from edge arrays.
+
+        Args:
+            memory_ids: Memory ID for each node index
+            sources: Source node index of each edge
+            targets: Target node index of each edge
+            weights: Edge weights (optional, default 1.0)
+        """
+        _require_numpy()
+
+        self.memory_ids = list(memory_ids)
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        if self.sources.shape != self.targets.shape:
+            raise ValueError("sources and targets must have the same length")
+        if weights is None:
+            self.weights = np.ones(len(self.sources), dtype=np.float64)
+        else:
+            self.weights = np.asarray(weights, dtype=np.float64)
+            if self.weights.shape != self.sources.shape:
+                raise ValueError("weights must have one entry per edge")
+
+        n = len(self.memory_ids)
+        if len(self.sources) and (self.sources.max() >= n or self.targets.max() >= n
+                                  or self.sources.min() < 0 or self.targets.min() < 0):
+            raise ValueError("edge index out of range")
+
+    @property
+    def node_count(self) -> int:
+        """Number of memories in the graph."""
+        return len(self.memory_ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of relationship edges."""
+        return len(self.sources)
+
+    # Construction
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[str, str]],
+        memory_ids: Optional[Iterable[str]] = None
+    ) -> 'GraphAnalytics':
+        """
+        Build from (source_id, target_id) pairs.
+
+        Args:
+            edges: Iterable of (source memory ID, target memory ID)
+            memory_ids: Extra memories to include even without edges (optional)
+
+        Returns:
+            GraphAnalytics instance
+        """
+        index: Dict[str, int] = {}
+        ids: List[str] = []
+
+        def node(memory_id: str) -> int:
+            if memory_id not in index:
+                index[memory_id] = len(ids)
+                ids.append(memory_id)
+            return index[memory_id]
+
+        for memory_id in memory_ids or ():
+            node(memory_id)
+        sources, targets = [], []
+        for source, target in edges:
+            sources.append(node(source))
+            targets.append(node(target))
+        return cls(ids, sources, targets)
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Any,
+        memory_ids: Optional[Iterable[str]] = None
+    ) -> 'GraphAnalytics':
+        """
+        Build from a MemoryGraph's live edges.
+
+        Args:
+            graph: MemoryGraph instance
+            memory_ids: Extra memories to include even without edges (optional)
+
+        Returns:
+            GraphAnalytics instance
+        """
+        _require_numpy()
+        ids, indptr, indices = graph.to_csr(directed=True)
+        indptr = np.asarray(indptr, dtype=np.int64)
+        targets = np.asarray(indices, dtype=np.int64)
+        sources = np.repeat(np.arange(len(ids), dtype=np.int64), np.diff(indptr))
+
+        known = set(ids)
+        extra = [m for m in dict.fromkeys(memory_ids or ()) if m not in known]
+        return cls(ids + extra, sources, targets)
+
+    @classmethod
+    def from_relationships(cls, responses: Dict[str, Dict[str, Any]]) -> 'GraphAnalytics':
+        """
+        Build from get_relationships() responses.
+
+        Args:
+            responses: Mapping of memory ID to its get_relationships() response
+
+        Returns:
+            GraphAnalytics instance
+        """
+        edges = []
+        for memory_id, response in responses.items():
+            for rel in (response or {}).get('relationships') or []:
+                if not isinstance(rel, dict):
+                    continue
+                source = rel.get('source_id') or rel.get('from') or memory_id
+                target = rel.get('target_id') or rel.get('to')
+                if target:
+                    edges.append((source, target))
+        return cls.from_edges(edges, memory_ids=responses.keys())
+
+    @classmethod
+    def from_graph_context(cls, response: Dict[str, Any]) -> 'GraphAnalytics':
+        """
+        Build from a single get_graph_context() response.
+
+        Args:
+            response: Response dict from get_graph_context()
+
+        Returns:
+            GraphAnalytics instance
+        """
+        nodes = [n['id'] for n in response.get('nodes') or [] if isinstance(n, dict) and n.get('id')]
+        edges = []
+        for edge in response.get('edges') or []:
+            if not isinstance(edge, dict):
+                continue
+            source = edge.get('from') or edge.get('source_id')
+            target = edge.get('to') or edge.get('target_id')
+            if source and target:
+                edges.append((source, target))
+        return cls.from_edges(edges, memory_ids=nodes)
+
+    # Helpers
+
+    def _undirected(self) -> Tuple[Any, Any]:
+        """Edge arrays with every edge present in both directions."""
+        return (
+            np.concatenate([self.sources, self.targets]),
+            np.concatenate([self.targets, self.sources])
+        )
+
+    def _to_dict(self, values: Any) -> Dict[str, float]:
+        return dict(zip(self.memory_ids, values.tolist()))
+
+    def _groups(self, labels: Any) -> List[List[str]]:
+        """Group memory IDs by label, largest group first."""
+        if not len(labels):
+            return []
+        order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[order]
+        boundaries = np.flatnonzero(np.diff(sorted_labels)) + 1
+        groups = [
+            [self.memory_ids[i] for i in chunk]
+            for chunk in np.split(order, boundaries)
+        ]
+        groups.sort(key=len, reverse=True)
+        return groups
+
+    # Algorithms
+
+    def degree_centrality(self) -> Dict[str, float]:
+        """
+        Compute degree centrality (in + out degree over n - 1).
+
+        Returns:
+            Dict mapping memory ID to centrality
+        """
+        n = self.node_count
+        if n == 0:
+            return {}
+        degree = (np.bincount(self.sources, minlength=n) +
+                  np.bincount(self.targets, minlength=n)).astype(np.float64)
+        return self._to_dict(degree / max(n - 1, 1))
+
+    def pagerank(
+        self,
+        damping: float = 0.85,
+        tol: float = 1e-6,
+        max_iter: int = 100
+    ) -> Dict[str, float]:
+        """
+        Compute PageRank by power iteration.
+
+        Rank held by memories without outgoing edges is spread uniformly.
+
+        Args:
+            damping: Damping factor (default: 0.85)
+            tol: L1 convergence tolerance (default: 1e-6)
+            max_iter: Maximum iterations (default: 100)
+
+        Returns:
+            Dict mapping memory ID to PageRank score (scores sum to 1)
+        """
+        if not 0.0 < damping < 1.0:
+            raise ValueError("damping must be between 0.0 and 1.0")
+
+        n = self.node_count
+        if n == 0:
+            return {}
+
+        out_weight = np.bincount(self.sources, weights=self.weights, minlength=n)
+        dangling = out_weight == 0
+        edge_share = self.weights / np.where(dangling, 1.0, out_weight)[self.sources]
+
+        rank = np.full(n, 1.0 / n)
+        for _ in range(max_iter):
+            spread = np.bincount(self.targets, weights=rank[self.sources] * edge_share, minlength=n)
+            new_rank = (1.0 - damping) / n + damping * (spread + rank[dangling].sum() / n)
+            converged = np.abs(new_rank - rank).sum() < tol
+            rank = new_rank
+            if converged:
+                break
+
+        return self._to_dict(rank / rank.sum())
+
+    def hubs(self, top_k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Get the most central memories by PageRank.
+
+        Args:
+            top_k: Number of memories to return (default: 10)
+
+        Returns:
+            List of (memory ID, score), highest score first
+        """
+        scores = self.pagerank()
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+    def isolated(self) -> List[str]:
+        """
+        Get memories with no relationships in the loaded graph.
+
+        Only memories the graph was built with can be found: a graph from
+        get_graph_context() holds just the root's neighbourhood, where every
+        memory is connected. To look for orphans across all memories, build
+        with from_edges(edges, memory_ids=<every memory ID>), e.g. from
+        get_all().
+
+        Returns:
+            List of memory IDs
+        """
+        n = self.node_count
+        degree = np.bincount(self.sources, minlength=n) + np.bincount(self.targets, minlength=n)
+        return [self.memory_ids[i] for i in np.flatnonzero(degree == 0)]
+
+    def connected_components(self) -> List[List[str]]:
+        """
+        Find weakly connected components.
+
+        Uses min-label propagation with pointer jumping over the edge arrays.
+
+        Returns:
+            List of components (lists of memory IDs), largest first
+        """
+        n = self.node_count
+        labels = np.arange(n, dtype=np.int64)
+        sources, targets = self._undirected()
+        while True:
+            new_labels = labels.copy()
+            np.minimum.at(new_labels, sources, labels[targets])
+            new_labels = new_labels[new_labels]
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+        return self._groups(labels)
+
+    def communities(self, max_iter: int = 20) -> List[List[str]]:
+        """
+        Detect communities by synchronous label propagation.
+
+        Each memory repeatedly adopts the label most common among its
+        neighbors and itself (ties go to the smallest label), which keeps the
+        result deterministic.
+
+        Args:
+            max_iter: Maximum propagation rounds (default: 20)
+
+        Returns:
+            List of communities (lists of memory IDs), largest first
+        """
+        n = self.node_count
+        labels = np.arange(n, dtype=np.int64)
+        if n == 0:
+            return []
+
+        sources, targets = self._undirected()
+        nodes = np.concatenate([sources, np.arange(n, dtype=np.int64)])
+        neighbors = np.concatenate([targets, np.arange(n, dtype=np.int64)])
+
+        for _ in range(max_iter):
+            keys = nodes * n + labels[neighbors]
+            unique_keys, counts = np.unique(keys, return_counts=True)
+            key_nodes = unique_keys // n
+            key_labels = unique_keys % n
+            order = np.lexsort((key_labels, -counts, key_nodes))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = key_nodes[order][1:] != key_nodes[order][:-1]
+            new_labels = labels.copy()
+            new_labels[key_nodes[order][first]] = key_labels[order][first]
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+
+        return self._groups(labels)
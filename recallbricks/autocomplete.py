@@ -0,0 +1,366 @@
+"""
+RecallBricks Local Autocomplete
+Prefix suggestions served from an in-process radix trie
+"""
+
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class _Node:
+    """Radix trie node; `edge` is the label of the edge leading into it."""
+
+    __slots__ = ('edge', 'children', 'term', 'weight')
+
+    def __init__(self, edge: str = ""):
+        self.edge = edge
+        self.children: Dict[str, '_Node'] = {}
+        self.term: Optional[str] = None
+        self.weight = 0.0
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    length = min(len(a), len(b))
+    for i in range(length):
+        if a[i] != b[i]:
+            return i
+    return length
+
+
+class RadixTrie:
+    """
+    Compressed prefix trie mapping terms to weights.
+
+    Chains of single-child nodes are merged into one edge, so memory grows
+    with the number of distinct terms rather than their total length.
+    Lookups are case-insensitive; each term keeps the spelling it was first
+    added with.
+
+    Usage:
+        >>> trie = RadixTrie()
+        >>> trie.add("authentication", 2.0)
+        >>> trie.add("authorization")
+        >>> trie.complete("auth")
+        [('authentication', 2.0), ('authorization', 1.0)]
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._size = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, term: str) -> bool:
+        node = self._find(term.lower(), exact=True)
+        return node is not None and node.term is not None
+
+    def add(self, term: str, weight: float = 1.0) -> None:
+        """
+        Add a term, or add weight to it if already present.
+
+        Args:
+            term: Term to add
+            weight: Weight added to the term (default: 1.0)
+        """
+        key = term.strip().lower()
+        if not key:
+            return
+        with self._lock:
+            node = self._root
+            rest = key
+            while rest:
+                child = node.children.get(rest[0])
+                if child is None:
+                    child = node.children[rest[0]] = _Node(rest)
+                    node, rest = child, ""
+                    break
+                shared = _common_prefix_length(rest, child.edge)
+                if shared < len(child.edge):
+                    # Split the edge at the point where the keys diverge
+                    middle = _Node(child.edge[:shared])
+                    child.edge = child.edge[shared:]
+                    middle.children[child.edge[0]] = child
+                    node.children[rest[0]] = middle
+                    child = middle
+                node, rest = child, rest[shared:]
+
+            if node.term is None:
+                node.term = term.strip()
+                self._size += 1
+            node.weight += weight
+
+    def _find(self, key: str, exact: bool) -> Optional[_Node]:
+        """Find the node whose path spells key (or, if not exact, starts with it)."""
+        node = self._root
+        rest = key
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                return None
+            if rest.startswith(child.edge):
+                node, rest = child, rest[len(child.edge):]
+            elif not exact and child.edge.startswith(rest):
+                return child
+            else:
+                return None
+        return node
+
+    def complete(self, prefix: str, limit: int = 5) -> List[Tuple[str, float]]:
+        """
+        Get the highest-weighted terms starting with prefix.
+
+        Args:
+            prefix: Prefix to complete
+            limit: Maximum number of terms (default: 5)
+
+        Returns:
+            List of (term, weight), highest weight first
+        """
+        with self._lock:
+            start = self._find(prefix.strip().lower(), exact=False)
+            if start is None:
+                return []
+            found = []
+            stack = [start]
+            while stack:
+                node = stack.pop()
+                if node.term is not None:
+                    found.append((node.term, node.weight))
+                stack.extend(node.children.values())
+        return heapq.nsmallest(limit, found, key=lambda item: (-item[1], item[0].lower()))
+
+
+class SuggestionEngine:
+    """
+    Local autocomplete in front of SearchClient.suggest().
+
+    Suggestions are answered from a radix trie seeded with server
+    suggestions, past queries and memory tags/entities. The API is only
+    called when the trie has fewer than min_results suggestions for a
+    prefix, and never again for a prefix (or an extension of a prefix) the
+    server has already fully answered.
+
+    Usage:
+        >>> from recallbricks.autonomous import SearchClient
+        >>> from recallbricks.autocomplete import SuggestionEngine
+        >>> search = SearchClient(api_key="rb_dev_xxx")
+        >>> engine = SuggestionEngine(search, agent_id="agent_123")
+        >>> engine.add_memories(memories)               # seed tags and entities
+        >>>
+        >>> # Per keystroke: local answer now, server refinement after a pause
+        >>> engine.suggest_debounced("auth", callback=update_dropdown)
+    """
+
+    # Weights given to each source of terms
+    QUERY_WEIGHT = 3.0
+    SERVER_WEIGHT = 1.0
+    TERM_WEIGHT = 0.5
+
+    def __init__(
+        self,
+        search_client: Any,
+        agent_id: str,
+        limit: int = 5,
+        min_results: int = 3,
+        min_weight: float = 0.0,
+        debounce_seconds: float = 0.15,
+        server_ttl: float = 300.0
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            search_client: SearchClient used for server suggestions
+            agent_id: Agent whose suggestions are requested
+            limit: Suggestions returned per lookup (default: 5)
+            min_results: Local suggestions needed to skip the API (default: 3)
+            min_weight: Minimum weight for a local suggestion to count toward
+                       min_results (default: 0.0)
+            debounce_seconds: Quiet period before suggest_debounced() calls
+                             the API (default: 0.15)
+            server_ttl: Seconds a prefix answered by the server is trusted
+                       (default: 300)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if min_results < 0:
+            raise ValueError("min_results must be non-negative")
+        if debounce_seconds < 0:
+            raise ValueError("debounce_seconds must be non-negative")
+
+        self.search_client = search_client
+        self.agent_id = agent_id
+        self.limit = limit
+        self.min_results = min_results
+        self.min_weight = min_weight
+        self.debounce_seconds = debounce_seconds
+        self.server_ttl = server_ttl
+        self.trie = RadixTrie()
+        # prefix -> expiry of a server answer that returned fewer than limit results
+        self._exhausted: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._stats = {"lookups": 0, "local": 0, "api_calls": 0, "debounced": 0}
+
+    # Seeding
+
+    def add_queries(self, queries: Iterable[str]) -> None:
+        """Add past queries; repeated queries rank higher."""
+        for query in queries:
+            self.trie.add(query, self.QUERY_WEIGHT)
+
+    def add_terms(self, terms: Iterable[str], weight: Optional[float] = None) -> None:
+        """Add tags, entities or other vocabulary."""
+        for term in terms:
+            if isinstance(term, str):
+                self.trie.add(term, self.TERM_WEIGHT if weight is None else weight)
+
+    def add_memories(self, memories: Iterable[Dict[str, Any]]) -> None:
+        """Add the tags and entities of memory dicts (top level or in metadata)."""
+        for memory in memories:
+            if not isinstance(memory, dict):
+                continue
+            metadata = memory.get('metadata') or {}
+            for source in (memory, metadata):
+                self.add_terms(source.get('tags') or [])
+                self.add_terms(source.get('entities') or [])
+
+    # Lookups
+
+    def _local(self, prefix: str, limit: int) -> List[str]:
+        return [term for term, _ in self.trie.complete(prefix, limit)]
+
+    def _needs_server(self, prefix: str, limit: int) -> bool:
+        confident = [w for _, w in self.trie.complete(prefix, limit) if w >= self.min_weight]
+        if len(confident) >= min(self.min_results, limit):
+            return False
+        key = prefix.strip().lower()
+        now = time.monotonic()
+        with self._lock:
+            for answered, expires_at in list(self._exhausted.items()):
+                if expires_at <= now:
+                    del self._exhausted[answered]
+                elif key.startswith(answered):
+                    return False
+        return True
+
+    def _fetch(self, prefix: str, limit: int) -> None:
+        with self._lock:
+            self._stats["api_calls"] += 1
+        response = self.search_client.suggest(self.agent_id, prefix, limit=limit)
+        suggestions = (response or {}).get('suggestions') or []
+        for suggestion in suggestions:
+            if isinstance(suggestion, dict):
+                text = suggestion.get('text') or suggestion.get('query')
+                weight = float(suggestion.get('score') or self.SERVER_WEIGHT)
+            else:
+                text, weight = suggestion, self.SERVER_WEIGHT
+            if isinstance(text, str):
+                self.trie.add(text, weight)
+        if len(suggestions) < limit:
+            with self._lock:
+                self._exhausted[prefix.strip().lower()] = time.monotonic() + self.server_ttl
+
+    def suggest(self, partial_query: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Get suggestions, calling the API only if local ones are insufficient.
+
+        Args:
+            partial_query: Text typed so far
+            limit: Maximum number of suggestions (default: engine limit)
+
+        Returns:
+            Suggested completions, best first
+        """
+        if not partial_query:
+            raise ValueError("partial_query is required")
+        limit = limit or self.limit
+        with self._lock:
+            self._stats["lookups"] += 1
+        if self._needs_server(partial_query, limit):
+            self._fetch(partial_query, limit)
+        else:
+            with self._lock:
+                self._stats["local"] += 1
+        return self._local(partial_query, limit)
+
+    def suggest_debounced(
+        self,
+        partial_query: str,
+        callback: Callable[[str, List[str]], None],
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Answer locally now and refine from the server once typing pauses.
+
+        Each call cancels the previous pending server lookup, so a burst of
+        keystrokes costs at most one API call, made debounce_seconds after
+        the last one. The callback receives the prefix and the refined
+        suggestions; it runs on a timer thread and is not called if the
+        local answer was already sufficient or the lookup failed.
+
+        Args:
+            partial_query: Text typed so far
+            callback: Called with (partial_query, suggestions) after a server lookup
+            limit: Maximum number of suggestions (default: engine limit)
+
+        Returns:
+            Local suggestions available immediately
+        """
+        if not partial_query:
+            raise ValueError("partial_query is required")
+        limit = limit or self.limit
+        with self._lock:
+            self._stats["lookups"] += 1
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+                self._stats["debounced"] += 1
+
+        local = self._local(partial_query, limit)
+        if not self._needs_server(partial_query, limit):
+            with self._lock:
+                self._stats["local"] += 1
+            return local
+
+        def fire() -> None:
+            try:
+                self._fetch(partial_query, limit)
+            except Exception:
+                return
+            callback(partial_query, self._local(partial_query, limit))
+
+        timer = threading.Timer(self.debounce_seconds, fire)
+        timer.daemon = True
+        with self._lock:
+            self._timer = timer
+        timer.start()
+        return local
+
+    def record_query(self, query: str) -> None:
+        """Record a submitted query so it ranks higher next time."""
+        self.trie.add(query, self.QUERY_WEIGHT)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dict with lookups, lookups answered locally, API calls, keystrokes
+            whose pending lookup was superseded, and the number of terms
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["terms"] = len(self.trie)
+        return stats
+
+    def close(self) -> None:
+        """Cancel any pending debounced lookup."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -6,7 +6,8 @@ Provides common HTTP request handling for all autonomous clients
 import requests
 import time
 import re
-from typing import Dict, Any, Optional
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Optional
 
 from ..exceptions import (
     AuthenticationError,
@@ -16,6 +17,7 @@ from ..exceptions import (
     ValidationError,
     NotFoundError
 )
+from ..jobs import JobRunner
 
 
 class BaseAutonomousClient:
@@ -26,6 +28,10 @@ class BaseAutonomousClient:
     that all autonomous clients inherit from.
     """
 
+    # Runs the *_async methods; assign one to share it between clients,
+    # otherwise a default JobRunner is created on first use
+    job_runner: Optional[JobRunner] = None
+
     def __init__(
         self,
         api_key: str,
@@ -52,6 +58,12 @@ class BaseAutonomousClient:
             'Content-Type': 'application/json'
         })
 
+    def _submit_job(self, method: Callable[..., Any], *args: Any, **job_options: Any) -> Future:
+        """Run a client method on the job runner, creating a default one if needed."""
+        if self.job_runner is None:
+            self.job_runner = JobRunner()
+        return self.job_runner.submit(method, *args, **job_options)
+
     def _sanitize_input(self, value: str, max_length: int = 10000) -> str:
         """
         Sanitize string input to prevent injection attacks.
@@ -5,6 +5,8 @@ Manages agent context, session state, and environmental awareness
 
 from typing import Dict, Any, Optional, List
 from .base import BaseAutonomousClient
+from ..context_state import SessionStateCache
+from ..history import HistoryWriter
 
 
 class ContextClient(BaseAutonomousClient):
@@ -132,6 +134,64 @@ class ContextClient(BaseAutonomousClient):
             json={"context": context_data, "merge": merge}
         )
 
+    def patch(
+        self,
+        session_id: str,
+        operations: List[Dict[str, Any]],
+        version: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply a JSON Patch (RFC 6902) to session context.
+
+        Args:
+            session_id: ID of the session
+            operations: Patch operations against the session context
+            version: Context version the patch was computed against; the
+                     API rejects the patch if the context has changed since
+                     (optional)
+
+        Returns:
+            Dict containing the new context version
+
+        Example:
+            >>> client.patch(
+            ...     session_id="sess_123",
+            ...     operations=[{"op": "replace", "path": "/progress", "value": 0.6}],
+            ...     version=7
+            ... )
+        """
+        if not session_id:
+            raise ValueError("session_id is required")
+        if not operations:
+            raise ValueError("operations is required")
+
+        payload: Dict[str, Any] = {"patch": operations}
+        if version is not None:
+            payload["version"] = version
+
+        return self._request(
+            "PATCH",
+            f"/api/autonomous/context/{session_id}",
+            json=payload
+        )
+
+    def state_cache(self, **options: Any) -> SessionStateCache:
+        """
+        Create a local cache of session state and environments.
+
+        Args:
+            **options: SessionStateCache options (max_age)
+
+        Returns:
+            SessionStateCache reading and writing through this client
+
+        Example:
+            >>> state = client.state_cache()
+            >>> state.update("sess_123", {"current_step": "testing"})
+            >>> context = state.get("sess_123")   # no API call
+        """
+        return SessionStateCache(self, **options)
+
     def add_to_history(
         self,
         session_id: str,
@@ -167,6 +227,59 @@ class ContextClient(BaseAutonomousClient):
             json={"entry": entry}
         )
 
+    def add_history_entries(
+        self,
+        session_id: str,
+        entries: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Add several entries to the session history in one request.
+
+        Args:
+            session_id: ID of the session
+            entries: History entries to add, in order
+
+        Returns:
+            Dict containing updated history
+
+        Example:
+            >>> client.add_history_entries(
+            ...     session_id="sess_123",
+            ...     entries=[
+            ...         {"action": "tool_call", "tool": "search"},
+            ...         {"action": "tool_result", "hits": 4}
+            ...     ]
+            ... )
+        """
+        if not session_id:
+            raise ValueError("session_id is required")
+        if not entries:
+            raise ValueError("entries is required")
+
+        return self._request(
+            "POST",
+            f"/api/autonomous/context/{session_id}/history",
+            json={"entries": entries}
+        )
+
+    def history_writer(self, **options: Any) -> HistoryWriter:
+        """
+        Create a buffered writer for session history.
+
+        Args:
+            **options: HistoryWriter options (max_batch, flush_interval,
+                       ring_size, bulk, max_workers, ...)
+
+        Returns:
+            HistoryWriter sending through this client
+
+        Example:
+            >>> history = client.history_writer(flush_interval=0.5)
+            >>> history.append("sess_123", {"action": "user_message", "content": "Hi"})
+            >>> history.end_turn("sess_123")
+        """
+        return HistoryWriter(self, **options)
+
     def get_history(
         self,
         session_id: str,
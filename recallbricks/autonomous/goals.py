@@ -3,8 +3,10 @@ GoalsClient for RecallBricks Autonomous Agent API
 Manages agent goals, objectives, and progress tracking
 """
 
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, List
 from .base import BaseAutonomousClient
+from ..goal_tree import GoalTree
 
 
 class GoalsClient(BaseAutonomousClient):
@@ -326,3 +328,42 @@ class GoalsClient(BaseAutonomousClient):
             raise ValueError("goal_id is required")
 
         return self._request("POST", f"/api/autonomous/goals/{goal_id}/suggest")
+
+    def suggest_next_steps_async(self, goal_id: str, **job_options: Any) -> Future:
+        """
+        Run suggest_next_steps() in the background.
+
+        Args:
+            goal_id: ID of the goal
+            **job_options: JobRunner.submit() options (callback, timeout,
+                           use_cache)
+
+        Returns:
+            Future resolving to the suggested next steps
+
+        Example:
+            >>> future = client.suggest_next_steps_async("goal_123", timeout=60)
+            >>> steps = future.result()['steps']
+        """
+        if not goal_id:
+            raise ValueError("goal_id is required")
+
+        return self._submit_job(self.suggest_next_steps, goal_id, **job_options)
+
+    def goal_tree(self, **options: Any) -> GoalTree:
+        """
+        Create a local index of goal hierarchies.
+
+        Args:
+            **options: GoalTree options (coalesce_seconds, on_error)
+
+        Returns:
+            GoalTree reading and writing through this client
+
+        Example:
+            >>> goals = client.goal_tree(coalesce_seconds=2.0)
+            >>> goals.load("goal_123")
+            >>> goals.update_progress("goal_456", 40)
+            >>> print(goals.progress("goal_123"))   # no API call
+        """
+        return GoalTree(self, **options)
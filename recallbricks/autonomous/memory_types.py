@@ -3,8 +3,11 @@ MemoryTypesClient for RecallBricks Autonomous Agent API
 Manages different types of memory (episodic, semantic, procedural)
 """
 
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, List
 from .base import BaseAutonomousClient
+from ..aggregation import AggregationCache
+from ..query_cache import SemanticQueryCache
 
 
 class MemoryTypesClient(BaseAutonomousClient):
@@ -33,6 +36,36 @@ class MemoryTypesClient(BaseAutonomousClient):
         ... )
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.recallbricks.com",
+        timeout: int = 30,
+        aggregation_cache: Optional[AggregationCache] = None,
+        query_cache: Optional[SemanticQueryCache] = None
+    ):
+        """
+        Initialize the memory types client.
+
+        Args:
+            api_key: Your RecallBricks API key
+            base_url: API base URL (default: production)
+            timeout: Request timeout in seconds (default: 30)
+            aggregation_cache: AggregationCache to notify of stored and
+                              consolidated memories (default: none)
+            query_cache: SemanticQueryCache shared with a SearchClient; an
+                        agent's cached semantic() results are dropped when
+                        it stores or consolidates memories (default: none)
+        """
+        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        self.aggregation_cache = aggregation_cache
+        self.query_cache = query_cache
+
+    def _invalidate_queries(self, agent_id: str) -> None:
+        """Drop an agent's cached semantic() results after a write."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate(f"semantic:{agent_id}")
+
     def store_episodic(
         self,
         agent_id: str,
@@ -84,7 +117,11 @@ class MemoryTypesClient(BaseAutonomousClient):
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/memory-types", json=payload)
+        response = self._request("POST", "/api/autonomous/memory-types", json=payload)
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.record_response(payload["agent_id"], payload, response)
+        self._invalidate_queries(payload["agent_id"])
+        return response
 
     def store_semantic(
         self,
@@ -141,7 +178,11 @@ class MemoryTypesClient(BaseAutonomousClient):
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/memory-types", json=payload)
+        response = self._request("POST", "/api/autonomous/memory-types", json=payload)
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.record_response(payload["agent_id"], payload, response)
+        self._invalidate_queries(payload["agent_id"])
+        return response
 
     def store_procedural(
         self,
@@ -200,7 +241,11 @@ class MemoryTypesClient(BaseAutonomousClient):
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/memory-types", json=payload)
+        response = self._request("POST", "/api/autonomous/memory-types", json=payload)
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.record_response(payload["agent_id"], payload, response)
+        self._invalidate_queries(payload["agent_id"])
+        return response
 
     def retrieve(
         self,
@@ -293,8 +338,40 @@ class MemoryTypesClient(BaseAutonomousClient):
         if category:
             payload["category"] = category
 
-        return self._request(
+        response = self._request(
             "POST",
             "/api/autonomous/memory-types/consolidate",
             json=payload
         )
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.invalidate(agent_id)
+        self._invalidate_queries(payload["agent_id"])
+        return response
+
+    def consolidate_semantic_async(
+        self,
+        agent_id: str,
+        category: Optional[str] = None,
+        **job_options: Any
+    ) -> Future:
+        """
+        Run consolidate_semantic() in the background.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            category: Only consolidate this category (optional)
+            **job_options: JobRunner.submit() options (callback, timeout);
+                           results are not cached, as consolidating changes
+                           stored memories (use_cache defaults to False)
+
+        Returns:
+            Future resolving to the consolidation results
+
+        Example:
+            >>> future = client.consolidate_semantic_async("agent_123", category="security")
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        job_options.setdefault("use_cache", False)
+        return self._submit_job(self.consolidate_semantic, agent_id, category, **job_options)
@@ -3,8 +3,10 @@ MetacognitionClient for RecallBricks Autonomous Agent API
 Enables agent self-awareness and reasoning about its own cognitive processes
 """
 
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, List
 from .base import BaseAutonomousClient
+from ..reasoning import ReasoningPipeline
 
 
 class MetacognitionClient(BaseAutonomousClient):
@@ -32,6 +34,27 @@ class MetacognitionClient(BaseAutonomousClient):
         ... )
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.recallbricks.com",
+        timeout: int = 30,
+        reasoning_pipeline: Optional[ReasoningPipeline] = None
+    ):
+        """
+        Initialize the metacognition client.
+
+        Args:
+            api_key: Your RecallBricks API key
+            base_url: API base URL (default: production)
+            timeout: Request timeout in seconds (default: 30)
+            reasoning_pipeline: ReasoningPipeline flushed before reasoning
+                                traces and pattern analyses are read
+                                (default: none)
+        """
+        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        self.reasoning_pipeline = reasoning_pipeline
+
     def log_reasoning(
         self,
         agent_id: str,
@@ -85,6 +108,87 @@ class MetacognitionClient(BaseAutonomousClient):
 
         return self._request("POST", "/api/autonomous/metacognition/reasoning", json=payload)
 
+    def log_reasoning_batch(
+        self,
+        agent_id: str,
+        entries: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Log several reasoning steps in one request.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            entries: Reasoning steps in order, each with step, reasoning and
+                     optionally confidence, alternatives and metadata
+
+        Returns:
+            Dict containing logged reasoning entries
+
+        Example:
+            >>> client.log_reasoning_batch(
+            ...     agent_id="agent_123",
+            ...     entries=[
+            ...         {"step": "plan", "reasoning": "Split into three tasks"},
+            ...         {"step": "select", "reasoning": "Start with the API", "confidence": 0.7}
+            ...     ]
+            ... )
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if not entries:
+            raise ValueError("entries is required")
+
+        steps = []
+        for entry in entries:
+            if not entry.get("step"):
+                raise ValueError("step is required")
+            if not entry.get("reasoning"):
+                raise ValueError("reasoning is required")
+            item = {
+                "step": self._sanitize_input(entry["step"], max_length=256),
+                "reasoning": self._sanitize_input(entry["reasoning"]),
+                "confidence": max(0.0, min(1.0, entry.get("confidence", 0.5)))
+            }
+            if entry.get("alternatives"):
+                item["alternatives"] = entry["alternatives"]
+            if entry.get("metadata"):
+                item["metadata"] = entry["metadata"]
+            steps.append(item)
+
+        return self._request(
+            "POST",
+            "/api/autonomous/metacognition/reasoning",
+            json={
+                "agent_id": self._sanitize_input(agent_id, max_length=256),
+                "entries": steps
+            }
+        )
+
+    def buffer_reasoning(self, **options: Any) -> ReasoningPipeline:
+        """
+        Log reasoning steps in the background instead of on the caller's thread.
+
+        Args:
+            **options: ReasoningPipeline options (max_batch, flush_interval,
+                       max_queue, overflow, sample_rate, bulk, ...)
+
+        Returns:
+            The attached ReasoningPipeline
+
+        Example:
+            >>> pipeline = client.buffer_reasoning(overflow="sample", sample_rate=0.2)
+            >>> pipeline.log("agent_123", "evaluate", "Cache hit rate too low", confidence=0.6)
+            >>> pipeline.flush("agent_123")   # at episode end
+        """
+        pipeline = ReasoningPipeline(self, **options)
+        self.reasoning_pipeline = pipeline
+        return pipeline
+
+    def _flush_reasoning(self, agent_id: str) -> None:
+        """Send the agent's buffered reasoning steps before reading them back."""
+        if self.reasoning_pipeline is not None:
+            self.reasoning_pipeline.flush(agent_id, timeout=self.timeout)
+
     def evaluate_confidence(
         self,
         agent_id: str,
@@ -155,6 +259,7 @@ class MetacognitionClient(BaseAutonomousClient):
         if not agent_id:
             raise ValueError("agent_id is required")
 
+        self._flush_reasoning(agent_id)
         params = {"agent_id": agent_id, "limit": limit}
         if session_id:
             params["session_id"] = session_id
@@ -184,6 +289,7 @@ class MetacognitionClient(BaseAutonomousClient):
         if not agent_id:
             raise ValueError("agent_id is required")
 
+        self._flush_reasoning(agent_id)
         return self._request(
             "POST",
             "/api/autonomous/metacognition/analyze",
@@ -193,6 +299,27 @@ class MetacognitionClient(BaseAutonomousClient):
             }
         )
 
+    def analyze_patterns_async(self, agent_id: str, days: int = 7, **job_options: Any) -> Future:
+        """
+        Run analyze_patterns() in the background.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            days: Number of days to analyze (default: 7)
+            **job_options: JobRunner.submit() options (callback, timeout,
+                           use_cache)
+
+        Returns:
+            Future resolving to the pattern analysis
+
+        Example:
+            >>> future = client.analyze_patterns_async("agent_123", days=30)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        return self._submit_job(self.analyze_patterns, agent_id, days, **job_options)
+
     def get_biases(self, agent_id: str) -> Dict[str, Any]:
         """
         Get detected cognitive biases for an agent.
@@ -257,3 +384,36 @@ class MetacognitionClient(BaseAutonomousClient):
                 "depth": depth
             }
         )
+
+    def self_reflect_async(
+        self,
+        agent_id: str,
+        topic: str,
+        depth: str = "standard",
+        **job_options: Any
+    ) -> Future:
+        """
+        Run self_reflect() in the background.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            topic: Topic for self-reflection
+            depth: Reflection depth (brief, standard, deep)
+            **job_options: JobRunner.submit() options (callback, timeout,
+                           use_cache)
+
+        Returns:
+            Future resolving to the self-reflection results
+
+        Example:
+            >>> future = client.self_reflect_async(
+            ...     "agent_123", "Recent decision-making quality",
+            ...     callback=lambda f: print(f.result()['insights'])
+            ... )
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if not topic:
+            raise ValueError("topic is required")
+
+        return self._submit_job(self.self_reflect, agent_id, topic, depth, **job_options)
@@ -3,8 +3,13 @@ ProspectiveMemoryClient for RecallBricks Autonomous Agent API
 Manages future-oriented memory for scheduled tasks and reminders
 """
 
-from typing import Dict, Any, Optional, List
+import hashlib
+import os
+from typing import Callable, Dict, Any, Optional, List, Union
 from .base import BaseAutonomousClient
+from ..coordination import CoordinatedTriggerPoller
+from ..polling import TriggerPoller
+from ..scheduler import TriggerScheduler
 
 
 class ProspectiveMemoryClient(BaseAutonomousClient):
@@ -30,6 +35,31 @@ class ProspectiveMemoryClient(BaseAutonomousClient):
         >>> pending = client.get_pending(agent_id="agent_123")
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.recallbricks.com",
+        timeout: int = 30,
+        trigger_scheduler: Optional[TriggerScheduler] = None,
+        trigger_poller: Optional[Union[TriggerPoller, CoordinatedTriggerPoller]] = None
+    ):
+        """
+        Initialize the prospective memory client.
+
+        Args:
+            api_key: Your RecallBricks API key
+            base_url: API base URL (default: production)
+            timeout: Request timeout in seconds (default: 30)
+            trigger_scheduler: TriggerScheduler kept in sync with creates,
+                               reschedules, cancellations and completions
+                               (default: none)
+            trigger_poller: TriggerPoller or CoordinatedTriggerPoller told
+                            about new trigger_at times (default: none)
+        """
+        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        self.trigger_scheduler = trigger_scheduler
+        self.trigger_poller = trigger_poller
+
     def create(
         self,
         agent_id: str,
@@ -91,7 +121,12 @@ class ProspectiveMemoryClient(BaseAutonomousClient):
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/prospective-memory", json=payload)
+        response = self._request("POST", "/api/autonomous/prospective-memory", json=payload)
+        if self.trigger_scheduler is not None and isinstance(response, dict):
+            self.trigger_scheduler.track(dict(payload, **response))
+        if self.trigger_poller is not None and trigger_at:
+            self.trigger_poller.hint(payload["agent_id"], trigger_at)
+        return response
 
     def get(self, memory_id: str) -> Dict[str, Any]:
         """
@@ -197,11 +232,14 @@ class ProspectiveMemoryClient(BaseAutonomousClient):
         if outcome:
             payload["outcome"] = self._sanitize_input(outcome)
 
-        return self._request(
+        response = self._request(
             "PUT",
             f"/api/autonomous/prospective-memory/{memory_id}",
             json=payload
         )
+        if self.trigger_scheduler is not None:
+            self.trigger_scheduler.untrack(memory_id)
+        return response
 
     def cancel(self, memory_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -224,11 +262,14 @@ class ProspectiveMemoryClient(BaseAutonomousClient):
         if reason:
             payload["reason"] = self._sanitize_input(reason)
 
-        return self._request(
+        response = self._request(
             "PUT",
             f"/api/autonomous/prospective-memory/{memory_id}",
             json=payload
         )
+        if self.trigger_scheduler is not None:
+            self.trigger_scheduler.untrack(memory_id)
+        return response
 
     def reschedule(
         self,
@@ -256,8 +297,142 @@ class ProspectiveMemoryClient(BaseAutonomousClient):
         if not trigger_at:
             raise ValueError("trigger_at is required")
 
-        return self._request(
+        response = self._request(
             "PUT",
             f"/api/autonomous/prospective-memory/{memory_id}",
             json={"trigger_at": trigger_at}
         )
+        if self.trigger_scheduler is not None:
+            self.trigger_scheduler.retime(memory_id, trigger_at)
+        return response
+
+    def schedule_triggers(
+        self,
+        agent_ids: List[str],
+        handlers: Optional[List[Callable[[Dict[str, Any]], None]]] = None,
+        poll_interval: float = 30.0,
+        start: bool = True
+    ) -> TriggerScheduler:
+        """
+        Fire reminders locally at their trigger_at instead of polling check_triggers().
+
+        Loads the agents' pending memories into a TriggerScheduler, attaches
+        it to this client so later creates, reschedules, cancellations and
+        completions keep it in sync, and starts it.
+
+        Args:
+            agent_ids: Agents whose memories are scheduled
+            handlers: Callables receiving each triggered memory dict (optional)
+            poll_interval: Seconds between check_triggers() calls for agents
+                          with event or condition triggers (default: 30)
+            start: Start the scheduler thread (default: True)
+
+        Returns:
+            The attached TriggerScheduler
+
+        Example:
+            >>> scheduler = client.schedule_triggers(
+            ...     ["agent_123"],
+            ...     handlers=[lambda memory: print(f"Due: {memory['content']}")]
+            ... )
+        """
+        if not agent_ids:
+            raise ValueError("agent_ids is required")
+
+        scheduler = TriggerScheduler(self, agent_ids, handlers=handlers or (),
+                                     poll_interval=poll_interval)
+        self.trigger_scheduler = scheduler
+        if start:
+            scheduler.start()
+        return scheduler
+
+    def poll_triggers(
+        self,
+        agent_ids: List[str],
+        handlers: Optional[List[Callable[[str, Dict[str, Any]], None]]] = None,
+        max_workers: int = 8,
+        start: bool = True,
+        **options: Any
+    ) -> TriggerPoller:
+        """
+        Poll check_triggers() for many agents on adaptive per-agent intervals.
+
+        Args:
+            agent_ids: Agents to poll
+            handlers: Callables receiving (agent_id, memory) per triggered memory (optional)
+            max_workers: Maximum concurrent checks (default: 8)
+            start: Start polling immediately (default: True)
+            **options: TriggerPoller options (base_interval, min_interval,
+                       max_interval, backoff, jitter, on_error)
+
+        Returns:
+            The attached TriggerPoller
+
+        Example:
+            >>> poller = client.poll_triggers(
+            ...     agent_ids,
+            ...     handlers=[lambda agent_id, memory: print(agent_id, memory['content'])],
+            ...     max_interval=900
+            ... )
+        """
+        if not agent_ids:
+            raise ValueError("agent_ids is required")
+
+        poller = TriggerPoller(self, agent_ids, handlers=handlers or (), max_workers=max_workers,
+                               session=self.session, **options)
+        self.trigger_poller = poller
+        if start:
+            poller.start()
+        return poller
+
+    def poll_triggers_coordinated(
+        self,
+        agent_ids: Optional[List[str]] = None,
+        handlers: Optional[List[Callable[[str, Dict[str, Any]], None]]] = None,
+        db_path: Optional[str] = None,
+        start: bool = True,
+        **options: Any
+    ) -> CoordinatedTriggerPoller:
+        """
+        Share check_triggers() polling with the other worker processes on this host.
+
+        Call this in every worker. One worker at a time polls each shard of
+        agents, and fired triggers are delivered to a worker that subscribed
+        to the agent, so reminders are neither polled nor fired N times.
+
+        Args:
+            agent_ids: Agents served by this worker (more can be added with subscribe())
+            handlers: Callables receiving (agent_id, memory) per triggered memory (optional)
+            db_path: SQLite file shared by the workers (default: one per API key
+                     in ~/.cache/recallbricks, or $XDG_CACHE_HOME/recallbricks,
+                     created readable by the current user only)
+            start: Start coordinating immediately (default: True)
+            **options: CoordinatedTriggerPoller and TriggerPoller options
+                       (num_shards, lease_seconds, base_interval, max_workers, ...)
+
+        Returns:
+            The attached CoordinatedTriggerPoller for this worker
+
+        Example:
+            >>> poller = client.poll_triggers_coordinated(
+            ...     agent_ids=["agent_123"],
+            ...     handlers=[lambda agent_id, memory: notify(agent_id, memory)]
+            ... )
+        """
+        if db_path is None:
+            key = hashlib.sha256(f"{self.base_url}|{self.api_key}".encode('utf-8')).hexdigest()[:16]
+            cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            directory = os.path.join(cache_home, "recallbricks")
+            # Fired triggers hold memory content; keep them away from other users
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            os.chmod(directory, 0o700)
+            db_path = os.path.join(directory, f"triggers-{key}.sqlite3")
+
+        poller = CoordinatedTriggerPoller(self, db_path, handlers=handlers or (),
+                                          session=self.session, **options)
+        for agent_id in agent_ids or ():
+            poller.subscribe(agent_id)
+        self.trigger_poller = poller
+        if start:
+            poller.start()
+        return poller
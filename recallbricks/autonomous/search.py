@@ -3,8 +3,19 @@ SearchClient for RecallBricks Autonomous Agent API
 Provides advanced search capabilities across agent memories
 """
 
-from typing import Dict, Any, Optional, List
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, Iterator, Optional, List, Union
 from .base import BaseAutonomousClient
+from ..query_cache import SemanticQueryCache
+from ..fusion import fused_search
+from ..federated import federate
+from ..temporal import TimeLike, format_time, parse_time, scan_windows
+from ..batch import (
+    DEFAULT_MAX_WORKERS,
+    ensure_pool_capacity,
+    run_concurrently,
+    deduplicate
+)
 
 
 class SearchClient(BaseAutonomousClient):
@@ -32,6 +43,40 @@ class SearchClient(BaseAutonomousClient):
         ... )
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.recallbricks.com",
+        timeout: int = 30,
+        query_cache: Optional[SemanticQueryCache] = None
+    ):
+        """
+        Initialize the search client.
+
+        Args:
+            api_key: Your RecallBricks API key
+            base_url: API base URL (default: production)
+            timeout: Request timeout in seconds (default: 30)
+            query_cache: SemanticQueryCache serving semantic() for repeated and
+                        near-duplicate queries (default: disabled)
+        """
+        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        self.query_cache = query_cache
+
+    def invalidate_query_cache(self, agent_id: Optional[str] = None) -> None:
+        """
+        Drop cached semantic() results, e.g. after storing agent memories.
+
+        Args:
+            agent_id: Only drop results for this agent (default: all agents)
+        """
+        if self.query_cache is None:
+            return
+        if agent_id is None:
+            self.query_cache.invalidate()
+        else:
+            self.query_cache.invalidate(f"semantic:{agent_id}")
+
     def semantic(
         self,
         agent_id: str,
@@ -82,7 +127,139 @@ class SearchClient(BaseAutonomousClient):
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/search", json=payload)
+        if self.query_cache is None:
+            return self._request("POST", "/api/autonomous/search", json=payload)
+
+        namespace = f"semantic:{payload['agent_id']}"
+        params = {key: value for key, value in payload.items() if key != "query"}
+        cached = self.query_cache.get(namespace, payload["query"], params)
+        if cached is not None:
+            return cached
+        response = self._request("POST", "/api/autonomous/search", json=payload)
+        if isinstance(response, dict):
+            self.query_cache.set(namespace, payload["query"], response, params)
+        return response
+
+    def semantic_many(
+        self,
+        agent_id: str,
+        queries: List[str],
+        limit: int = 10,
+        min_score: float = 0.0,
+        memory_types: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        deduplicate_results: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Run several independent semantic searches concurrently.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            queries: List of search queries
+            limit: Maximum number of results per query (default: 10)
+            min_score: Minimum relevance score (default: 0.0)
+            memory_types: Filter by memory types (optional)
+            metadata: Additional search metadata (optional)
+            max_workers: Maximum number of queries in flight (default: 8)
+            deduplicate_results: Drop results already returned for an earlier
+                                 query in the list (default: False)
+
+        Returns:
+            One entry per query, in input order: the semantic() response dict,
+            or the exception raised for that query
+
+        Example:
+            >>> results = client.semantic_many(
+            ...     agent_id="agent_123",
+            ...     queries=["JWT rotation", "OAuth scopes"]
+            ... )
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if not isinstance(queries, list):
+            raise TypeError(f"queries must be a list, got {type(queries).__name__}")
+
+        ensure_pool_capacity(self.session, max_workers)
+        results = run_concurrently(
+            self.semantic,
+            [
+                {
+                    "agent_id": agent_id,
+                    "query": query,
+                    "limit": limit,
+                    "min_score": min_score,
+                    "memory_types": memory_types,
+                    "metadata": metadata
+                }
+                for query in queries
+            ],
+            max_workers=max_workers
+        )
+
+        if deduplicate_results:
+            results = deduplicate(results, items_key="results")
+        return results
+
+    def semantic_federated(
+        self,
+        agent_ids: List[str],
+        query: str,
+        limit: int = 10,
+        per_agent_limit: Optional[int] = None,
+        min_score: float = 0.0,
+        memory_types: Optional[List[str]] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, Any]:
+        """
+        Run one semantic search per agent concurrently and merge by score.
+
+        Agents that fail are reported in "errors" and do not affect the
+        others.
+
+        Args:
+            agent_ids: Agents to search
+            query: Search query
+            limit: Number of merged results (default: 10)
+            per_agent_limit: Results requested from each agent (default: limit)
+            min_score: Minimum relevance score (default: 0.0)
+            memory_types: Filter by memory types (optional)
+            max_workers: Maximum number of searches in flight (default: 8)
+
+        Returns:
+            {
+                "results": [{"scope": "agent_123", "score": 0.91, "memory": {...}}],
+                "scopes": {"agent_123": 10, ...},     # results returned per agent
+                "errors": {"agent_456": APIError(...)}
+            }
+
+        Example:
+            >>> merged = client.semantic_federated(
+            ...     agent_ids=["agent_1", "agent_2", "agent_3"],
+            ...     query="deploy runbook",
+            ...     max_workers=4
+            ... )
+            >>> for hit in merged["results"]:
+            ...     print(hit["scope"], hit["memory"]["content"])
+        """
+        if not query:
+            raise ValueError("query is required")
+
+        return federate(
+            self.semantic,
+            agent_ids,
+            scope_param="agent_id",
+            items_key="results",
+            limit=limit,
+            call_kwargs={
+                "query": query,
+                "limit": per_agent_limit or limit,
+                "min_score": min_score,
+                "memory_types": memory_types
+            },
+            max_workers=max_workers,
+            session=self.session
+        )
 
     def filtered(
         self,
@@ -178,6 +355,65 @@ class SearchClient(BaseAutonomousClient):
             }
         )
 
+    def fused_search(
+        self,
+        agent_id: str,
+        query: str,
+        modes: Optional[List[str]] = None,
+        limit: int = 10,
+        method: str = "rrf",
+        weights: Optional[Dict[str, float]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        client: Any = None
+    ) -> Dict[str, Any]:
+        """
+        Run several search modes concurrently and fuse their rankings.
+
+        See recallbricks.fusion.fused_search() for the response format.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            query: Search query
+            modes: Modes to run: semantic, hybrid, filtered, and with a
+                  RecallBricks client also recall and search_weighted
+                  (default: semantic and hybrid, plus filtered when filters
+                  are given and recall/search_weighted when client is given)
+            limit: Results requested from each mode and returned (default: 10)
+            method: "rrf" or "score" (default: "rrf")
+            weights: Weight per mode (default: 1.0)
+            filters: Filters for the filtered mode (optional)
+            timeout: Seconds to wait before fusing whatever has arrived (optional)
+            client: RecallBricks client for recall/search_weighted (optional)
+
+        Returns:
+            Dict with fused results and the completed, pending and failed modes
+
+        Example:
+            >>> fused = client.fused_search(
+            ...     agent_id="agent_123",
+            ...     query="JWT rotation",
+            ...     modes=["semantic", "hybrid"],
+            ...     timeout=1.0
+            ... )
+            >>> top = fused["results"][0]["memory"]
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        return fused_search(
+            query,
+            search_client=self,
+            agent_id=agent_id,
+            client=client,
+            modes=modes,
+            limit=limit,
+            method=method,
+            weights=weights,
+            filters=filters,
+            timeout=timeout
+        )
+
     def similar(
         self,
         agent_id: str,
@@ -266,6 +502,84 @@ class SearchClient(BaseAutonomousClient):
 
         return self._request("POST", "/api/autonomous/search/temporal", json=payload)
 
+    def temporal_scan(
+        self,
+        agent_id: str,
+        start_time: TimeLike,
+        end_time: TimeLike,
+        query: Optional[str] = None,
+        limit: int = 20,
+        windows: int = 8,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        min_window_seconds: float = 60.0,
+        on_error: Optional[Callable[[datetime, datetime, Exception], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Scan every memory in a time range, oldest first.
+
+        Splits the range into windows fetched concurrently with temporal().
+        Windows that return `limit` results are halved and fetched again, so
+        dense periods are covered completely without knowing their density in
+        advance. Results are yielded as soon as all earlier windows are done.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            start_time: Start of time range (ISO format or datetime)
+            end_time: End of time range (ISO format or datetime)
+            query: Optional query within time range
+            limit: Results requested per window (default: 20)
+            windows: Number of initial windows (default: 8)
+            max_workers: Maximum number of requests in flight (default: 8)
+            min_window_seconds: Windows shorter than this are not split further
+                               and may be truncated (default: 60)
+            on_error: Called with (window start, window end, exception) when a
+                      window's request fails; the scan then skips that window
+                      (default: the exception ends the scan when reached)
+
+        Returns:
+            Iterator over result dicts in time order
+
+        Example:
+            >>> for memory in client.temporal_scan(
+            ...     agent_id="agent_123",
+            ...     start_time="2024-01-01T00:00:00Z",
+            ...     end_time="2024-07-01T00:00:00Z",
+            ...     windows=26
+            ... ):
+            ...     audit_log.write(memory)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+
+        start, end = parse_time(start_time), parse_time(end_time)
+        if end <= start:
+            raise ValueError("end_time must be after start_time")
+
+        def fetch(window_start: datetime, window_end: datetime) -> List[Dict[str, Any]]:
+            response = self.temporal(
+                agent_id,
+                start_time=format_time(window_start),
+                end_time=format_time(window_end),
+                query=query,
+                limit=limit
+            )
+            items = response.get('results', response.get('memories')) or []
+            return [item for item in items if isinstance(item, dict)]
+
+        ensure_pool_capacity(self.session, max_workers)
+        return scan_windows(
+            fetch,
+            start,
+            end,
+            limit=limit,
+            windows=windows,
+            max_workers=max_workers,
+            min_window=timedelta(seconds=min_window_seconds),
+            on_error=on_error
+        )
+
     def aggregate(
         self,
         agent_id: str,
@@ -3,8 +3,9 @@ UncertaintyClient for RecallBricks Autonomous Agent API
 Manages agent uncertainty quantification and confidence calibration
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 from .base import BaseAutonomousClient
+from ..calibration import CalibrationTracker
 
 
 class UncertaintyClient(BaseAutonomousClient):
@@ -30,6 +31,26 @@ class UncertaintyClient(BaseAutonomousClient):
         >>> summary = client.get_summary(agent_id="agent_123")
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.recallbricks.com",
+        timeout: int = 30,
+        calibration: Optional[CalibrationTracker] = None
+    ):
+        """
+        Initialize the uncertainty client.
+
+        Args:
+            api_key: Your RecallBricks API key
+            base_url: API base URL (default: production)
+            timeout: Request timeout in seconds (default: 30)
+            calibration: CalibrationTracker fed by record() and resolve()
+                         (default: none)
+        """
+        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        self.calibration = calibration
+
     def record(
         self,
         agent_id: str,
@@ -83,7 +104,10 @@ class UncertaintyClient(BaseAutonomousClient):
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/uncertainty", json=payload)
+        response = self._request("POST", "/api/autonomous/uncertainty", json=payload)
+        if self.calibration is not None and isinstance(response, dict) and response.get('id'):
+            self.calibration.predict(response['id'], agent_id, topic, payload["confidence"])
+        return response
 
     def get_by_topic(
         self,
@@ -253,7 +277,8 @@ class UncertaintyClient(BaseAutonomousClient):
         self,
         uncertainty_id: str,
         resolution: str,
-        new_confidence: float
+        new_confidence: float,
+        outcome: Optional[Union[bool, float]] = None
     ) -> Dict[str, Any]:
         """
         Resolve an uncertainty with new information.
@@ -262,6 +287,9 @@ class UncertaintyClient(BaseAutonomousClient):
             uncertainty_id: ID of the uncertainty record
             resolution: How the uncertainty was resolved
             new_confidence: New confidence level after resolution
+            outcome: Whether the recorded confidence proved right, for the
+                     calibration tracker; not sent to the API
+                     (default: new_confidence)
 
         Returns:
             Dict containing updated uncertainty record
@@ -276,7 +304,7 @@ class UncertaintyClient(BaseAutonomousClient):
         if not uncertainty_id:
             raise ValueError("uncertainty_id is required")
 
-        return self._request(
+        response = self._request(
             "PUT",
             f"/api/autonomous/uncertainty/{uncertainty_id}",
             json={
@@ -285,3 +313,33 @@ class UncertaintyClient(BaseAutonomousClient):
                 "status": "resolved"
             }
         )
+        if self.calibration is not None:
+            self.calibration.resolve(uncertainty_id, new_confidence if outcome is None else outcome)
+        return response
+
+    def track_calibration(self, **options: Any) -> CalibrationTracker:
+        """
+        Track calibration locally from record() and resolve().
+
+        Metrics are computed from every outcome. With sync_interval set,
+        outcomes are also sent to the server through calibrate(), but only
+        as one summary per topic and sync (mean confidence and observed
+        accuracy), so server-side calibration statistics are lossy.
+
+        Args:
+            **options: CalibrationTracker options (n_bins, sync_interval,
+                       max_pending, on_error)
+
+        Returns:
+            The attached CalibrationTracker
+
+        Example:
+            >>> calibration = client.track_calibration(sync_interval=600)
+            >>> report = calibration.report("agent_123")
+            >>> print(f"ECE: {report['ece']:.3f}, Brier: {report['brier']:.3f}")
+            >>> for topic, metrics in calibration.by_topic("agent_123").items():
+            ...     print(topic, metrics['ece'])
+        """
+        tracker = CalibrationTracker(self, **options)
+        self.calibration = tracker
+        return tracker
@@ -3,8 +3,12 @@ WorkingMemoryClient for RecallBricks Autonomous Agent API
 Manages active, short-term memory for AI agents
 """
 
+from concurrent.futures import Future
 from typing import Dict, Any, Optional, List
 from .base import BaseAutonomousClient
+from ..aggregation import AggregationCache
+from ..query_cache import SemanticQueryCache
+from ..working_tier import LocalWorkingMemory
 
 
 class WorkingMemoryClient(BaseAutonomousClient):
@@ -29,6 +33,42 @@ class WorkingMemoryClient(BaseAutonomousClient):
         >>> memories = client.retrieve(agent_id="agent_123")
     """
 
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.recallbricks.com",
+        timeout: int = 30,
+        aggregation_cache: Optional[AggregationCache] = None,
+        query_cache: Optional[SemanticQueryCache] = None
+    ):
+        """
+        Initialize the working memory client.
+
+        Args:
+            api_key: Your RecallBricks API key
+            base_url: API base URL (default: production)
+            timeout: Request timeout in seconds (default: 30)
+            aggregation_cache: AggregationCache to notify of stores, updates,
+                              deletes, clears and consolidations (default: none)
+            query_cache: SemanticQueryCache shared with a SearchClient; an
+                        agent's cached semantic() results are dropped when
+                        it stores, clears or consolidates memories, and all
+                        cached results on an update or delete, which only
+                        carry a memory ID (default: none)
+        """
+        super().__init__(api_key, base_url=base_url, timeout=timeout)
+        self.aggregation_cache = aggregation_cache
+        self.query_cache = query_cache
+
+    def _invalidate_queries(self, agent_id: Optional[str] = None) -> None:
+        """Drop cached semantic() results after a write (all agents without agent_id)."""
+        if self.query_cache is None:
+            return
+        if agent_id is None:
+            self.query_cache.invalidate()
+        else:
+            self.query_cache.invalidate(f"semantic:{agent_id}")
+
     def store(
         self,
         agent_id: str,
@@ -78,7 +118,11 @@ class WorkingMemoryClient(BaseAutonomousClient):
         if metadata is not None:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/api/autonomous/working-memory", json=payload)
+        response = self._request("POST", "/api/autonomous/working-memory", json=payload)
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.record_response(payload["agent_id"], payload, response)
+        self._invalidate_queries(payload["agent_id"])
+        return response
 
     def retrieve(
         self,
@@ -158,11 +202,15 @@ class WorkingMemoryClient(BaseAutonomousClient):
         if not payload:
             raise ValueError("At least one field must be provided for update")
 
-        return self._request(
+        response = self._request(
             "PUT",
             f"/api/autonomous/working-memory/{memory_id}",
             json=payload
         )
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.record_update(memory_id)
+        self._invalidate_queries()
+        return response
 
     def delete(self, memory_id: str) -> Dict[str, Any]:
         """
@@ -180,7 +228,11 @@ class WorkingMemoryClient(BaseAutonomousClient):
         if not memory_id:
             raise ValueError("memory_id is required")
 
-        return self._request("DELETE", f"/api/autonomous/working-memory/{memory_id}")
+        response = self._request("DELETE", f"/api/autonomous/working-memory/{memory_id}")
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.record_delete(memory_id)
+        self._invalidate_queries()
+        return response
 
     def clear(self, agent_id: str, memory_type: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -204,7 +256,11 @@ class WorkingMemoryClient(BaseAutonomousClient):
         if memory_type:
             params["memory_type"] = memory_type
 
-        return self._request("DELETE", "/api/autonomous/working-memory", params=params)
+        response = self._request("DELETE", "/api/autonomous/working-memory", params=params)
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.invalidate(agent_id)
+        self._invalidate_queries(self._sanitize_input(agent_id, max_length=256))
+        return response
 
     def consolidate(
         self,
@@ -236,4 +292,59 @@ class WorkingMemoryClient(BaseAutonomousClient):
             "strategy": strategy
         }
 
-        return self._request("POST", "/api/autonomous/working-memory/consolidate", json=payload)
+        response = self._request("POST", "/api/autonomous/working-memory/consolidate", json=payload)
+        if self.aggregation_cache is not None:
+            self.aggregation_cache.invalidate(agent_id)
+        self._invalidate_queries(payload["agent_id"])
+        return response
+
+    def consolidate_async(
+        self,
+        agent_id: str,
+        strategy: str = "importance",
+        **job_options: Any
+    ) -> Future:
+        """
+        Run consolidate() in the background.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            strategy: Consolidation strategy (importance, recency, relevance)
+            **job_options: JobRunner.submit() options (callback, timeout);
+                           results are not cached, as consolidating moves
+                           memories to long-term storage (use_cache
+                           defaults to False)
+
+        Returns:
+            Future resolving to the consolidation results
+
+        Example:
+            >>> future = client.consolidate_async("agent_123", timeout=60)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        job_options.setdefault("use_cache", False)
+        return self._submit_job(self.consolidate, agent_id, strategy, **job_options)
+
+    def local(self, agent_id: str, **options: Any) -> LocalWorkingMemory:
+        """
+        Open a local, write-through working-memory tier for an agent.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            **options: LocalWorkingMemory options (max_items, reconcile_interval,
+                       consolidate_size, consolidate_age_seconds, ...)
+
+        Returns:
+            LocalWorkingMemory loaded with the agent's working memory
+
+        Example:
+            >>> with client.local("agent_123", consolidate_size=200) as memory:
+            ...     memory.store("Deploy is blocked on review", memory_type="task")
+            ...     tasks = memory.retrieve(memory_type="task")
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        return LocalWorkingMemory(self, agent_id, **options)
@@ -0,0 +1,141 @@
+"""
+RecallBricks Batch Helpers
+Concurrent execution of independent API calls over a client's shared session
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+
+import requests
+
+
+DEFAULT_MAX_WORKERS = 8
+
+
+_pool_lock = threading.Lock()
+
+
+def ensure_pool_capacity(session: requests.Session, size: int) -> None:
+    """
+    Make sure the session's connection pools can serve `size` concurrent requests.
+
+    requests keeps at most 10 connections per host by default; running more
+    workers than that would discard connections instead of reusing them.
+
+    Only plain requests HTTPAdapters are resized. The replacement keeps the
+    old adapter's max_retries, pool_connections and pool_block, and the old
+    adapter is closed. Adapter subclasses (custom TLS, transports, ...) are
+    left untouched; to run many workers through one, give it a large enough
+    pool_maxsize yourself.
+
+    Args:
+        session: Session shared by the client
+        size: Number of concurrent requests expected
+    """
+    with _pool_lock:
+        for prefix in ("https://", "http://"):
+            adapter = session.adapters.get(prefix)
+            if type(adapter) is not requests.adapters.HTTPAdapter:
+                continue
+            if getattr(adapter, "_pool_maxsize", requests.adapters.DEFAULT_POOLSIZE) >= size:
+                continue
+            session.mount(prefix, requests.adapters.HTTPAdapter(
+                pool_connections=getattr(adapter, "_pool_connections",
+                                         requests.adapters.DEFAULT_POOLSIZE),
+                pool_maxsize=size,
+                max_retries=adapter.max_retries,
+                pool_block=getattr(adapter, "_pool_block", requests.adapters.DEFAULT_POOLBLOCK)
+            ))
+            adapter.close()
+
+
+def run_concurrently(
+    func: Callable[..., Any],
+    calls: List[Dict[str, Any]],
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> List[Union[Any, Exception]]:
+    """
+    Run `func` once per keyword-argument dict in `calls`, concurrently.
+
+    Args:
+        func: Callable to invoke
+        calls: Keyword arguments for each invocation
+        max_workers: Maximum number of calls in flight (default: 8)
+
+    Returns:
+        One entry per call, in input order: the call's return value, or the
+        exception it raised
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    if not calls:
+        return []
+
+    def invoke(kwargs: Dict[str, Any]) -> Union[Any, Exception]:
+        try:
+            return func(**kwargs)
+        except Exception as e:
+            return e
+
+    if len(calls) == 1:
+        return [invoke(calls[0])]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        return list(executor.map(invoke, calls))
+
+
+def _item_id(item: Any) -> Optional[str]:
+    """Return the id of a memory dict or result object, if it has one."""
+    if isinstance(item, dict):
+        return item.get("id")
+    return getattr(item, "id", None)
+
+
+def deduplicate(
+    results: List[Union[Any, Exception]],
+    items_key: Optional[str] = None
+) -> List[Union[Any, Exception]]:
+    """
+    Drop memories that already appeared in an earlier result set.
+
+    The first occurrence of a memory id is kept; exceptions and items without
+    an id are passed through unchanged.
+
+    Args:
+        results: Per-query results, as returned by run_concurrently()
+        items_key: Key holding the item list when results are response dicts
+                  (e.g. "memories"); None when results are plain lists
+
+    Returns:
+        New list of per-query results with duplicates removed
+    """
+    seen: Set[str] = set()
+
+    def unique(items: List[Any]) -> List[Any]:
+        kept = []
+        for item in items:
+            item_id = _item_id(item)
+            if item_id is not None:
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+            kept.append(item)
+        return kept
+
+    deduped: List[Union[Any, Exception]] = []
+    for result in results:
+        if isinstance(result, Exception):
+            deduped.append(result)
+        elif items_key is None:
+            deduped.append(unique(result))
+        elif isinstance(result, dict) and isinstance(result.get(items_key), list):
+            copy = dict(result)
+            copy[items_key] = unique(result[items_key])
+            if "count" in copy:
+                copy["count"] = len(copy[items_key])
+            deduped.append(copy)
+        else:
+            deduped.append(result)
+    return deduped
@@ -0,0 +1,382 @@
+"""
+RecallBricks Calibration
+Local confidence-calibration analytics for UncertaintyClient
+
+Requires NumPy (pip install recallbricks[analytics]).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for calibration analytics. "
+            "Install it with: pip install recallbricks[analytics]"
+        )
+
+
+# Rows of a bin table: outcomes, summed confidence, summed outcome, summed squared error
+_COUNT, _CONFIDENCE, _OUTCOME, _SQUARED_ERROR = range(4)
+
+
+class CalibrationTracker:
+    """
+    Incremental calibration statistics over (confidence, outcome) pairs.
+
+    Each pair is folded into a per-agent, per-topic table of confidence
+    bins holding counts and sums, so adding outcomes is O(1) (or one
+    bincount for a batch) and reports cost O(bins) however long the
+    history is. Reports give expected and maximum calibration error,
+    Brier score and reliability-diagram bins; outcomes may be 0/1 or a
+    probability in between.
+
+    Attached to an UncertaintyClient, record() registers predictions and
+    resolve() supplies their outcomes. With sync_interval set, the outcomes
+    gathered since the last sync are sent per topic with
+    UncertaintyClient.calibrate() every sync_interval seconds instead of
+    once per event. Syncing is lossy: the server sees one summary event per
+    topic and sync (mean confidence, observed accuracy), not the individual
+    outcomes, so its own calibration statistics are coarser than report().
+
+    Usage:
+        >>> from recallbricks.autonomous import UncertaintyClient
+        >>> client = UncertaintyClient(api_key="rb_dev_xxx")
+        >>> calibration = client.track_calibration(sync_interval=300)
+        >>> record = client.record("agent_123", "Database choice", confidence=0.8)
+        >>> client.resolve(record["id"], "Benchmarks confirmed it", 1.0, outcome=True)
+        >>> calibration.report("agent_123")["ece"]
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        n_bins: int = 10,
+        sync_interval: Optional[float] = None,
+        max_pending: int = 10000,
+        on_error: Optional[Callable[[Exception], None]] = None
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            client: UncertaintyClient used to sync summaries (optional)
+            n_bins: Equal-width confidence bins (default: 10)
+            sync_interval: Seconds between summary syncs to the server
+                           (default: only when sync() is called)
+            max_pending: Unresolved predictions remembered (default: 10000)
+            on_error: Called with the exception when a sync fails (optional)
+        """
+        _require_numpy()
+        if n_bins < 1:
+            raise ValueError("n_bins must be at least 1")
+        if sync_interval is not None and sync_interval <= 0:
+            raise ValueError("sync_interval must be positive")
+
+        self.client = client
+        self.n_bins = n_bins
+        self.sync_interval = sync_interval
+        self.max_pending = max_pending
+        self.on_error = on_error
+        # (agent_id, topic) -> bin table, shape (4, n_bins)
+        self._tables: Dict[Tuple[str, str], "np.ndarray"] = {}
+        # (agent_id, topic) -> bin table at the last sync
+        self._synced: Dict[Tuple[str, str], "np.ndarray"] = {}
+        # prediction id -> (agent_id, topic, confidence)
+        self._pending: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Held for a whole sync so a timer sync and a manual one cannot send the same delta
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"outcomes": 0, "syncs": 0, "synced_topics": 0, "sync_errors": 0}
+
+        if sync_interval is not None and client is not None:
+            self._thread = threading.Thread(target=self._run, name="recallbricks-calibration",
+                                            daemon=True)
+            self._thread.start()
+
+    def _table(self, agent_id: str, topic: str) -> "np.ndarray":
+        table = self._tables.get((agent_id, topic))
+        if table is None:
+            table = self._tables[(agent_id, topic)] = np.zeros((4, self.n_bins))
+        return table
+
+    def _bin_table(self, confidences: "np.ndarray", outcomes: "np.ndarray") -> "np.ndarray":
+        """Fold pairs into a bin table with one bincount per row."""
+        bins = np.minimum((confidences * self.n_bins).astype(np.int64), self.n_bins - 1)
+        return np.stack([
+            np.bincount(bins, minlength=self.n_bins),
+            np.bincount(bins, weights=confidences, minlength=self.n_bins),
+            np.bincount(bins, weights=outcomes, minlength=self.n_bins),
+            np.bincount(bins, weights=(confidences - outcomes) ** 2, minlength=self.n_bins),
+        ]).astype(float)
+
+    # Recording
+
+    def predict(self, prediction_id: str, agent_id: str, topic: str, confidence: float) -> None:
+        """
+        Remember a prediction until its outcome is known.
+
+        Args:
+            prediction_id: ID the outcome will be reported under
+            agent_id: Unique identifier for the agent
+            topic: Topic or decision being predicted
+            confidence: Confidence level 0.0-1.0
+        """
+        with self._lock:
+            self._pending[prediction_id] = (agent_id, topic, max(0.0, min(1.0, confidence)))
+            self._pending.move_to_end(prediction_id)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+
+    def resolve(self, prediction_id: str, outcome: Union[bool, float]) -> bool:
+        """
+        Record the outcome of a remembered prediction.
+
+        Args:
+            prediction_id: ID passed to predict()
+            outcome: True/False, or the probability the prediction was right
+
+        Returns:
+            True if the prediction was known
+        """
+        with self._lock:
+            prediction = self._pending.pop(prediction_id, None)
+        if prediction is None:
+            return False
+        agent_id, topic, confidence = prediction
+        self.add(agent_id, topic, confidence, outcome)
+        return True
+
+    def add(self, agent_id: str, topic: str, confidence: float, outcome: Union[bool, float]) -> None:
+        """
+        Record one (confidence, outcome) pair.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            topic: Topic or decision that was predicted
+            confidence: Confidence level 0.0-1.0
+            outcome: True/False, or the probability the prediction was right
+        """
+        confidence = max(0.0, min(1.0, float(confidence)))
+        outcome = max(0.0, min(1.0, float(outcome)))
+        index = min(int(confidence * self.n_bins), self.n_bins - 1)
+        with self._lock:
+            table = self._table(agent_id, topic)
+            table[:, index] += (1.0, confidence, outcome, (confidence - outcome) ** 2)
+            self._stats["outcomes"] += 1
+
+    def add_many(
+        self,
+        agent_id: str,
+        topics: Union[str, Sequence[str]],
+        confidences: Iterable[float],
+        outcomes: Iterable[Union[bool, float]]
+    ) -> int:
+        """
+        Record many (confidence, outcome) pairs at once, e.g. a loaded history.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            topics: One topic for all pairs, or a topic per pair
+            confidences: Confidence levels 0.0-1.0
+            outcomes: Outcomes, as booleans or probabilities
+
+        Returns:
+            Number of pairs recorded
+        """
+        confidences = np.clip(np.asarray(confidences, dtype=float), 0.0, 1.0)
+        outcomes = np.clip(np.asarray(outcomes, dtype=float), 0.0, 1.0)
+        if confidences.shape != outcomes.shape or confidences.ndim != 1:
+            raise ValueError("confidences and outcomes must be 1-D and the same length")
+
+        if isinstance(topics, str):
+            groups = [(topics, slice(None))]
+        else:
+            labels = np.asarray(topics, dtype=object)
+            if labels.shape != confidences.shape:
+                raise ValueError("topics must be a string or one topic per pair")
+            names, inverse = np.unique(labels.astype(str), return_inverse=True)
+            groups = [(str(name), inverse == i) for i, name in enumerate(names)]
+
+        partial = [(topic, self._bin_table(confidences[mask], outcomes[mask]))
+                   for topic, mask in groups]
+        with self._lock:
+            for topic, table in partial:
+                self._table(agent_id, topic)[:] += table
+            self._stats["outcomes"] += len(confidences)
+        return len(confidences)
+
+    # Reporting
+
+    def _combined(self, agent_id: str, topic: Optional[str]) -> "np.ndarray":
+        with self._lock:
+            if topic is not None:
+                table = self._tables.get((agent_id, topic))
+                return table.copy() if table is not None else np.zeros((4, self.n_bins))
+            tables = [t for (agent, _), t in self._tables.items() if agent == agent_id]
+            return np.sum(tables, axis=0) if tables else np.zeros((4, self.n_bins))
+
+    def _summarize(self, table: "np.ndarray", with_bins: bool) -> Dict[str, Any]:
+        counts = table[_COUNT]
+        total = counts.sum()
+        result: Dict[str, Any] = {"count": int(total)}
+        if not total:
+            result.update(ece=None, mce=None, brier=None, mean_confidence=None, accuracy=None)
+            if with_bins:
+                result["bins"] = []
+            return result
+
+        filled = counts > 0
+        mean_conf = np.divide(table[_CONFIDENCE], counts, out=np.zeros(self.n_bins), where=filled)
+        accuracy = np.divide(table[_OUTCOME], counts, out=np.zeros(self.n_bins), where=filled)
+        gaps = np.abs(accuracy - mean_conf)
+        result.update(
+            ece=float((counts * gaps).sum() / total),
+            mce=float(gaps[filled].max()),
+            brier=float(table[_SQUARED_ERROR].sum() / total),
+            mean_confidence=float(table[_CONFIDENCE].sum() / total),
+            accuracy=float(table[_OUTCOME].sum() / total),
+        )
+        if with_bins:
+            edges = np.linspace(0.0, 1.0, self.n_bins + 1)
+            result["bins"] = [
+                {
+                    "lower": float(edges[i]),
+                    "upper": float(edges[i + 1]),
+                    "count": int(counts[i]),
+                    "mean_confidence": float(mean_conf[i]),
+                    "accuracy": float(accuracy[i]),
+                }
+                for i in np.flatnonzero(filled)
+            ]
+        return result
+
+    def report(self, agent_id: str, topic: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get calibration metrics for an agent, or one of its topics.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            topic: Only this topic (default: all topics)
+
+        Returns:
+            Dict with count, ece (expected calibration error), mce (maximum
+            calibration error), brier, mean_confidence, accuracy and the
+            non-empty reliability bins; metrics are None without outcomes
+        """
+        return self._summarize(self._combined(agent_id, topic), with_bins=True)
+
+    def by_topic(self, agent_id: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get calibration metrics per topic for an agent.
+
+        Args:
+            agent_id: Unique identifier for the agent
+
+        Returns:
+            Dict mapping topic to its count, ece, mce, brier,
+            mean_confidence and accuracy
+        """
+        with self._lock:
+            tables = {topic: t.copy() for (agent, topic), t in self._tables.items()
+                      if agent == agent_id}
+        return {topic: self._summarize(table, with_bins=False) for topic, table in tables.items()}
+
+    # Syncing
+
+    def sync(self) -> int:
+        """
+        Send outcomes gathered since the last sync to the server.
+
+        Each (agent, topic) with new outcomes is sent as one
+        UncertaintyClient.calibrate() call carrying their mean confidence,
+        with a summary of the observed accuracy as the outcome. The
+        individual outcomes are not sent, so server-side calibration sees
+        one event per topic and sync.
+
+        Returns:
+            Number of topics synced
+        """
+        if self.client is None:
+            raise ValueError("client is required to sync")
+
+        with self._sync_lock:
+            return self._sync()
+
+    def _sync(self) -> int:
+        with self._lock:
+            deltas = []
+            for key, table in self._tables.items():
+                delta = table - self._synced.get(key, 0.0)
+                if delta[_COUNT].sum() > 0:
+                    deltas.append((key, table.copy(), delta))
+
+        synced = 0
+        for (agent_id, topic), table, delta in deltas:
+            count = delta[_COUNT].sum()
+            accuracy = delta[_OUTCOME].sum() / count
+            try:
+                self.client.calibrate(
+                    agent_id, topic,
+                    actual_outcome=f"Summary of {int(count)} outcomes: observed accuracy {accuracy:.3f}",
+                    predicted_confidence=round(float(delta[_CONFIDENCE].sum() / count), 6)
+                )
+            except Exception as e:
+                with self._lock:
+                    self._stats["sync_errors"] += 1
+                if self.on_error is not None:
+                    self.on_error(e)
+                continue
+            with self._lock:
+                self._synced[(agent_id, topic)] = table
+            synced += 1
+
+        with self._lock:
+            self._stats["syncs"] += 1
+            self._stats["synced_topics"] += synced
+        return synced
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.sync_interval):
+            try:
+                self.sync()
+            except Exception as e:  # keep the timer alive
+                if self.on_error is not None:
+                    self.on_error(e)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get tracker statistics.
+
+        Returns:
+            Dict with outcomes recorded, unresolved predictions, tracked
+            topics, syncs run, topics synced and failed syncs
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["pending"] = len(self._pending)
+            stats["topics"] = len(self._tables)
+            return stats
+
+    def close(self) -> None:
+        """Stop periodic syncing, syncing outstanding outcomes first."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self.sync()
+
+    def __enter__(self) -> "CalibrationTracker":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -4,10 +4,11 @@ The Memory Layer for AI - Persistent memory across all AI models
 """
 
 import requests
+import copy
 import functools
 import time
 import re
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Union, Iterator, Callable
 from .exceptions import (
     AuthenticationError,
     RateLimitError,
@@ -22,12 +23,27 @@ from .types import (
     LearningMetrics,
     PatternAnalysis,
     WeightedSearchResult,
+    CompactPredictedMemory,
+    CompactSuggestedMemory,
+    CompactWeightedSearchResult,
     MemoryMetadata,
     CategorySummary,
     RecallResponse,
     LearnedMemory,
     OrganizedRecallResult
 )
+from .batch import (
+    DEFAULT_MAX_WORKERS,
+    ensure_pool_capacity,
+    run_concurrently,
+    deduplicate
+)
+from .cache import TTLCache
+from .query_cache import SemanticQueryCache
+from .streaming import RecallStream, parse_recall_response, summarize_categories
+from .results import ResultSet
+from .diversity import diversify
+from .federated import federate
 import warnings
 
 
@@ -48,13 +64,20 @@ class RecallBricks:
         >>> memory.save("Important context", user_id="user_123")
         >>> memories = memory.get_all()
     """
-    
+
+    # Page size used by recall_stream() when the server cannot stream
+    RECALL_PAGE_SIZE = 20
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         service_token: Optional[str] = None,
         base_url: str = "https://api.recallbricks.com/api/v1",
-        timeout: int = 30
+        timeout: int = 30,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        compact_results: bool = False,
+        query_cache: Optional[SemanticQueryCache] = None
     ):
         """
         Initialize RecallBricks client.
@@ -64,6 +87,16 @@ class RecallBricks:
             service_token: Your RecallBricks service token (for server-to-server access)
             base_url: API base URL (default: production)
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Enable the read cache for get() and get_relationships()
+                      with this time-to-live in seconds (default: disabled)
+            cache_size: Maximum number of cached entries (default: 1024)
+            compact_results: Return slotted, lazily-read result objects
+                            (CompactPredictedMemory, CompactSuggestedMemory,
+                            CompactWeightedSearchResult) from predict_memories(),
+                            suggest_memories() and search_weighted() (default: False)
+            query_cache: SemanticQueryCache serving recall() for repeated and
+                        near-duplicate queries; cleared by save(), learn(),
+                        update() and delete() (default: disabled)
 
         Note:
             You must provide either api_key or service_token, but not both.
@@ -82,6 +115,11 @@ class RecallBricks:
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.session = requests.Session()
+        self.compact_results = compact_results
+        self.query_cache = query_cache
+        self.cache: Optional[TTLCache] = (
+            TTLCache(max_size=cache_size, ttl_seconds=cache_ttl) if cache_ttl else None
+        )
 
         # Set authentication header based on which credential was provided
         if service_token:
@@ -95,6 +133,18 @@ class RecallBricks:
                 'Content-Type': 'application/json'
             })
     
+    def _invalidate_memory(self, memory_id: str, relationships: bool = False) -> None:
+        """Drop a memory (and optionally its relationships) from the read cache."""
+        if self.cache is not None:
+            self.cache.delete(("memory", memory_id))
+            if relationships:
+                self.cache.delete(("relationships", memory_id))
+
+    def _invalidate_queries(self) -> None:
+        """Drop cached recall() results after a write."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate("recall")
+
     def _sanitize_input(self, value: str, max_length: int = 10000) -> str:
         """
         Sanitize string input to prevent injection attacks
@@ -155,7 +205,8 @@ class RecallBricks:
             **kwargs: Additional request parameters
 
         Returns:
-            API response as dictionary
+            API response as dictionary, or the open requests.Response when
+            called with stream=True
         """
         url = f"{self.base_url}{endpoint}"
 
@@ -240,6 +291,10 @@ class RecallBricks:
                         request_id=error_data.get('requestId')
                     )
 
+                # Streaming responses are decoded by the caller
+                if kwargs.get('stream'):
+                    return response
+
                 # Parse JSON response
                 try:
                     return response.json() if response.content else {}
@@ -349,7 +404,9 @@ class RecallBricks:
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/memories", json=payload, max_retries=max_retries)
+        response = self._request("POST", "/memories", json=payload, max_retries=max_retries)
+        self._invalidate_queries()
+        return response
 
     def learn(
         self,
@@ -450,7 +507,9 @@ class RecallBricks:
         if metadata:
             payload["metadata"] = metadata
 
-        return self._request("POST", "/memories/learn", json=payload, max_retries=max_retries)
+        response = self._request("POST", "/memories/learn", json=payload, max_retries=max_retries)
+        self._invalidate_queries()
+        return response
 
     def save_memory(
         self,
@@ -571,6 +630,31 @@ class RecallBricks:
             >>> # With helpfulness filter
             >>> results = rb.recall("bugs", min_helpfulness_score=0.7)
         """
+        payload = self._build_recall_payload(
+            query, limit, min_helpfulness_score, organized, user_id, project_id
+        )
+        if self.query_cache is None:
+            return self._request("POST", "/memories/recall", json=payload)
+
+        params = {key: value for key, value in payload.items() if key != "query"}
+        cached = self.query_cache.get("recall", payload["query"], params)
+        if cached is not None:
+            return cached
+        response = self._request("POST", "/memories/recall", json=payload)
+        if isinstance(response, dict):
+            self.query_cache.set("recall", payload["query"], response, params)
+        return response
+
+    def _build_recall_payload(
+        self,
+        query: str,
+        limit: int,
+        min_helpfulness_score: Optional[float],
+        organized: bool,
+        user_id: Optional[str],
+        project_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Validate recall() arguments and build the request payload."""
         # Validate user_id when using service token
         if self.service_token and not user_id:
             raise ValueError(
@@ -607,7 +691,327 @@ class RecallBricks:
         if project_id:
             payload["project_id"] = project_id
 
-        return self._request("POST", "/memories/recall", json=payload)
+        return payload
+
+    def recall_many(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        min_helpfulness_score: Optional[float] = None,
+        organized: bool = False,
+        user_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        deduplicate_results: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Run several independent recall() queries concurrently.
+
+        Queries share the client's session and connection pool. A failing query
+        does not affect the others: its slot holds the raised exception.
+
+        Args:
+            queries: List of search query strings
+            limit: Maximum number of results per query (default: 10)
+            min_helpfulness_score: Minimum helpfulness score filter (0.0-1.0)
+            organized: If True, each result is organized by category with summaries
+            user_id: User ID filter. Required when using service token authentication.
+            project_id: Optional project ID filter
+            max_workers: Maximum number of queries in flight (default: 8)
+            deduplicate_results: Drop memories already returned for an earlier
+                                 query in the list (default: False)
+
+        Returns:
+            One entry per query, in input order: the recall() response dict,
+            or the exception raised for that query
+
+        Raises:
+            TypeError: If queries is not a list
+
+        Example:
+            >>> queries = ["editor preferences", "deploy steps"]
+            >>> results = rb.recall_many(queries)
+            >>> for query, result in zip(queries, results):
+            ...     if isinstance(result, Exception):
+            ...         print(f"{query} failed: {result}")
+            ...     else:
+            ...         print(f"{query}: {len(result['memories'])} memories")
+        """
+        if not isinstance(queries, list):
+            raise TypeError(f"queries must be a list, got {type(queries).__name__}")
+
+        ensure_pool_capacity(self.session, max_workers)
+        results = run_concurrently(
+            self.recall,
+            [
+                {
+                    "query": query,
+                    "limit": limit,
+                    "min_helpfulness_score": min_helpfulness_score,
+                    "organized": organized,
+                    "user_id": user_id,
+                    "project_id": project_id
+                }
+                for query in queries
+            ],
+            max_workers=max_workers
+        )
+
+        if deduplicate_results:
+            results = deduplicate(results, items_key="memories")
+        return results
+
+    def recall_federated(
+        self,
+        query: str,
+        project_ids: List[str],
+        limit: int = 10,
+        per_project_limit: Optional[int] = None,
+        min_helpfulness_score: Optional[float] = None,
+        user_id: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> Dict[str, Any]:
+        """
+        Run one recall() per project concurrently and merge by score.
+
+        Projects that fail are reported in "errors" and do not affect the
+        others.
+
+        Args:
+            query: Search query text
+            project_ids: Projects to search
+            limit: Number of merged results (default: 10)
+            per_project_limit: Results requested from each project (default: limit)
+            min_helpfulness_score: Minimum helpfulness score filter (0.0-1.0)
+            user_id: User ID filter. Required when using service token authentication.
+            max_workers: Maximum number of recalls in flight (default: 8)
+
+        Returns:
+            {
+                "results": [{"scope": "proj_a", "score": 0.92, "memory": {...}}],
+                "scopes": {"proj_a": 10, ...},     # results returned per project
+                "errors": {"proj_b": APIError(...)}
+            }
+
+        Raises:
+            ValueError: If query is empty
+            TypeError: If project_ids is not a list
+
+        Example:
+            >>> merged = rb.recall_federated("release checklist", ["web", "mobile", "infra"])
+            >>> for hit in merged["results"]:
+            ...     print(f"[{hit['scope']}] {hit['memory']['text']}")
+        """
+        # Validate once up front rather than failing every project
+        self._build_recall_payload(
+            query, per_project_limit or limit, min_helpfulness_score, False, user_id, None
+        )
+
+        return federate(
+            self.recall,
+            project_ids,
+            scope_param="project_id",
+            items_key="memories",
+            limit=limit,
+            call_kwargs={
+                "query": query,
+                "limit": per_project_limit or limit,
+                "min_helpfulness_score": min_helpfulness_score,
+                "user_id": user_id
+            },
+            max_workers=max_workers,
+            session=self.session
+        )
+
+    def recall_diverse(
+        self,
+        query: str,
+        limit: int = 10,
+        diversity: float = 0.5,
+        fetch_limit: Optional[int] = None,
+        embed: Optional[Callable[[List[str]], Any]] = None,
+        min_helpfulness_score: Optional[float] = None,
+        organized: bool = False,
+        user_id: Optional[str] = None,
+        project_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Recall memories with near-duplicates filtered out.
+
+        Over-fetches candidates with recall() and keeps a diverse subset chosen
+        by maximal marginal relevance. Similarity is computed locally from the
+        embed callable if given, otherwise from MinHash signatures of the
+        memory texts. Requires numpy.
+
+        Args:
+            query: Search query text
+            limit: Number of memories to return (default: 10)
+            diversity: Trade-off between relevance (0.0) and novelty (1.0) (default: 0.5)
+            fetch_limit: Number of candidates to fetch (default: 4 * limit, at most 100)
+            embed: Callable mapping a list of texts to embedding vectors (optional)
+            min_helpfulness_score: Minimum helpfulness score filter (0.0-1.0)
+            organized: If True, category summaries are computed for the selected memories
+            user_id: User ID filter. Required when using service token authentication.
+            project_id: Optional project ID filter
+
+        Returns:
+            recall() response dict holding only the selected memories
+
+        Raises:
+            ValueError: If arguments are out of range
+            TypeError: If query is not a string
+
+        Example:
+            >>> results = rb.recall_diverse("deployment notes", limit=5, diversity=0.7)
+            >>> for mem in results['memories']:
+            ...     print(mem['text'])
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        fetch_limit = fetch_limit or min(limit * 4, 100)
+        if fetch_limit < limit:
+            raise ValueError("fetch_limit must be at least limit")
+
+        response = self.recall(
+            query,
+            limit=fetch_limit,
+            min_helpfulness_score=min_helpfulness_score,
+            organized=organized,
+            user_id=user_id,
+            project_id=project_id
+        )
+        selected = diversify(
+            response.get('memories') or [], limit, diversity=diversity, embed=embed
+        )
+
+        result = dict(response, memories=selected)
+        if 'count' in result:
+            result['count'] = len(selected)
+        if 'total' in result:
+            result['total'] = len(selected)
+        if organized:
+            result['categories'] = summarize_categories(selected, response.get('categories') or {})
+        return result
+
+    def recall_stream(
+        self,
+        query: str,
+        limit: int = 10,
+        min_helpfulness_score: Optional[float] = None,
+        organized: bool = False,
+        user_id: Optional[str] = None,
+        project_id: Optional[str] = None,
+        page_size: Optional[int] = None
+    ) -> RecallStream:
+        """
+        Recall memories, yielding each one as soon as it is decoded.
+
+        The request asks the server for an NDJSON stream. If the server does not
+        support streaming, or page_size is given, results are fetched in pages
+        instead, sending an `offset` the recall endpoint may not honour; pages
+        are de-duplicated by memory id, so such a server yields one page of
+        results rather than repeats. With organized=True the category block is
+        delivered at the end, on the returned stream's `categories` attribute.
+
+        The request is sent lazily, when iteration starts; errors are raised
+        from the iteration.
+
+        Args:
+            query: Search query text
+            limit: Maximum number of results (default: 10)
+            min_helpfulness_score: Minimum helpfulness score filter (0.0-1.0)
+            organized: If True, category summaries are delivered after the memories
+            user_id: User ID filter. Required when using service token authentication.
+            project_id: Optional project ID filter
+            page_size: Fetch in pages of this size instead of streaming (optional)
+
+        Returns:
+            RecallStream, usable with `for` and `async for`
+
+        Raises:
+            ValueError: If query is empty or min_helpfulness_score is out of range
+            TypeError: If query is not a string
+
+        Example:
+            >>> stream = rb.recall_stream("user preferences", limit=100, organized=True)
+            >>> for memory in stream:
+            ...     print(memory['text'])
+            >>> for category, info in stream.categories.items():
+            ...     print(f"{category}: {info['count']} memories")
+        """
+        payload = self._build_recall_payload(
+            query, limit, min_helpfulness_score, organized, user_id, project_id
+        )
+        if page_size is not None and page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        return RecallStream(self._recall_events(payload, page_size))
+
+    def _recall_events(self, payload: Dict[str, Any], page_size: Optional[int]) -> Iterator[Any]:
+        """Stream recall events, falling back to pages if streaming is refused."""
+        if page_size is None:
+            try:
+                response = self._request(
+                    "POST",
+                    "/memories/recall",
+                    json=dict(payload, stream=True),
+                    headers={"Accept": "application/x-ndjson"},
+                    stream=True
+                )
+            except ValidationError:
+                pass
+            except APIError as e:
+                if e.status_code not in (406, 415, 501):
+                    raise
+            else:
+                yield from parse_recall_response(response)
+                return
+
+        yield from self._recall_pages(payload, page_size or self.RECALL_PAGE_SIZE)
+
+    def _recall_pages(self, payload: Dict[str, Any], page_size: int) -> Iterator[Any]:
+        """
+        Yield recall events one page at a time using offset pagination.
+
+        /memories/recall is not documented to accept `offset`; a server that
+        ignores it returns the first page again. Memories are therefore
+        de-duplicated by id, and paging stops at a short page or at a page
+        that adds no new memories.
+        """
+        memories: List[Dict[str, Any]] = []
+        seen = set()
+        server_categories: Dict[str, Any] = {}
+        limit = payload["limit"]
+        offset = 0
+
+        while len(memories) < limit:
+            size = min(page_size, limit - len(memories))
+            page = self._request(
+                "POST",
+                "/memories/recall",
+                json=dict(payload, limit=size, offset=offset)
+            )
+            page_memories = page.get('memories') or []
+            offset += len(page_memories)
+            added = 0
+            for memory in page_memories:
+                memory_id = memory.get('id') if isinstance(memory, dict) else None
+                if memory_id is not None:
+                    if memory_id in seen:
+                        continue
+                    seen.add(memory_id)
+                if len(memories) >= limit:
+                    break
+                memories.append(memory)
+                added += 1
+                yield ('memory', memory)
+            server_categories.update(page.get('categories') or {})
+            if len(page_memories) < size or not added:
+                break
+
+        if payload.get("organized"):
+            yield ('categories', summarize_categories(memories, server_categories))
+        yield ('total', len(memories))
 
     def get_all(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -666,7 +1070,16 @@ class RecallBricks:
         Example:
             >>> specific = memory.get("123e4567-e89b-12d3-a456-426614174000")
         """
-        return self._request("GET", f"/memories/{memory_id}")
+        if self.cache is not None:
+            cached = self.cache.get(("memory", memory_id))
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+        response = self._request("GET", f"/memories/{memory_id}")
+
+        if self.cache is not None and isinstance(response, dict):
+            self.cache.set(("memory", memory_id), copy.deepcopy(response))
+        return response
     
     def delete(self, memory_id: str) -> Dict[str, Any]:
         """
@@ -681,7 +1094,12 @@ class RecallBricks:
         Example:
             >>> memory.delete("123e4567-e89b-12d3-a456-426614174000")
         """
-        return self._request("DELETE", f"/memories/{memory_id}")
+        self._invalidate_memory(memory_id, relationships=True)
+        response = self._request("DELETE", f"/memories/{memory_id}")
+        # Again afterwards: a prefetch racing the request may have re-cached it
+        self._invalidate_memory(memory_id, relationships=True)
+        self._invalidate_queries()
+        return response
 
     def update(
         self,
@@ -719,7 +1137,11 @@ class RecallBricks:
         if not payload:
             raise ValueError("At least one field (text, tags, or metadata) must be provided")
 
-        return self._request("PUT", f"/memories/{memory_id}", json=payload)
+        self._invalidate_memory(memory_id)
+        response = self._request("PUT", f"/memories/{memory_id}", json=payload)
+        self._invalidate_memory(memory_id)
+        self._invalidate_queries()
+        return response
 
     def health(self) -> Dict[str, Any]:
         """
@@ -771,6 +1193,11 @@ class RecallBricks:
         if not isinstance(memory_id, str):
             raise TypeError(f"memory_id must be a string, got {type(memory_id).__name__}")
 
+        if self.cache is not None:
+            cached = self.cache.get(("relationships", memory_id))
+            if cached is not None:
+                return copy.deepcopy(cached)
+
         response = self._request("GET", f"/relationships/memory/{memory_id}")
 
         # Validate response structure
@@ -782,6 +1209,8 @@ class RecallBricks:
         if not isinstance(response, dict):
             raise APIError(f"Invalid response type: expected dict, got {type(response).__name__}", status_code=500)
 
+        if self.cache is not None:
+            self.cache.set(("relationships", memory_id), copy.deepcopy(response))
         return response
 
     def get_graph_context(self, memory_id: str, depth: int = 2) -> Dict[str, Any]:
@@ -932,7 +1361,8 @@ class RecallBricks:
 
         # Parse response into PredictedMemory objects
         predictions = response.get('predictions', [])
-        return [PredictedMemory.from_dict(p) for p in predictions]
+        result_type = CompactPredictedMemory if self.compact_results else PredictedMemory
+        return [result_type.from_dict(p) for p in predictions]
 
     def suggest_memories(
         self,
@@ -979,7 +1409,8 @@ class RecallBricks:
 
         # Parse response into SuggestedMemory objects
         suggestions = response.get('suggestions', [])
-        return [SuggestedMemory.from_dict(s) for s in suggestions]
+        result_type = CompactSuggestedMemory if self.compact_results else SuggestedMemory
+        return [result_type.from_dict(s) for s in suggestions]
 
     def get_learning_metrics(self, days: int = 30) -> LearningMetrics:
         """
@@ -1036,8 +1467,9 @@ class RecallBricks:
         weight_by_usage: bool = False,
         decay_old_memories: bool = False,
         adaptive_weights: bool = True,
-        min_helpfulness_score: Optional[float] = None
-    ) -> List[WeightedSearchResult]:
+        min_helpfulness_score: Optional[float] = None,
+        as_result_set: bool = False
+    ) -> Union[List[WeightedSearchResult], ResultSet]:
         """
         Search memories with intelligent weighting based on usage, helpfulness, and recency.
 
@@ -1048,9 +1480,11 @@ class RecallBricks:
             decay_old_memories: Reduce score for old memories (default: False)
             adaptive_weights: Use adaptive weighting algorithm (default: True)
             min_helpfulness_score: Minimum helpfulness score filter (optional)
+            as_result_set: Return a columnar ResultSet with NumPy score
+                          columns instead of a list (requires numpy)
 
         Returns:
-            List of WeightedSearchResult objects
+            List of WeightedSearchResult objects, or a ResultSet if as_result_set=True
 
         Example:
             >>> results = rb.search_weighted(
@@ -1087,4 +1521,124 @@ class RecallBricks:
 
         # Parse response into WeightedSearchResult objects
         results = response.get('results', [])
-        return [WeightedSearchResult.from_dict(r) for r in results]
+        if as_result_set:
+            return ResultSet.from_dicts(results)
+        result_type = CompactWeightedSearchResult if self.compact_results else WeightedSearchResult
+        return [result_type.from_dict(r) for r in results]
+
+    def search_weighted_many(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        weight_by_usage: bool = False,
+        decay_old_memories: bool = False,
+        adaptive_weights: bool = True,
+        min_helpfulness_score: Optional[float] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        deduplicate_results: bool = False
+    ) -> List[Union[List[WeightedSearchResult], Exception]]:
+        """
+        Run several independent search_weighted() queries concurrently.
+
+        Args:
+            queries: List of search query strings
+            limit: Maximum number of results per query (default: 10)
+            weight_by_usage: Boost frequently used memories (default: False)
+            decay_old_memories: Reduce score for old memories (default: False)
+            adaptive_weights: Use adaptive weighting algorithm (default: True)
+            min_helpfulness_score: Minimum helpfulness score filter (optional)
+            max_workers: Maximum number of queries in flight (default: 8)
+            deduplicate_results: Drop results already returned for an earlier
+                                 query in the list (default: False)
+
+        Returns:
+            One entry per query, in input order: the list of WeightedSearchResult
+            objects, or the exception raised for that query
+
+        Raises:
+            TypeError: If queries is not a list
+
+        Example:
+            >>> results = rb.search_weighted_many(
+            >>>     ["authentication", "rate limiting"],
+            >>>     weight_by_usage=True,
+            >>>     deduplicate_results=True
+            >>> )
+        """
+        if not isinstance(queries, list):
+            raise TypeError(f"queries must be a list, got {type(queries).__name__}")
+
+        ensure_pool_capacity(self.session, max_workers)
+        results = run_concurrently(
+            self.search_weighted,
+            [
+                {
+                    "query": query,
+                    "limit": limit,
+                    "weight_by_usage": weight_by_usage,
+                    "decay_old_memories": decay_old_memories,
+                    "adaptive_weights": adaptive_weights,
+                    "min_helpfulness_score": min_helpfulness_score
+                }
+                for query in queries
+            ],
+            max_workers=max_workers
+        )
+
+        if deduplicate_results:
+            results = deduplicate(results)
+        return results
+
+    def search_weighted_diverse(
+        self,
+        query: str,
+        limit: int = 10,
+        diversity: float = 0.5,
+        fetch_limit: Optional[int] = None,
+        embed: Optional[Callable[[List[str]], Any]] = None,
+        weight_by_usage: bool = False,
+        decay_old_memories: bool = False,
+        adaptive_weights: bool = True,
+        min_helpfulness_score: Optional[float] = None
+    ) -> List[WeightedSearchResult]:
+        """
+        Weighted search with near-duplicates filtered out.
+
+        Over-fetches candidates with search_weighted() and keeps a diverse
+        subset chosen by maximal marginal relevance on relevance_score.
+        Requires numpy.
+
+        Args:
+            query: Search query string
+            limit: Number of results to return (default: 10)
+            diversity: Trade-off between relevance (0.0) and novelty (1.0) (default: 0.5)
+            fetch_limit: Number of candidates to fetch (default: 4 * limit, at most 100)
+            embed: Callable mapping a list of texts to embedding vectors (optional)
+            weight_by_usage: Boost frequently used memories (default: False)
+            decay_old_memories: Reduce score for old memories (default: False)
+            adaptive_weights: Use adaptive weighting algorithm (default: True)
+            min_helpfulness_score: Minimum helpfulness score filter (optional)
+
+        Returns:
+            List of WeightedSearchResult objects, in selection order
+
+        Example:
+            >>> results = rb.search_weighted_diverse("authentication", limit=5)
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        fetch_limit = fetch_limit or min(limit * 4, 100)
+        if fetch_limit < limit:
+            raise ValueError("fetch_limit must be at least limit")
+
+        results = self.search_weighted(
+            query,
+            limit=fetch_limit,
+            weight_by_usage=weight_by_usage,
+            decay_old_memories=decay_old_memories,
+            adaptive_weights=adaptive_weights,
+            min_helpfulness_score=min_helpfulness_score
+        )
+        return diversify(
+            results, limit, diversity=diversity, embed=embed, score_key='relevance_score'
+        )
@@ -0,0 +1,332 @@
+"""
+RecallBricks Context State
+Local session-state cache with JSON Patch updates for ContextClient
+"""
+
+import copy
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .exceptions import APIError
+
+
+# Status codes the API uses when a patch was computed against a stale version
+CONFLICT_STATUS = (409, 412)
+
+# Status codes meaning the server does not accept patches for sessions
+UNSUPPORTED_STATUS = (405, 415, 501)
+
+# Keys under which a session response may carry its context
+_CONTEXT_KEYS = ("context", "data")
+
+
+def _escape(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def json_patch(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute an RFC 6902 JSON Patch turning old into new.
+
+    Objects are compared key by key and only changed keys are emitted;
+    any other changed value (including lists) is replaced whole.
+
+    Args:
+        old: Current JSON value
+        new: Desired JSON value
+        path: JSON Pointer of the values (default: document root)
+
+    Returns:
+        List of add, remove and replace operations; empty if equal
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        operations: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                operations.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                operations.append({"op": "add", "path": child, "value": value})
+            else:
+                operations.extend(json_patch(old[key], value, child))
+        return operations
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _context_key(response: Any) -> Optional[str]:
+    if isinstance(response, dict):
+        for key in _CONTEXT_KEYS:
+            if isinstance(response.get(key), dict):
+                return key
+    return None
+
+
+class SessionStateCache:
+    """
+    Local cache of ContextClient session state and agent environments.
+
+    get() and get_environment() are fetched once and then served from
+    memory until changed through the cache. update() applies the change
+    to the cached context and sends only a JSON Patch of what differs,
+    tagged with the last version the server reported; if the server
+    rejects it as a version conflict (or does not accept patches) the
+    update is sent in full as ContextClient.update() would, and the
+    cached state is refreshed from the response.
+
+    Usage:
+        >>> from recallbricks.autonomous import ContextClient
+        >>> client = ContextClient(api_key="rb_dev_xxx")
+        >>> state = client.state_cache()
+        >>> context = state.get("sess_123")               # API call
+        >>> state.update("sess_123", {"progress": 0.6})   # PATCH of one key
+        >>> context = state.get("sess_123")               # local
+    """
+
+    def __init__(self, client: Any, max_age: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            client: ContextClient used for requests
+            max_age: Seconds before a cached session or environment is
+                     refetched (default: only when changed elsewhere and
+                     invalidated)
+        """
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+
+        self.client = client
+        self.max_age = max_age
+        # session_id -> (fetched_at, response)
+        self._sessions: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # agent_id -> (fetched_at, response)
+        self._environments: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._patch_supported = True
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "fetches": 0, "patches": 0, "full_updates": 0,
+                       "conflicts": 0, "unchanged": 0, "bytes_saved": 0}
+
+    def _fresh(self, entry: Optional[Tuple[float, Dict[str, Any]]]) -> bool:
+        return entry is not None and (
+            self.max_age is None or time.monotonic() - entry[0] < self.max_age
+        )
+
+    # Sessions
+
+    def get(self, session_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get the current context for a session, from memory when cached.
+
+        Args:
+            session_id: ID of the session
+            refresh: Refetch even if cached (default: False)
+
+        Returns:
+            Dict containing session context
+        """
+        if not session_id:
+            raise ValueError("session_id is required")
+
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if not refresh and self._fresh(entry):
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry[1])
+
+        response = self.client.get(session_id)
+        with self._lock:
+            self._stats["fetches"] += 1
+            self._sessions[session_id] = (time.monotonic(), copy.deepcopy(response))
+        return response
+
+    def update(
+        self,
+        session_id: str,
+        context_data: Dict[str, Any],
+        merge: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Update session context, sending only what changed.
+
+        Args:
+            session_id: ID of the session
+            context_data: New context data
+            merge: Merge with existing context (default: True)
+
+        Returns:
+            Dict containing updated context
+        """
+        if not session_id:
+            raise ValueError("session_id is required")
+        if not context_data:
+            raise ValueError("context_data is required")
+
+        cached = self.get(session_id)
+        key = _context_key(cached)
+        if key is None:
+            return self._full_update(session_id, context_data, merge)
+
+        current = cached[key]
+        target = {**current, **context_data} if merge else dict(context_data)
+        operations = json_patch(current, target)
+        if not operations:
+            with self._lock:
+                self._stats["unchanged"] += 1
+            return cached
+        if not self._patch_supported:
+            return self._full_update(session_id, context_data, merge)
+
+        try:
+            response = self.client.patch(session_id, operations, version=cached.get("version"))
+        except APIError as e:
+            if e.status_code in CONFLICT_STATUS:
+                with self._lock:
+                    self._stats["conflicts"] += 1
+            elif e.status_code in UNSUPPORTED_STATUS:
+                self._patch_supported = False
+            else:
+                raise
+            return self._full_update(session_id, context_data, merge)
+
+        saved = len(json.dumps(target, default=str)) - len(json.dumps(operations, default=str))
+        updated = dict(cached)
+        updated[key] = target
+        if isinstance(response, dict) and "version" in response:
+            updated["version"] = response["version"]
+        else:
+            updated.pop("version", None)
+        with self._lock:
+            self._stats["patches"] += 1
+            self._stats["bytes_saved"] += max(saved, 0)
+            self._sessions[session_id] = (time.monotonic(), updated)
+        return copy.deepcopy(updated)
+
+    def _full_update(
+        self,
+        session_id: str,
+        context_data: Dict[str, Any],
+        merge: bool
+    ) -> Dict[str, Any]:
+        """Send the update in full and cache the server's answer."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+        response = self.client.update(session_id, context_data, merge=merge)
+        with self._lock:
+            self._stats["full_updates"] += 1
+            if _context_key(response) is not None:
+                self._sessions[session_id] = (time.monotonic(), copy.deepcopy(response))
+        return response
+
+    def end_session(self, session_id: str, summary: Optional[str] = None) -> Dict[str, Any]:
+        """
+        End a context session and drop its cached state.
+
+        Args:
+            session_id: ID of the session
+            summary: Session summary (optional)
+
+        Returns:
+            Dict containing ended session info
+        """
+        self.invalidate(session_id)
+        return self.client.end_session(session_id, summary=summary)
+
+    # Environments
+
+    def get_environment(self, agent_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get an agent's environmental context, from memory when cached.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            refresh: Refetch even if cached (default: False)
+
+        Returns:
+            Dict containing environment information
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        with self._lock:
+            entry = self._environments.get(agent_id)
+            if not refresh and self._fresh(entry):
+                self._stats["hits"] += 1
+                return copy.deepcopy(entry[1])
+
+        response = self.client.get_environment(agent_id)
+        with self._lock:
+            self._stats["fetches"] += 1
+            self._environments[agent_id] = (time.monotonic(), copy.deepcopy(response))
+        return response
+
+    def set_environment(self, agent_id: str, environment: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Set an agent's environmental context.
+
+        Setting the environment already cached is skipped; otherwise the
+        cached environment is dropped and refetched on next read.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            environment: Environment configuration
+
+        Returns:
+            Dict containing updated environment
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if not environment:
+            raise ValueError("environment is required")
+
+        with self._lock:
+            entry = self._environments.get(agent_id)
+            if self._fresh(entry) and entry[1].get("environment", entry[1]) == environment:
+                self._stats["unchanged"] += 1
+                return copy.deepcopy(entry[1])
+            self._environments.pop(agent_id, None)
+
+        response = self.client.set_environment(agent_id, environment)
+        with self._lock:
+            self._stats["full_updates"] += 1
+        return response
+
+    # Maintenance
+
+    def invalidate(self, session_id: Optional[str] = None, agent_id: Optional[str] = None) -> None:
+        """
+        Drop cached state so the next read refetches it.
+
+        Args:
+            session_id: Session to drop (default: all sessions if agent_id is also omitted)
+            agent_id: Environment to drop (default: all environments if
+                      session_id is also omitted)
+        """
+        with self._lock:
+            if session_id is None and agent_id is None:
+                self._sessions.clear()
+                self._environments.clear()
+                return
+            if session_id is not None:
+                self._sessions.pop(session_id, None)
+            if agent_id is not None:
+                self._environments.pop(agent_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with local reads, fetches, patches and full updates sent,
+            version conflicts, updates skipped as unchanged, and bytes
+            saved by sending patches instead of full contexts
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["sessions"] = len(self._sessions)
+            stats["environments"] = len(self._environments)
+            return stats
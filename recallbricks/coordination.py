@@ -0,0 +1,413 @@
+"""
+RecallBricks Polling Coordination
+Shares check_triggers() polling between worker processes on one host
+"""
+
+import json
+import math
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .polling import TriggerPoller
+from .temporal import TimeLike, parse_time
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workers (
+    worker TEXT PRIMARY KEY,
+    heartbeat REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    agent_id TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    shard INTEGER NOT NULL,
+    PRIMARY KEY (agent_id, worker)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    shard INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fired (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_id TEXT NOT NULL,
+    worker TEXT,
+    memory TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hints (
+    agent_id TEXT PRIMARY KEY,
+    trigger_at REAL NOT NULL
+);
+"""
+
+
+def shard_of(agent_id: str, num_shards: int) -> int:
+    """Shard an agent belongs to; stable across processes."""
+    return zlib.crc32(agent_id.encode('utf-8')) % num_shards
+
+
+class CoordinatedTriggerPoller:
+    """
+    check_triggers() polling shared by the worker processes of one host.
+
+    Workers coordinate through a SQLite file. Each worker subscribes the
+    agents it serves; agents are split into shards, and each shard is
+    leased to one live worker at a time, which polls every subscribed agent
+    in it with a TriggerPoller. Leases are spread evenly over live workers
+    and renewed every tick; a worker that stops renewing (because it died)
+    loses its shards to the others once lease_seconds pass. Fired triggers
+    go into a queue in the same file, addressed to a worker subscribed to
+    the agent, which hands them to its handlers - so each reminder fires
+    once, in a process that serves its agent. hint() passes a new trigger_at
+    to whichever worker polls the agent.
+
+    A stopped poller leaves the pool; start() rejoins it with the same
+    subscriptions.
+
+    Usage:
+        >>> from recallbricks.autonomous import ProspectiveMemoryClient
+        >>> client = ProspectiveMemoryClient(api_key="rb_dev_xxx")
+        >>> # In every gunicorn/uwsgi worker:
+        >>> poller = client.poll_triggers_coordinated(handlers=[on_trigger])
+        >>> poller.subscribe("agent_123")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        db_path: str,
+        handlers: Iterable[Callable[[str, Dict[str, Any]], None]] = (),
+        worker_id: Optional[str] = None,
+        num_shards: int = 16,
+        lease_seconds: float = 15.0,
+        tick_seconds: float = 1.0,
+        fired_ttl: float = 3600.0,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+        **poller_options: Any
+    ):
+        """
+        Initialize the coordinated poller.
+
+        Args:
+            client: ProspectiveMemoryClient used for check_triggers()
+            db_path: SQLite file shared by the workers; created readable and
+                     writable by the current user only
+            handlers: Callables receiving (agent_id, memory) per triggered memory
+            worker_id: Unique name of this worker (default: host, pid and a random suffix)
+            num_shards: Number of agent shards leased out (default: 16)
+            lease_seconds: Seconds a lease or heartbeat stays valid without
+                          renewal (default: 15)
+            tick_seconds: Seconds between coordination rounds (default: 1)
+            fired_ttl: Seconds an undeliverable fired trigger is kept (default: 3600)
+            on_error: Called with (agent_id, exception) when a check or handler fails
+            **poller_options: TriggerPoller options for the shards this worker leads
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        if not 0 < tick_seconds < lease_seconds:
+            raise ValueError("tick_seconds must be positive and shorter than lease_seconds")
+
+        self.db_path = db_path
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.num_shards = num_shards
+        self.lease_seconds = lease_seconds
+        self.tick_seconds = tick_seconds
+        self.fired_ttl = fired_ttl
+        self.on_error = on_error
+        self._handlers = list(handlers)
+        self._subscribed: Set[str] = set()
+        self._owned: Set[int] = set()
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = self._connect()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"ticks": 0, "enqueued": 0, "delivered": 0, "errors": 0}
+        self.poller = TriggerPoller(client, handlers=[self._enqueue], on_error=on_error,
+                                    **poller_options)
+
+    # Storage
+
+    def _connect(self) -> sqlite3.Connection:
+        # Create the file private to this user; sqlite3 would honour the umask
+        if self.db_path != ":memory:":
+            os.close(os.open(self.db_path, os.O_RDWR | os.O_CREAT, 0o600))
+        db = sqlite3.connect(self.db_path, timeout=self.lease_seconds, isolation_level=None,
+                             check_same_thread=False)
+        db.executescript(_SCHEMA)
+        return db
+
+    def _transaction(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        with self._db_lock:
+            # Closed by stop(); reopened when the poller is used again
+            if self._db is None:
+                self._db = self._connect()
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(self._db)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            return result
+
+    def _enqueue(self, agent_id: str, memory: Dict[str, Any]) -> None:
+        """Queue a fired trigger for a worker subscribed to its agent."""
+        def work(db: sqlite3.Connection) -> None:
+            db.execute(
+                "INSERT INTO fired (agent_id, worker, memory, created_at) "
+                "VALUES (?, (SELECT MIN(worker) FROM subscriptions WHERE agent_id = ?), ?, ?)",
+                (agent_id, agent_id, json.dumps(memory), time.time())
+            )
+            self._stats["enqueued"] += 1
+        self._transaction(work)
+
+    # Membership
+
+    def subscribe(self, agent_id: str) -> None:
+        """
+        Serve an agent from this worker: its triggers are polled by whichever
+        worker leads its shard and delivered here.
+
+        Args:
+            agent_id: Unique identifier for the agent
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        def work(db: sqlite3.Connection) -> None:
+            self._heartbeat(db, time.time())
+            db.execute(
+                "INSERT OR IGNORE INTO subscriptions (agent_id, worker, shard) VALUES (?, ?, ?)",
+                (agent_id, self.worker_id, shard_of(agent_id, self.num_shards))
+            )
+        self._transaction(work)
+        self._subscribed.add(agent_id)
+
+    def unsubscribe(self, agent_id: str) -> None:
+        """Stop serving an agent from this worker."""
+        self._transaction(lambda db: db.execute(
+            "DELETE FROM subscriptions WHERE agent_id = ? AND worker = ?", (agent_id, self.worker_id)
+        ))
+        self._subscribed.discard(agent_id)
+
+    def add_handler(self, handler: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Register a callable receiving (agent_id, memory) per triggered memory."""
+        self._handlers.append(handler)
+
+    def hint(self, agent_id: str, trigger_at: TimeLike) -> None:
+        """
+        Tell the worker polling an agent that a memory triggers at trigger_at.
+
+        Agents polled here are hinted directly; otherwise the hint is queued
+        for the worker leading the agent's shard, which picks it up on its
+        next tick.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            trigger_at: When the memory triggers
+        """
+        if agent_id in self.poller.stats()["intervals"]:
+            self.poller.hint(agent_id, trigger_at)
+            return
+        moment = parse_time(trigger_at).timestamp()
+        self._transaction(lambda db: db.execute(
+            "INSERT INTO hints (agent_id, trigger_at) VALUES (?, ?) "
+            "ON CONFLICT(agent_id) DO UPDATE SET trigger_at = MIN(trigger_at, excluded.trigger_at)",
+            (agent_id, moment)
+        ))
+
+    # Coordination
+
+    def _heartbeat(self, db: sqlite3.Connection, now: float) -> None:
+        db.execute(
+            "INSERT INTO workers (worker, heartbeat) VALUES (?, ?) "
+            "ON CONFLICT(worker) DO UPDATE SET heartbeat = excluded.heartbeat",
+            (self.worker_id, now)
+        )
+
+    def _round(self, db: sqlite3.Connection) -> Dict[str, Any]:
+        now = time.time()
+        expires_at = now + self.lease_seconds
+        self._heartbeat(db, now)
+
+        # Forget dead workers and readdress their undelivered triggers
+        db.execute("DELETE FROM workers WHERE heartbeat < ?", (now - self.lease_seconds,))
+        db.execute("DELETE FROM subscriptions WHERE worker NOT IN (SELECT worker FROM workers)")
+        db.execute(
+            "UPDATE fired SET worker = (SELECT MIN(worker) FROM subscriptions s "
+            "WHERE s.agent_id = fired.agent_id) "
+            "WHERE worker IS NULL OR worker NOT IN (SELECT worker FROM workers)"
+        )
+        db.execute("DELETE FROM fired WHERE worker IS NULL AND created_at < ?", (now - self.fired_ttl,))
+
+        # Lease an even share of the shards that have subscribers
+        live = db.execute("SELECT COUNT(*) FROM workers").fetchone()[0]
+        active = [row[0] for row in db.execute("SELECT DISTINCT shard FROM subscriptions ORDER BY shard")]
+        share = math.ceil(len(active) / live) if active else 0
+        owned = [row[0] for row in db.execute(
+            "SELECT shard FROM leases WHERE owner = ? AND expires_at >= ? ORDER BY shard",
+            (self.worker_id, now)
+        )]
+        owned = [shard for shard in owned if shard in active]
+        release = owned[share:]
+        owned = owned[:share]
+        for shard in release:
+            db.execute("DELETE FROM leases WHERE shard = ? AND owner = ?", (shard, self.worker_id))
+        for shard in active:
+            if len(owned) >= share:
+                break
+            if shard in owned:
+                continue
+            cursor = db.execute(
+                "INSERT INTO leases (shard, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(shard) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE leases.expires_at < ?",
+                (shard, self.worker_id, expires_at, now)
+            )
+            if cursor.rowcount:
+                owned.append(shard)
+        if owned:
+            db.execute(
+                f"UPDATE leases SET expires_at = ? WHERE owner = ? AND shard IN ({','.join('?' * len(owned))})",
+                (expires_at, self.worker_id, *owned)
+            )
+
+        agents = [row[0] for row in db.execute(
+            f"SELECT DISTINCT agent_id FROM subscriptions WHERE shard IN ({','.join('?' * len(owned))})",
+            owned
+        )] if owned else []
+
+        # Take hints for the agents polled here; drop ones nobody picked up
+        hints = db.execute(
+            f"SELECT agent_id, trigger_at FROM hints WHERE agent_id IN ({','.join('?' * len(agents))})",
+            agents
+        ).fetchall() if agents else []
+        if hints:
+            db.execute(f"DELETE FROM hints WHERE agent_id IN ({','.join('?' * len(hints))})",
+                       [row[0] for row in hints])
+        db.execute("DELETE FROM hints WHERE trigger_at < ?", (now - self.fired_ttl,))
+
+        # Take this worker's deliveries
+        rows = db.execute(
+            "SELECT id, agent_id, memory FROM fired WHERE worker = ? ORDER BY id", (self.worker_id,)
+        ).fetchall()
+        if rows:
+            db.execute(f"DELETE FROM fired WHERE id IN ({','.join('?' * len(rows))})",
+                       [row[0] for row in rows])
+        return {"owned": set(owned), "agents": agents, "hints": hints, "deliveries": rows}
+
+    def tick(self) -> List[Dict[str, Any]]:
+        """
+        Run one coordination round: heartbeat, rebalance and renew leases,
+        update the agents polled here, and deliver this worker's fired triggers.
+
+        Returns:
+            Fired memories delivered to this worker's handlers
+        """
+        result = self._transaction(self._round)
+        self._owned = result["owned"]
+
+        polled = set(self.poller.stats()["intervals"])
+        for agent_id in polled - set(result["agents"]):
+            self.poller.remove_agent(agent_id)
+        for agent_id in set(result["agents"]) - polled:
+            self.poller.add_agent(agent_id)
+        for agent_id, trigger_at in result["hints"]:
+            self.poller.hint(agent_id, datetime.fromtimestamp(trigger_at, timezone.utc))
+
+        delivered = []
+        for _, agent_id, memory in result["deliveries"]:
+            memory = json.loads(memory)
+            delivered.append(memory)
+            for handler in list(self._handlers):
+                try:
+                    handler(agent_id, memory)
+                except Exception as e:
+                    self._stats["errors"] += 1
+                    if self.on_error is not None:
+                        self.on_error(agent_id, e)
+        self._stats["ticks"] += 1
+        self._stats["delivered"] += len(delivered)
+        return delivered
+
+    @property
+    def owned_shards(self) -> Set[int]:
+        """Shards this worker currently leads."""
+        return set(self._owned)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.tick_seconds):
+            try:
+                self.tick()
+            except Exception as e:
+                # e.g. another worker held the database too long; retry next tick
+                self._stats["errors"] += 1
+                if self.on_error is not None:
+                    self.on_error("", e)
+
+    def start(self) -> "CoordinatedTriggerPoller":
+        """Start coordinating and polling in the background; rejoins after stop()."""
+        if self._thread is None:
+            self._stop.clear()
+
+            def work(db: sqlite3.Connection) -> None:
+                self._heartbeat(db, time.time())
+                db.executemany(
+                    "INSERT OR IGNORE INTO subscriptions (agent_id, worker, shard) VALUES (?, ?, ?)",
+                    [(agent_id, self.worker_id, shard_of(agent_id, self.num_shards))
+                     for agent_id in self._subscribed]
+                )
+            self._transaction(work)
+            self.tick()
+            self.poller.start()
+            self._thread = threading.Thread(target=self._run, name="recallbricks-coordination",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop, hand this worker's shards to the others and leave the pool."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.poller.stop()
+
+        def work(db: sqlite3.Connection) -> None:
+            db.execute("DELETE FROM leases WHERE owner = ?", (self.worker_id,))
+            db.execute("DELETE FROM subscriptions WHERE worker = ?", (self.worker_id,))
+            db.execute("DELETE FROM workers WHERE worker = ?", (self.worker_id,))
+        self._transaction(work)
+        self._owned = set()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coordination statistics.
+
+        Returns:
+            Dict with coordination rounds, triggers queued for other workers,
+            triggers delivered here, handler or coordination errors, shards led
+            and agents subscribed here
+        """
+        stats: Dict[str, Any] = dict(self._stats)
+        stats["owned_shards"] = len(self._owned)
+        stats["subscribed"] = len(self._subscribed)
+        return stats
+
+    def __enter__(self) -> "CoordinatedTriggerPoller":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,200 @@
+"""
+RecallBricks Result Diversification
+Maximal marginal relevance (MMR) selection of non-redundant memories
+
+Requires NumPy (pip install recallbricks[analytics]).
+"""
+
+import re
+import zlib
+from typing import Any, Callable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+# Mersenne prime used for the MinHash permutations
+_PRIME = (1 << 61) - 1
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for diversification. "
+            "Install it with: pip install recallbricks[analytics]"
+        )
+
+
+def _shingles(text: str, size: int) -> List[int]:
+    """Hash the word n-grams of a text to 32-bit integers."""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < size:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+    return [zlib.crc32(gram.encode('utf-8')) for gram in grams]
+
+
+def text_signatures(texts: Sequence[str], num_hashes: int = 64, shingle_size: int = 2, seed: int = 1) -> Any:
+    """
+    Compute MinHash signatures of word shingles.
+
+    The fraction of equal positions in two signatures estimates the Jaccard
+    similarity of the texts' shingle sets.
+
+    Args:
+        texts: Texts to sign
+        num_hashes: Signature length (default: 64)
+        shingle_size: Words per shingle (default: 2)
+        seed: Seed for the hash permutations (default: 1)
+
+    Returns:
+        (len(texts), num_hashes) uint64 array
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    # Multipliers below 2**29 keep a * h + b under 2**63 for 32-bit shingle hashes
+    a = rng.integers(1, 1 << 29, size=num_hashes, dtype=np.uint64)
+    b = rng.integers(0, _PRIME, size=num_hashes, dtype=np.uint64)
+
+    signatures = np.full((len(texts), num_hashes), np.iinfo(np.uint64).max, dtype=np.uint64)
+    for row, text in enumerate(texts):
+        hashes = np.array(_shingles(text or "", shingle_size), dtype=np.uint64)
+        if len(hashes):
+            permuted = (hashes[:, np.newaxis] * a + b) % np.uint64(_PRIME)
+            signatures[row] = permuted.min(axis=0)
+    return signatures
+
+
+def signature_similarity(signatures: Any) -> Any:
+    """
+    Pairwise estimated Jaccard similarity between MinHash signatures.
+
+    Args:
+        signatures: (n, num_hashes) array from text_signatures()
+
+    Returns:
+        (n, n) float64 array
+    """
+    _require_numpy()
+    signatures = np.asarray(signatures)
+    return (signatures[:, np.newaxis, :] == signatures[np.newaxis, :, :]).mean(axis=2)
+
+
+def cosine_similarity(embeddings: Any) -> Any:
+    """
+    Pairwise cosine similarity between embedding vectors.
+
+    Args:
+        embeddings: (n, dim) array-like
+
+    Returns:
+        (n, n) float64 array
+    """
+    _require_numpy()
+    vectors = np.asarray(embeddings, dtype=np.float64)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors / np.where(norms == 0, 1.0, norms)
+    return vectors @ vectors.T
+
+
+def mmr_select(relevance: Sequence[float], similarity: Any, k: int, diversity: float = 0.5) -> List[int]:
+    """
+    Greedily select k items by maximal marginal relevance.
+
+    Each step picks the item maximizing
+    (1 - diversity) * relevance - diversity * max similarity to the items
+    already selected.
+
+    Args:
+        relevance: Relevance score of each item
+        similarity: (n, n) pairwise similarity matrix
+        k: Number of items to select
+        diversity: Trade-off between relevance (0.0) and novelty (1.0) (default: 0.5)
+
+    Returns:
+        Indices of the selected items, in selection order
+    """
+    _require_numpy()
+    if not 0.0 <= diversity <= 1.0:
+        raise ValueError("diversity must be between 0.0 and 1.0")
+
+    relevance = np.asarray(relevance, dtype=np.float64)
+    similarity = np.asarray(similarity, dtype=np.float64)
+    n = len(relevance)
+    if similarity.shape != (n, n):
+        raise ValueError("similarity must be an (n, n) matrix")
+
+    selected: List[int] = []
+    available = np.ones(n, dtype=bool)
+    max_similarity = np.zeros(n, dtype=np.float64)
+    for _ in range(min(k, n)):
+        marginal = (1.0 - diversity) * relevance - diversity * max_similarity
+        marginal[~available] = -np.inf
+        best = int(np.argmax(marginal))
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_similarity, similarity[best], out=max_similarity)
+    return selected
+
+
+def diversify(
+    items: Sequence[Any],
+    k: int,
+    diversity: float = 0.5,
+    embeddings: Optional[Any] = None,
+    embed: Optional[Callable[[List[str]], Any]] = None,
+    score_key: str = 'score',
+    text_key: str = 'text'
+) -> List[Any]:
+    """
+    Pick a diverse top-k from over-fetched results.
+
+    Similarity comes from, in order of preference: the embeddings argument,
+    the embed callable applied to the item texts, an "embedding" field present
+    on every item, or MinHash signatures of the item texts.
+
+    Args:
+        items: Result dicts or objects (e.g. recall() memories or WeightedSearchResult)
+        k: Number of items to keep
+        diversity: Trade-off between relevance (0.0) and novelty (1.0) (default: 0.5)
+        embeddings: (len(items), dim) embedding matrix (optional)
+        embed: Callable mapping a list of texts to embeddings (optional)
+        score_key: Field holding the relevance score (default: "score")
+        text_key: Field holding the text (default: "text")
+
+    Returns:
+        Selected items, in selection order
+
+    Example:
+        >>> results = rb.search_weighted("deploy steps", limit=40)
+        >>> top = diversify(results, k=10, score_key="relevance_score")
+    """
+    _require_numpy()
+    items = list(items)
+    if not items or k <= 0:
+        return []
+
+    def field(item: Any, name: str) -> Any:
+        return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+    texts = [field(item, text_key) or "" for item in items]
+    if embeddings is None and embed is not None:
+        embeddings = embed(texts)
+    if embeddings is None:
+        stored = [field(item, 'embedding') for item in items]
+        if all(vector is not None for vector in stored):
+            embeddings = stored
+
+    if embeddings is not None:
+        similarity = cosine_similarity(embeddings)
+        if similarity.shape[0] != len(items):
+            raise ValueError("embeddings must have one row per item")
+    else:
+        similarity = signature_similarity(text_signatures(texts))
+
+    relevance = [float(field(item, score_key) or 0.0) for item in items]
+    return [items[i] for i in mmr_select(relevance, similarity, k, diversity)]
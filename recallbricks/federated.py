@@ -0,0 +1,107 @@
+"""
+RecallBricks Federated Search
+Fans a query out across agents or projects and merges the ranked results
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .batch import DEFAULT_MAX_WORKERS, ensure_pool_capacity, run_concurrently
+
+
+def _score(item: Any) -> float:
+    if isinstance(item, dict):
+        score = item.get('score', item.get('relevance_score'))
+    else:
+        score = getattr(item, 'score', getattr(item, 'relevance_score', None))
+    return float(score or 0.0)
+
+
+def kway_merge(rankings: Dict[str, Sequence[Any]], limit: int) -> List[Dict[str, Any]]:
+    """
+    Merge per-scope ranked lists into one list ordered by score.
+
+    Each list must already be ordered best first, as the API returns them.
+    Only the heads of the lists sit on the heap, so merging costs
+    O(limit * log(scopes)) regardless of how many results each scope returned.
+    Ties keep scope order.
+
+    Args:
+        rankings: Mapping of scope to its ranked results
+        limit: Maximum number of merged results
+
+    Returns:
+        List of {"scope": ..., "score": ..., "memory": item}, best first
+    """
+    heap = []
+    for order, (scope, items) in enumerate(rankings.items()):
+        if items:
+            heap.append((-_score(items[0]), order, 0, scope))
+    heapq.heapify(heap)
+
+    merged: List[Dict[str, Any]] = []
+    while heap and len(merged) < limit:
+        negative_score, order, position, scope = heapq.heappop(heap)
+        items = rankings[scope]
+        merged.append({"scope": scope, "score": -negative_score, "memory": items[position]})
+        if position + 1 < len(items):
+            heapq.heappush(heap, (-_score(items[position + 1]), order, position + 1, scope))
+    return merged
+
+
+def federate(
+    search: Any,
+    scopes: List[str],
+    scope_param: str,
+    items_key: str,
+    limit: int,
+    call_kwargs: Optional[Dict[str, Any]] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    session: Any = None
+) -> Dict[str, Any]:
+    """
+    Run one search per scope concurrently and k-way merge the results.
+
+    Args:
+        search: Search method to call (e.g. SearchClient.semantic)
+        scopes: Scope values, one call each
+        scope_param: Name of the keyword argument receiving the scope
+        items_key: Response key holding the ranked items
+        limit: Number of merged results returned
+        call_kwargs: Other arguments passed to every call (optional)
+        max_workers: Maximum number of searches in flight (default: 8)
+        session: Session whose pool should fit max_workers (optional)
+
+    Returns:
+        {
+            "results": [{"scope": ..., "score": ..., "memory": {...}}],
+            "scopes": {scope: number of results it returned},
+            "errors": {scope: exception}
+        }
+    """
+    if not isinstance(scopes, list):
+        raise TypeError(f"scopes must be a list, got {type(scopes).__name__}")
+    scopes = list(dict.fromkeys(scopes))
+
+    if session is not None:
+        ensure_pool_capacity(session, min(max_workers, max(len(scopes), 1)))
+    responses = run_concurrently(
+        search,
+        [dict(call_kwargs or {}, **{scope_param: scope}) for scope in scopes],
+        max_workers=max_workers
+    )
+
+    rankings: Dict[str, List[Any]] = {}
+    errors: Dict[str, Exception] = {}
+    for scope, response in zip(scopes, responses):
+        if isinstance(response, Exception):
+            errors[scope] = response
+        else:
+            items: Union[List[Any], Any] = (response or {}).get(items_key) or []
+            rankings[scope] = items if isinstance(items, list) else []
+
+    return {
+        "results": kway_merge(rankings, limit),
+        "scopes": {scope: len(items) for scope, items in rankings.items()},
+        "errors": errors
+    }
@@ -0,0 +1,281 @@
+"""
+RecallBricks Search Fusion
+Runs several search modes in parallel and merges their rankings
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .batch import ensure_pool_capacity
+
+
+SEARCH_MODES = ("semantic", "hybrid", "filtered", "recall", "search_weighted")
+
+# Rank offset of reciprocal-rank fusion; 60 is the usual choice
+RRF_K = 60
+
+
+def _field(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _item_key(item: Any) -> Any:
+    """Identify a result across modes: by id, falling back to its text."""
+    item_id = _field(item, 'id') or _field(item, 'memory_id')
+    if item_id:
+        return item_id
+    return ('text', _field(item, 'text') or _field(item, 'content'))
+
+
+def _item_score(item: Any) -> float:
+    score = _field(item, 'score')
+    if score is None:
+        score = _field(item, 'relevance_score')
+    return float(score or 0.0)
+
+
+def ranked_items(response: Any) -> List[Any]:
+    """
+    Extract the ranked result list from any search mode's response.
+
+    Args:
+        response: search_weighted() list, or a response dict holding
+                 "results" or "memories"
+
+    Returns:
+        Result items, best first
+    """
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        for key in ('results', 'memories'):
+            if isinstance(response.get(key), list):
+                return response[key]
+    return []
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, Sequence[Any]],
+    weights: Optional[Dict[str, float]] = None,
+    k: int = RRF_K
+) -> List[Dict[str, Any]]:
+    """
+    Merge ranked lists by reciprocal-rank fusion.
+
+    A result scores sum(weight / (k + rank)) over the lists it appears in,
+    so agreement between modes matters more than any single raw score.
+
+    Args:
+        rankings: Mapping of mode name to its ranked results
+        weights: Weight per mode (default: 1.0)
+        k: Rank offset (default: 60)
+
+    Returns:
+        Fused results, best first (see fused_search() for the entry format)
+    """
+    weights = weights or {}
+
+    def contribution(mode: str, rank: int, item: Any) -> float:
+        return weights.get(mode, 1.0) / (k + rank)
+
+    return _fuse(rankings, contribution)
+
+
+def score_fusion(
+    rankings: Dict[str, Sequence[Any]],
+    weights: Optional[Dict[str, float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Merge ranked lists by a weighted sum of min-max normalized scores.
+
+    Args:
+        rankings: Mapping of mode name to its ranked results
+        weights: Weight per mode (default: 1.0)
+
+    Returns:
+        Fused results, best first (see fused_search() for the entry format)
+    """
+    weights = weights or {}
+    bounds: Dict[str, Tuple[float, float]] = {}
+    for mode, items in rankings.items():
+        scores = [_item_score(item) for item in items]
+        if scores:
+            bounds[mode] = (min(scores), max(scores))
+
+    def contribution(mode: str, rank: int, item: Any) -> float:
+        low, high = bounds[mode]
+        normalized = (_item_score(item) - low) / (high - low) if high > low else 1.0
+        return weights.get(mode, 1.0) * normalized
+
+    return _fuse(rankings, contribution)
+
+
+def _fuse(
+    rankings: Dict[str, Sequence[Any]],
+    contribution: Callable[[str, int, Any], float]
+) -> List[Dict[str, Any]]:
+    fused: Dict[Any, Dict[str, Any]] = {}
+    for mode, items in rankings.items():
+        for rank, item in enumerate(items, start=1):
+            key = _item_key(item)
+            entry = fused.get(key)
+            if entry is None:
+                entry = fused[key] = {
+                    "id": key if isinstance(key, str) else None,
+                    "fused_score": 0.0,
+                    "ranks": {},
+                    "scores": {},
+                    "memory": item
+                }
+            elif mode in entry["ranks"]:
+                continue
+            entry["fused_score"] += contribution(mode, rank, item)
+            entry["ranks"][mode] = rank
+            entry["scores"][mode] = _item_score(item)
+    return sorted(fused.values(), key=lambda entry: entry["fused_score"], reverse=True)
+
+
+def fused_search(
+    query: str,
+    search_client: Any = None,
+    agent_id: Optional[str] = None,
+    client: Any = None,
+    modes: Optional[Sequence[str]] = None,
+    limit: int = 10,
+    method: str = "rrf",
+    weights: Optional[Dict[str, float]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    rrf_k: int = RRF_K
+) -> Dict[str, Any]:
+    """
+    Run several search modes concurrently and fuse their rankings.
+
+    semantic, hybrid and filtered run on a SearchClient for agent_id; recall
+    and search_weighted run on a RecallBricks client. When timeout elapses,
+    the modes that have answered are fused and the rest are reported as
+    pending.
+
+    Args:
+        query: Search query
+        search_client: SearchClient for semantic/hybrid/filtered (optional)
+        agent_id: Agent to search with search_client
+        client: RecallBricks client for recall/search_weighted (optional)
+        modes: Modes to run (default: every mode the given clients support;
+              filtered only when filters are given)
+        limit: Results requested from each mode and returned (default: 10)
+        method: "rrf" (reciprocal-rank fusion) or "score" (weighted sum of
+               normalized scores) (default: "rrf")
+        weights: Weight per mode (default: 1.0)
+        filters: Filters for the filtered mode (optional)
+        timeout: Seconds to wait before fusing whatever has arrived
+                (default: wait for every mode)
+        rrf_k: Rank offset for reciprocal-rank fusion (default: 60)
+
+    Returns:
+        {
+            "results": [
+                {
+                    "id": "mem_123",
+                    "fused_score": 0.032,
+                    "ranks": {"semantic": 1, "recall": 2},
+                    "scores": {"semantic": 0.91, "recall": 0.88},
+                    "memory": {...}      # item from the first mode that returned it
+                }
+            ],
+            "completed": ["semantic", "recall"],
+            "pending": [],               # modes still running at the deadline
+            "errors": {}                 # mode -> exception
+        }
+
+    Raises:
+        ValueError: If a mode is unknown or its client is missing
+
+    Example:
+        >>> from recallbricks.fusion import fused_search
+        >>> fused = fused_search(
+        ...     "deploy checklist",
+        ...     search_client=search, agent_id="agent_123",
+        ...     client=rb,
+        ...     modes=["semantic", "hybrid", "recall"],
+        ...     timeout=1.5
+        ... )
+        >>> for hit in fused["results"]:
+        ...     print(hit["id"], hit["ranks"])
+    """
+    if not query:
+        raise ValueError("query is required")
+    if method not in ("rrf", "score"):
+        raise ValueError("method must be 'rrf' or 'score'")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive")
+
+    agent_modes = ("semantic", "hybrid", "filtered")
+    if modes is None:
+        modes = []
+        if search_client is not None:
+            modes += ["semantic", "hybrid"] + (["filtered"] if filters else [])
+        if client is not None:
+            modes += ["recall", "search_weighted"]
+    modes = list(dict.fromkeys(modes))
+    if not modes:
+        raise ValueError("at least one mode is required")
+
+    calls: Dict[str, Callable[[], Any]] = {}
+    for mode in modes:
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown mode '{mode}'. Expected one of: {', '.join(SEARCH_MODES)}")
+        if mode in agent_modes and (search_client is None or not agent_id):
+            raise ValueError(f"mode '{mode}' requires search_client and agent_id")
+        if mode not in agent_modes and client is None:
+            raise ValueError(f"mode '{mode}' requires client")
+
+    if "semantic" in modes:
+        calls["semantic"] = lambda: search_client.semantic(agent_id, query, limit=limit)
+    if "hybrid" in modes:
+        calls["hybrid"] = lambda: search_client.hybrid(agent_id, query, limit=limit)
+    if "filtered" in modes:
+        calls["filtered"] = lambda: search_client.filtered(
+            agent_id, query=query, filters=filters, limit=limit
+        )
+    if "recall" in modes:
+        calls["recall"] = lambda: client.recall(query, limit=limit)
+    if "search_weighted" in modes:
+        calls["search_weighted"] = lambda: client.search_weighted(query, limit=min(limit, 100))
+
+    for owner in (search_client, client):
+        if owner is not None:
+            ensure_pool_capacity(owner.session, len(calls))
+
+    executor = ThreadPoolExecutor(max_workers=len(calls))
+    try:
+        futures = {executor.submit(call): mode for mode, call in calls.items()}
+        done, not_done = wait(futures, timeout=timeout)
+    finally:
+        # Stragglers keep running in the background; their results are ignored
+        executor.shutdown(wait=False)
+
+    rankings: Dict[str, List[Any]] = {}
+    errors: Dict[str, Exception] = {}
+    for future, mode in futures.items():
+        if future not in done:
+            future.cancel()
+            continue
+        error = future.exception()
+        if error is not None:
+            errors[mode] = error
+        else:
+            rankings[mode] = ranked_items(future.result())
+
+    ordered = {mode: rankings[mode] for mode in modes if mode in rankings}
+    if method == "rrf":
+        results = reciprocal_rank_fusion(ordered, weights, k=rrf_k)
+    else:
+        results = score_fusion(ordered, weights)
+
+    return {
+        "results": results[:limit],
+        "completed": list(ordered),
+        "pending": [mode for mode in modes if mode not in ordered and mode not in errors],
+        "errors": errors
+    }
@@ -0,0 +1,484 @@
+"""
+RecallBricks Goal Tree
+Local goal-hierarchy index with progress roll-up and coalesced updates
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Statuses whose goals no longer count towards their parent's progress
+EXCLUDED_STATUSES = ("cancelled",)
+
+
+def _unwrap(response: Any) -> Dict[str, Any]:
+    """Return the root goal of a hierarchy response."""
+    if isinstance(response, dict) and 'id' not in response:
+        for key in ('hierarchy', 'goal'):
+            if isinstance(response.get(key), dict):
+                return response[key]
+    return response
+
+
+class GoalTree:
+    """
+    Local index of GoalsClient goal hierarchies.
+
+    Each tree is downloaded once with get_hierarchy() (or list()) and then
+    kept current from the results of update_progress(), complete(),
+    cancel() and add_subgoal() made through the index, so reading a tree
+    again needs no request. Parent progress is rolled up locally as the
+    mean progress of non-cancelled subgoals (completed goals count as
+    100), and after a change only the goal's ancestors are recomputed.
+
+    Progress updates are applied locally at once and sent after
+    coalesce_seconds; further updates of the same goal within that window
+    replace the pending value, so a burst becomes one PUT.
+
+    Usage:
+        >>> from recallbricks.autonomous import GoalsClient
+        >>> client = GoalsClient(api_key="rb_dev_xxx")
+        >>> with client.goal_tree(coalesce_seconds=1.0) as goals:
+        ...     tree = goals.get_hierarchy("goal_123")      # API call
+        ...     for pct in (10, 20, 30):
+        ...         goals.update_progress("goal_456", pct)  # one PUT, later
+        ...     goals.progress("goal_123")                  # rolled up locally
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        coalesce_seconds: float = 0.5,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            client: GoalsClient used for requests
+            coalesce_seconds: Seconds progress updates of a goal are held
+                              and merged before sending (default: 0.5)
+            on_error: Called with (goal_id, exception) when a held progress
+                      update fails to send (optional)
+        """
+        if coalesce_seconds < 0:
+            raise ValueError("coalesce_seconds must not be negative")
+
+        self.client = client
+        self.coalesce_seconds = coalesce_seconds
+        self.on_error = on_error
+        # goal id -> goal fields, without subgoals
+        self._goals: Dict[str, Dict[str, Any]] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._parent: Dict[str, Optional[str]] = {}
+        self._rollup: Dict[str, float] = {}
+        # goal id -> (due, progress, notes)
+        self._pending: Dict[str, Tuple[float, float, Optional[str]]] = {}
+        self._sending = 0
+        # goal id -> progress PUTs in flight
+        self._in_flight: Dict[str, int] = {}
+        # goal id -> bumped by complete()/cancel(); older PUT responses are ignored
+        self._generation: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"loads": 0, "local_reads": 0, "updates": 0, "puts": 0,
+                       "coalesced": 0, "errors": 0}
+
+    # Index maintenance (lock held)
+
+    def _index(self, goal: Dict[str, Any], parent_id: Optional[str]) -> None:
+        """Add a goal and its nested subgoals, replacing what was indexed."""
+        goal_id = goal['id']
+        fields = {k: v for k, v in goal.items() if k != 'subgoals'}
+        if parent_id is None:
+            parent_id = fields.get('parent_goal_id') or self._parent.get(goal_id)
+        self._goals[goal_id] = fields
+        self._parent[goal_id] = parent_id
+        if parent_id is not None and parent_id in self._goals:
+            siblings = self._children.setdefault(parent_id, [])
+            if goal_id not in siblings:
+                siblings.append(goal_id)
+        if 'subgoals' in goal:
+            self._children[goal_id] = []
+            for sub in goal.get('subgoals') or []:
+                self._index(sub, goal_id)
+        else:
+            self._children.setdefault(goal_id, [])
+
+    def _compute(self, goal_id: str) -> float:
+        goal = self._goals[goal_id]
+        if goal.get('status') == 'completed':
+            return 100.0
+        values = [
+            self._rollup[child] for child in self._children.get(goal_id, ())
+            if self._goals[child].get('status') not in EXCLUDED_STATUSES
+        ]
+        if not values:
+            return float(goal.get('progress') or 0)
+        return sum(values) / len(values)
+
+    def _rollup_all(self, goal_id: str) -> None:
+        for child in self._children.get(goal_id, ()):
+            self._rollup_all(child)
+        self._rollup[goal_id] = self._compute(goal_id)
+
+    def _rollup_up(self, goal_id: Optional[str]) -> None:
+        while goal_id is not None and goal_id in self._goals:
+            self._rollup[goal_id] = self._compute(goal_id)
+            goal_id = self._parent.get(goal_id)
+
+    def _apply(self, goal_id: str, changes: Dict[str, Any], response: Any = None) -> None:
+        goal = self._goals.get(goal_id)
+        if goal is None:
+            return
+        goal.update(changes)
+        if isinstance(response, dict) and response.get('id') == goal_id:
+            goal.update({k: v for k, v in response.items() if k != 'subgoals'})
+        self._rollup_up(goal_id)
+
+    def _tree(self, goal_id: str) -> Dict[str, Any]:
+        node = dict(self._goals[goal_id])
+        node['rollup_progress'] = self._rollup[goal_id]
+        node['subgoals'] = [self._tree(child) for child in self._children.get(goal_id, ())]
+        return node
+
+    # Loading and reading
+
+    def load(self, goal_id: str) -> Dict[str, Any]:
+        """
+        Download a goal's hierarchy and index it, replacing any indexed copy.
+
+        Args:
+            goal_id: ID of the root goal
+
+        Returns:
+            Goal tree with subgoals and rollup_progress on every goal
+        """
+        if not goal_id:
+            raise ValueError("goal_id is required")
+
+        root = _unwrap(self.client.get_hierarchy(goal_id))
+        with self._cond:
+            self._stats["loads"] += 1
+            self._index(root, None)
+            self._rollup_all(root['id'])
+            self._rollup_up(self._parent.get(root['id']))
+            return self._tree(root['id'])
+
+    def load_agent(self, agent_id: str, status: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Download an agent's goals with their subgoals and index them.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            status: Filter by status (active, completed, cancelled)
+            limit: Maximum number of goals (default: 20)
+
+        Returns:
+            Indexed top-level goal trees
+        """
+        response = self.client.list(agent_id, status=status, include_subgoals=True, limit=limit)
+        goals = (response or {}).get('goals') or []
+        with self._cond:
+            self._stats["loads"] += 1
+            for goal in goals:
+                self._index(goal, None)
+            for goal in goals:
+                self._rollup_all(goal['id'])
+            roots = [g['id'] for g in goals if self._parent.get(g['id']) not in self._goals]
+            return [self._tree(goal_id) for goal_id in roots]
+
+    def get_hierarchy(self, goal_id: str) -> Dict[str, Any]:
+        """
+        Get a goal tree, from the index when the goal is loaded.
+
+        Args:
+            goal_id: ID of the root goal
+
+        Returns:
+            Goal tree with subgoals and rollup_progress on every goal
+        """
+        with self._cond:
+            if goal_id in self._goals:
+                self._stats["local_reads"] += 1
+                return self._tree(goal_id)
+        return self.load(goal_id)
+
+    def get(self, goal_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an indexed goal without its subgoals.
+
+        Args:
+            goal_id: ID of the goal
+
+        Returns:
+            Goal with rollup_progress, or None if not indexed
+        """
+        with self._cond:
+            goal = self._goals.get(goal_id)
+            if goal is None:
+                return None
+            self._stats["local_reads"] += 1
+            return dict(goal, rollup_progress=self._rollup[goal_id])
+
+    def progress(self, goal_id: str) -> float:
+        """
+        Get a goal's rolled-up progress.
+
+        Args:
+            goal_id: ID of an indexed goal
+
+        Returns:
+            Progress 0-100 from its subgoals, or its own progress if it has none
+        """
+        with self._cond:
+            if goal_id not in self._rollup:
+                raise KeyError(goal_id)
+            return self._rollup[goal_id]
+
+    # Changes
+
+    def update_progress(self, goal_id: str, progress: float, notes: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Update goal progress locally and send it after coalesce_seconds.
+
+        Args:
+            goal_id: ID of the goal
+            progress: Progress percentage 0-100
+            notes: Progress notes (optional; the latest notes are sent)
+
+        Returns:
+            The indexed goal after the update
+        """
+        if not goal_id:
+            raise ValueError("goal_id is required")
+
+        progress = max(0, min(100, progress))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("GoalTree is closed")
+            self._stats["updates"] += 1
+            self._apply(goal_id, {"progress": progress})
+            held = self._pending.get(goal_id)
+            if held is not None:
+                self._stats["coalesced"] += 1
+                due = held[0]
+                if notes is None:
+                    notes = held[2]
+            else:
+                due = time.monotonic() + self.coalesce_seconds
+            self._pending[goal_id] = (due, progress, notes)
+            self._ensure_thread()
+            self._cond.notify_all()
+            goal = self._goals.get(goal_id)
+            return dict(goal, rollup_progress=self._rollup[goal_id]) if goal else {"id": goal_id}
+
+    def complete(self, goal_id: str, outcome: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Mark a goal as completed, dropping any held progress update.
+
+        A progress PUT already in flight for the goal is waited for first, so
+        it cannot reach the server, or overwrite the index, after completion.
+
+        Args:
+            goal_id: ID of the goal
+            outcome: Outcome description (optional)
+
+        Returns:
+            Dict containing updated goal
+        """
+        self._fence(goal_id)
+        response = self.client.complete(goal_id, outcome=outcome)
+        with self._cond:
+            self._apply(goal_id, {"status": "completed", "progress": 100}, response)
+        return response
+
+    def cancel(self, goal_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Cancel a goal, dropping any held progress update and waiting for
+        one in flight.
+
+        Args:
+            goal_id: ID of the goal
+            reason: Cancellation reason (optional)
+
+        Returns:
+            Dict containing updated goal
+        """
+        self._fence(goal_id)
+        response = self.client.cancel(goal_id, reason=reason)
+        with self._cond:
+            self._apply(goal_id, {"status": "cancelled"}, response)
+        return response
+
+    def _fence(self, goal_id: str) -> None:
+        """Drop a goal's held update and wait out its PUT in flight."""
+        with self._cond:
+            self._pending.pop(goal_id, None)
+            self._generation[goal_id] = self._generation.get(goal_id, 0) + 1
+            self._cond.wait_for(lambda: not self._in_flight.get(goal_id))
+
+    def add_subgoal(self, parent_goal_id: str, title: str, description: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Add a subgoal and index it under its parent.
+
+        When the parent is indexed its agent_id (or an ancestor's) is known,
+        so the subgoal is created directly without first fetching the parent.
+
+        Args:
+            parent_goal_id: ID of the parent goal
+            title: Subgoal title
+            description: Subgoal description (optional)
+
+        Returns:
+            Dict containing created subgoal
+        """
+        with self._cond:
+            agent_id = None
+            goal_id: Optional[str] = parent_goal_id
+            while agent_id is None and goal_id in self._goals:
+                agent_id = self._goals[goal_id].get('agent_id')
+                goal_id = self._parent.get(goal_id)
+        if agent_id:
+            response = self.client.create(agent_id, title, description=description,
+                                          parent_goal_id=parent_goal_id)
+        else:
+            response = self.client.add_subgoal(parent_goal_id, title, description=description)
+
+        with self._cond:
+            if parent_goal_id in self._goals and isinstance(response, dict) and response.get('id'):
+                goal = dict(response)
+                goal.setdefault('title', title)
+                goal.setdefault('progress', 0)
+                goal.setdefault('status', 'active')
+                goal.setdefault('parent_goal_id', parent_goal_id)
+                self._index(goal, parent_goal_id)
+                self._rollup[goal['id']] = self._compute(goal['id'])
+                self._rollup_up(parent_goal_id)
+        return response
+
+    def invalidate(self, goal_id: Optional[str] = None) -> None:
+        """
+        Forget indexed goals so the next read downloads them again.
+
+        Args:
+            goal_id: Goal whose tree (with its subgoals) to forget
+                     (default: everything)
+        """
+        with self._cond:
+            if goal_id is None:
+                for index in (self._goals, self._children, self._parent, self._rollup):
+                    index.clear()
+                return
+            stack = [goal_id]
+            parent_id = self._parent.get(goal_id)
+            while stack:
+                current = stack.pop()
+                stack.extend(self._children.pop(current, ()))
+                for index in (self._goals, self._parent, self._rollup):
+                    index.pop(current, None)
+            if parent_id in self._children and goal_id in self._children[parent_id]:
+                self._children[parent_id].remove(goal_id)
+                self._rollup_up(parent_id)
+
+    # Sending held progress updates
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="recallbricks-goals", daemon=True)
+            self._thread.start()
+
+    def _take_due(self, force: bool) -> List[Tuple[str, float, Optional[str], int]]:
+        now = time.monotonic()
+        due = [(goal_id, progress, notes, self._generation.get(goal_id, 0))
+               for goal_id, (at, progress, notes) in self._pending.items() if force or at <= now]
+        for goal_id, _, _, _ in due:
+            del self._pending[goal_id]
+            self._in_flight[goal_id] = self._in_flight.get(goal_id, 0) + 1
+        self._sending += len(due)
+        return due
+
+    def _sent(self, goal_id: str) -> None:
+        """Mark a goal's PUT as finished (lock held)."""
+        self._sending -= 1
+        self._in_flight[goal_id] -= 1
+        if not self._in_flight[goal_id]:
+            del self._in_flight[goal_id]
+        self._cond.notify_all()
+
+    def _send(self, updates: List[Tuple[str, float, Optional[str], int]]) -> None:
+        for goal_id, progress, notes, generation in updates:
+            try:
+                response = self.client.update_progress(goal_id, progress, notes=notes)
+            except Exception as e:
+                with self._cond:
+                    self._stats["errors"] += 1
+                    self._sent(goal_id)
+                if self.on_error is not None:
+                    self.on_error(goal_id, e)
+                continue
+            with self._cond:
+                self._stats["puts"] += 1
+                if goal_id not in self._pending and self._generation.get(goal_id, 0) == generation:
+                    self._apply(goal_id, {}, response)
+                self._sent(goal_id)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                updates = self._take_due(self._closed)
+                while not updates:
+                    if self._closed and not self._pending:
+                        return
+                    wait = min((at for at, _, _ in self._pending.values()), default=None)
+                    self._cond.wait(None if wait is None else max(0.0, wait - time.monotonic()))
+                    updates = self._take_due(self._closed)
+            self._send(updates)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Send held progress updates now and wait for them.
+
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            True if everything was sent, False on timeout
+        """
+        with self._cond:
+            self._pending = {goal_id: (0.0, progress, notes)
+                             for goal_id, (_, progress, notes) in self._pending.items()}
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._pending and not self._sending, timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict with trees downloaded, reads served locally, progress
+            updates made, PUTs sent, updates merged into a held PUT, failed
+            sends, goals indexed and updates still held
+        """
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["goals"] = len(self._goals)
+            stats["pending"] = len(self._pending)
+            return stats
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send held progress updates and stop the sender."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self) -> "GoalTree":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
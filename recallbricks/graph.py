@@ -0,0 +1,416 @@
+"""
+RecallBricks Relationship Graph Cache
+Local store of memory relationships answering multi-hop queries without
+re-asking the server to traverse
+"""
+
+import threading
+import time
+from array import array
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .batch import DEFAULT_MAX_WORKERS, ensure_pool_capacity, run_concurrently
+
+
+class MemoryGraph:
+    """
+    Client-side cache of the memory relationship graph.
+
+    Edges learned from get_relationships() and get_graph_context() responses
+    are kept in compressed sparse row (CSR) adjacency arrays. Neighborhood and
+    shortest-path queries run locally; only frontier nodes whose relationships
+    are unknown or expired are fetched from the API, in parallel.
+
+    Traversal ignores edge direction, matching how get_graph_context() expands
+    a memory's neighborhood.
+
+    Usage:
+        >>> from recallbricks import RecallBricks
+        >>> from recallbricks.graph import MemoryGraph
+        >>> rb = RecallBricks(api_key="rb_dev_xxx")
+        >>> graph = MemoryGraph(rb, ttl_seconds=600)
+        >>>
+        >>> # Fetches only what is missing, then answers locally
+        >>> hops = graph.k_hop("mem_123", k=2)
+        >>> path = graph.shortest_path("mem_123", "mem_456")
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        ttl_seconds: float = 300.0,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ):
+        """
+        Initialize the graph store.
+
+        Args:
+            client: RecallBricks client used to fetch missing nodes (optional;
+                   without it the graph only answers from ingested data)
+            ttl_seconds: Lifetime of learned edges in seconds (default: 300)
+            max_workers: Maximum concurrent relationship fetches (default: 8)
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+
+        self._lock = threading.RLock()
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        # (source index, target index) -> (relationship type, expires at)
+        self._edges: Dict[Tuple[int, int], Tuple[Optional[str], float]] = {}
+        # node index -> time until which its full relationship list is known
+        self._expanded: Dict[int, float] = {}
+        self._indptr = array('l', [0])
+        self._indices = array('l')
+        self._dirty = False
+
+        if client is not None:
+            ensure_pool_capacity(client.session, max_workers)
+
+    # Ingestion
+
+    def _node_index(self, memory_id: str) -> int:
+        index = self._index.get(memory_id)
+        if index is None:
+            index = len(self._ids)
+            self._ids.append(memory_id)
+            self._index[memory_id] = index
+        return index
+
+    def add_edge(
+        self,
+        source_id: str,
+        target_id: str,
+        relationship_type: Optional[str] = None,
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Add or refresh a single relationship edge.
+
+        Args:
+            source_id: ID of the source memory
+            target_id: ID of the target memory
+            relationship_type: Relationship type, e.g. "related_to" (optional)
+            ttl_seconds: Edge lifetime, overriding the graph default (optional)
+        """
+        if not source_id or not target_id:
+            raise ValueError("source_id and target_id are required")
+
+        expires_at = time.monotonic() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            key = (self._node_index(source_id), self._node_index(target_id))
+            if key not in self._edges:
+                self._dirty = True
+            self._edges[key] = (relationship_type, expires_at)
+
+    def add_relationships(self, memory_id: str, response: Dict[str, Any]) -> None:
+        """
+        Ingest a get_relationships() response.
+
+        The memory's relationship list is treated as complete until the TTL
+        expires, so it will not be fetched again before then.
+
+        Args:
+            memory_id: Memory the relationships were requested for
+            response: Response dict from get_relationships()
+        """
+        relationships = response.get('relationships') or []
+        with self._lock:
+            index = self._node_index(memory_id)
+            for rel in relationships:
+                if not isinstance(rel, dict):
+                    continue
+                source = rel.get('source_id') or rel.get('from') or memory_id
+                target = rel.get('target_id') or rel.get('to')
+                if target:
+                    self.add_edge(source, target, rel.get('type'))
+            self._expanded[index] = time.monotonic() + self.ttl_seconds
+
+    def add_graph_context(self, memory_id: str, response: Dict[str, Any], depth: int = 2) -> None:
+        """
+        Ingest a get_graph_context() response.
+
+        Nodes closer to the root than the requested depth had all their
+        relationships returned and are marked as fully known.
+
+        Args:
+            memory_id: Memory the graph context was requested for
+            response: Response dict from get_graph_context()
+            depth: Depth passed to get_graph_context() (default: 2)
+        """
+        nodes = response.get('nodes') or []
+        edges = response.get('edges') or []
+        with self._lock:
+            for node in nodes:
+                if isinstance(node, dict) and node.get('id'):
+                    self._node_index(node['id'])
+                    self._nodes[node['id']] = node
+
+            adjacency: Dict[str, List[str]] = {}
+            for edge in edges:
+                if not isinstance(edge, dict):
+                    continue
+                source = edge.get('from') or edge.get('source_id')
+                target = edge.get('to') or edge.get('target_id')
+                if source and target:
+                    self.add_edge(source, target, edge.get('type'))
+                    adjacency.setdefault(source, []).append(target)
+                    adjacency.setdefault(target, []).append(source)
+
+            if memory_id and depth > 0:
+                expires_at = time.monotonic() + self.ttl_seconds
+                distances = {memory_id: 0}
+                queue = deque([memory_id])
+                while queue:
+                    current = queue.popleft()
+                    if distances[current] >= depth:
+                        continue
+                    self._expanded[self._node_index(current)] = expires_at
+                    for neighbor in adjacency.get(current, ()):
+                        if neighbor not in distances:
+                            distances[neighbor] = distances[current] + 1
+                            queue.append(neighbor)
+
+    # Maintenance
+
+    def expire(self) -> int:
+        """
+        Drop expired edges and expansion markers.
+
+        Returns:
+            Number of edges removed
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._edges.items() if expires_at <= now]
+            for key in expired:
+                del self._edges[key]
+            for index in [i for i, expires_at in self._expanded.items() if expires_at <= now]:
+                del self._expanded[index]
+            if expired:
+                self._dirty = True
+            return len(expired)
+
+    def clear(self) -> None:
+        """Remove everything from the graph."""
+        with self._lock:
+            self._ids.clear()
+            self._index.clear()
+            self._nodes.clear()
+            self._edges.clear()
+            self._expanded.clear()
+            self._indptr = array('l', [0])
+            self._indices = array('l')
+            self._dirty = False
+
+    def _build_csr(self, pairs: Iterable[Tuple[int, int]]) -> Tuple[array, array]:
+        ordered = sorted(set(pairs))
+        indptr = array('l', [0]) * (len(self._ids) + 1)
+        for source, _ in ordered:
+            indptr[source + 1] += 1
+        for i in range(len(self._ids)):
+            indptr[i + 1] += indptr[i]
+        indices = array('l', (target for _, target in ordered))
+        return indptr, indices
+
+    def _refresh(self) -> None:
+        """Purge expired edges and rebuild the undirected CSR arrays if needed."""
+        self.expire()
+        if self._dirty or len(self._indptr) != len(self._ids) + 1:
+            pairs = []
+            for source, target in self._edges:
+                pairs.append((source, target))
+                pairs.append((target, source))
+            self._indptr, self._indices = self._build_csr(pairs)
+            self._dirty = False
+
+    def to_csr(self, directed: bool = True) -> Tuple[List[str], array, array]:
+        """
+        Export the live edges as CSR adjacency arrays.
+
+        Args:
+            directed: Keep edge direction; otherwise every edge appears both
+                     ways (default: True)
+
+        Returns:
+            Tuple of (memory ids by node index, indptr, indices)
+        """
+        with self._lock:
+            self._refresh()
+            if directed:
+                indptr, indices = self._build_csr(self._edges.keys())
+            else:
+                indptr, indices = array('l', self._indptr), array('l', self._indices)
+            return list(self._ids), indptr, indices
+
+    # Queries
+
+    @property
+    def node_count(self) -> int:
+        """Number of memories seen by the graph."""
+        return len(self._ids)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of live relationship edges."""
+        with self._lock:
+            self.expire()
+            return len(self._edges)
+
+    def node(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """Return the node payload from get_graph_context(), if one was seen."""
+        return self._nodes.get(memory_id)
+
+    def relationship_type(self, source_id: str, target_id: str) -> Optional[str]:
+        """Return the type of the edge source -> target, if it is known."""
+        with self._lock:
+            source = self._index.get(source_id)
+            target = self._index.get(target_id)
+            edge = self._edges.get((source, target))
+            return edge[0] if edge else None
+
+    def _neighbor_indices(self, index: int) -> array:
+        return self._indices[self._indptr[index]:self._indptr[index + 1]]
+
+    def neighbors(self, memory_id: str, fetch_missing: bool = True) -> List[str]:
+        """
+        Get the memories directly related to a memory.
+
+        Args:
+            memory_id: ID of the memory
+            fetch_missing: Fetch the memory's relationships if unknown (default: True)
+
+        Returns:
+            List of related memory IDs
+        """
+        hops = self.k_hop(memory_id, k=1, fetch_missing=fetch_missing)
+        return [other for other, distance in hops.items() if distance == 1]
+
+    def _is_expanded(self, index: int, now: float) -> bool:
+        expires_at = self._expanded.get(index)
+        return expires_at is not None and expires_at > now
+
+    def _fetch_frontier(self, indices: Iterable[int]) -> None:
+        """Fetch relationships for unexpanded nodes in parallel."""
+        if self.client is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            missing = [self._ids[i] for i in indices if not self._is_expanded(i, now)]
+        if not missing:
+            return
+
+        results = run_concurrently(
+            self.client.get_relationships,
+            [{"memory_id": memory_id} for memory_id in missing],
+            max_workers=self.max_workers
+        )
+        for memory_id, result in zip(missing, results):
+            if not isinstance(result, Exception):
+                self.add_relationships(memory_id, result)
+
+    def k_hop(
+        self,
+        memory_id: str,
+        k: int = 2,
+        fetch_missing: bool = True
+    ) -> Dict[str, int]:
+        """
+        Get every memory within k hops of a memory.
+
+        Args:
+            memory_id: ID of the starting memory
+            k: Maximum number of hops (default: 2)
+            fetch_missing: Fetch relationships of frontier nodes that are not
+                          known locally (default: True)
+
+        Returns:
+            Dict mapping memory ID to hop distance, including the start at 0
+        """
+        if not memory_id:
+            raise ValueError("memory_id cannot be None or empty")
+        if k < 0:
+            raise ValueError(f"k must be non-negative, got {k}")
+
+        with self._lock:
+            start = self._node_index(memory_id)
+        distances = {start: 0}
+        frontier = [start]
+
+        for hop in range(1, k + 1):
+            if fetch_missing:
+                self._fetch_frontier(frontier)
+            with self._lock:
+                self._refresh()
+                next_frontier = []
+                for index in frontier:
+                    for neighbor in self._neighbor_indices(index):
+                        if neighbor not in distances:
+                            distances[neighbor] = hop
+                            next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return {self._ids[index]: distance for index, distance in distances.items()}
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_depth: int = 6,
+        fetch_missing: bool = True
+    ) -> Optional[List[str]]:
+        """
+        Find a shortest relationship path between two memories.
+
+        Args:
+            source_id: ID of the starting memory
+            target_id: ID of the destination memory
+            max_depth: Maximum path length in hops (default: 6)
+            fetch_missing: Fetch relationships of frontier nodes that are not
+                          known locally (default: True)
+
+        Returns:
+            List of memory IDs from source to target, or None if no path
+            exists within max_depth
+        """
+        if not source_id or not target_id:
+            raise ValueError("source_id and target_id are required")
+        if source_id == target_id:
+            return [source_id]
+
+        with self._lock:
+            start = self._node_index(source_id)
+            goal = self._node_index(target_id)
+        parents = {start: -1}
+        frontier = [start]
+
+        for _ in range(max_depth):
+            if fetch_missing:
+                self._fetch_frontier(frontier)
+            with self._lock:
+                self._refresh()
+                next_frontier = []
+                for index in frontier:
+                    for neighbor in self._neighbor_indices(index):
+                        if neighbor in parents:
+                            continue
+                        parents[neighbor] = index
+                        if neighbor == goal:
+                            path = [neighbor]
+                            while parents[path[-1]] != -1:
+                                path.append(parents[path[-1]])
+                            return [self._ids[i] for i in reversed(path)]
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return None
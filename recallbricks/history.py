@@ -0,0 +1,327 @@
+"""
+RecallBricks History Writer
+Buffered, ordered session-history writes with a local tail for reads
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import requests
+
+from .batch import DEFAULT_MAX_WORKERS, ensure_pool_capacity
+from .temporal import format_time
+
+
+class _Session:
+    """Buffered entries and recent history of one session."""
+
+    __slots__ = ('buffer', 'first_buffered', 'recent', 'sending', 'failures')
+
+    def __init__(self, ring_size: int):
+        self.buffer: List[Dict[str, Any]] = []
+        self.first_buffered = 0.0
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=ring_size)
+        self.sending = False
+        self.failures = 0
+
+
+class HistoryWriter:
+    """
+    Buffered writer for ContextClient session history.
+
+    append() returns immediately; entries are buffered per session and
+    sent when max_batch entries are waiting, when the oldest has waited
+    flush_interval seconds, or at end_turn(). Each session's entries are
+    sent in append order, one batch at a time, while different sessions are
+    sent concurrently. With bulk=True a batch is one
+    add_history_entries() request; otherwise its entries are posted one by
+    one with add_to_history() over the shared keep-alive session.
+
+    The last ring_size entries of each session are kept in memory, so
+    get_history() for recent entries needs no request.
+
+    Usage:
+        >>> from recallbricks.autonomous import ContextClient
+        >>> client = ContextClient(api_key="rb_dev_xxx")
+        >>> with client.history_writer(max_batch=25) as history:
+        ...     history.append("sess_123", {"action": "tool_call", "tool": "search"})
+        ...     history.append("sess_123", {"action": "tool_result", "hits": 4})
+        ...     history.end_turn("sess_123")              # send this turn's entries
+        ...     recent = history.get_history("sess_123", limit=10)   # no API call
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_batch: int = 20,
+        flush_interval: float = 1.0,
+        ring_size: int = 200,
+        bulk: bool = False,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = 3,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            client: ContextClient used to send and read history
+            max_batch: Buffered entries per session that trigger a send (default: 20)
+            flush_interval: Seconds an entry may wait before it is sent (default: 1.0)
+            ring_size: Recent entries kept in memory per session (default: 200)
+            bulk: Send each batch in one request with add_history_entries()
+                  (default: False)
+            max_workers: Sessions sent concurrently (default: 8)
+            max_retries: Failed sends of a batch before it is dropped (default: 3)
+            on_error: Called with (session_id, exception) when a send fails (optional)
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if ring_size < 1:
+            raise ValueError("ring_size must be at least 1")
+
+        self.client = client
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.ring_size = ring_size
+        self.bulk = bulk
+        self.max_retries = max_retries
+        self.on_error = on_error
+        self._sessions: Dict[str, _Session] = {}
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._timer: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {"appended": 0, "sent": 0, "requests": 0, "local_reads": 0,
+                       "errors": 0, "dropped": 0}
+
+        if isinstance(getattr(client, "session", None), requests.Session):
+            ensure_pool_capacity(client.session, max_workers)
+
+    def _session(self, session_id: str) -> _Session:
+        state = self._sessions.get(session_id)
+        if state is None:
+            state = self._sessions[session_id] = _Session(self.ring_size)
+        return state
+
+    # Writing
+
+    def append(self, session_id: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Buffer a history entry.
+
+        Args:
+            session_id: ID of the session
+            entry: History entry to add; a timestamp is added if missing
+
+        Returns:
+            The entry as it will be sent
+        """
+        if not session_id:
+            raise ValueError("session_id is required")
+        if not entry:
+            raise ValueError("entry is required")
+
+        entry = dict(entry)
+        entry.setdefault("timestamp", format_time(datetime.now(timezone.utc)))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("HistoryWriter is closed")
+            state = self._session(session_id)
+            if not state.buffer:
+                state.first_buffered = time.monotonic()
+            state.buffer.append(entry)
+            state.recent.append(entry)
+            self._stats["appended"] += 1
+            if len(state.buffer) >= self.max_batch:
+                self._start(session_id, state)
+            self._ensure_timer()
+        return dict(entry)
+
+    def end_turn(self, session_id: Optional[str] = None) -> None:
+        """
+        Send buffered entries now, without waiting for them.
+
+        Args:
+            session_id: Only send this session's entries (default: all sessions)
+        """
+        with self._cond:
+            targets = [session_id] if session_id else list(self._sessions)
+            for target in targets:
+                state = self._sessions.get(target)
+                if state is not None and state.buffer:
+                    self._start(target, state)
+
+    def flush(self, session_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Send buffered entries and wait until they are sent (or dropped).
+
+        Args:
+            session_id: Only flush this session (default: all sessions)
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            True if everything was sent, False on timeout
+        """
+        self.end_turn(session_id)
+
+        def idle() -> bool:
+            targets = [session_id] if session_id else list(self._sessions)
+            return all(
+                not state.buffer and not state.sending
+                for state in (self._sessions.get(target) for target in targets) if state is not None
+            )
+
+        with self._cond:
+            return self._cond.wait_for(idle, timeout)
+
+    def _start(self, session_id: str, state: _Session) -> None:
+        """Start sending a session's buffer unless a send is in flight (lock held)."""
+        if not state.sending:
+            state.sending = True
+            self._executor.submit(self._drain, session_id, state)
+
+    def _send(self, session_id: str, batch: List[Dict[str, Any]]) -> Tuple[int, Optional[Exception]]:
+        """Send a batch in order; returns how many entries went through and any error."""
+        sent, calls = 0, 0
+        try:
+            if self.bulk:
+                calls += 1
+                self.client.add_history_entries(session_id, batch)
+                sent = len(batch)
+            else:
+                for entry in batch:
+                    calls += 1
+                    self.client.add_to_history(session_id, entry)
+                    sent += 1
+        except Exception as e:
+            return sent, e
+        finally:
+            with self._cond:
+                self._stats["requests"] += calls
+                self._stats["sent"] += sent
+        return sent, None
+
+    def _drain(self, session_id: str, state: _Session) -> None:
+        while True:
+            with self._cond:
+                batch = state.buffer[:self.max_batch]
+                if not batch:
+                    state.sending = False
+                    self._cond.notify_all()
+                    return
+                del state.buffer[:len(batch)]
+
+            sent, error = self._send(session_id, batch)
+
+            with self._cond:
+                if error is None:
+                    state.failures = 0
+                    continue
+                self._stats["errors"] += 1
+                state.failures += 1
+                unsent = batch[sent:]
+                if state.failures > self.max_retries:
+                    self._stats["dropped"] += len(unsent)
+                    state.failures = 0
+                else:
+                    # Put the rest back in front and retry on the next interval
+                    state.buffer[:0] = unsent
+                    state.first_buffered = time.monotonic()
+                state.sending = False
+                self._cond.notify_all()
+            if self.on_error is not None:
+                self.on_error(session_id, error)
+            return
+
+    def _ensure_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run_timer, name="recallbricks-history",
+                                           daemon=True)
+            self._timer.start()
+
+    def _run_timer(self) -> None:
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                wait = self.flush_interval
+                for session_id, state in self._sessions.items():
+                    if not state.buffer or state.sending:
+                        continue
+                    age = now - state.first_buffered
+                    if age >= self.flush_interval:
+                        self._start(session_id, state)
+                    else:
+                        wait = min(wait, self.flush_interval - age)
+                self._cond.wait(wait)
+
+    # Reading
+
+    def get_history(self, session_id: str, limit: int = 50) -> Dict[str, Any]:
+        """
+        Get the latest history entries, from memory when enough are held.
+
+        Recent entries are those appended through this writer or loaded by
+        an earlier call; if fewer than limit are held, buffered entries are
+        flushed and the history is fetched from the API.
+
+        Args:
+            session_id: ID of the session
+            limit: Maximum number of entries (default: 50)
+
+        Returns:
+            Dict containing history entries, oldest first, and count
+        """
+        if not session_id:
+            raise ValueError("session_id is required")
+
+        with self._cond:
+            state = self._sessions.get(session_id)
+            if state is not None and len(state.recent) >= limit:
+                self._stats["local_reads"] += 1
+                entries = list(state.recent)[-limit:] if limit > 0 else []
+                return {"entries": [dict(entry) for entry in entries], "count": len(entries)}
+
+        self.flush(session_id)
+        response = self.client.get_history(session_id, limit=limit)
+        entries = (response or {}).get('entries') or []
+        with self._cond:
+            state = self._session(session_id)
+            if not state.buffer:
+                state.recent.clear()
+                state.recent.extend(dict(entry) for entry in entries)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dict with entries appended, entries sent, requests made, history
+            reads served locally, failed sends, dropped entries and entries
+            still buffered
+        """
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["buffered"] = sum(len(state.buffer) for state in self._sessions.values())
+            return stats
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush buffered entries and stop the writer."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
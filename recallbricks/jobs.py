@@ -0,0 +1,249 @@
+"""
+RecallBricks Jobs
+Background execution and result caching for slow, LLM-backed endpoints
+"""
+
+import json
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .cache import TTLCache
+
+
+_MISSING = object()
+
+
+def _owner_key(func: Callable[..., Any]) -> Hashable:
+    """
+    Identify the object a method is bound to.
+
+    A weak reference is used rather than id(): once the client is freed its
+    entries can no longer match, even if a new client reuses the address.
+    """
+    owner = getattr(func, "__self__", None)
+    if owner is None:
+        return None
+    try:
+        return weakref.ref(owner)
+    except TypeError:  # not weak-referenceable; keep it alive instead
+        return owner
+
+
+def _job_key(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+    """Cache key for a call: the method, the client it is bound to, and its arguments."""
+    arguments = json.dumps([args, kwargs], sort_keys=True, default=str)
+    return (getattr(func, "__qualname__", repr(func)), _owner_key(func), arguments)
+
+
+class JobRunner:
+    """
+    Bounded background executor for slow API calls.
+
+    submit() runs a call on one of max_workers threads and returns a
+    concurrent.futures.Future at once. Jobs can take a completion callback
+    and a timeout, after which the future fails with TimeoutError, and can
+    be cancelled with future.cancel() until they finish; a cancelled or
+    timed-out call that already started still completes in the background,
+    but its result is discarded.
+
+    Successful results are cached for cache_ttl seconds keyed by the
+    method, its client and its arguments, so resubmitting the same call
+    returns a completed future without a request; an identical call still
+    in flight is shared rather than started twice (so cancelling it cancels
+    it for every caller). Pass use_cache=False for calls with side effects;
+    the clients' consolidate *_async methods do so by default.
+
+    Usage:
+        >>> from recallbricks.autonomous import GoalsClient, MetacognitionClient
+        >>> from recallbricks.jobs import JobRunner
+        >>> runner = JobRunner(max_workers=4, cache_ttl=600)
+        >>> goals = GoalsClient(api_key="rb_dev_xxx")
+        >>> goals.job_runner = runner
+        >>> future = goals.suggest_next_steps_async("goal_123", timeout=30)
+        >>> ...                                    # keep working
+        >>> steps = future.result()
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        cache_ttl: float = 300.0,
+        cache_size: int = 256,
+        default_timeout: Optional[float] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Jobs run at once; others wait in line (default: 4)
+            cache_ttl: Seconds a result is reused for the same call (default: 300)
+            cache_size: Results kept in the cache (default: 256)
+            default_timeout: Seconds before a job fails with TimeoutError
+                             when submit() is given none (default: no limit)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self.cache = TTLCache(max_size=cache_size, ttl_seconds=cache_ttl)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recallbricks-job")
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "cache_hits": 0, "shared": 0, "completed": 0,
+                       "failed": 0, "cancelled": 0, "timed_out": 0}
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        callback: Optional[Callable[[Future], None]] = None,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        **kwargs: Any
+    ) -> Future:
+        """
+        Run func(*args, **kwargs) in the background.
+
+        Args:
+            func: Client method (or any callable) to run
+            *args: Positional arguments for func
+            callback: Called with the future once it is done (optional)
+            timeout: Seconds before the job fails with TimeoutError
+                     (default: default_timeout)
+            use_cache: Reuse a cached or in-flight result of the same call
+                       (default: True)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Future resolving to func's result
+        """
+        key = _job_key(func, args, kwargs) if use_cache else None
+        with self._lock:
+            self._stats["submitted"] += 1
+            if key is not None:
+                cached = self.cache.get(key, _MISSING)
+                if cached is not _MISSING:
+                    self._stats["cache_hits"] += 1
+                    future: Future = Future()
+                    future.set_result(cached)
+                    return self._with_callback(future, callback)
+                shared = self._in_flight.get(key)
+                if shared is not None:
+                    self._stats["shared"] += 1
+                    return self._with_callback(shared, callback)
+
+            # The caller's future stays pending until the call finishes, so
+            # cancel() succeeds at any point before that.
+            future = Future()
+            task = self._executor.submit(func, *args, **kwargs)
+            if key is not None:
+                self._in_flight[key] = future
+
+        timeout = self.default_timeout if timeout is None else timeout
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, self._expire, (future, task))
+            timer.daemon = True
+            timer.start()
+
+        def finish(task: Future) -> None:
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                if key is not None and self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+                if task.cancelled() or future.done():
+                    return
+                error = task.exception()
+                if error is None:
+                    self._stats["completed"] += 1
+                    if key is not None:
+                        self.cache.set(key, task.result())
+                else:
+                    self._stats["failed"] += 1
+            # Resolve outside the lock; done callbacks run here
+            try:
+                if error is None:
+                    future.set_result(task.result())
+                else:
+                    future.set_exception(error)
+            except Exception:  # cancelled or expired meanwhile
+                pass
+
+        def cancelled(outer: Future) -> None:
+            if outer.cancelled():
+                task.cancel()
+                with self._lock:
+                    self._stats["cancelled"] += 1
+                    if self._in_flight.get(key) is future:
+                        del self._in_flight[key]
+
+        future.add_done_callback(cancelled)
+        task.add_done_callback(finish)
+        return self._with_callback(future, callback)
+
+    @staticmethod
+    def _with_callback(future: Future, callback: Optional[Callable[[Future], None]]) -> Future:
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    def _expire(self, future: Future, task: Future) -> None:
+        task.cancel()
+        try:
+            future.set_exception(TimeoutError("job timed out"))
+        except Exception:  # finished meanwhile
+            return
+        with self._lock:
+            self._stats["timed_out"] += 1
+            for key, shared in list(self._in_flight.items()):
+                if shared is future:
+                    del self._in_flight[key]
+
+    def invalidate(self, func: Optional[Callable[..., Any]] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            func: Only drop results of this method on its client (default: all)
+        """
+        if func is None:
+            self.cache.clear()
+            return
+        name = getattr(func, "__qualname__", repr(func))
+        owner = _owner_key(func)
+        for key in self.cache.keys():
+            if key[0] == name and key[1] == owner:
+                self.cache.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get runner statistics.
+
+        Returns:
+            Dict with jobs submitted, answered from cache, shared with an
+            identical running job, completed, failed, cancelled, timed out
+            and currently running
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["in_flight"] = len(self._in_flight)
+            return stats
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting jobs; queued jobs still run.
+
+        Args:
+            wait: Wait for running jobs to finish (default: True)
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "JobRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
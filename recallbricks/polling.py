@@ -0,0 +1,331 @@
+"""
+RecallBricks Trigger Polling
+Adaptive, concurrent check_triggers() polling across many agents
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from .batch import DEFAULT_MAX_WORKERS, ensure_pool_capacity
+from .temporal import TimeLike, parse_time
+
+
+class _AgentState:
+    """Polling schedule of one agent."""
+
+    __slots__ = ('interval', 'due', 'next_trigger', 'checking', 'checks', 'fired')
+
+    def __init__(self, interval: float, due: float):
+        self.interval = interval
+        self.due = due
+        # Earliest known trigger_at, as a time.time() value
+        self.next_trigger: Optional[float] = None
+        self.checking = False
+        self.checks = 0
+        self.fired = 0
+
+
+class TriggerPoller:
+    """
+    Polls check_triggers() for many agents, each on its own adaptive interval.
+
+    An agent whose check fires something is checked again after
+    base_interval; each check that fires nothing doubles (backoff) its
+    interval up to max_interval. An agent with a known upcoming trigger_at
+    (from hint(), or `next_trigger_at` in the check response) is checked
+    at that time instead, but never more often than min_interval. Intervals
+    are jittered and first checks spread over base_interval so agents do
+    not poll in lockstep, and at most max_workers checks run at once.
+
+    Handlers receive (agent_id, memory) for each triggered memory and run on
+    the worker that made the check.
+
+    Usage:
+        >>> from recallbricks.autonomous import ProspectiveMemoryClient
+        >>> client = ProspectiveMemoryClient(api_key="rb_dev_xxx")
+        >>> poller = client.poll_triggers(agent_ids, handlers=[on_trigger])
+        >>> poller.add_agent("agent_new")
+        >>> poller.stop()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        agent_ids: Iterable[str] = (),
+        handlers: Iterable[Callable[[str, Dict[str, Any]], None]] = (),
+        base_interval: float = 30.0,
+        min_interval: float = 1.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        jitter: float = 0.1,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        session: Optional[requests.Session] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            client: ProspectiveMemoryClient used for check_triggers()
+            agent_ids: Agents to poll (more can be added with add_agent())
+            handlers: Callables receiving (agent_id, memory) per triggered memory
+            base_interval: Interval for active agents, in seconds (default: 30)
+            min_interval: Shortest interval for any agent (default: 1)
+            max_interval: Longest interval for idle agents (default: 600)
+            backoff: Interval multiplier after a check that fires nothing (default: 2.0)
+            jitter: Random spread applied to each interval, as a fraction (default: 0.1)
+            max_workers: Maximum concurrent checks (default: 8)
+            session: Session whose connection pool is sized for max_workers (optional)
+            on_error: Called with (agent_id, exception) when a check or handler fails
+        """
+        if not 0 < min_interval <= base_interval <= max_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= base_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.client = client
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.on_error = on_error
+        self._handlers = list(handlers)
+        self._agents: Dict[str, _AgentState] = {}
+        # (due, sequence, agent_id); stale entries are skipped when popped
+        self._queue: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        # Created per start(), so the poller can be restarted after stop()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._random = random.Random()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._stats = {"checks": 0, "fired": 0, "errors": 0}
+
+        if session is not None:
+            ensure_pool_capacity(session, max_workers)
+        for agent_id in agent_ids:
+            self.add_agent(agent_id)
+
+    # Scheduling (lock held)
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1 + self._random.uniform(-self.jitter, self.jitter))
+
+    def _schedule(self, agent_id: str, state: _AgentState, delay: float) -> None:
+        if state.next_trigger is not None:
+            until_trigger = state.next_trigger - time.time()
+            delay = min(delay, max(until_trigger, self.min_interval))
+        state.due = time.monotonic() + max(delay, 0.0)
+        heapq.heappush(self._queue, (state.due, next(self._sequence), agent_id))
+        self._cond.notify()
+
+    # Agents
+
+    def add_agent(self, agent_id: str, next_trigger_at: Optional[TimeLike] = None) -> None:
+        """
+        Start polling an agent; its first check is spread over base_interval.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            next_trigger_at: Earliest known trigger_at for the agent (optional)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        with self._cond:
+            if agent_id in self._agents:
+                return
+            state = self._agents[agent_id] = _AgentState(self.base_interval, 0.0)
+            if next_trigger_at is not None:
+                state.next_trigger = parse_time(next_trigger_at).timestamp()
+            self._schedule(agent_id, state, self._random.uniform(0, self.base_interval))
+
+    def remove_agent(self, agent_id: str) -> None:
+        """Stop polling an agent."""
+        with self._cond:
+            self._agents.pop(agent_id, None)
+
+    def hint(self, agent_id: str, trigger_at: TimeLike) -> None:
+        """
+        Tell the poller an agent has a memory triggering at trigger_at.
+
+        The agent is checked at trigger_at if that is sooner than its next
+        scheduled check.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            trigger_at: When the memory triggers
+        """
+        moment = parse_time(trigger_at).timestamp()
+        with self._cond:
+            state = self._agents.get(agent_id)
+            if state is None:
+                return
+            if state.next_trigger is None or moment < state.next_trigger:
+                state.next_trigger = moment
+            if not state.checking:
+                remaining = state.due - time.monotonic()
+                if moment - time.time() < remaining:
+                    self._schedule(agent_id, state, remaining)
+
+    def add_handler(self, handler: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Register a callable receiving (agent_id, memory) per triggered memory."""
+        with self._cond:
+            self._handlers.append(handler)
+
+    # Checks
+
+    def _error(self, agent_id: str, error: Exception) -> None:
+        with self._cond:
+            self._stats["errors"] += 1
+        if self.on_error is not None:
+            self.on_error(agent_id, error)
+
+    def check(self, agent_id: str) -> List[Dict[str, Any]]:
+        """
+        Check one agent now, dispatch what fired, and reschedule it.
+
+        Args:
+            agent_id: Unique identifier for the agent
+
+        Returns:
+            Triggered memories
+        """
+        try:
+            response = self.client.check_triggers(agent_id)
+        except Exception as e:
+            response = None
+            self._error(agent_id, e)
+        triggered = (response or {}).get('triggered') or []
+
+        with self._cond:
+            handlers = list(self._handlers)
+            state = self._agents.get(agent_id)
+            self._stats["checks"] += 1
+            self._stats["fired"] += len(triggered)
+            if state is not None:
+                state.checking = False
+                state.checks += 1
+                state.fired += len(triggered)
+                now = time.time()
+                if state.next_trigger is not None and state.next_trigger <= now:
+                    state.next_trigger = None
+                upcoming = (response or {}).get('next_trigger_at')
+                if upcoming:
+                    state.next_trigger = parse_time(upcoming).timestamp()
+                if triggered:
+                    state.interval = self.base_interval
+                else:
+                    state.interval = min(state.interval * self.backoff, self.max_interval)
+                self._schedule(agent_id, state, self._jittered(state.interval))
+
+        for memory in triggered:
+            for handler in handlers:
+                try:
+                    handler(agent_id, memory)
+                except Exception as e:
+                    self._error(agent_id, e)
+        return triggered
+
+    def _run_check(self, agent_id: str, slots: threading.Semaphore) -> None:
+        try:
+            self.check(agent_id)
+        finally:
+            slots.release()
+
+    def _run(self, executor: ThreadPoolExecutor, slots: threading.Semaphore) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    if self._queue:
+                        due, _, agent_id = self._queue[0]
+                        state = self._agents.get(agent_id)
+                        if state is None or state.due != due or state.checking:
+                            heapq.heappop(self._queue)
+                            continue
+                        wait = due - time.monotonic()
+                        if wait <= 0:
+                            heapq.heappop(self._queue)
+                            state.checking = True
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+            # Block here while max_workers checks are in flight
+            slots.acquire()
+            try:
+                executor.submit(self._run_check, agent_id, slots)
+            except RuntimeError as e:
+                # The executor was shut down under us (e.g. at interpreter exit)
+                slots.release()
+                with self._cond:
+                    state = self._agents.get(agent_id)
+                    if state is not None:
+                        state.checking = False
+                        self._schedule(agent_id, state, 0.0)
+                    if self._thread is threading.current_thread():
+                        self._thread = None
+                    if self._executor is executor:
+                        self._executor = None
+                self._error(agent_id, e)
+                return
+
+    def start(self) -> "TriggerPoller":
+        """Start polling in the background; a stopped poller can be started again."""
+        with self._cond:
+            if self._thread is None:
+                self._stopped = False
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                slots = threading.Semaphore(self.max_workers)
+                self._thread = threading.Thread(target=self._run, args=(self._executor, slots),
+                                                name="recallbricks-trigger-poller", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop polling; checks in flight finish if wait is set."""
+        with self._cond:
+            self._stopped = True
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get polling statistics.
+
+        Returns:
+            Dict with checks made, memories fired, failed checks or handlers,
+            agents polled and their current intervals by agent
+        """
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["agents"] = len(self._agents)
+            stats["intervals"] = {agent_id: state.interval for agent_id, state in self._agents.items()}
+            return stats
+
+    def __enter__(self) -> "TriggerPoller":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,215 @@
+"""
+RecallBricks Predictive Prefetch
+Warms the client read cache with memories predict_memories() expects to be needed
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .batch import ensure_pool_capacity, run_concurrently
+
+
+class _TokenBucket:
+    """Blocking token bucket limiting how many fetches start per second."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class MemoryPrefetcher:
+    """
+    Background prefetcher for predicted memories.
+
+    Calls predict_memories() for a context or set of recent memory ids, then
+    fetches every prediction above a confidence threshold (and optionally its
+    relationships) so the following get()/get_relationships() calls are served
+    from the client's read cache.
+
+    Usage:
+        >>> from recallbricks import RecallBricks
+        >>> from recallbricks.prefetch import MemoryPrefetcher
+        >>> rb = RecallBricks(api_key="rb_dev_xxx", cache_ttl=300)
+        >>> prefetcher = MemoryPrefetcher(rb, min_confidence=0.7)
+        >>>
+        >>> # Fire and forget at the start of a turn
+        >>> prefetcher.schedule(context="User is working on auth")
+        >>> ...
+        >>> memory = rb.get("mem_123")  # served locally if it was predicted
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        min_confidence: float = 0.7,
+        limit: int = 10,
+        include_relationships: bool = True,
+        max_requests_per_second: float = 20.0,
+        max_workers: int = 4
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            client: RecallBricks client created with a read cache (cache_ttl)
+            min_confidence: Minimum prediction confidence to prefetch (default: 0.7)
+            limit: Number of predictions requested per call (default: 10)
+            include_relationships: Also prefetch relationships of each memory (default: True)
+            max_requests_per_second: Upper bound on prefetch requests issued
+                                     per second (default: 20)
+            max_workers: Maximum concurrent prefetch requests (default: 4)
+
+        Raises:
+            ValueError: If the client has no read cache or arguments are out of range
+        """
+        if getattr(client, "cache", None) is None:
+            raise ValueError(
+                "client read cache is disabled; create the client with cache_ttl "
+                "to use prefetching"
+            )
+        if not 0.0 <= min_confidence <= 1.0:
+            raise ValueError("min_confidence must be between 0.0 and 1.0")
+        if max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be positive")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.client = client
+        self.min_confidence = min_confidence
+        self.limit = limit
+        self.include_relationships = include_relationships
+        self.max_workers = max_workers
+        self._bucket = _TokenBucket(max_requests_per_second, burst=max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._stats_lock = threading.Lock()
+        self._stats = {"predictions": 0, "prefetched": 0, "skipped": 0, "errors": 0}
+
+        ensure_pool_capacity(client.session, max_workers)
+
+    def _fetch(self, kind: str, memory_id: str) -> Any:
+        self._bucket.acquire()
+        if kind == "memory":
+            return self.client.get(memory_id)
+        return self.client.get_relationships(memory_id)
+
+    def warm(self, memory_ids: List[str]) -> List[str]:
+        """
+        Fetch memories into the read cache, skipping those already cached.
+
+        Args:
+            memory_ids: IDs of memories to warm
+
+        Returns:
+            IDs of memories that were fetched successfully
+        """
+        cache = self.client.cache
+        calls = []
+        for memory_id in dict.fromkeys(memory_ids):
+            if ("memory", memory_id) not in cache:
+                calls.append({"kind": "memory", "memory_id": memory_id})
+            if self.include_relationships and ("relationships", memory_id) not in cache:
+                calls.append({"kind": "relationships", "memory_id": memory_id})
+
+        results = run_concurrently(self._fetch, calls, max_workers=self.max_workers)
+
+        fetched = []
+        errors = 0
+        for call, result in zip(calls, results):
+            if isinstance(result, Exception):
+                errors += 1
+            elif call["kind"] == "memory":
+                fetched.append(call["memory_id"])
+
+        with self._stats_lock:
+            self._stats["prefetched"] += len(fetched)
+            self._stats["errors"] += errors
+        return fetched
+
+    def prefetch(
+        self,
+        context: Optional[str] = None,
+        recent_memory_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Predict and prefetch memories, blocking until done.
+
+        Args:
+            context: Optional context string for prediction
+            recent_memory_ids: Optional list of recently accessed memory IDs
+
+        Returns:
+            IDs of memories that were fetched into the cache
+        """
+        predictions = self.client.predict_memories(
+            context=context,
+            recent_memory_ids=recent_memory_ids,
+            limit=self.limit
+        )
+
+        selected = [
+            p.id for p in predictions
+            if p.id and p.confidence_score >= self.min_confidence
+        ]
+        with self._stats_lock:
+            self._stats["predictions"] += len(predictions)
+            self._stats["skipped"] += len(predictions) - len(selected)
+
+        return self.warm(selected)
+
+    def schedule(
+        self,
+        context: Optional[str] = None,
+        recent_memory_ids: Optional[List[str]] = None
+    ) -> "Future[List[str]]":
+        """
+        Run prefetch() in the background.
+
+        Scheduled prefetches run one after another so they never exceed the
+        configured bandwidth bound.
+
+        Args:
+            context: Optional context string for prediction
+            recent_memory_ids: Optional list of recently accessed memory IDs
+
+        Returns:
+            Future resolving to the list of prefetched memory IDs
+        """
+        return self._executor.submit(self.prefetch, context, recent_memory_ids)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get prefetch statistics.
+
+        Returns:
+            Dict with predictions seen, memories prefetched, predictions skipped
+            below the confidence threshold, and failed fetches
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the background worker."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "MemoryPrefetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,241 @@
+"""
+RecallBricks Semantic Query Cache
+Serves repeated and near-duplicate search queries from a local cache
+"""
+
+import copy
+import hashlib
+import json
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import TTLCache
+
+
+# Question words and negations are kept: "when did X deploy" and "where did
+# X deploy" ask for different memories
+STOPWORDS = frozenset("""
+a about an and any are as at be been by can could did do does for from had has
+have i in is it its me my of on or our please should show that the their them
+there these this those to was we were will with would you your
+""".split())
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+_SUFFIXES = ('ing', 'ed', 's')
+
+
+def _stem(token: str) -> str:
+    """Strip a common inflection suffix (preferred -> prefer, editors -> editor)."""
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            if len(token) > 3 and token[-1] == token[-2]:
+                token = token[:-1]
+            break
+    return token
+
+
+def normalize_query(query: str) -> str:
+    """
+    Reduce a query to a canonical form.
+
+    Lowercases, drops punctuation, possessives and stopwords, strips common
+    suffixes and sorts the remaining unique terms, so that queries differing
+    only in phrasing or word order map to the same string.
+
+    Args:
+        query: Search query
+
+    Returns:
+        Normalized query (terms separated by single spaces)
+
+    Example:
+        >>> normalize_query("the editor the user prefers")
+        'editor prefer user'
+        >>> normalize_query("user's preferred editor")
+        'editor prefer user'
+    """
+    text = query.lower().replace("'s", " ").replace("’s", " ")
+    terms = {_stem(token) for token in _WORD_PATTERN.findall(text) if token not in STOPWORDS}
+    return " ".join(sorted(terms)) or " ".join(text.split())
+
+
+def simhash(text: str, bits: int = 64) -> int:
+    """
+    Compute a SimHash sketch over character trigrams.
+
+    Texts with small edits produce sketches a few bits apart.
+
+    Args:
+        text: Text to sketch (usually a normalized query)
+        bits: Sketch width in bits, at most 64 (default: 64)
+
+    Returns:
+        Sketch as an integer
+    """
+    padded = f" {text} "
+    grams = [padded[i:i + 3] for i in range(max(len(padded) - 2, 1))]
+    weights = [0] * bits
+    for gram in grams:
+        digest = int.from_bytes(
+            hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        for bit in range(bits):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+class SemanticQueryCache:
+    """
+    Query-result cache keyed by normalized query text.
+
+    Each entry lives in a namespace (e.g. "recall" or "semantic:agent_123")
+    and is stored together with the non-query request parameters, which must
+    match exactly. The query itself is matched after normalization and,
+    when max_distance is set, also by SimHash distance to cached queries.
+
+    Usage:
+        >>> from recallbricks import RecallBricks
+        >>> from recallbricks.query_cache import SemanticQueryCache
+        >>> cache = SemanticQueryCache(ttl_seconds=60, max_distance=8)
+        >>> rb = RecallBricks(api_key="rb_dev_xxx", query_cache=cache)
+        >>> rb.recall("user's preferred editor")
+        >>> rb.recall("the editor the user prefers")  # served locally
+        >>> cache.stats()["hit_rate"]
+        0.5
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 60.0,
+        max_distance: Optional[int] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached results (default: 1024)
+            ttl_seconds: Time-to-live of each result in seconds (default: 60)
+            max_distance: Serve queries whose SimHash sketch differs from a
+                         cached query's by at most this many bits (default:
+                         disabled, normalized queries must match exactly)
+        """
+        if max_distance is not None and not 0 <= max_distance <= 64:
+            raise ValueError("max_distance must be between 0 and 64")
+
+        self.max_distance = max_distance
+        self._results = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        # (namespace, params) -> {normalized query: sketch}, for near matching
+        self._sketches: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0, "invalidations": 0}
+
+    @staticmethod
+    def _scope(namespace: str, params: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        return namespace, json.dumps(params or {}, sort_keys=True, default=str)
+
+    def _near_match(self, scope: Tuple[str, str], normalized: str) -> Optional[str]:
+        candidates = self._sketches.get(scope)
+        if not candidates:
+            return None
+        sketch = simhash(normalized)
+        best, best_distance = None, self.max_distance + 1
+        for other, other_sketch in candidates.items():
+            distance = bin(sketch ^ other_sketch).count('1')
+            if distance < best_distance:
+                best, best_distance = other, distance
+        return best
+
+    def get(self, namespace: str, query: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Look up a cached result.
+
+        Args:
+            namespace: Cache namespace
+            query: Search query
+            params: Other request parameters; must match the cached entry exactly
+
+        Returns:
+            Copy of the cached result, or None on a miss
+        """
+        scope = self._scope(namespace, params)
+        normalized = normalize_query(query)
+        with self._lock:
+            result = self._results.get(scope + (normalized,))
+            if result is not None:
+                self._stats["hits"] += 1
+                return copy.deepcopy(result)
+
+            if self.max_distance is not None:
+                match = self._near_match(scope, normalized)
+                if match is not None:
+                    result = self._results.get(scope + (match,))
+                    if result is not None:
+                        self._stats["hits"] += 1
+                        self._stats["near_hits"] += 1
+                        return copy.deepcopy(result)
+                    # Expired or evicted; forget the sketch too
+                    del self._sketches[scope][match]
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, namespace: str, query: str, result: Any, params: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Cache a result.
+
+        Args:
+            namespace: Cache namespace
+            query: Search query
+            result: Response to cache
+            params: Other request parameters
+        """
+        scope = self._scope(namespace, params)
+        normalized = normalize_query(query)
+        with self._lock:
+            self._results.set(scope + (normalized,), copy.deepcopy(result))
+            if self.max_distance is not None:
+                sketches = self._sketches.setdefault(scope, {})
+                if len(sketches) >= self._results.max_size:
+                    live = {key for key in sketches if scope + (key,) in self._results}
+                    self._sketches[scope] = sketches = {k: v for k, v in sketches.items() if k in live}
+                sketches[normalized] = simhash(normalized)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        Drop cached results after a write.
+
+        Args:
+            namespace: Only drop this namespace (default: everything)
+        """
+        with self._lock:
+            self._stats["invalidations"] += 1
+            if namespace is None:
+                self._results.clear()
+                self._sketches.clear()
+                return
+            for key in self._results.keys():
+                if key[0] == namespace:
+                    self._results.delete(key)
+            for scope in [s for s in self._sketches if s[0] == namespace]:
+                del self._sketches[scope]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with size, hits (of which near_hits were sketch matches),
+            misses, hit_rate and invalidations
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["size"] = len(self._results)
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            return stats
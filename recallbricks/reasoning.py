@@ -0,0 +1,337 @@
+"""
+RecallBricks Reasoning Pipeline
+Non-blocking, batched reasoning-trace logging for MetacognitionClient
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "sample")
+
+
+class ReasoningPipeline:
+    """
+    Background pipeline for MetacognitionClient.log_reasoning().
+
+    log() queues a reasoning step and returns immediately. A background
+    worker sends each agent's steps in order, in batches of up to
+    max_batch, once a batch is full or its oldest step has waited
+    flush_interval seconds; failed sends are retried with exponential
+    backoff. A failed batch waits out its backoff without holding up
+    other agents, and the agent's later steps stay queued behind it.
+    When more than max_queue steps are waiting the overflow policy
+    decides what is lost:
+
+    - "drop_oldest": the oldest queued step is discarded (default)
+    - "drop_newest": the new step is discarded
+    - "sample": above high_water of max_queue only sample_rate of new
+      steps are kept; when full the new step is discarded
+
+    Call flush() at episode end; a client with this pipeline attached
+    flushes the agent itself before get_reasoning_trace() and
+    analyze_patterns().
+
+    Usage:
+        >>> from recallbricks.autonomous import MetacognitionClient
+        >>> client = MetacognitionClient(api_key="rb_dev_xxx")
+        >>> pipeline = client.buffer_reasoning(max_batch=50)
+        >>> pipeline.log("agent_123", "plan", "Split the task into three steps", confidence=0.7)
+        >>> trace = client.get_reasoning_trace("agent_123")   # flushed first
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_batch: int = 20,
+        flush_interval: float = 1.0,
+        max_queue: int = 10000,
+        overflow: str = "drop_oldest",
+        high_water: float = 0.8,
+        sample_rate: float = 0.1,
+        bulk: bool = False,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ):
+        """
+        Initialize the pipeline and start its worker.
+
+        Args:
+            client: MetacognitionClient used to send steps
+            max_batch: Steps per agent sent together (default: 20)
+            flush_interval: Seconds a step may wait before it is sent (default: 1.0)
+            max_queue: Steps held before the overflow policy applies (default: 10000)
+            overflow: "drop_oldest", "drop_newest" or "sample" (default: "drop_oldest")
+            high_water: Fraction of max_queue above which "sample" starts
+                        sampling (default: 0.8)
+            sample_rate: Fraction of new steps kept while sampling (default: 0.1)
+            bulk: Send each batch in one request with log_reasoning_batch()
+                  (default: False)
+            max_retries: Retries of a failed send before its steps are
+                         dropped, on top of the client's own retries of each
+                         request (default: 3)
+            retry_backoff: Seconds before the first retry, doubled after
+                           each failure (default: 0.5)
+            on_error: Called with (agent_id, exception) when steps are dropped
+                      after failing (optional)
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        if not 0 < high_water <= 1:
+            raise ValueError("high_water must be between 0 and 1")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self.client = client
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.high_water = high_water
+        self.sample_rate = sample_rate
+        self.bulk = bulk
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.on_error = on_error
+        # agent_id -> queued (seq, queued_at, step), in arrival order
+        self._queues: "OrderedDict[str, Deque[Tuple[int, float, Dict[str, Any]]]]" = OrderedDict()
+        self._queued = 0
+        self._in_flight: Dict[str, int] = {}
+        # agent_id -> (due, attempt, steps) of a failed batch awaiting retry
+        self._retrying: Dict[str, Tuple[float, int, List[Dict[str, Any]]]] = {}
+        self._seq = 0
+        self._flushing = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"logged": 0, "sent": 0, "requests": 0, "retries": 0,
+                       "dropped": 0, "sampled_out": 0, "failed": 0}
+        self._worker = threading.Thread(target=self._run, name="recallbricks-reasoning",
+                                        daemon=True)
+        self._worker.start()
+
+    # Logging
+
+    def log(
+        self,
+        agent_id: str,
+        step: str,
+        reasoning: str,
+        confidence: float = 0.5,
+        alternatives: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Queue a reasoning step without waiting for the API.
+
+        Args:
+            agent_id: Unique identifier for the agent
+            step: Name/identifier of the reasoning step
+            reasoning: Description of the reasoning process
+            confidence: Confidence level 0.0-1.0 (default: 0.5)
+            alternatives: Alternative approaches considered (optional)
+            metadata: Additional metadata (optional)
+
+        Returns:
+            True if the step was queued, False if the overflow policy dropped it
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if not step:
+            raise ValueError("step is required")
+        if not reasoning:
+            raise ValueError("reasoning is required")
+
+        entry: Dict[str, Any] = {"step": step, "reasoning": reasoning, "confidence": confidence}
+        if alternatives:
+            entry["alternatives"] = alternatives
+        if metadata:
+            entry["metadata"] = metadata
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ReasoningPipeline is closed")
+            self._stats["logged"] += 1
+            if not self._admit():
+                return False
+            self._seq += 1
+            queue = self._queues.get(agent_id)
+            if queue is None:
+                queue = self._queues[agent_id] = deque()
+            queue.append((self._seq, time.monotonic(), entry))
+            self._queued += 1
+            if len(queue) >= self.max_batch or len(queue) == 1:
+                self._cond.notify_all()
+        return True
+
+    def _admit(self) -> bool:
+        """Apply the overflow policy to a new step (lock held)."""
+        if self.overflow == "sample" and self._queued >= self.high_water * self.max_queue:
+            if self._queued >= self.max_queue:
+                self._stats["dropped"] += 1
+                return False
+            if random.random() >= self.sample_rate:
+                self._stats["sampled_out"] += 1
+                return False
+            return True
+        if self._queued < self.max_queue:
+            return True
+        if self.overflow == "drop_newest":
+            self._stats["dropped"] += 1
+            return False
+        # drop_oldest: discard the head with the lowest sequence number
+        agent_id = min(self._queues, key=lambda a: self._queues[a][0][0])
+        self._queues[agent_id].popleft()
+        if not self._queues[agent_id]:
+            del self._queues[agent_id]
+        self._queued -= 1
+        self._stats["dropped"] += 1
+        return True
+
+    def flush(self, agent_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Send queued steps now and wait until they are sent (or dropped).
+
+        Args:
+            agent_id: Only wait for this agent's steps (default: all agents)
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            True if the steps were sent, False on timeout
+        """
+        def done() -> bool:
+            if agent_id is not None:
+                return agent_id not in self._queues and not self._in_flight.get(agent_id)
+            return not self._queues and not any(self._in_flight.values())
+
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(done, timeout)
+            finally:
+                self._flushing -= 1
+
+    # Worker
+
+    def _next_batch(self) -> Tuple[Optional[str], List[Dict[str, Any]], int, float]:
+        """Take a ready batch and its attempt number, or return how long to wait (lock held)."""
+        now = time.monotonic()
+        wait = self.flush_interval
+        for agent_id, (due, attempt, batch) in list(self._retrying.items()):
+            if due <= now:
+                del self._retrying[agent_id]
+                return agent_id, batch, attempt, 0.0
+            wait = min(wait, due - now)
+        for agent_id, queue in self._queues.items():
+            if agent_id in self._retrying:
+                continue  # its failed batch goes first
+            age = now - queue[0][1]
+            if self._flushing or self._closed or len(queue) >= self.max_batch \
+                    or age >= self.flush_interval:
+                batch = [queue.popleft()[2] for _ in range(min(self.max_batch, len(queue)))]
+                # Rotate so agents take turns
+                del self._queues[agent_id]
+                if queue:
+                    self._queues[agent_id] = queue
+                self._queued -= len(batch)
+                self._in_flight[agent_id] = self._in_flight.get(agent_id, 0) + len(batch)
+                return agent_id, batch, 0, 0.0
+            wait = min(wait, self.flush_interval - age)
+        return None, [], 0, wait
+
+    def _send(self, agent_id: str, batch: List[Dict[str, Any]]) -> Tuple[int, Optional[Exception]]:
+        """Send a batch in order; returns how many steps went through and any error."""
+        sent, calls = 0, 0
+        try:
+            if self.bulk:
+                calls += 1
+                self.client.log_reasoning_batch(agent_id, batch)
+                sent = len(batch)
+            else:
+                for entry in batch:
+                    calls += 1
+                    self.client.log_reasoning(agent_id, **entry)
+                    sent += 1
+        except Exception as e:
+            return sent, e
+        finally:
+            with self._cond:
+                self._stats["requests"] += calls
+                self._stats["sent"] += sent
+        return sent, None
+
+    def _deliver(self, agent_id: str, batch: List[Dict[str, Any]], attempt: int) -> None:
+        """
+        Send a batch once. What is left after a failure is put back with a
+        due time rather than retried here, so one failing agent does not hold
+        up the others' steps.
+        """
+        sent, error = self._send(agent_id, batch)
+        remaining = batch[sent:] if error is not None else []
+        with self._cond:
+            self._in_flight[agent_id] -= sent
+            if error is not None and attempt < self.max_retries:
+                self._stats["retries"] += 1
+                due = time.monotonic() + self.retry_backoff * (2 ** attempt)
+                self._retrying[agent_id] = (due, attempt + 1, remaining)
+                self._cond.notify_all()
+                return
+            self._in_flight[agent_id] -= len(remaining)
+            if not self._in_flight[agent_id]:
+                del self._in_flight[agent_id]
+            self._stats["failed"] += len(remaining)
+            self._cond.notify_all()
+        if error is not None and self.on_error is not None:
+            self.on_error(agent_id, error)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    agent_id, batch, attempt, wait = self._next_batch()
+                    if batch:
+                        break
+                    if self._closed and not self._retrying:
+                        return
+                    self._cond.wait(wait if self._queues or self._retrying else None)
+            self._deliver(agent_id, batch, attempt)
+
+    # Lifecycle
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pipeline statistics.
+
+        Returns:
+            Dict with steps logged, sent, dropped by the overflow policy,
+            sampled out, failed after retries, requests made, retries and
+            steps still queued
+        """
+        with self._cond:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["queued"] = self._queued
+            return stats
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send queued steps and stop the worker."""
+        self.flush(timeout=timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+
+    def __enter__(self) -> "ReasoningPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,226 @@
+"""
+RecallBricks Local Re-ranking
+Re-scores over-fetched search_weighted() results with custom weight profiles
+
+Requires NumPy (pip install recallbricks[analytics]).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from .results import SCORE_COLUMNS, ResultSet
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for re-ranking. "
+            "Install it with: pip install recallbricks[analytics]"
+        )
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Convert an ISO 8601 string or datetime to a UTC POSIX timestamp."""
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, str) and value:
+        try:
+            moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    else:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+@dataclass
+class WeightProfile:
+    """
+    Weights and filters for one way of ranking results.
+
+    The score of a result is the weighted sum of its score components,
+    multiplied by 0.5 ** (age_days / half_life_days) when a half-life is set.
+    Results below min_helpfulness or min_relevance are dropped.
+    """
+    relevance: float = 1.0
+    usage: float = 0.0
+    helpfulness: float = 0.0
+    recency: float = 0.0
+    half_life_days: Optional[float] = None
+    min_helpfulness: Optional[float] = None
+    min_relevance: Optional[float] = None
+
+    def __post_init__(self):
+        if self.half_life_days is not None and self.half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+
+    @property
+    def weights(self) -> List[float]:
+        """Weights in SCORE_COLUMNS order."""
+        return [self.relevance, self.usage, self.helpfulness, self.recency]
+
+
+# Ready-made profiles
+PROFILES: Dict[str, WeightProfile] = {
+    "relevance": WeightProfile(),
+    "balanced": WeightProfile(relevance=1.0, usage=0.5, helpfulness=0.5, recency=0.5),
+    "proven": WeightProfile(relevance=1.0, usage=0.5, helpfulness=1.0, min_helpfulness=0.1),
+    "fresh": WeightProfile(relevance=1.0, recency=0.5, half_life_days=7.0),
+}
+
+
+class Reranker:
+    """
+    Vectorized re-ranker over a fixed set of search results.
+
+    Score components and ages are loaded into NumPy arrays once; each
+    profile is then applied as a matrix product, an element-wise decay and
+    a threshold mask. rank_many() scores every profile in a single pass.
+
+    Usage:
+        >>> from recallbricks.rerank import Reranker, WeightProfile
+        >>> results = rb.search_weighted("deployment", limit=200, as_result_set=True)
+        >>> reranker = Reranker(results)
+        >>> top = reranker.rank(WeightProfile(usage=0.5, half_life_days=30), top_k=10)
+        >>> variants = reranker.rank_many({
+        ...     "fresh": WeightProfile(recency=1.0, half_life_days=3),
+        ...     "proven": WeightProfile(helpfulness=1.0, min_helpfulness=0.2),
+        ... }, top_k=10)
+    """
+
+    def __init__(self, results: Union[ResultSet, Sequence[Any]], now: Optional[datetime] = None):
+        """
+        Initialize the re-ranker.
+
+        Args:
+            results: ResultSet, or a list of result dicts / WeightedSearchResult objects
+            now: Reference time for ages (default: current UTC time)
+        """
+        _require_numpy()
+
+        if not isinstance(results, ResultSet):
+            results = list(results)
+            if results and isinstance(results[0], dict):
+                results = ResultSet.from_dicts(results)
+            else:
+                results = ResultSet.from_results(results)
+        self.results = results
+
+        reference = _parse_timestamp(now) if now is not None else datetime.now(timezone.utc).timestamp()
+        timestamps = np.array(
+            [_parse_timestamp(v) for v in results.values('created_at')],
+            dtype=np.float64
+        )
+        # Results without a usable created_at are treated as brand new (no decay)
+        self.age_days = np.nan_to_num(np.maximum(reference - timestamps, 0.0) / 86400.0, nan=0.0)
+        self._components = np.vstack([results.column(name) for name in SCORE_COLUMNS])
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def scores_many(self, profiles: Sequence[WeightProfile]) -> Any:
+        """
+        Score every result under each profile.
+
+        Args:
+            profiles: Weight profiles
+
+        Returns:
+            (len(profiles), n) float64 array; filtered-out results score -inf
+        """
+        n = len(self.results)
+        if not profiles:
+            return np.empty((0, n), dtype=np.float64)
+
+        weights = np.array([p.weights for p in profiles], dtype=np.float64)
+        scores = weights @ self._components
+
+        half_lives = np.array(
+            [p.half_life_days if p.half_life_days else np.inf for p in profiles],
+            dtype=np.float64
+        )
+        scores *= np.exp2(-self.age_days[np.newaxis, :] / half_lives[:, np.newaxis])
+
+        helpfulness = self._components[SCORE_COLUMNS.index('helpfulness_boost')]
+        relevance = self._components[SCORE_COLUMNS.index('relevance_score')]
+        min_help = np.array(
+            [-np.inf if p.min_helpfulness is None else p.min_helpfulness for p in profiles]
+        )
+        min_rel = np.array(
+            [-np.inf if p.min_relevance is None else p.min_relevance for p in profiles]
+        )
+        rejected = ((helpfulness[np.newaxis, :] < min_help[:, np.newaxis]) |
+                    (relevance[np.newaxis, :] < min_rel[:, np.newaxis]))
+        scores[rejected] = -np.inf
+        return scores
+
+    def scores(self, profile: WeightProfile) -> Any:
+        """
+        Score every result under one profile.
+
+        Args:
+            profile: Weight profile
+
+        Returns:
+            1-D float64 array; filtered-out results score -inf
+        """
+        return self.scores_many([profile])[0]
+
+    def _select(self, scores: Any, top_k: Optional[int]) -> ResultSet:
+        kept = self.results.filter(np.isfinite(scores))
+        kept_scores = scores[np.isfinite(scores)]
+        if top_k is None:
+            return kept.sort_by(kept_scores)
+        return kept.top_k(top_k, key=kept_scores)
+
+    def rank(self, profile: Union[WeightProfile, str], top_k: Optional[int] = None) -> ResultSet:
+        """
+        Re-rank results under one profile.
+
+        Args:
+            profile: WeightProfile or the name of an entry in PROFILES
+            top_k: Number of results to keep (default: all that pass the filters)
+
+        Returns:
+            ResultSet ordered by profile score, highest first
+        """
+        profile = self._resolve(profile)
+        return self._select(self.scores(profile), top_k)
+
+    def rank_many(
+        self,
+        profiles: Dict[str, Union[WeightProfile, str]],
+        top_k: Optional[int] = None
+    ) -> Dict[str, ResultSet]:
+        """
+        Re-rank results under several profiles at once.
+
+        Args:
+            profiles: Mapping of label to WeightProfile (or PROFILES name)
+            top_k: Number of results to keep per profile (default: all)
+
+        Returns:
+            Dict mapping each label to its ranked ResultSet
+        """
+        labels = list(profiles)
+        matrix = self.scores_many([self._resolve(profiles[label]) for label in labels])
+        return {label: self._select(row, top_k) for label, row in zip(labels, matrix)}
+
+    @staticmethod
+    def _resolve(profile: Union[WeightProfile, str]) -> WeightProfile:
+        if isinstance(profile, WeightProfile):
+            return profile
+        try:
+            return PROFILES[profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown profile '{profile}'. Expected one of: {', '.join(PROFILES)}"
+            )
@@ -0,0 +1,299 @@
+"""
+RecallBricks Columnar Result Sets
+Column-oriented storage for search_weighted() results with vectorized
+sorting, filtering and export
+
+Requires NumPy (pip install recallbricks[analytics]). pandas and pyarrow are
+only needed for the corresponding export methods.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from .types import WeightedSearchResult
+
+
+SCORE_COLUMNS = ('relevance_score', 'usage_boost', 'helpfulness_boost', 'recency_boost')
+
+_RESULT_FIELDS = (
+    'id', 'text', 'source', 'project_id', 'tags', 'metadata', 'created_at'
+) + SCORE_COLUMNS
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for ResultSet. "
+            "Install it with: pip install recallbricks[analytics]"
+        )
+
+
+class ResultSet:
+    """
+    Columnar collection of weighted search results.
+
+    Score components live in one contiguous float64 block with a row per
+    column, so each column is exposed as a zero-copy NumPy array. IDs, texts
+    and the remaining fields stay in Python lists. Iterating still yields
+    WeightedSearchResult objects.
+
+    Usage:
+        >>> results = rb.search_weighted("authentication", limit=100, as_result_set=True)
+        >>> strong = results.where("helpfulness_boost", min_value=0.2)
+        >>> for result in strong.top_k(10):
+        ...     print(result.text, result.relevance_score)
+        >>> usage = results.column("usage_boost")        # numpy array, no copy
+        >>> df = results.to_pandas()
+    """
+
+    def __init__(self, records: List[Dict[str, Any]], scores: Any = None):
+        """
+        Initialize from result dicts.
+
+        Args:
+            records: Result dicts as returned by the API
+            scores: Precomputed (len(SCORE_COLUMNS), n) score block (optional)
+        """
+        _require_numpy()
+
+        self._records = records
+        self.ids: List[str] = [r.get('id', '') for r in records]
+        self.texts: List[str] = [r.get('text', '') for r in records]
+        if scores is None:
+            scores = np.array(
+                [[float(r.get(name) or 0.0) for r in records] for name in SCORE_COLUMNS],
+                dtype=np.float64
+            ).reshape(len(SCORE_COLUMNS), len(records))
+        self._scores = np.ascontiguousarray(scores, dtype=np.float64)
+
+    @classmethod
+    def from_dicts(cls, results: Sequence[Dict[str, Any]]) -> 'ResultSet':
+        """
+        Build from the `results` list of a search_weighted() response.
+
+        Args:
+            results: Result dicts
+
+        Returns:
+            ResultSet instance
+        """
+        return cls([r for r in results if isinstance(r, dict)])
+
+    @classmethod
+    def from_results(cls, results: Sequence[Any]) -> 'ResultSet':
+        """
+        Build from WeightedSearchResult (or compact) objects.
+
+        Args:
+            results: Result objects
+
+        Returns:
+            ResultSet instance
+        """
+        return cls([{name: getattr(r, name) for name in _RESULT_FIELDS} for r in results])
+
+    def _take(self, indices: Any) -> 'ResultSet':
+        indices = np.asarray(indices, dtype=np.int64)
+        return ResultSet(
+            [self._records[i] for i in indices.tolist()],
+            self._scores[:, indices]
+        )
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[WeightedSearchResult]:
+        for record in self._records:
+            yield WeightedSearchResult.from_dict(record)
+
+    def __getitem__(self, key: Union[int, slice, Sequence[int], Any]) -> Any:
+        if isinstance(key, (int, np.integer)):
+            return WeightedSearchResult.from_dict(self._records[key])
+        if isinstance(key, slice):
+            return self._take(np.arange(len(self))[key])
+        key = np.asarray(key)
+        if key.dtype == bool:
+            return self.filter(key)
+        return self._take(key)
+
+    def __repr__(self) -> str:
+        return f"ResultSet({len(self)} results)"
+
+    # Columns
+
+    def column(self, name: str) -> Any:
+        """
+        Get a score column as a NumPy array view (no copy).
+
+        Args:
+            name: One of relevance_score, usage_boost, helpfulness_boost,
+                 recency_boost
+
+        Returns:
+            1-D float64 array
+        """
+        try:
+            return self._scores[SCORE_COLUMNS.index(name)]
+        except ValueError:
+            raise ValueError(
+                f"Unknown column '{name}'. Expected one of: {', '.join(SCORE_COLUMNS)}"
+            )
+
+    def values(self, name: str) -> List[Any]:
+        """
+        Get the raw values of any result field, in order.
+
+        Args:
+            name: Field name, e.g. "created_at" or "tags"
+
+        Returns:
+            List with one value per result (None where missing)
+        """
+        return [record.get(name) for record in self._records]
+
+    def combined_score(self, weights: Optional[Dict[str, float]] = None) -> Any:
+        """
+        Compute a weighted sum of the score columns.
+
+        Args:
+            weights: Weight per column (default: 1.0 for every column)
+
+        Returns:
+            1-D float64 array
+        """
+        weights = weights or {}
+        unknown = set(weights) - set(SCORE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+        vector = np.array([weights.get(name, 1.0) for name in SCORE_COLUMNS])
+        return vector @ self._scores
+
+    # Vectorized operations
+
+    def sort_by(self, key: Union[str, Any] = 'relevance_score', descending: bool = True) -> 'ResultSet':
+        """
+        Sort by a score column or an array of keys.
+
+        Args:
+            key: Column name or 1-D array with one value per result
+            descending: Highest first (default: True)
+
+        Returns:
+            New ResultSet
+        """
+        values = self.column(key) if isinstance(key, str) else np.asarray(key, dtype=np.float64)
+        order = np.argsort(-values if descending else values, kind='stable')
+        return self._take(order)
+
+    def top_k(self, k: int, key: Union[str, Any] = 'relevance_score') -> 'ResultSet':
+        """
+        Get the k highest-scoring results, highest first.
+
+        Args:
+            k: Number of results
+            key: Column name or 1-D array with one value per result
+
+        Returns:
+            New ResultSet
+        """
+        values = self.column(key) if isinstance(key, str) else np.asarray(key, dtype=np.float64)
+        if k >= len(self):
+            return self.sort_by(values)
+        if k <= 0:
+            return self._take([])
+        candidates = np.argpartition(-values, k - 1)[:k]
+        order = candidates[np.argsort(-values[candidates], kind='stable')]
+        return self._take(order)
+
+    def filter(self, mask: Any) -> 'ResultSet':
+        """
+        Keep results where a boolean mask is True.
+
+        Args:
+            mask: 1-D boolean array with one value per result
+
+        Returns:
+            New ResultSet
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise ValueError("mask must have one entry per result")
+        return self._take(np.flatnonzero(mask))
+
+    def where(
+        self,
+        column: str,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None
+    ) -> 'ResultSet':
+        """
+        Keep results whose column value lies within [min_value, max_value].
+
+        Args:
+            column: Score column name
+            min_value: Inclusive lower bound (optional)
+            max_value: Inclusive upper bound (optional)
+
+        Returns:
+            New ResultSet
+        """
+        values = self.column(column)
+        mask = np.ones(len(self), dtype=bool)
+        if min_value is not None:
+            mask &= values >= min_value
+        if max_value is not None:
+            mask &= values <= max_value
+        return self.filter(mask)
+
+    # Export
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Export score columns as NumPy arrays (views, no copy).
+
+        Returns:
+            Dict mapping column name to 1-D array
+        """
+        return {name: self._scores[i] for i, name in enumerate(SCORE_COLUMNS)}
+
+    def to_list(self) -> List[WeightedSearchResult]:
+        """Materialize as a list of WeightedSearchResult objects."""
+        return list(self)
+
+    def to_pandas(self) -> Any:
+        """
+        Export as a pandas DataFrame with id, text and score columns.
+
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for to_pandas(). Install it with: pip install pandas")
+
+        columns: Dict[str, Any] = {"id": self.ids, "text": self.texts}
+        columns.update(self.to_numpy())
+        return pd.DataFrame(columns)
+
+    def to_arrow(self) -> Any:
+        """
+        Export as a pyarrow Table with id, text and score columns.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow is required for to_arrow(). Install it with: pip install pyarrow")
+
+        columns: Dict[str, Any] = {"id": pa.array(self.ids), "text": pa.array(self.texts)}
+        columns.update({name: pa.array(values) for name, values in self.to_numpy().items()})
+        return pa.table(columns)
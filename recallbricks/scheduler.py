@@ -0,0 +1,455 @@
+"""
+RecallBricks Trigger Scheduler
+Fires prospective-memory reminders locally at their trigger_at time
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .temporal import TimeLike, format_time, parse_time
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel.
+
+    Level 0 has one slot per tick; each higher level has slots covering a
+    whole rotation of the level below. Deadlines are placed on the lowest
+    level that can hold them and cascade down as time advances, so adding,
+    removing and firing an item are O(1), and advancing over idle stretches
+    skips whole rotations instead of walking every tick. Deadlines beyond
+    the top level wait in an overflow set.
+
+    Times are integer ticks (e.g. milliseconds since the epoch).
+
+    Usage:
+        >>> wheel = TimerWheel()
+        >>> wheel.advance(1000)
+        []
+        >>> wheel.add("reminder", 1250)
+        >>> wheel.advance(1249), wheel.advance(1250)
+        ([], ['reminder'])
+    """
+
+    def __init__(self, slots: int = 256, levels: int = 4):
+        if slots < 2:
+            raise ValueError("slots must be at least 2")
+        if levels < 1:
+            raise ValueError("levels must be at least 1")
+        self.slots = slots
+        self.levels = levels
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._wheels: List[List[Dict[Any, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._counts = [0] * levels
+        self._overflow: Dict[Any, int] = {}
+        # item -> (level, slot); level == levels means overflow
+        self._where: Dict[Any, tuple] = {}
+        # Next tick to process
+        self._cursor: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._where
+
+    def _place(self, item: Any, deadline: int) -> None:
+        deadline = max(deadline, self._cursor)
+        delta = deadline - self._cursor
+        for level in range(self.levels):
+            if delta < self._spans[level + 1]:
+                slot = (deadline // self._spans[level]) % self.slots
+                self._wheels[level][slot][item] = deadline
+                self._counts[level] += 1
+                self._where[item] = (level, slot)
+                return
+        self._overflow[item] = deadline
+        self._where[item] = (self.levels, None)
+
+    def add(self, item: Any, deadline: int) -> None:
+        """Schedule item at deadline, replacing any earlier schedule for it."""
+        self.remove(item)
+        if self._cursor is None:
+            self._cursor = deadline
+        self._place(item, deadline)
+
+    def remove(self, item: Any) -> bool:
+        """Unschedule item; returns whether it was scheduled."""
+        where = self._where.pop(item, None)
+        if where is None:
+            return False
+        level, slot = where
+        if level == self.levels:
+            del self._overflow[item]
+        else:
+            del self._wheels[level][slot][item]
+            self._counts[level] -= 1
+        return True
+
+    def _cascade(self) -> None:
+        """Redistribute the slots whose span starts at the cursor."""
+        if self._cursor % self._spans[self.levels] == 0 and self._overflow:
+            pending, self._overflow = self._overflow, {}
+            for item, deadline in pending.items():
+                del self._where[item]
+                self._place(item, deadline)
+        for level in range(self.levels - 1, 0, -1):
+            if self._cursor % self._spans[level]:
+                continue
+            slot = (self._cursor // self._spans[level]) % self.slots
+            bucket = self._wheels[level][slot]
+            if not bucket:
+                continue
+            self._wheels[level][slot] = {}
+            self._counts[level] -= len(bucket)
+            for item, deadline in bucket.items():
+                del self._where[item]
+                self._place(item, deadline)
+
+    def _lowest_level(self) -> int:
+        for level, count in enumerate(self._counts):
+            if count:
+                return level
+        return self.levels
+
+    def advance(self, now: int) -> List[Any]:
+        """
+        Move the wheel to now.
+
+        Returns:
+            Items whose deadline is at or before now, in deadline order
+        """
+        if self._cursor is None:
+            self._cursor = now + 1
+            return []
+
+        due: List[Any] = []
+        while self._cursor <= now:
+            bucket = self._wheels[0][self._cursor % self.slots]
+            if bucket:
+                self._wheels[0][self._cursor % self.slots] = {}
+                self._counts[0] -= len(bucket)
+                for item in bucket:
+                    del self._where[item]
+                due.extend(bucket)
+
+            if not self._where:
+                self._cursor = now + 1
+                break
+            # Jump straight to the next boundary of the lowest occupied level
+            span = self._spans[max(self._lowest_level(), 1) if not self._counts[0] else 0]
+            self._cursor = min(now + 1, (self._cursor // span + 1) * span)
+            self._cascade()
+        return due
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        Earliest tick at which advance() may return items or must cascade.
+
+        Returns:
+            The nearest level-0 deadline or higher-level cascade boundary,
+            or None when the wheel is empty
+        """
+        if not self._where:
+            return None
+        candidates = []
+        if self._counts[0]:
+            for offset in range(self.slots):
+                if self._wheels[0][(self._cursor + offset) % self.slots]:
+                    candidates.append(self._cursor + offset)
+                    break
+        for level in range(1, self.levels):
+            if not self._counts[level]:
+                continue
+            span = self._spans[level]
+            base = self._cursor // span
+            for offset in range(1, self.slots + 1):
+                if self._wheels[level][(base + offset) % self.slots]:
+                    candidates.append((base + offset) * span)
+                    break
+        if self._overflow:
+            span = self._spans[self.levels]
+            candidates.append((self._cursor // span + 1) * span)
+        return min(candidates)
+
+
+def _epoch_ms(value: TimeLike) -> int:
+    return int(parse_time(value).timestamp() * 1000)
+
+
+class TriggerScheduler:
+    """
+    Local scheduler for prospective-memory triggers.
+
+    Pending memories are loaded once with get_pending(). Time-based
+    memories are kept in a timer wheel and handed to the registered
+    handlers at their trigger_at time (to the millisecond) by a background
+    thread, with no polling. check_triggers() is only called, every
+    poll_interval, for agents that have event- or condition-based memories
+    pending. A ProspectiveMemoryClient with this scheduler attached keeps it
+    in sync as memories are created, rescheduled, cancelled or completed.
+
+    Handlers run on the scheduler thread and should hand long work off.
+
+    Usage:
+        >>> from recallbricks.autonomous import ProspectiveMemoryClient
+        >>> client = ProspectiveMemoryClient(api_key="rb_dev_xxx")
+        >>> scheduler = client.schedule_triggers(["agent_123"], handlers=[notify])
+        >>> client.create("agent_123", "Check the deploy", trigger_at="2024-12-28T14:00:00Z")
+        >>> # notify(memory) is called at 14:00:00.000
+        >>> scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        agent_ids: Iterable[str] = (),
+        handlers: Iterable[Callable[[Dict[str, Any]], None]] = (),
+        poll_interval: float = 30.0,
+        load_limit: int = 1000,
+        on_error: Optional[Callable[[Exception], None]] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            client: ProspectiveMemoryClient used to load and poll memories
+            agent_ids: Agents whose memories are scheduled (more can be added with watch())
+            handlers: Callables receiving each triggered memory dict
+            poll_interval: Seconds between check_triggers() calls for agents
+                          with event or condition triggers (default: 30)
+            load_limit: Maximum pending memories loaded per agent (default: 1000)
+            on_error: Called with the exception when a poll or handler fails (optional)
+        """
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be positive")
+
+        self.client = client
+        self.poll_interval = poll_interval
+        self.load_limit = load_limit
+        self.on_error = on_error
+        self._handlers: List[Callable[[Dict[str, Any]], None]] = list(handlers)
+        self._agents: Set[str] = set()
+        # memory id -> memory dict, for every memory scheduled or polled
+        self._memories: Dict[str, Dict[str, Any]] = {}
+        # agent id -> ids of event/condition memories awaiting check_triggers()
+        self._polled: Dict[str, Set[str]] = {}
+        self._wheel = TimerWheel()
+        self._wheel.advance(self._now())
+        self._cond = threading.Condition(threading.RLock())
+        self._next_poll = time.monotonic() + poll_interval
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+        self._stats = {"scheduled": 0, "fired": 0, "polls": 0, "errors": 0, "max_lateness_ms": 0}
+
+        for agent_id in agent_ids:
+            self.watch(agent_id)
+
+    @staticmethod
+    def _now() -> int:
+        return int(time.time() * 1000)
+
+    def add_handler(self, handler: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callable receiving each triggered memory dict."""
+        with self._cond:
+            self._handlers.append(handler)
+
+    # Tracking
+
+    def watch(self, agent_id: str) -> int:
+        """
+        Load an agent's pending memories and schedule them.
+
+        Args:
+            agent_id: Unique identifier for the agent
+
+        Returns:
+            Number of memories loaded
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+
+        response = self.client.get_pending(agent_id, limit=self.load_limit)
+        memories = (response or {}).get('memories') or []
+        with self._cond:
+            self._agents.add(agent_id)
+            for memory in memories:
+                self.track(dict(memory, agent_id=memory.get('agent_id') or agent_id))
+        return len(memories)
+
+    def track(self, memory: Dict[str, Any]) -> None:
+        """
+        Schedule a prospective memory for a watched agent.
+
+        Time-based memories go on the timer wheel; others are polled for.
+        Memories of unwatched agents, or without an id, are ignored.
+
+        Args:
+            memory: Memory dict with id, agent_id, trigger_type and trigger_at
+        """
+        memory_id = memory.get('id')
+        agent_id = memory.get('agent_id')
+        if not memory_id or agent_id not in self._agents:
+            return
+        with self._cond:
+            self.untrack(memory_id)
+            self._memories[memory_id] = memory
+            trigger_at = memory.get('trigger_at')
+            if memory.get('trigger_type', 'time') == 'time' and trigger_at:
+                self._wheel.add(memory_id, _epoch_ms(trigger_at))
+            else:
+                self._polled.setdefault(agent_id, set()).add(memory_id)
+            self._stats["scheduled"] += 1
+            self._cond.notify()
+
+    def retime(self, memory_id: str, trigger_at: TimeLike) -> None:
+        """Move a tracked time-based memory to a new trigger_at."""
+        with self._cond:
+            memory = self._memories.get(memory_id)
+            if memory is None:
+                return
+            if not isinstance(trigger_at, str):
+                trigger_at = format_time(parse_time(trigger_at))
+            self.track(dict(memory, trigger_at=trigger_at, trigger_type='time'))
+
+    def untrack(self, memory_id: str) -> None:
+        """Stop scheduling a memory (completed, cancelled or deleted)."""
+        with self._cond:
+            memory = self._memories.pop(memory_id, None)
+            if memory is None:
+                return
+            self._wheel.remove(memory_id)
+            polled = self._polled.get(memory.get('agent_id'))
+            if polled is not None:
+                polled.discard(memory_id)
+                if not polled:
+                    del self._polled[memory.get('agent_id')]
+            self._cond.notify()
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Get the memories currently scheduled or polled for."""
+        with self._cond:
+            return [dict(memory) for memory in self._memories.values()]
+
+    # Firing
+
+    def _dispatch(self, memories: List[Dict[str, Any]]) -> None:
+        with self._cond:
+            handlers = list(self._handlers)
+        for memory in memories:
+            for handler in handlers:
+                try:
+                    handler(memory)
+                except Exception as e:
+                    self._error(e)
+
+    def _error(self, error: Exception) -> None:
+        with self._cond:
+            self._stats["errors"] += 1
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _fire_due(self) -> List[Dict[str, Any]]:
+        """Pop memories whose trigger_at has passed (lock held)."""
+        now = self._now()
+        fired = []
+        for memory_id in self._wheel.advance(now):
+            memory = self._memories.pop(memory_id, None)
+            if memory is None:
+                continue
+            lateness = now - _epoch_ms(memory['trigger_at'])
+            self._stats["max_lateness_ms"] = max(self._stats["max_lateness_ms"], lateness)
+            fired.append(memory)
+        self._stats["fired"] += len(fired)
+        return fired
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Call check_triggers() for agents with event or condition memories pending.
+
+        Returns:
+            Triggered memories that were dispatched to the handlers
+        """
+        with self._cond:
+            agents = list(self._polled)
+            self._next_poll = time.monotonic() + self.poll_interval
+        fired = []
+        for agent_id in agents:
+            try:
+                response = self.client.check_triggers(agent_id)
+            except Exception as e:
+                self._error(e)
+                continue
+            with self._cond:
+                self._stats["polls"] += 1
+                for memory in (response or {}).get('triggered') or []:
+                    memory_id = memory.get('id')
+                    # Time-based memories are fired by the wheel, not the poll
+                    if memory_id in self._memories and memory_id not in self._wheel:
+                        self.untrack(memory_id)
+                        fired.append(dict(memory, agent_id=memory.get('agent_id') or agent_id))
+                        self._stats["fired"] += 1
+        self._dispatch(fired)
+        return fired
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                fired = self._fire_due()
+                poll_due = bool(self._polled) and time.monotonic() >= self._next_poll
+                if not fired and not poll_due:
+                    timeouts = []
+                    deadline = self._wheel.next_deadline()
+                    if deadline is not None:
+                        timeouts.append(max(0.0, deadline / 1000 - time.time()))
+                    if self._polled:
+                        timeouts.append(max(0.0, self._next_poll - time.monotonic()))
+                    self._cond.wait(min(timeouts) if timeouts else None)
+                    continue
+            self._dispatch(fired)
+            if poll_due:
+                self.poll()
+
+    def start(self) -> "TriggerScheduler":
+        """Start the scheduler thread."""
+        with self._cond:
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name="recallbricks-triggers",
+                                                daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduler thread."""
+        with self._cond:
+            self._stopped = True
+            thread, self._thread = self._thread, None
+            self._cond.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Dict with memories scheduled, memories fired, check_triggers()
+            calls, handler or poll errors, the largest delay past trigger_at
+            in milliseconds, and the number currently pending
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._memories)
+            return stats
+
+    def __enter__(self) -> "TriggerScheduler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,198 @@
+"""
+RecallBricks Streaming Recall
+Incremental delivery of recall() results as they are decoded
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import APIError, RecallBricksError
+from .types import CategorySummary, RecallMemory
+
+
+# Events produced by the response parsers: ("memory", dict), ("categories", dict)
+# or ("total", int)
+Event = Tuple[str, Any]
+
+_DONE = object()
+
+
+def _line_events(obj: Dict[str, Any]) -> Iterator[Event]:
+    """Translate one NDJSON record into stream events."""
+    kind = obj.get('type')
+    if kind == 'memory':
+        memory = obj.get('memory', obj.get('data'))
+        if isinstance(memory, dict):
+            yield ('memory', memory)
+    elif kind == 'categories':
+        yield ('categories', obj.get('categories') or {})
+    elif kind == 'error':
+        error = obj.get('error') if isinstance(obj.get('error'), dict) else obj
+        raise APIError(
+            error.get('message', 'Stream error'),
+            code=error.get('code'),
+            hint=error.get('hint'),
+            request_id=error.get('requestId')
+        )
+    elif kind is None and 'id' in obj:
+        yield ('memory', obj)
+    else:
+        if 'categories' in obj:
+            yield ('categories', obj.get('categories') or {})
+        total = obj.get('total', obj.get('count'))
+        if isinstance(total, int):
+            yield ('total', total)
+
+
+def parse_recall_response(response: Any) -> Iterator[Event]:
+    """
+    Decode a streamed recall response into events.
+
+    NDJSON bodies are decoded line by line as they arrive; a plain JSON body
+    (a server that ignored the streaming request) is decoded in one piece.
+
+    Args:
+        response: requests.Response opened with stream=True
+
+    Yields:
+        Stream events
+    """
+    try:
+        content_type = response.headers.get('Content-Type', '')
+        if 'ndjson' in content_type or 'jsonl' in content_type:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError as e:
+                    raise RecallBricksError(f"Invalid JSON in stream: {str(e)}")
+                if isinstance(obj, dict):
+                    yield from _line_events(obj)
+            return
+
+        try:
+            data = response.json() if response.content else {}
+        except ValueError as e:
+            raise RecallBricksError(f"Invalid JSON response: {str(e)}")
+        for memory in data.get('memories') or []:
+            yield ('memory', memory)
+        if 'categories' in data:
+            yield ('categories', data.get('categories') or {})
+        total = data.get('total', data.get('count'))
+        if isinstance(total, int):
+            yield ('total', total)
+    finally:
+        response.close()
+
+
+def summarize_categories(
+    memories: List[RecallMemory],
+    server_categories: Dict[str, CategorySummary]
+) -> Dict[str, CategorySummary]:
+    """
+    Build category summaries for memories gathered across several pages.
+
+    Counts and average scores are computed locally; summary text is taken
+    from the server's per-page summaries when available.
+
+    Args:
+        memories: All memories delivered
+        server_categories: Category blocks merged from the pages
+
+    Returns:
+        Dict mapping category name to CategorySummary
+    """
+    totals: Dict[str, List[float]] = {}
+    for memory in memories:
+        category = (memory.get('metadata') or {}).get('category')
+        if category:
+            totals.setdefault(category, []).append(float(memory.get('score') or 0.0))
+
+    return {
+        category: CategorySummary(
+            count=len(scores),
+            avg_score=sum(scores) / len(scores),
+            summary=(server_categories.get(category) or {}).get('summary', '')
+        )
+        for category, scores in totals.items()
+    }
+
+
+class RecallStream:
+    """
+    Iterator over recall results that yields memories as they are decoded.
+
+    Works both as a regular iterator and as an async iterator. The category
+    block and total are available once iteration has finished.
+
+    Usage:
+        >>> stream = rb.recall_stream("user preferences", limit=100, organized=True)
+        >>> for memory in stream:
+        ...     prompt.append(memory['text'])
+        >>> print(stream.categories)
+        >>>
+        >>> # In async code
+        >>> async for memory in rb.recall_stream("user preferences"):
+        ...     prompt.append(memory['text'])
+    """
+
+    def __init__(self, events: Iterator[Event]):
+        """
+        Initialize the stream.
+
+        Args:
+            events: Iterator of stream events
+        """
+        self._events = events
+        self.categories: Optional[Dict[str, CategorySummary]] = None
+        self.total: Optional[int] = None
+        self.count = 0
+        self.done = False
+
+    def __iter__(self) -> 'RecallStream':
+        return self
+
+    def __next__(self) -> RecallMemory:
+        for kind, value in self._events:
+            if kind == 'memory':
+                self.count += 1
+                return value
+            if kind == 'categories':
+                self.categories = value
+            elif kind == 'total':
+                self.total = value
+        self.done = True
+        if self.total is None:
+            self.total = self.count
+        raise StopIteration
+
+    def _next_or_done(self) -> Any:
+        try:
+            return next(self)
+        except StopIteration:
+            return _DONE
+
+    def __aiter__(self) -> 'RecallStream':
+        return self
+
+    async def __anext__(self) -> RecallMemory:
+        loop = asyncio.get_running_loop()
+        memory = await loop.run_in_executor(None, self._next_or_done)
+        if memory is _DONE:
+            raise StopAsyncIteration
+        return memory
+
+    def collect(self) -> Dict[str, Any]:
+        """
+        Drain the stream into a regular recall() response dict.
+
+        Returns:
+            Dict with memories, categories (if any) and total
+        """
+        memories = list(self)
+        result: Dict[str, Any] = {"memories": memories, "total": self.total}
+        if self.categories is not None:
+            result["categories"] = self.categories
+        return result
@@ -0,0 +1,174 @@
+"""
+RecallBricks Temporal Scan
+Concurrent, adaptively subdivided scans over long time ranges
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from .batch import DEFAULT_MAX_WORKERS
+
+
+TimeLike = Union[str, datetime]
+
+
+def parse_time(value: TimeLike) -> datetime:
+    """
+    Parse an ISO 8601 string (or pass through a datetime) as an aware UTC datetime.
+
+    Raises:
+        ValueError: If the string is not ISO 8601
+    """
+    if isinstance(value, datetime):
+        moment = value
+    else:
+        moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def format_time(moment: datetime) -> str:
+    """Format a UTC datetime as ISO 8601 with a Z suffix."""
+    return moment.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _timestamp(item: Dict[str, Any]) -> str:
+    return item.get('created_at') or item.get('timestamp') or ''
+
+
+class _Window:
+    """One time window; resolved with its results, or with its two halves once split."""
+
+    __slots__ = ('start', 'end', 'depth', 'future', 'resolved')
+
+    def __init__(self, start: datetime, end: datetime, depth: int):
+        self.start = start
+        self.end = end
+        self.depth = depth
+        self.future: Optional["Future[Any]"] = None
+        # List of results, or a list of two child _Windows
+        self.resolved: "Future[Any]" = Future()
+
+
+def scan_windows(
+    fetch: Callable[[datetime, datetime], List[Dict[str, Any]]],
+    start: datetime,
+    end: datetime,
+    limit: int,
+    windows: int = 8,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    min_window: timedelta = timedelta(minutes=1),
+    max_depth: int = 12,
+    on_error: Optional[Callable[[datetime, datetime, Exception], None]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Scan [start, end] window by window, yielding results in time order.
+
+    All windows are fetched concurrently. A window that returns `limit`
+    results may have been truncated, so as soon as it comes back it is split
+    in half and both halves are fetched, until windows fit, reach min_window
+    or max_depth; refinements of different windows run side by side. Results
+    are yielded as soon as every earlier window is complete, so the first
+    results arrive before the whole range has been scanned.
+
+    A window whose request fails is passed to on_error, and the scan goes
+    on without it; without on_error the exception is raised when the scan
+    reaches that window, ending it.
+
+    Args:
+        fetch: Callable returning the results for one (start, end) window
+        start: Start of the range
+        end: End of the range
+        limit: Per-request result limit used by fetch
+        windows: Number of initial windows (default: 8)
+        max_workers: Maximum number of requests in flight (default: 8)
+        min_window: Windows shorter than this are not split (default: 1 minute)
+        max_depth: Maximum number of times a window is halved (default: 12)
+        on_error: Called with (window start, window end, exception) for a
+                  failed window, which is then skipped (optional)
+
+    Yields:
+        Result dicts, oldest first, each memory once
+    """
+    if end <= start:
+        raise ValueError("end_time must be after start_time")
+    if windows < 1:
+        raise ValueError("windows must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    submitted: List[_Window] = []
+
+    def split(window_start: datetime, window_end: datetime, parts: int) -> List[Tuple[datetime, datetime]]:
+        step = (window_end - window_start) / parts
+        bounds = [window_start + step * i for i in range(parts)] + [window_end]
+        return list(zip(bounds[:-1], bounds[1:]))
+
+    def submit(window_start: datetime, window_end: datetime, depth: int) -> _Window:
+        window = _Window(window_start, window_end, depth)
+        submitted.append(window)
+        try:
+            window.future = executor.submit(fetch, window_start, window_end)
+        except RuntimeError:  # scan closed meanwhile
+            window.resolved.cancel()
+            return window
+        window.future.add_done_callback(lambda future: resolve(window, future))
+        return window
+
+    def resolve(window: _Window, future: "Future[Any]") -> None:
+        """Runs as soon as a window's request finishes, on the worker thread."""
+        if future.cancelled():
+            window.resolved.cancel()
+            return
+        error = future.exception()
+        if error is not None:
+            window.resolved.set_exception(error)
+            return
+        results = future.result()
+        can_split = (window.depth < max_depth and
+                     window.end - window.start >= 2 * min_window)
+        if len(results) >= limit and can_split:
+            window.resolved.set_result([
+                submit(half_start, half_end, window.depth + 1)
+                for half_start, half_end in split(window.start, window.end, 2)
+            ])
+        else:
+            window.resolved.set_result(results)
+
+    queue: Deque[_Window] = deque(
+        submit(window_start, window_end, 0)
+        for window_start, window_end in split(start, end, windows)
+    )
+    seen: Set[str] = set()
+
+    try:
+        while queue:
+            window = queue.popleft()
+            try:
+                resolved = window.resolved.result()
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(window.start, window.end, e)
+                continue
+
+            if resolved and isinstance(resolved[0], _Window):
+                queue.extendleft(reversed(resolved))
+                continue
+
+            for item in sorted(resolved, key=_timestamp):
+                item_id = item.get('id')
+                if item_id is not None:
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                yield item
+    finally:
+        executor.shutdown(wait=False)
+        for window in list(submitted):
+            if window.future is not None:
+                window.future.cancel()
@@ -4,8 +4,9 @@ Phase 2A Metacognition Features
 Phase 2B Automatic Metatags Features
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 try:
     from typing import TypedDict
 except ImportError:
@@ -148,6 +149,143 @@ class WeightedSearchResult:
         )
 
 
+# Compact result types
+#
+# Slotted alternatives to the dataclasses above for large result pages. They
+# keep a reference to the decoded response dict instead of copying every field,
+# and read fields from it on attribute access.
+
+
+class _LazyField:
+    """Descriptor reading a field from the wrapped response dict on access."""
+
+    __slots__ = ('name', 'default', 'factory')
+
+    def __init__(self, name: str, default: Any = None, factory: Any = None):
+        self.name = name
+        self.default = default
+        self.factory = factory
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        data = obj._data
+        if self.name in data:
+            return data[self.name]
+        if self.factory is not None:
+            value = data[self.name] = self.factory()
+            return value
+        return self.default
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj._data[self.name] = value
+
+
+def _intern_fields(data: Dict[str, Any], names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Intern repeated strings (and lists of strings) in place."""
+    for name in names:
+        value = data.get(name)
+        if type(value) is str:
+            data[name] = sys.intern(value)
+        elif type(value) is list:
+            data[name] = [sys.intern(v) if type(v) is str else v for v in value]
+    return data
+
+
+class _CompactResult:
+    """Base class for slotted, lazily-read result types"""
+
+    __slots__ = ('_data',)
+
+    _fields: Tuple[str, ...] = ()
+    _interned: Tuple[str, ...] = ()
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        if len(args) > len(self._fields):
+            raise TypeError(
+                f"{type(self).__name__}() takes at most {len(self._fields)} positional arguments"
+            )
+        data = dict(zip(self._fields, args))
+        for name, value in kwargs.items():
+            if name not in self._fields:
+                raise TypeError(f"{type(self).__name__}() got an unexpected keyword argument '{name}'")
+            if name in data:
+                raise TypeError(f"{type(self).__name__}() got multiple values for argument '{name}'")
+            data[name] = value
+        self._data = _intern_fields(data, self._interned)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Wrap an API response dict without copying it"""
+        obj = cls.__new__(cls)
+        obj._data = _intern_fields(data, cls._interned)
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize all fields into a plain dict"""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompactPredictedMemory(_CompactResult):
+    """Slotted, lazily-read equivalent of PredictedMemory"""
+
+    __slots__ = ()
+    _fields = ('id', 'content', 'confidence_score', 'reasoning', 'metadata')
+
+    id = _LazyField('id', '')
+    content = _LazyField('content', '')
+    confidence_score = _LazyField('confidence_score', 0.0)
+    reasoning = _LazyField('reasoning', '')
+    metadata = _LazyField('metadata')
+
+
+class CompactSuggestedMemory(_CompactResult):
+    """Slotted, lazily-read equivalent of SuggestedMemory"""
+
+    __slots__ = ()
+    _fields = ('id', 'content', 'confidence', 'reasoning', 'relevance_context')
+
+    id = _LazyField('id', '')
+    content = _LazyField('content', '')
+    confidence = _LazyField('confidence', 0.0)
+    reasoning = _LazyField('reasoning', '')
+    relevance_context = _LazyField('relevance_context', '')
+
+
+class CompactWeightedSearchResult(_CompactResult):
+    """Slotted, lazily-read equivalent of WeightedSearchResult"""
+
+    __slots__ = ()
+    _fields = (
+        'id', 'text', 'source', 'project_id', 'tags', 'metadata', 'created_at',
+        'relevance_score', 'usage_boost', 'helpfulness_boost', 'recency_boost'
+    )
+    _interned = ('source', 'project_id', 'tags')
+
+    id = _LazyField('id', '')
+    text = _LazyField('text', '')
+    source = _LazyField('source', 'api')
+    project_id = _LazyField('project_id', 'default')
+    tags = _LazyField('tags', factory=list)
+    metadata = _LazyField('metadata')
+    created_at = _LazyField('created_at')
+    relevance_score = _LazyField('relevance_score', 0.0)
+    usage_boost = _LazyField('usage_boost', 0.0)
+    helpfulness_boost = _LazyField('helpfulness_boost', 0.0)
+    recency_boost = _LazyField('recency_boost', 0.0)
+
+
 # Phase 2B: Automatic Metatags TypedDict definitions
 
 class MemoryMetadata(TypedDict, total=False):
@@ -0,0 +1,600 @@
+"""
+RecallBricks Local Working Memory
+In-process, write-through working-memory tier for a single agent
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .temporal import parse_time
+
+
+class TTLWheel:
+    """
+    Timing wheel of expiry deadlines.
+
+    Deadlines are rounded up to the next tick, so adding and removing an
+    item is O(1) and advancing costs one slot per elapsed tick. Items expire
+    at most one tick after their deadline.
+    """
+
+    def __init__(self, tick: float = 1.0):
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        self.tick = tick
+        self._slots: Dict[int, Set[str]] = {}
+        self._slot_of: Dict[str, int] = {}
+        self._cursor: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def add(self, item: str, expires_at: float) -> None:
+        """Schedule item to expire at expires_at (a time.monotonic() value)."""
+        self.remove(item)
+        slot = math.ceil(expires_at / self.tick)
+        if self._cursor is not None:
+            slot = max(slot, self._cursor)
+        self._slots.setdefault(slot, set()).add(item)
+        self._slot_of[item] = slot
+
+    def remove(self, item: str) -> None:
+        """Unschedule item, if scheduled."""
+        slot = self._slot_of.pop(item, None)
+        if slot is not None:
+            bucket = self._slots[slot]
+            bucket.discard(item)
+            if not bucket:
+                del self._slots[slot]
+
+    def advance(self, now: float) -> List[str]:
+        """
+        Move the wheel to now.
+
+        Returns:
+            Items whose deadline has passed
+        """
+        current = math.floor(now / self.tick)
+        if self._cursor is None:
+            self._cursor = current
+        expired: List[str] = []
+        if self._cursor > current:
+            return expired
+        # Walk tick by tick unless the wheel is sparser than the elapsed time
+        if current - self._cursor <= len(self._slots):
+            due = range(self._cursor, current + 1)
+        else:
+            due = sorted(slot for slot in self._slots if slot <= current)
+        for slot in due:
+            for item in self._slots.pop(slot, ()):
+                del self._slot_of[item]
+                expired.append(item)
+        self._cursor = current + 1
+        return expired
+
+
+class LocalWorkingMemory:
+    """
+    Local working-memory tier for one agent, written through to the API.
+
+    store(), update() and delete() apply to an in-process copy immediately
+    and are sent to the server in order by a background worker. retrieve()
+    is answered locally with the same filtering and priority ordering as
+    WorkingMemoryClient.retrieve(); entries expire on their ttl_seconds.
+    Every reconcile_interval the local copy is refreshed from the server,
+    and consolidate() is requested automatically once the tier holds
+    consolidate_size entries or its oldest entry is consolidate_age_seconds
+    old, at most once per consolidate_cooldown.
+
+    When more than max_items entries are held, the lowest-priority ones are
+    dropped locally (they stay on the server), so retrieve() is exact for
+    the top max_items entries.
+
+    Usage:
+        >>> from recallbricks.autonomous import WorkingMemoryClient
+        >>> client = WorkingMemoryClient(api_key="rb_dev_xxx")
+        >>> with client.local("agent_123", reconcile_interval=60) as memory:
+        ...     memory.store("User prefers dark mode", priority=0.8)
+        ...     context = memory.retrieve(limit=5)       # no API call
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        agent_id: str,
+        max_items: int = 1000,
+        reconcile_interval: Optional[float] = 30.0,
+        consolidate_size: Optional[int] = None,
+        consolidate_age_seconds: Optional[float] = None,
+        consolidate_strategy: str = "importance",
+        consolidate_cooldown: float = 60.0,
+        ttl_tick: float = 1.0,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        load: bool = True
+    ):
+        """
+        Initialize the tier.
+
+        Args:
+            client: WorkingMemoryClient used for write-through and reconciliation
+            agent_id: Agent whose working memory is held
+            max_items: Maximum entries held locally (default: 1000)
+            reconcile_interval: Seconds between refreshes from the server,
+                               or None to never refresh (default: 30)
+            consolidate_size: Entry count that triggers consolidate() (optional)
+            consolidate_age_seconds: Age of the oldest entry that triggers
+                                    consolidate() (optional)
+            consolidate_strategy: Strategy passed to consolidate() (default: importance)
+            consolidate_cooldown: Minimum seconds between automatic
+                                 consolidations, so entries the server keeps
+                                 do not trigger it again on every call
+                                 (default: 60)
+            ttl_tick: Resolution of ttl_seconds expiry in seconds (default: 1.0)
+            on_error: Called with the exception when a background call fails (optional)
+            load: Load the server's working memory before returning (default: True)
+        """
+        if not agent_id:
+            raise ValueError("agent_id is required")
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        if reconcile_interval is not None and reconcile_interval <= 0:
+            raise ValueError("reconcile_interval must be positive")
+        if consolidate_cooldown < 0:
+            raise ValueError("consolidate_cooldown must not be negative")
+
+        self.client = client
+        self.agent_id = agent_id
+        self.max_items = max_items
+        self.reconcile_interval = reconcile_interval
+        self.consolidate_size = consolidate_size
+        self.consolidate_age_seconds = consolidate_age_seconds
+        self.consolidate_strategy = consolidate_strategy
+        self.consolidate_cooldown = consolidate_cooldown
+        self.on_error = on_error
+
+        # local id -> memory dict as returned by retrieve()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._stored_at: Dict[str, float] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._server_ids: Dict[str, str] = {}
+        # Writes queued per local id; entries with queued writes survive reconciles
+        self._pending: Dict[str, int] = {}
+        # Server ids deleted locally whose DELETE has not completed yet
+        self._deleting: Set[str] = set()
+        # (priority, sequence, local id); stale tuples are skipped lazily
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._wheel = TTLWheel(ttl_tick)
+        self._lock = threading.RLock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._last_reconcile = time.monotonic()
+        self._reconciling = False
+        self._consolidating = False
+        self._last_consolidation: Optional[float] = None
+        self._stats = {
+            "local_reads": 0, "writes": 0, "write_errors": 0, "expired": 0,
+            "evicted": 0, "reconciles": 0, "consolidations": 0,
+        }
+
+        if load:
+            self.reconcile(wait=True)
+
+    # Local state (lock held)
+
+    def _put(
+        self,
+        local_id: str,
+        memory: Dict[str, Any],
+        expires_at: Optional[float],
+        stored_at: Optional[float] = None
+    ) -> None:
+        self._entries[local_id] = memory
+        if stored_at is not None:
+            self._stored_at[local_id] = stored_at
+        else:
+            self._stored_at.setdefault(local_id, time.monotonic())
+        heapq.heappush(self._heap, (memory.get('priority', 0.5), next(self._sequence), local_id))
+        if expires_at is not None:
+            self._expires_at[local_id] = expires_at
+            self._wheel.add(local_id, expires_at)
+        else:
+            self._expires_at.pop(local_id, None)
+            self._wheel.remove(local_id)
+
+    def _drop(self, local_id: str) -> Optional[Dict[str, Any]]:
+        self._wheel.remove(local_id)
+        self._expires_at.pop(local_id, None)
+        self._stored_at.pop(local_id, None)
+        return self._entries.pop(local_id, None)
+
+    def _expire(self) -> None:
+        for local_id in self._wheel.advance(time.monotonic()):
+            if self._drop(local_id) is not None:
+                self._stats["expired"] += 1
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_items and self._heap:
+            priority, _, local_id = heapq.heappop(self._heap)
+            memory = self._entries.get(local_id)
+            if memory is None or memory.get('priority', 0.5) != priority:
+                continue
+            self._drop(local_id)
+            self._server_ids.pop(local_id, None)
+            self._stats["evicted"] += 1
+        # Rebuild once stale tuples dominate the heap
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(m.get('priority', 0.5), next(self._sequence), local_id)
+                          for local_id, m in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _local_id_for(self, memory_id: str) -> str:
+        for local_id, server_id in self._server_ids.items():
+            if server_id == memory_id:
+                return local_id
+        return memory_id
+
+    # Background calls
+
+    def _submit(self, local_id: Optional[str], call: Callable[[], Any]) -> "Future[Any]":
+        if local_id is not None:
+            self._pending[local_id] = self._pending.get(local_id, 0) + 1
+
+        def run() -> Any:
+            try:
+                return call()
+            except Exception as e:
+                with self._lock:
+                    self._stats["write_errors"] += 1
+                if self.on_error is not None:
+                    self.on_error(e)
+                raise
+            finally:
+                if local_id is not None:
+                    with self._lock:
+                        self._pending[local_id] -= 1
+                        if not self._pending[local_id]:
+                            del self._pending[local_id]
+
+        return self._executor.submit(run)
+
+    def _maintain(self) -> None:
+        """Expire entries and start due reconciles or consolidations (lock held)."""
+        self._expire()
+        now = time.monotonic()
+        if self._needs_consolidation(now):
+            self._start_consolidate()
+        elif (self.reconcile_interval is not None and not self._reconciling
+              and now - self._last_reconcile >= self.reconcile_interval):
+            self._start_reconcile()
+
+    def _needs_consolidation(self, now: float) -> bool:
+        if self._consolidating:
+            return False
+        if (self._last_consolidation is not None
+                and now - self._last_consolidation < self.consolidate_cooldown):
+            return False
+        if self.consolidate_size is not None and len(self._entries) >= self.consolidate_size:
+            return True
+        if self.consolidate_age_seconds is not None and self._stored_at:
+            return now - min(self._stored_at.values()) >= self.consolidate_age_seconds
+        return False
+
+    def _start_consolidate(self) -> "Future[Any]":
+        self._consolidating = True
+        self._last_consolidation = time.monotonic()
+        self._stats["consolidations"] += 1
+
+        def consolidate() -> Any:
+            try:
+                return self.client.consolidate(self.agent_id, strategy=self.consolidate_strategy)
+            finally:
+                with self._lock:
+                    self._consolidating = False
+
+        future = self._submit(None, consolidate)
+        # Consolidated entries leave working memory on the server
+        self._start_reconcile()
+        return future
+
+    def _start_reconcile(self) -> "Future[Any]":
+        self._reconciling = True
+        self._last_reconcile = time.monotonic()
+        return self._submit(None, self._reconcile)
+
+    def _reconcile(self) -> None:
+        try:
+            response = self.client.retrieve(self.agent_id, limit=self.max_items)
+        finally:
+            with self._lock:
+                self._reconciling = False
+                self._last_reconcile = time.monotonic()
+        memories = (response or {}).get('memories') or []
+        now = time.monotonic()
+        utcnow = datetime.now(timezone.utc)
+
+        with self._lock:
+            self._stats["reconciles"] += 1
+            # Server copies replace local ones, keeping the IDs callers were given
+            local_ids = {server_id: local_id for local_id, server_id in self._server_ids.items()}
+            stale = {local_id for local_id in self._entries if local_id not in self._pending}
+
+            for memory in memories:
+                server_id = memory.get('id')
+                if not server_id or server_id in self._deleting:
+                    continue
+                local_id = local_ids.get(server_id, server_id)
+                if local_id in self._pending:
+                    continue
+                expires_at = None
+                if memory.get('expires_at'):
+                    remaining = (parse_time(memory['expires_at']) - utcnow).total_seconds()
+                    if remaining <= 0:
+                        continue
+                    expires_at = now + remaining
+                elif local_id in self._expires_at:
+                    expires_at = self._expires_at[local_id]
+                stored_at = self._stored_at.get(local_id)
+                if stored_at is None and memory.get('created_at'):
+                    stored_at = now - max(0.0, (utcnow - parse_time(memory['created_at'])).total_seconds())
+                stale.discard(local_id)
+                self._server_ids[local_id] = server_id
+                if local_id != server_id:
+                    memory = dict(memory, id=local_id, server_id=server_id)
+                self._put(local_id, dict(memory), expires_at, stored_at)
+
+            for local_id in stale:
+                self._drop(local_id)
+                self._server_ids.pop(local_id, None)
+            self._evict()
+
+    # Public API
+
+    def store(
+        self,
+        content: str,
+        memory_type: str = "context",
+        priority: float = 0.5,
+        ttl_seconds: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Store content locally and write it through to the API.
+
+        Args:
+            content: Memory content to store
+            memory_type: Type of memory (context, task, observation)
+            priority: Priority level 0.0-1.0 (default: 0.5)
+            ttl_seconds: Time-to-live in seconds (optional)
+            metadata: Additional metadata (optional)
+
+        Returns:
+            The stored memory; its id is local until the write completes
+        """
+        if not content:
+            raise ValueError("content is required")
+
+        local_id = f"local-{uuid.uuid4().hex}"
+        memory: Dict[str, Any] = {
+            "id": local_id,
+            "agent_id": self.agent_id,
+            "content": content,
+            "memory_type": memory_type,
+            "priority": max(0.0, min(1.0, priority)),
+        }
+        if ttl_seconds is not None:
+            memory["ttl_seconds"] = ttl_seconds
+        if metadata is not None:
+            memory["metadata"] = metadata
+
+        def write() -> Any:
+            response = self.client.store(
+                self.agent_id, content, memory_type=memory_type, priority=priority,
+                ttl_seconds=ttl_seconds, metadata=metadata
+            )
+            server_id = response.get('id') if isinstance(response, dict) else None
+            if server_id:
+                with self._lock:
+                    self._server_ids[local_id] = server_id
+                    if local_id in self._entries:
+                        self._entries[local_id]["server_id"] = server_id
+            return response
+
+        with self._lock:
+            expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+            self._put(local_id, memory, expires_at)
+            self._stats["writes"] += 1
+            self._submit(local_id, write)
+            self._evict()
+            self._maintain()
+            return dict(memory)
+
+    def retrieve(
+        self,
+        memory_type: Optional[str] = None,
+        limit: int = 10,
+        min_priority: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve working memory from the local tier.
+
+        Args:
+            memory_type: Filter by memory type (optional)
+            limit: Maximum number of memories to retrieve (default: 10)
+            min_priority: Minimum priority threshold (optional)
+
+        Returns:
+            Dict containing list of memories (highest priority first) and count
+        """
+        with self._lock:
+            self._maintain()
+            self._stats["local_reads"] += 1
+            candidates = [
+                (local_id, memory) for local_id, memory in self._entries.items()
+                if (not memory_type or memory.get('memory_type') == memory_type)
+                and (min_priority is None or memory.get('priority', 0.5) >= min_priority)
+            ]
+            top = heapq.nsmallest(
+                limit, candidates,
+                key=lambda item: (-item[1].get('priority', 0.5), -self._stored_at.get(item[0], 0.0))
+            )
+            memories = [dict(memory) for _, memory in top]
+        return {"memories": memories, "count": len(memories)}
+
+    def update(
+        self,
+        memory_id: str,
+        content: Optional[str] = None,
+        priority: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Update an entry locally and write the change through to the API.
+
+        Args:
+            memory_id: Local or server ID of the memory
+            content: New content (optional)
+            priority: New priority level (optional)
+            metadata: New metadata (optional)
+
+        Returns:
+            The updated memory
+        """
+        if not memory_id:
+            raise ValueError("memory_id is required")
+        if content is None and priority is None and metadata is None:
+            raise ValueError("At least one field must be provided for update")
+
+        with self._lock:
+            local_id = self._local_id_for(memory_id)
+            memory = self._entries.get(local_id)
+            if memory is None:
+                raise KeyError(memory_id)
+            memory = dict(memory)
+            if content is not None:
+                memory["content"] = content
+            if priority is not None:
+                memory["priority"] = max(0.0, min(1.0, priority))
+            if metadata is not None:
+                memory["metadata"] = metadata
+            self._put(local_id, memory, self._expires_at.get(local_id))
+
+            def write() -> Any:
+                with self._lock:
+                    server_id = self._server_ids.get(local_id)
+                if server_id is None:
+                    raise ValueError(f"memory {memory_id} was never stored on the server")
+                return self.client.update(server_id, content=content, priority=priority,
+                                          metadata=metadata)
+
+            self._stats["writes"] += 1
+            self._submit(local_id, write)
+            return dict(memory)
+
+    def delete(self, memory_id: str) -> None:
+        """
+        Delete an entry locally and on the server.
+
+        Args:
+            memory_id: Local or server ID of the memory
+        """
+        if not memory_id:
+            raise ValueError("memory_id is required")
+
+        with self._lock:
+            local_id = self._local_id_for(memory_id)
+            self._drop(local_id)
+            known = self._server_ids.get(local_id)
+            if known is not None:
+                self._deleting.add(known)
+
+            def write() -> Any:
+                with self._lock:
+                    server_id = self._server_ids.pop(local_id, None)
+                if server_id is None:
+                    return None
+                try:
+                    return self.client.delete(server_id)
+                finally:
+                    with self._lock:
+                        self._deleting.discard(server_id)
+
+            self._stats["writes"] += 1
+            self._submit(local_id, write)
+
+    def reconcile(self, wait: bool = False) -> "Future[Any]":
+        """
+        Refresh the local tier from the server after queued writes complete.
+
+        Args:
+            wait: Block until the refresh is applied (default: False)
+
+        Returns:
+            Future resolving once the refresh is applied
+        """
+        with self._lock:
+            future = self._start_reconcile()
+        if wait:
+            future.result()
+        return future
+
+    def consolidate(self, wait: bool = True) -> Any:
+        """
+        Consolidate working memory on the server and refresh the local tier.
+
+        Args:
+            wait: Block until consolidation completes (default: True)
+
+        Returns:
+            consolidate() response if waiting, otherwise its Future
+        """
+        with self._lock:
+            future = self._start_consolidate()
+        return future.result() if wait else future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Block until every queued write has been sent.
+
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Raises:
+            TimeoutError: If writes are still queued after timeout
+        """
+        self._executor.submit(lambda: None).result(timeout=timeout)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get tier statistics.
+
+        Returns:
+            Dict with entries held, local reads, writes queued, failed
+            background calls, expirations, evictions, reconciles and
+            consolidations
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            return stats
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the background worker, sending queued writes first if wait is set."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "LocalWorkingMemory":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
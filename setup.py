@@ -29,4 +29,7 @@ setup(
     install_requires=[
         "requests>=2.31.0",
     ],
+    extras_require={
+        "analytics": ["numpy>=1.20"],
+    },
 )
@@ -0,0 +1,143 @@
+"""
+Tests for the incremental aggregation cache
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.aggregation import AggregationCache
+from recallbricks.autonomous import MemoryTypesClient, WorkingMemoryClient
+
+
+class TestAggregationCache(unittest.TestCase):
+    """Test caching and local bucket updates"""
+
+    def setUp(self):
+        self.search = MagicMock()
+        self.search.aggregate.return_value = {
+            "buckets": [{"key": "security", "count": 4}, {"key": "ops", "count": 2}],
+            "total": 6,
+        }
+        self.types = MagicMock()
+        self.types.get_statistics.return_value = {
+            "episodic": {"count": 1}, "semantic": {"count": 5}, "procedural": {"count": 0}, "total": 6,
+        }
+        self.cache = AggregationCache(self.search, self.types, refresh_interval=60)
+
+    def test_polls_share_one_fetch(self):
+        """Repeated reads within the interval are served locally"""
+        for _ in range(3):
+            result = self.cache.aggregate("agent_1", "category")
+        self.search.aggregate.assert_called_once_with("agent_1", "category", query=None, aggregation="count")
+        self.assertEqual(result["total"], 6)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["fetches"]), (2, 1))
+
+        # Callers get copies and cannot corrupt the cache
+        result["buckets"].clear()
+        self.assertEqual(len(self.cache.aggregate("agent_1", "category")["buckets"]), 2)
+
+    def test_refresh_interval(self):
+        """Results older than the interval are refetched"""
+        with patch('recallbricks.aggregation.time.monotonic', return_value=100.0):
+            self.cache.aggregate("agent_1", "category")
+        with patch('recallbricks.aggregation.time.monotonic', return_value=159.0):
+            self.cache.aggregate("agent_1", "category")
+        self.assertEqual(self.search.aggregate.call_count, 1)
+        with patch('recallbricks.aggregation.time.monotonic', return_value=161.0):
+            self.cache.aggregate("agent_1", "category")
+        self.assertEqual(self.search.aggregate.call_count, 2)
+
+    def test_store_and_delete_adjust_buckets(self):
+        """Local stores and deletes update counts without a fetch"""
+        self.cache.aggregate("agent_1", "category")
+        self.cache.get_statistics("agent_1")
+
+        self.cache.record_store("agent_1", {"id": "m1", "memory_type": "semantic", "category": "security"})
+        self.cache.record_store("agent_1", {"id": "m2", "memory_type": "semantic",
+                                            "metadata": {"category": "billing"}})
+        buckets = {b["key"]: b["count"] for b in self.cache.aggregate("agent_1", "category")["buckets"]}
+        self.assertEqual(buckets, {"security": 5, "ops": 2, "billing": 1})
+        self.assertEqual(self.cache.get_statistics("agent_1")["semantic"]["count"], 7)
+
+        self.cache.record_delete("m1")
+        result = self.cache.aggregate("agent_1", "category")
+        self.assertEqual(result["buckets"][0], {"key": "security", "count": 4})
+        self.assertEqual(result["total"], 7)
+        self.assertEqual(self.search.aggregate.call_count, 1)
+        self.assertEqual(self.types.get_statistics.call_count, 1)
+
+    def test_unadjustable_results_are_dropped(self):
+        """Filtered or non-count aggregates and unknown deletes force a refetch"""
+        self.cache.aggregate("agent_1", "category", query="deploy")
+        self.cache.aggregate("agent_1", "category", aggregation="avg_score")
+        self.cache.aggregate("agent_2", "category")
+        self.cache.record_store("agent_1", {"id": "m1", "category": "ops"})
+        self.assertEqual(self.cache.stats()["size"], 1)
+
+        self.cache.record_delete("unknown")
+        self.assertEqual(self.cache.stats()["size"], 0)
+
+    def test_clients_report_writes(self):
+        """Clients sharing the cache report stores, deletes and clears"""
+        types = MemoryTypesClient(api_key="test-key", aggregation_cache=self.cache)
+        working = WorkingMemoryClient(api_key="test-key", aggregation_cache=self.cache)
+        self.cache.aggregate("agent_1", "category")
+
+        with patch.object(types, '_request', return_value={"id": "s1"}):
+            types.store_semantic("agent_1", "TLS is required", category="security")
+        with patch.object(working, '_request', return_value={"id": "w1"}):
+            working.store("agent_1", "scratch", metadata={"category": "ops"})
+            working.delete("s1")
+        buckets = {b["key"]: b["count"] for b in self.cache.aggregate("agent_1", "category")["buckets"]}
+        self.assertEqual(buckets, {"security": 4, "ops": 3})
+
+        with patch.object(working, '_request', return_value={"success": True}):
+            working.clear("agent_1")
+        self.cache.aggregate("agent_1", "category")
+        self.assertEqual(self.search.aggregate.call_count, 2)
+
+    def test_updates_and_consolidation_invalidate(self):
+        """Updates and consolidations force a refetch of the agent's results"""
+        types = MemoryTypesClient(api_key="test-key", aggregation_cache=self.cache)
+        working = WorkingMemoryClient(api_key="test-key", aggregation_cache=self.cache)
+        calls = [
+            lambda: working.update("w1", metadata={"category": "security"}),
+            lambda: working.consolidate("agent_1"),
+            lambda: types.consolidate_semantic("agent_1"),
+        ]
+        for n, call in enumerate(calls, start=1):
+            self.cache.aggregate("agent_1", "category")
+            with patch.object(working, '_request', return_value={}), \
+                    patch.object(types, '_request', return_value={}):
+                call()
+            self.cache.aggregate("agent_1", "category")
+            self.assertEqual(self.search.aggregate.call_count, n + 1)
+
+    def test_fetch_locks_evicted(self):
+        """Fetch locks do not outlive their results"""
+        with patch('recallbricks.aggregation.time.monotonic', return_value=100.0):
+            for n in range(50):
+                self.cache.aggregate("agent_1", "category", query=f"q{n}")
+        with patch('recallbricks.aggregation.time.monotonic', return_value=200.0):
+            self.cache.aggregate("agent_2", "category")
+        self.assertEqual(len(self.cache._fetch_locks), 1)
+        self.cache.invalidate()
+        self.assertEqual(len(self.cache._fetch_locks), 0)
+
+    def test_validation(self):
+        """Missing clients and agent IDs are rejected"""
+        with self.assertRaises(ValueError):
+            AggregationCache(refresh_interval=0)
+        with self.assertRaises(ValueError):
+            AggregationCache().aggregate("agent_1", "category")
+        with self.assertRaises(ValueError):
+            self.cache.get_statistics("")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for vectorized graph analytics over memory relationships
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy  # noqa: F401
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from recallbricks.graph import MemoryGraph
+
+if HAS_NUMPY:
+    from recallbricks.analytics import GraphAnalytics
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestGraphAnalytics(unittest.TestCase):
+    """Test GraphAnalytics algorithms"""
+
+    def setUp(self):
+        # Two triangles joined by c-d, plus an orphan memory
+        self.analytics = GraphAnalytics.from_edges(
+            [("a", "b"), ("b", "c"), ("c", "a"),
+             ("d", "e"), ("e", "f"), ("f", "d"),
+             ("c", "d")],
+            memory_ids=["orphan"]
+        )
+
+    def test_counts(self):
+        """Nodes and edges are loaded"""
+        self.assertEqual(self.analytics.node_count, 7)
+        self.assertEqual(self.analytics.edge_count, 7)
+
+    def test_pagerank_sums_to_one(self):
+        """PageRank is a probability distribution favouring linked memories"""
+        ranks = self.analytics.pagerank()
+        self.assertAlmostEqual(sum(ranks.values()), 1.0, places=6)
+        self.assertLess(ranks["orphan"], ranks["d"])
+
+    def test_pagerank_star(self):
+        """The center of a star ranks highest"""
+        star = GraphAnalytics.from_edges([(leaf, "hub") for leaf in "abcde"])
+        self.assertEqual(star.hubs(top_k=1)[0][0], "hub")
+
+    def test_degree_centrality(self):
+        """Degree centrality counts in and out edges"""
+        centrality = self.analytics.degree_centrality()
+        self.assertAlmostEqual(centrality["c"], 3 / 6)
+        self.assertEqual(centrality["orphan"], 0.0)
+
+    def test_isolated(self):
+        """Memories without relationships are reported"""
+        self.assertEqual(self.analytics.isolated(), ["orphan"])
+
+    def test_connected_components(self):
+        """Linked memories form one component, the orphan another"""
+        components = self.analytics.connected_components()
+        self.assertEqual(sorted(components[0]), ["a", "b", "c", "d", "e", "f"])
+        self.assertEqual(components[1], ["orphan"])
+
+    def test_communities(self):
+        """Label propagation separates the two triangles"""
+        communities = [sorted(c) for c in self.analytics.communities()]
+        self.assertIn(["a", "b", "c"], communities)
+        self.assertIn(["d", "e", "f"], communities)
+        self.assertIn(["orphan"], communities)
+
+    def test_from_graph(self):
+        """A MemoryGraph's edges can be analysed directly"""
+        graph = MemoryGraph()
+        graph.add_edge("x", "y")
+        graph.add_edge("y", "z")
+        analytics = GraphAnalytics.from_graph(graph, memory_ids=["lonely"])
+        self.assertEqual(analytics.edge_count, 2)
+        self.assertEqual(analytics.isolated(), ["lonely"])
+        self.assertEqual(len(analytics.connected_components()[0]), 3)
+
+    def test_from_relationships_and_graph_context(self):
+        """API responses load without per-memory calls"""
+        analytics = GraphAnalytics.from_relationships({
+            "a": {"relationships": [{"type": "related_to", "target_id": "b"}]},
+            "c": {"relationships": []},
+        })
+        self.assertEqual(analytics.isolated(), ["c"])
+
+        analytics = GraphAnalytics.from_graph_context({
+            "nodes": [{"id": "r"}, {"id": "s"}],
+            "edges": [{"from": "r", "to": "s", "type": "related_to"}],
+        })
+        self.assertEqual(analytics.edge_count, 1)
+
+    def test_empty_graph(self):
+        """Empty graphs produce empty results"""
+        empty = GraphAnalytics([], [], [])
+        self.assertEqual(empty.pagerank(), {})
+        self.assertEqual(empty.connected_components(), [])
+        self.assertEqual(empty.communities(), [])
+
+    def test_invalid_edges(self):
+        """Out-of-range edge indices are rejected"""
+        with self.assertRaises(ValueError):
+            GraphAnalytics(["a"], [0], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for trie-backed local autocomplete
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autocomplete import RadixTrie, SuggestionEngine
+
+
+class TestRadixTrie(unittest.TestCase):
+    """Test the compressed trie"""
+
+    def test_complete_by_weight(self):
+        """Completions are ordered by weight, then alphabetically"""
+        trie = RadixTrie()
+        trie.add("authentication", 2.0)
+        trie.add("authorization")
+        trie.add("auth")
+        trie.add("audit")
+        self.assertEqual(trie.complete("auth"),
+                         [("authentication", 2.0), ("auth", 1.0), ("authorization", 1.0)])
+        self.assertEqual(trie.complete("authe"), [("authentication", 2.0)])
+        self.assertEqual(trie.complete("au", limit=1), [("authentication", 2.0)])
+        self.assertEqual(trie.complete("x"), [])
+
+    def test_edges_are_compressed(self):
+        """Single-child chains are stored as one edge and split on divergence"""
+        trie = RadixTrie()
+        trie.add("deployment")
+        root_child = trie._root.children["d"]
+        self.assertEqual(root_child.edge, "deployment")
+        trie.add("deploy")
+        self.assertEqual(trie._root.children["d"].edge, "deploy")
+        self.assertEqual(len(trie), 2)
+        self.assertIn("deploy", trie)
+        self.assertNotIn("depl", trie)
+
+    def test_case_insensitive_and_weights_accumulate(self):
+        """Lookups ignore case and re-adding a term adds weight"""
+        trie = RadixTrie()
+        trie.add("Kubernetes")
+        trie.add("kubernetes", 2.0)
+        self.assertEqual(trie.complete("KUB"), [("Kubernetes", 3.0)])
+        self.assertEqual(len(trie), 1)
+
+
+class TestSuggestionEngine(unittest.TestCase):
+    """Test SuggestionEngine API avoidance"""
+
+    def setUp(self):
+        self.search = MagicMock()
+        self.search.suggest.return_value = {"suggestions": ["auth tokens", "authorization"]}
+        self.engine = SuggestionEngine(self.search, agent_id="agent_1", min_results=2)
+
+    def test_local_results_skip_api(self):
+        """Enough local suggestions means no API call"""
+        self.engine.add_queries(["authentication flow", "auth middleware"])
+        self.assertEqual(self.engine.suggest("auth"), ["auth middleware", "authentication flow"])
+        self.search.suggest.assert_not_called()
+
+    def test_api_fills_gaps_once(self):
+        """Sparse prefixes hit the API; exhausted prefixes are not re-fetched"""
+        self.assertEqual(self.engine.suggest("auth"), ["auth tokens", "authorization"])
+        self.search.suggest.assert_called_once_with("agent_1", "auth", limit=5)
+
+        self.search.suggest.return_value = {"suggestions": []}
+        self.engine.suggest("autho")
+        self.engine.suggest("authx")
+        self.assertEqual(self.search.suggest.call_count, 1)
+        self.assertEqual(self.engine.stats()["api_calls"], 1)
+
+    def test_seed_from_memories(self):
+        """Tags and entities of memories become suggestions"""
+        self.engine.add_memories([
+            {"id": "1", "tags": ["postgres"], "metadata": {"entities": ["PostgreSQL", "pgbouncer"]}},
+        ])
+        self.assertEqual(self.engine.suggest("p", limit=3), ["pgbouncer", "postgres", "PostgreSQL"])
+        self.search.suggest.assert_not_called()
+
+    def test_debounce_collapses_keystrokes(self):
+        """A burst of keystrokes results in one API call for the last prefix"""
+        engine = SuggestionEngine(self.search, agent_id="agent_1", debounce_seconds=0.05)
+        done = threading.Event()
+        received = []
+
+        def callback(prefix, suggestions):
+            received.append((prefix, suggestions))
+            done.set()
+
+        for prefix in ("a", "au", "aut"):
+            self.assertEqual(engine.suggest_debounced(prefix, callback), [])
+
+        self.assertTrue(done.wait(2))
+        self.search.suggest.assert_called_once_with("agent_1", "aut", limit=5)
+        self.assertEqual(received, [("aut", ["auth tokens", "authorization"])])
+        self.assertEqual(engine.stats()["debounced"], 2)
+        engine.close()
+
+    def test_validation(self):
+        """agent_id and partial_query are required"""
+        with self.assertRaises(ValueError):
+            SuggestionEngine(self.search, agent_id="")
+        with self.assertRaises(ValueError):
+            self.engine.suggest("")
+
+
+if __name__ == '__main__':
+    unittest.main()
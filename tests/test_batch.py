@@ -0,0 +1,206 @@
+"""
+Tests for batched multi-query execution
+Covers recall_many, search_weighted_many and SearchClient.semantic_many
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.autonomous import SearchClient
+from recallbricks.batch import run_concurrently, deduplicate, ensure_pool_capacity
+from recallbricks.exceptions import APIError
+from recallbricks.types import WeightedSearchResult
+
+
+class TestRunConcurrently(unittest.TestCase):
+    """Test the generic concurrent runner"""
+
+    def test_preserves_order(self):
+        """Results come back in input order regardless of completion order"""
+        def work(n):
+            time.sleep(0.01 * (5 - n))
+            return n * 2
+
+        results = run_concurrently(work, [{"n": i} for i in range(5)], max_workers=5)
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+
+    def test_exceptions_are_returned_in_place(self):
+        """A failing call yields its exception without affecting the others"""
+        def work(n):
+            if n == 1:
+                raise ValueError("boom")
+            return n
+
+        results = run_concurrently(work, [{"n": 0}, {"n": 1}, {"n": 2}])
+        self.assertEqual(results[0], 0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 2)
+
+    def test_runs_in_parallel(self):
+        """Calls overlap instead of running one after another"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        run_concurrently(work, [{} for _ in range(4)], max_workers=4)
+        self.assertGreater(max(peak), 1)
+
+    def test_invalid_max_workers(self):
+        """max_workers must be positive"""
+        with self.assertRaises(ValueError):
+            run_concurrently(lambda: None, [{}], max_workers=0)
+
+    def test_ensure_pool_capacity_grows_pool(self):
+        """The session pool is enlarged to match the worker count"""
+        client = RecallBricks(api_key="test_key")
+        ensure_pool_capacity(client.session, 32)
+        self.assertEqual(client.session.adapters["https://"]._pool_maxsize, 32)
+
+    def test_ensure_pool_capacity_keeps_adapter_config(self):
+        """Resizing keeps the mounted retry policy; adapter subclasses are left alone"""
+        client = RecallBricks(api_key="test_key")
+        client.session.mount("https://", HTTPAdapter(max_retries=Retry(total=5)))
+        ensure_pool_capacity(client.session, 32)
+        adapter = client.session.adapters["https://"]
+        self.assertEqual((adapter._pool_maxsize, adapter.max_retries.total), (32, 5))
+
+        class TLSAdapter(HTTPAdapter):
+            pass
+
+        custom = TLSAdapter()
+        client.session.mount("https://", custom)
+        ensure_pool_capacity(client.session, 64)
+        self.assertIs(client.session.adapters["https://"], custom)
+
+
+class TestDeduplicate(unittest.TestCase):
+    """Test cross-result de-duplication"""
+
+    def test_dict_results(self):
+        """Later duplicates are dropped and counts updated"""
+        results = [
+            {"memories": [{"id": "a"}, {"id": "b"}], "count": 2},
+            APIError("failed", status_code=500),
+            {"memories": [{"id": "b"}, {"id": "c"}], "count": 2},
+        ]
+        deduped = deduplicate(results, items_key="memories")
+        self.assertEqual([m["id"] for m in deduped[0]["memories"]], ["a", "b"])
+        self.assertIs(deduped[1], results[1])
+        self.assertEqual([m["id"] for m in deduped[2]["memories"]], ["c"])
+        self.assertEqual(deduped[2]["count"], 1)
+        # Input is not mutated
+        self.assertEqual(len(results[2]["memories"]), 2)
+
+    def test_object_results(self):
+        """Result objects are de-duplicated by their id attribute"""
+        results = [
+            [WeightedSearchResult(id="a", text="x")],
+            [WeightedSearchResult(id="a", text="x"), WeightedSearchResult(id="b", text="y")],
+        ]
+        deduped = deduplicate(results)
+        self.assertEqual([r.id for r in deduped[1]], ["b"])
+
+
+class TestRecallMany(unittest.TestCase):
+    """Test RecallBricks.recall_many and search_weighted_many"""
+
+    def setUp(self):
+        self.client = RecallBricks(api_key="test_key")
+
+    def test_recall_many(self):
+        """Each query is sent and results are returned in order"""
+        def fake_request(method, endpoint, **kwargs):
+            query = kwargs["json"]["query"]
+            if query == "bad":
+                raise APIError("Server error", status_code=500)
+            return {"memories": [{"id": query}], "count": 1}
+
+        with patch.object(self.client, '_request', side_effect=fake_request) as mock_request:
+            results = self.client.recall_many(["one", "bad", "two"], limit=3)
+
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(results[0]["memories"][0]["id"], "one")
+        self.assertIsInstance(results[1], APIError)
+        self.assertEqual(results[2]["memories"][0]["id"], "two")
+
+    def test_recall_many_validation_errors_are_per_query(self):
+        """An invalid query fails on its own slot"""
+        with patch.object(self.client, '_request') as mock_request:
+            mock_request.return_value = {"memories": [], "count": 0}
+            results = self.client.recall_many(["ok", ""])
+
+        self.assertIsInstance(results[0], dict)
+        self.assertIsInstance(results[1], ValueError)
+
+    def test_recall_many_requires_list(self):
+        """queries must be a list"""
+        with self.assertRaises(TypeError):
+            self.client.recall_many("single query")
+
+    def test_recall_many_deduplicates(self):
+        """deduplicate_results removes memories seen in earlier queries"""
+        with patch.object(self.client, '_request') as mock_request:
+            mock_request.return_value = {"memories": [{"id": "shared"}], "count": 1}
+            results = self.client.recall_many(["a", "b"], deduplicate_results=True)
+
+        self.assertEqual(len(results[0]["memories"]), 1)
+        self.assertEqual(results[1]["memories"], [])
+
+    def test_search_weighted_many(self):
+        """search_weighted_many parses each response into result objects"""
+        with patch.object(self.client, '_request') as mock_request:
+            mock_request.return_value = {"results": [{"id": "m1", "text": "hello"}]}
+            results = self.client.search_weighted_many(["a", "b"], deduplicate_results=True)
+
+        self.assertIsInstance(results[0][0], WeightedSearchResult)
+        self.assertEqual(results[1], [])
+
+
+class TestSemanticMany(unittest.TestCase):
+    """Test SearchClient.semantic_many"""
+
+    def setUp(self):
+        self.client = SearchClient(api_key="test_key")
+
+    @patch.object(SearchClient, '_request')
+    def test_semantic_many(self, mock_request):
+        """Each query is posted to the semantic search endpoint"""
+        mock_request.return_value = {"results": [{"id": "r1"}]}
+
+        results = self.client.semantic_many(
+            agent_id="agent_123",
+            queries=["q1", "q2"],
+            deduplicate_results=True
+        )
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args[0][1], "/api/autonomous/search")
+        self.assertEqual(len(results[0]["results"]), 1)
+        self.assertEqual(results[1]["results"], [])
+
+    def test_semantic_many_requires_agent_id(self):
+        """agent_id is required"""
+        with self.assertRaises(ValueError):
+            self.client.semantic_many(agent_id="", queries=["q"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Tests for local confidence-calibration analytics
+"""
+
+import random
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy  # noqa: F401
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from recallbricks.autonomous import UncertaintyClient
+
+if HAS_NUMPY:
+    from recallbricks.calibration import CalibrationTracker
+
+
+def brute_force(pairs, n_bins=10):
+    """Reference ECE and Brier score computed pair by pair."""
+    bins = {}
+    for confidence, outcome in pairs:
+        bins.setdefault(min(int(confidence * n_bins), n_bins - 1), []).append((confidence, outcome))
+    ece = sum(
+        len(items) / len(pairs) * abs(sum(o for _, o in items) / len(items) - sum(c for c, _ in items) / len(items))
+        for items in bins.values()
+    )
+    brier = sum((c - o) ** 2 for c, o in pairs) / len(pairs)
+    return ece, brier
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestCalibrationTracker(unittest.TestCase):
+    """Test calibration metrics and syncing"""
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.pairs = [(rng.random(), float(rng.random() < 0.6)) for _ in range(500)]
+
+    def test_matches_reference(self):
+        """Incremental and batch updates give the reference metrics"""
+        one_by_one = CalibrationTracker()
+        for confidence, outcome in self.pairs:
+            one_by_one.add("agent_1", "topic", confidence, outcome)
+        batched = CalibrationTracker()
+        batched.add_many("agent_1", "topic", [c for c, _ in self.pairs], [o for _, o in self.pairs])
+
+        ece, brier = brute_force(self.pairs)
+        for tracker in (one_by_one, batched):
+            report = tracker.report("agent_1")
+            self.assertEqual(report["count"], 500)
+            self.assertAlmostEqual(report["ece"], ece)
+            self.assertAlmostEqual(report["brier"], brier)
+            self.assertEqual(sum(b["count"] for b in report["bins"]), 500)
+
+    def test_reliability_bins(self):
+        tracker = CalibrationTracker(n_bins=4)
+        tracker.add_many("agent_1", "t", [0.1, 0.2, 0.9, 1.0], [0, 1, 1, 1])
+        report = tracker.report("agent_1")
+        self.assertEqual([(b["lower"], b["count"], b["accuracy"]) for b in report["bins"]],
+                         [(0.0, 2, 0.5), (0.75, 2, 1.0)])
+        self.assertAlmostEqual(report["mce"], abs(0.5 - 0.15))
+
+    def test_per_topic_breakdown(self):
+        """Topics are reported separately and combined for the agent"""
+        tracker = CalibrationTracker()
+        tracker.add_many("agent_1", ["db", "db", "auth"], [0.9, 0.9, 0.9], [1, 1, 0])
+        tracker.add("agent_2", "db", 0.5, True)
+        topics = tracker.by_topic("agent_1")
+        self.assertEqual(set(topics), {"db", "auth"})
+        self.assertAlmostEqual(topics["db"]["brier"], 0.01)
+        self.assertAlmostEqual(topics["auth"]["brier"], 0.81)
+        self.assertEqual(tracker.report("agent_1")["count"], 3)
+        self.assertIsNone(tracker.report("agent_3")["ece"])
+
+    def test_predict_resolve(self):
+        tracker = CalibrationTracker(max_pending=1)
+        tracker.predict("u1", "agent_1", "db", 0.8)
+        tracker.predict("u2", "agent_1", "db", 0.7)
+        self.assertFalse(tracker.resolve("u1", True))           # evicted
+        self.assertTrue(tracker.resolve("u2", False))
+        self.assertAlmostEqual(tracker.report("agent_1")["brier"], 0.49)
+
+    def test_sync_sends_deltas(self):
+        """Each sync sends one summary per topic with new outcomes"""
+        client = MagicMock()
+        tracker = CalibrationTracker(client)
+        tracker.add_many("agent_1", "db", [0.8, 0.6], [1, 0])
+        self.assertEqual(tracker.sync(), 1)
+        client.calibrate.assert_called_once_with(
+            "agent_1", "db", actual_outcome="Summary of 2 outcomes: observed accuracy 0.500",
+            predicted_confidence=0.7
+        )
+        self.assertEqual(tracker.sync(), 0)
+
+        client.calibrate.side_effect = RuntimeError("down")
+        tracker.add("agent_1", "db", 0.9, True)
+        self.assertEqual(tracker.sync(), 0)
+        client.calibrate.side_effect = None
+        tracker.sync()
+        self.assertEqual(client.calibrate.call_args.kwargs["predicted_confidence"], 0.9)
+
+    def test_concurrent_syncs_send_once(self):
+        """A sync started while another is sending does not resend its delta"""
+        gate = threading.Event()
+        started = threading.Event()
+        client = MagicMock()
+        client.calibrate.side_effect = lambda *args, **kwargs: (started.set(), gate.wait(2))
+        tracker = CalibrationTracker(client)
+        tracker.add("agent_1", "db", 0.8, True)
+        first = threading.Thread(target=tracker.sync)
+        first.start()
+        self.assertTrue(started.wait(2))
+        second = threading.Thread(target=tracker.sync)
+        second.start()
+        gate.set()
+        first.join(2)
+        second.join(2)
+        client.calibrate.assert_called_once()
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestClientCalibration(unittest.TestCase):
+    """Test UncertaintyClient.track_calibration()"""
+
+    def test_record_and_resolve_feed_tracker(self):
+        client = UncertaintyClient(api_key="test-key")
+        tracker = client.track_calibration()
+        with patch.object(client, '_request', return_value={"id": "unc_1"}):
+            client.record("agent_1", "db", confidence=0.8)
+            client.resolve("unc_1", "It worked", 0.9, outcome=True)
+            client.record("agent_1", "auth", confidence=0.6)
+            client.resolve("unc_1", "Already resolved", 0.5)
+        self.assertEqual(tracker.report("agent_1")["count"], 2)
+        self.assertAlmostEqual(tracker.by_topic("agent_1")["db"]["brier"], 0.04)
+        self.assertAlmostEqual(tracker.by_topic("agent_1")["auth"]["accuracy"], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Tests for slotted, lazily-read compact result types
+"""
+
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.types import (
+    PredictedMemory,
+    WeightedSearchResult,
+    CompactPredictedMemory,
+    CompactSuggestedMemory,
+    CompactWeightedSearchResult,
+)
+
+
+class TestCompactTypes(unittest.TestCase):
+    """Test compact result types"""
+
+    def test_no_instance_dict(self):
+        """Compact results carry no per-instance __dict__"""
+        result = CompactWeightedSearchResult.from_dict({"id": "m1"})
+        self.assertFalse(hasattr(result, "__dict__"))
+        with self.assertRaises(AttributeError):
+            result.unknown_field = 1
+
+    def test_from_dict_wraps_without_copying(self):
+        """Fields are read from the response dict on access"""
+        data = {"id": "m1", "text": "hello", "relevance_score": 0.9}
+        result = CompactWeightedSearchResult.from_dict(data)
+        data["text"] = "changed"
+        self.assertEqual(result.text, "changed")
+        self.assertEqual(result.relevance_score, 0.9)
+
+    def test_defaults_match_dataclasses(self):
+        """Missing fields use the same defaults as the dataclass from_dict"""
+        compact = CompactWeightedSearchResult.from_dict({})
+        full = WeightedSearchResult.from_dict({})
+        self.assertEqual(compact.to_dict(), full.__dict__)
+
+        compact = CompactPredictedMemory.from_dict({"id": "p1"})
+        full = PredictedMemory.from_dict({"id": "p1"})
+        self.assertEqual(compact.to_dict(), full.__dict__)
+
+    def test_strings_are_interned(self):
+        """Repeated source, project_id and tag strings share one object"""
+        a = CompactWeightedSearchResult.from_dict(
+            {"source": "".join(["ap", "i-x"]), "tags": ["".join(["t", "ag"])]})
+        b = CompactWeightedSearchResult.from_dict(
+            {"source": "".join(["api", "-x"]), "tags": ["".join(["ta", "g"])]})
+        self.assertIs(a.source, b.source)
+        self.assertIs(a.tags[0], b.tags[0])
+
+    def test_constructor_and_assignment(self):
+        """Keyword/positional construction and assignment work like dataclasses"""
+        result = CompactSuggestedMemory("s1", "content", confidence=0.7)
+        self.assertEqual(result.id, "s1")
+        self.assertEqual(result.reasoning, "")
+        result.reasoning = "because"
+        self.assertEqual(result.reasoning, "because")
+        self.assertEqual(result, CompactSuggestedMemory(
+            id="s1", content="content", confidence=0.7, reasoning="because"))
+        with self.assertRaises(TypeError):
+            CompactSuggestedMemory(bogus=1)
+
+    def test_default_tags_are_not_shared(self):
+        """Missing tags default to a fresh list per result"""
+        a = CompactWeightedSearchResult.from_dict({})
+        b = CompactWeightedSearchResult.from_dict({})
+        a.tags.append("x")
+        self.assertEqual(b.tags, [])
+        self.assertEqual(a.tags, ["x"])
+
+
+class TestCompactResultsClient(unittest.TestCase):
+    """Test the compact_results client option"""
+
+    def test_search_weighted_returns_compact(self):
+        """search_weighted returns compact results when enabled"""
+        client = RecallBricks(api_key="test_key", compact_results=True)
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {"results": [{"id": "m1", "text": "x", "usage_boost": 0.2}]}
+            results = client.search_weighted("query")
+
+        self.assertIsInstance(results[0], CompactWeightedSearchResult)
+        self.assertEqual(results[0].usage_boost, 0.2)
+
+    def test_predict_and_suggest_return_compact(self):
+        """predict_memories and suggest_memories honour compact_results"""
+        client = RecallBricks(api_key="test_key", compact_results=True)
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {
+                "predictions": [{"id": "p1", "confidence_score": 0.8}],
+                "suggestions": [{"id": "s1", "confidence": 0.9}],
+            }
+            predictions = client.predict_memories(context="ctx")
+            suggestions = client.suggest_memories("ctx")
+
+        self.assertIsInstance(predictions[0], CompactPredictedMemory)
+        self.assertIsInstance(suggestions[0], CompactSuggestedMemory)
+
+    def test_default_is_dataclasses(self):
+        """Dataclass results remain the default"""
+        client = RecallBricks(api_key="test_key")
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {"results": [{"id": "m1"}]}
+            self.assertIsInstance(client.search_weighted("query")[0], WeightedSearchResult)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for the session-state cache and JSON Patch updates
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import ContextClient
+from recallbricks.context_state import SessionStateCache, json_patch
+from recallbricks.exceptions import APIError
+
+
+class TestJsonPatch(unittest.TestCase):
+    """Test patch computation"""
+
+    def test_minimal_operations(self):
+        """Only changed keys are emitted, nested objects are descended"""
+        old = {"a": 1, "b": {"c": [1, 2], "d": "x"}, "gone": True, "a/b": 0}
+        new = {"a": 1, "b": {"c": [1, 2, 3], "d": "x"}, "added": None, "a/b": 1}
+        self.assertEqual(json_patch(old, new), [
+            {"op": "remove", "path": "/gone"},
+            {"op": "replace", "path": "/b/c", "value": [1, 2, 3]},
+            {"op": "add", "path": "/added", "value": None},
+            {"op": "replace", "path": "/a~1b", "value": 1},
+        ])
+        self.assertEqual(json_patch(old, dict(old)), [])
+
+    def test_type_change_is_replaced(self):
+        """1 and True compare equal but are different JSON"""
+        self.assertEqual(json_patch({"x": 1}, {"x": True}),
+                         [{"op": "replace", "path": "/x", "value": True}])
+
+
+class TestSessionStateCache(unittest.TestCase):
+    """Test local reads and delta updates"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get.return_value = {
+            "id": "sess_1", "version": 3, "context": {"topic": "auth", "notes": "x" * 1000}
+        }
+        self.client.patch.return_value = {"version": 4}
+        self.cache = SessionStateCache(self.client)
+
+    def test_get_served_locally(self):
+        """Session state is fetched once and copies are returned"""
+        first = self.cache.get("sess_1")
+        first["context"]["topic"] = "mutated"
+        self.assertEqual(self.cache.get("sess_1")["context"]["topic"], "auth")
+        self.client.get.assert_called_once_with("sess_1")
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_update_sends_patch(self):
+        """A one-key change is sent as one operation with the known version"""
+        result = self.cache.update("sess_1", {"topic": "billing"})
+        self.client.patch.assert_called_once_with(
+            "sess_1", [{"op": "replace", "path": "/topic", "value": "billing"}], version=3)
+        self.client.update.assert_not_called()
+        self.assertEqual(result["context"]["topic"], "billing")
+        self.assertEqual(result["version"], 4)
+
+        self.cache.update("sess_1", {"step": 2}, merge=False)
+        self.assertEqual(self.client.patch.call_args.kwargs["version"], 4)
+        self.assertEqual(self.cache.get("sess_1")["context"], {"step": 2})
+        self.client.get.assert_called_once()
+        self.assertGreater(self.cache.stats()["bytes_saved"], 900)
+
+    def test_unchanged_update_is_skipped(self):
+        """Updating to the cached values sends nothing"""
+        self.cache.update("sess_1", {"topic": "auth"})
+        self.client.patch.assert_not_called()
+        self.assertEqual(self.cache.stats()["unchanged"], 1)
+
+    def test_conflict_falls_back_to_full_update(self):
+        """A stale version resends the update in full and caches the result"""
+        self.client.patch.side_effect = APIError("Version conflict", status_code=409)
+        self.client.update.return_value = {"version": 9, "context": {"topic": "billing", "other": 1}}
+        result = self.cache.update("sess_1", {"topic": "billing"})
+        self.client.update.assert_called_once_with("sess_1", {"topic": "billing"}, merge=True)
+        self.assertEqual(result["version"], 9)
+        self.assertEqual(self.cache.get("sess_1")["context"]["other"], 1)
+        self.assertEqual(self.cache.stats()["conflicts"], 1)
+
+    def test_unsupported_patch_disables_patching(self):
+        """Servers without PATCH get full updates from then on"""
+        self.client.patch.side_effect = APIError("Method not allowed", status_code=405)
+        self.client.update.return_value = {"success": True}
+        self.cache.update("sess_1", {"topic": "a"})
+        self.cache.update("sess_1", {"topic": "b"})
+        self.client.patch.assert_called_once()
+        self.assertEqual(self.client.update.call_count, 2)
+
+    def test_other_errors_propagate(self):
+        """Errors unrelated to versioning are raised"""
+        self.client.patch.side_effect = APIError("Server error", status_code=500)
+        with self.assertRaises(APIError):
+            self.cache.update("sess_1", {"topic": "billing"})
+
+    def test_environment_cached(self):
+        """get_environment() is served locally until set or invalidated"""
+        self.client.get_environment.return_value = {"timezone": "UTC"}
+        self.cache.get_environment("agent_1")
+        self.cache.get_environment("agent_1")
+        self.client.get_environment.assert_called_once()
+
+        self.cache.set_environment("agent_1", {"timezone": "UTC"})
+        self.client.set_environment.assert_not_called()
+        self.cache.set_environment("agent_1", {"timezone": "America/New_York"})
+        self.client.set_environment.assert_called_once()
+        self.cache.get_environment("agent_1")
+        self.assertEqual(self.client.get_environment.call_count, 2)
+
+    def test_max_age(self):
+        """Entries older than max_age are refetched"""
+        cache = SessionStateCache(self.client, max_age=10)
+        with patch('recallbricks.context_state.time.monotonic', return_value=100.0):
+            cache.get("sess_1")
+        with patch('recallbricks.context_state.time.monotonic', return_value=111.0):
+            cache.get("sess_1")
+        self.assertEqual(self.client.get.call_count, 2)
+
+
+class TestContextClientPatch(unittest.TestCase):
+    """Test ContextClient.patch() and state_cache()"""
+
+    def test_patch_request(self):
+        client = ContextClient(api_key="test-key")
+        operations = [{"op": "replace", "path": "/topic", "value": "billing"}]
+        with patch.object(client, '_request', return_value={"version": 2}) as mock_request:
+            client.patch("sess_1", operations, version=1)
+        mock_request.assert_called_once_with(
+            "PATCH", "/api/autonomous/context/sess_1",
+            json={"patch": operations, "version": 1}
+        )
+        self.assertIsInstance(client.state_cache(), SessionStateCache)
+        with self.assertRaises(ValueError):
+            client.patch("sess_1", [])
+
+
+if __name__ == '__main__':
+    unittest.main()
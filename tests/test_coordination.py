@@ -0,0 +1,202 @@
+"""
+Tests for cross-process coordination of trigger polling
+"""
+
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import ProspectiveMemoryClient
+from recallbricks.coordination import CoordinatedTriggerPoller, shard_of
+
+
+class TestCoordinatedTriggerPoller(unittest.TestCase):
+    """Test shard leasing, handoff and delivery between workers"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp, ignore_errors=True)
+        self.db_path = os.path.join(self.tmp, "triggers.sqlite3")
+        self.client = MagicMock()
+        self.client.check_triggers.return_value = {"triggered": []}
+
+    def worker(self, name, **options):
+        received = []
+        worker = CoordinatedTriggerPoller(
+            self.client, self.db_path, worker_id=name, num_shards=4, lease_seconds=10,
+            handlers=[lambda agent_id, memory: received.append((agent_id, memory["id"]))], **options
+        )
+        worker.received = received
+        return worker
+
+    def test_each_shard_has_one_leader(self):
+        """Workers split the active shards and never poll the same agent"""
+        a, b = self.worker("a"), self.worker("b")
+        agents = [f"agent_{i}" for i in range(20)]
+        for agent_id in agents:
+            a.subscribe(agent_id)
+            b.subscribe(agent_id)
+        for _ in range(3):
+            a.tick()
+            b.tick()
+
+        self.assertFalse(a.owned_shards & b.owned_shards)
+        self.assertEqual(len(a.owned_shards | b.owned_shards), len({shard_of(x, 4) for x in agents}))
+        self.assertTrue(a.owned_shards and b.owned_shards)
+        polled_a = set(a.poller.stats()["intervals"])
+        polled_b = set(b.poller.stats()["intervals"])
+        self.assertFalse(polled_a & polled_b)
+        self.assertEqual(polled_a | polled_b, set(agents))
+        a.stop()
+        b.stop()
+
+    def test_fired_triggers_reach_subscriber(self):
+        """A trigger found by the leader is delivered once, to the serving worker"""
+        a, b = self.worker("a"), self.worker("b")
+        a.subscribe("agent_1")
+        a.tick()
+        b.subscribe("agent_2")
+        b.tick()
+        leader = a if shard_of("agent_2", 4) in a.owned_shards else b
+        self.assertIn("agent_2", leader.poller.stats()["intervals"])
+
+        self.client.check_triggers.return_value = {"triggered": [{"id": "pm_1", "content": "standup"}]}
+        leader.poller.check("agent_2")
+        a.tick()
+        b.tick()
+        self.assertEqual(b.received, [("agent_2", "pm_1")])
+        self.assertEqual(a.received, [])
+        b.tick()
+        self.assertEqual(len(b.received), 1)
+        a.stop()
+        b.stop()
+
+    def test_handoff_when_worker_dies(self):
+        """Shards of a worker that stops heartbeating move to a live worker"""
+        a, b = self.worker("a"), self.worker("b")
+        a.subscribe("agent_1")
+        b.subscribe("agent_1")
+        a.tick()
+        b.tick()
+        self.assertEqual(a.owned_shards, {shard_of("agent_1", 4)})
+        self.assertEqual(b.owned_shards, set())
+
+        # "a" crashes: no stop(), no more ticks
+        with patch('recallbricks.coordination.time.time', return_value=time.time() + 11):
+            b.tick()
+        self.assertEqual(b.owned_shards, {shard_of("agent_1", 4)})
+        b.stop()
+
+    def test_stop_hands_off_immediately(self):
+        """A clean stop releases leases for the next tick of other workers"""
+        a, b = self.worker("a"), self.worker("b")
+        a.subscribe("agent_1")
+        b.subscribe("agent_1")
+        a.tick()
+        a.stop()
+        b.tick()
+        self.assertEqual(b.owned_shards, {shard_of("agent_1", 4)})
+        b.stop()
+
+    def test_restart(self):
+        """A stopped worker rejoins with its subscriptions on start()"""
+        a = self.worker("a", tick_seconds=0.01)
+        a.subscribe("agent_1")
+        a.start()
+        a.stop()
+        self.assertEqual(a.owned_shards, set())
+
+        a.start()
+        self.addCleanup(a.stop)
+        self.assertEqual(a.owned_shards, {shard_of("agent_1", 4)})
+        self.assertIn("agent_1", a.poller.stats()["intervals"])
+
+    def test_tick_errors_reported(self):
+        """Any failure in a background tick is counted and passed to on_error"""
+        errors = []
+        a = self.worker("a", tick_seconds=0.01, on_error=lambda agent_id, e: errors.append(e))
+        a.start()
+        self.addCleanup(a.stop)
+        with patch.object(a, 'tick', side_effect=KeyError("agent_1")):
+            deadline = time.time() + 2
+            while not errors and time.time() < deadline:
+                time.sleep(0.01)
+        self.assertIsInstance(errors[0], KeyError)
+        self.assertGreaterEqual(a.stats()["errors"], 1)
+        self.assertTrue(a._thread.is_alive())
+
+    def test_hint_reaches_leader(self):
+        """A trigger_at hinted in one worker moves the leader's next check"""
+        a, b = self.worker("a", base_interval=300, max_interval=600), self.worker("b")
+        a.subscribe("agent_1")
+        a.tick()
+        b.tick()
+        a.poller._agents["agent_1"].due = time.monotonic() + 300
+
+        b.hint("agent_1", datetime.now(timezone.utc) + timedelta(seconds=2))
+        a.tick()
+        self.assertLess(a.poller._agents["agent_1"].due - time.monotonic(), 3)
+        a.stop()
+        b.stop()
+
+    def test_processes_share_one_lease(self):
+        """Separate processes contend for the same lease through the file"""
+        script = textwrap.dedent(f"""
+            import sys
+            sys.path.insert(0, {os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))!r})
+            from unittest.mock import MagicMock
+            from recallbricks.coordination import CoordinatedTriggerPoller
+            worker = CoordinatedTriggerPoller(MagicMock(), {self.db_path!r}, worker_id=sys.argv[1],
+                                              num_shards=1, lease_seconds=30)
+            worker.subscribe("agent_1")
+            worker.tick()
+            print(len(worker.owned_shards))
+        """)
+        owners = [
+            int(subprocess.run([sys.executable, "-c", script, name], capture_output=True,
+                               text=True, check=True).stdout)
+            for name in ("p1", "p2")
+        ]
+        self.assertEqual(owners, [1, 0])
+
+    def test_client_helper(self):
+        """poll_triggers_coordinated() subscribes the given agents"""
+        client = ProspectiveMemoryClient(api_key="test-key")
+        poller = client.poll_triggers_coordinated(["agent_1"], db_path=self.db_path, start=False)
+        poller.tick()
+        self.assertEqual(poller.stats()["subscribed"], 1)
+        self.assertEqual(poller.stats()["owned_shards"], 1)
+        self.assertIs(client.trigger_poller, poller)
+
+        poller.poller._agents["agent_1"].due = time.monotonic() + 300
+        trigger_at = (datetime.now(timezone.utc) + timedelta(seconds=2)).isoformat()
+        with patch.object(client, '_request', return_value={"id": "pm_1"}):
+            client.create("agent_1", "standup", trigger_at=trigger_at)
+        self.assertLess(poller.poller._agents["agent_1"].due - time.monotonic(), 3)
+        poller.stop()
+
+    @unittest.skipIf(os.name == "nt", "POSIX permissions")
+    def test_default_db_is_private(self):
+        """The default database lives in a per-user directory only its owner can read"""
+        client = ProspectiveMemoryClient(api_key="test-key")
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.tmp}):
+            poller = client.poll_triggers_coordinated(["agent_1"], start=False)
+        poller.stop()
+        directory = os.path.join(self.tmp, "recallbricks")
+        self.assertEqual(os.path.dirname(poller.db_path), directory)
+        self.assertEqual(stat.S_IMODE(os.stat(directory).st_mode), 0o700)
+        self.assertEqual(stat.S_IMODE(os.stat(poller.db_path).st_mode), 0o600)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Tests for MMR diversification of recall results
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from recallbricks import RecallBricks
+
+if HAS_NUMPY:
+    from recallbricks.diversity import (
+        text_signatures,
+        signature_similarity,
+        cosine_similarity,
+        mmr_select,
+        diversify
+    )
+
+
+MEMORIES = [
+    {"id": "1", "text": "The user prefers dark mode in the editor", "score": 0.95,
+     "metadata": {"category": "Preferences"}},
+    {"id": "2", "text": "The user prefers dark mode in the editor!", "score": 0.94,
+     "metadata": {"category": "Preferences"}},
+    {"id": "3", "text": "Deploys run every Friday from the main branch", "score": 0.80,
+     "metadata": {"category": "Work"}},
+    {"id": "4", "text": "User prefers dark mode in their editor", "score": 0.90,
+     "metadata": {"category": "Preferences"}},
+]
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestSimilarity(unittest.TestCase):
+    """Test similarity matrices"""
+
+    def test_signatures_detect_near_duplicates(self):
+        """MinHash similarity is high for near-duplicates and low otherwise"""
+        texts = [m["text"] for m in MEMORIES]
+        similarity = signature_similarity(text_signatures(texts))
+        self.assertEqual(similarity.shape, (4, 4))
+        self.assertEqual(similarity[0, 1], 1.0)
+        self.assertLess(similarity[0, 2], 0.2)
+        np.testing.assert_allclose(np.diag(similarity), 1.0)
+
+    def test_cosine_similarity(self):
+        """Cosine similarity handles zero vectors"""
+        similarity = cosine_similarity([[1, 0], [2, 0], [0, 1], [0, 0]])
+        self.assertAlmostEqual(similarity[0, 1], 1.0)
+        self.assertAlmostEqual(similarity[0, 2], 0.0)
+        self.assertEqual(similarity[3, 3], 0.0)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestMMR(unittest.TestCase):
+    """Test greedy MMR selection"""
+
+    def test_zero_diversity_is_relevance_order(self):
+        """diversity=0 selects by relevance only"""
+        similarity = np.ones((3, 3))
+        self.assertEqual(mmr_select([0.2, 0.9, 0.5], similarity, 3, diversity=0.0), [1, 2, 0])
+
+    def test_skips_redundant_items(self):
+        """A near-duplicate of a selected item loses to a novel one"""
+        similarity = np.array([[1.0, 0.95, 0.1], [0.95, 1.0, 0.1], [0.1, 0.1, 1.0]])
+        self.assertEqual(mmr_select([0.9, 0.85, 0.6], similarity, 2), [0, 2])
+
+    def test_validates_arguments(self):
+        """Bad diversity or matrix shape raises ValueError"""
+        with self.assertRaises(ValueError):
+            mmr_select([1.0], np.ones((1, 1)), 1, diversity=1.5)
+        with self.assertRaises(ValueError):
+            mmr_select([1.0, 0.5], np.ones((1, 1)), 1)
+
+    def test_diversify_text(self):
+        """diversify() drops near-duplicate texts"""
+        selected = diversify(MEMORIES, k=2)
+        self.assertEqual([m["id"] for m in selected], ["1", "3"])
+
+    def test_diversify_embeddings(self):
+        """Explicit embeddings replace text signatures"""
+        embeddings = [[1, 0], [0, 1], [1, 0], [0, 1]]
+        selected = diversify(MEMORIES, k=2, embeddings=embeddings)
+        self.assertEqual([m["id"] for m in selected], ["1", "2"])
+
+    def test_diversify_embed_callable(self):
+        """The embed callable receives the item texts"""
+        calls = []
+
+        def embed(texts):
+            calls.append(texts)
+            return [[1.0, 0.0]] * len(texts)
+
+        diversify(MEMORIES, k=2, embed=embed)
+        self.assertEqual(calls, [[m["text"] for m in MEMORIES]])
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestClientDiversify(unittest.TestCase):
+    """Test recall_diverse() and search_weighted_diverse()"""
+
+    def setUp(self):
+        self.client = RecallBricks(api_key="test-key")
+
+    def test_recall_diverse_overfetches(self):
+        """recall_diverse() fetches 4x the limit and trims the response"""
+        response = {"memories": MEMORIES, "categories": {"Preferences": {"count": 3, "summary": "UI"}},
+                    "total": 4}
+        with patch.object(self.client, '_request', return_value=response) as mock_request:
+            result = self.client.recall_diverse("editor", limit=2, organized=True)
+
+        self.assertEqual(mock_request.call_args[1]["json"]["limit"], 8)
+        self.assertEqual([m["id"] for m in result["memories"]], ["1", "3"])
+        self.assertEqual(result["total"], 2)
+        self.assertEqual(result["categories"]["Preferences"]["count"], 1)
+        self.assertEqual(result["categories"]["Preferences"]["summary"], "UI")
+
+    def test_recall_diverse_validates_fetch_limit(self):
+        """fetch_limit below limit raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.client.recall_diverse("editor", limit=10, fetch_limit=5)
+
+    def test_search_weighted_diverse(self):
+        """search_weighted_diverse() ranks on relevance_score"""
+        results = [
+            {"id": m["id"], "text": m["text"], "relevance_score": m["score"]}
+            for m in MEMORIES
+        ]
+        with patch.object(self.client, '_request', return_value={"results": results}) as mock_request:
+            selected = self.client.search_weighted_diverse("editor", limit=2)
+
+        self.assertEqual(mock_request.call_args[1]["json"]["limit"], 8)
+        self.assertEqual([r.id for r in selected], ["1", "3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for federated search across agents and projects
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.autonomous import SearchClient
+from recallbricks.exceptions import APIError
+from recallbricks.federated import kway_merge
+
+
+class TestKWayMerge(unittest.TestCase):
+    """Test heap-based merging"""
+
+    def test_merges_by_score(self):
+        """Lists are interleaved by score and tagged with their scope"""
+        merged = kway_merge({
+            "a": [{"id": "a1", "score": 0.9}, {"id": "a2", "score": 0.4}],
+            "b": [{"id": "b1", "score": 0.8}, {"id": "b2", "score": 0.7}],
+            "c": [],
+        }, limit=3)
+        self.assertEqual([m["memory"]["id"] for m in merged], ["a1", "b1", "b2"])
+        self.assertEqual([m["scope"] for m in merged], ["a", "b", "b"])
+
+    def test_ties_keep_scope_order(self):
+        """Equal scores keep the order scopes were given in"""
+        merged = kway_merge({"x": [{"score": 0.5}], "y": [{"score": 0.5}]}, limit=10)
+        self.assertEqual([m["scope"] for m in merged], ["x", "y"])
+
+
+class TestFederatedSearch(unittest.TestCase):
+    """Test client federated search methods"""
+
+    def test_semantic_federated(self):
+        """Each agent is searched once; failures are isolated"""
+        client = SearchClient(api_key="test-key")
+
+        def semantic(agent_id, query, limit, min_score, memory_types):
+            if agent_id == "broken":
+                raise APIError("down", status_code=503)
+            base = {"agent_1": 0.9, "agent_2": 0.8}[agent_id]
+            return {"results": [{"id": f"{agent_id}-{i}", "score": base - i * 0.3} for i in range(limit)]}
+
+        with patch.object(client, 'semantic', side_effect=semantic) as mock_semantic:
+            merged = client.semantic_federated(
+                ["agent_1", "agent_2", "broken", "agent_1"], "deploys", limit=3, per_agent_limit=2
+            )
+
+        self.assertEqual(mock_semantic.call_count, 3)
+        self.assertEqual([m["memory"]["id"] for m in merged["results"]],
+                         ["agent_1-0", "agent_2-0", "agent_1-1"])
+        self.assertEqual(merged["scopes"], {"agent_1": 2, "agent_2": 2})
+        self.assertIsInstance(merged["errors"]["broken"], APIError)
+
+    def test_recall_federated(self):
+        """recall() is called per project with the project_id set"""
+        client = RecallBricks(api_key="test-key")
+        responses = {
+            "web": {"memories": [{"id": "w", "score": 0.6}]},
+            "infra": {"memories": [{"id": "i", "score": 0.95}]},
+        }
+        with patch.object(client, '_request',
+                          side_effect=lambda method, endpoint, json: responses[json["project_id"]]):
+            merged = client.recall_federated("release", ["web", "infra"])
+
+        self.assertEqual([(m["scope"], m["memory"]["id"]) for m in merged["results"]],
+                         [("infra", "i"), ("web", "w")])
+        self.assertEqual(merged["errors"], {})
+
+    def test_validation(self):
+        """Bad queries and scope lists fail before any request"""
+        client = RecallBricks(api_key="test-key")
+        with patch.object(client, '_request') as mock_request:
+            with self.assertRaises(ValueError):
+                client.recall_federated("", ["web"])
+            with self.assertRaises(TypeError):
+                client.recall_federated("release", "web")
+        mock_request.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Tests for fused multi-mode search
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.autonomous import SearchClient
+from recallbricks.exceptions import APIError
+from recallbricks.fusion import fused_search, reciprocal_rank_fusion, score_fusion
+
+
+SEMANTIC = {"results": [{"id": "a", "score": 0.9}, {"id": "b", "score": 0.8}, {"id": "c", "score": 0.1}]}
+HYBRID = {"results": [{"id": "b", "score": 0.7}, {"id": "d", "score": 0.6}]}
+RECALL = {"memories": [{"id": "b", "text": "beta", "score": 0.95}, {"id": "a", "text": "alpha", "score": 0.5}]}
+
+
+class TestFusion(unittest.TestCase):
+    """Test rank and score fusion"""
+
+    def test_rrf_rewards_agreement(self):
+        """Results found by several modes rank first"""
+        fused = reciprocal_rank_fusion({
+            "semantic": SEMANTIC["results"],
+            "hybrid": HYBRID["results"],
+        })
+        self.assertEqual([r["id"] for r in fused], ["b", "a", "d", "c"])
+        self.assertEqual(fused[0]["ranks"], {"semantic": 2, "hybrid": 1})
+        self.assertAlmostEqual(fused[0]["fused_score"], 1 / 62 + 1 / 61)
+
+    def test_rrf_weights(self):
+        """Mode weights shift the fused order"""
+        fused = reciprocal_rank_fusion(
+            {"semantic": SEMANTIC["results"], "hybrid": HYBRID["results"]},
+            weights={"hybrid": 0.0}
+        )
+        self.assertEqual(fused[0]["id"], "a")
+
+    def test_score_fusion_normalizes(self):
+        """Scores are min-max normalized per mode before weighting"""
+        fused = score_fusion({"semantic": SEMANTIC["results"], "hybrid": HYBRID["results"]})
+        scores = {r["id"]: r["fused_score"] for r in fused}
+        self.assertAlmostEqual(scores["a"], 1.0)
+        self.assertAlmostEqual(scores["b"], 0.875 + 1.0)
+        self.assertAlmostEqual(scores["c"], 0.0)
+
+
+class TestFusedSearch(unittest.TestCase):
+    """Test fused_search() fan-out"""
+
+    def setUp(self):
+        self.search = SearchClient(api_key="test-key")
+        self.rb = RecallBricks(api_key="test-key")
+
+    def test_runs_modes_concurrently(self):
+        """All modes run in parallel and are fused"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def respond(response):
+            def call(*args, **kwargs):
+                barrier.wait()
+                return response
+            return call
+
+        with patch.object(self.search, 'semantic', side_effect=respond(SEMANTIC)), \
+                patch.object(self.search, 'hybrid', side_effect=respond(HYBRID)), \
+                patch.object(self.rb, 'recall', side_effect=respond(RECALL)):
+            fused = fused_search(
+                "query", search_client=self.search, agent_id="agent_1",
+                client=self.rb, modes=["semantic", "hybrid", "recall"]
+            )
+
+        self.assertEqual(fused["completed"], ["semantic", "hybrid", "recall"])
+        self.assertEqual(fused["results"][0]["id"], "b")
+        self.assertEqual(fused["pending"], [])
+
+    def test_deadline_returns_partial_results(self):
+        """Modes still running at the deadline are reported as pending"""
+        release = threading.Event()
+
+        def slow(*args, **kwargs):
+            release.wait(5)
+            return HYBRID
+
+        try:
+            with patch.object(self.search, 'semantic', return_value=SEMANTIC), \
+                    patch.object(self.search, 'hybrid', side_effect=slow):
+                start = time.monotonic()
+                fused = self.search.fused_search("agent_1", "query", timeout=0.2)
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        self.assertLess(elapsed, 2)
+        self.assertEqual(fused["completed"], ["semantic"])
+        self.assertEqual(fused["pending"], ["hybrid"])
+        self.assertEqual([r["id"] for r in fused["results"]], ["a", "b", "c"])
+
+    def test_failed_mode_is_reported(self):
+        """A failing mode does not prevent fusion of the others"""
+        with patch.object(self.search, 'semantic', return_value=SEMANTIC), \
+                patch.object(self.search, 'hybrid', side_effect=APIError("boom", status_code=500)):
+            fused = self.search.fused_search("agent_1", "query", method="score")
+
+        self.assertIsInstance(fused["errors"]["hybrid"], APIError)
+        self.assertEqual(fused["completed"], ["semantic"])
+        self.assertEqual(fused["pending"], [])
+
+    def test_default_modes(self):
+        """Default modes follow the clients supplied"""
+        with patch.object(self.rb, 'recall', return_value=RECALL), \
+                patch.object(self.rb, 'search_weighted', return_value=[]):
+            fused = fused_search("query", client=self.rb, limit=1)
+        self.assertEqual(fused["completed"], ["recall", "search_weighted"])
+        self.assertEqual(len(fused["results"]), 1)
+
+    def test_validation(self):
+        """Unknown modes and missing clients raise ValueError"""
+        with self.assertRaises(ValueError):
+            fused_search("query", client=self.rb, modes=["semantic"])
+        with self.assertRaises(ValueError):
+            fused_search("query", client=self.rb, modes=["telepathy"])
+        with self.assertRaises(ValueError):
+            fused_search("query", client=self.rb, method="borda")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Tests for the local goal-tree index
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import GoalsClient
+from recallbricks.goal_tree import GoalTree
+
+
+def hierarchy():
+    return {
+        "id": "root", "agent_id": "agent_1", "title": "Ship", "progress": 0, "status": "active",
+        "subgoals": [
+            {"id": "a", "title": "Build", "progress": 50, "status": "active", "subgoals": [
+                {"id": "a1", "title": "API", "progress": 100, "status": "active", "subgoals": []},
+                {"id": "a2", "title": "UI", "progress": 0, "status": "active", "subgoals": []},
+            ]},
+            {"id": "b", "title": "Test", "progress": 0, "status": "active", "subgoals": []},
+        ]
+    }
+
+
+class TestGoalTree(unittest.TestCase):
+    """Test loading, roll-up and incremental changes"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_hierarchy.return_value = hierarchy()
+        self.client.update_progress.side_effect = lambda goal_id, progress, notes=None: {
+            "id": goal_id, "progress": progress}
+        self.client.complete.side_effect = lambda goal_id, outcome=None: {
+            "id": goal_id, "status": "completed", "progress": 100}
+        self.client.cancel.side_effect = lambda goal_id, reason=None: {
+            "id": goal_id, "status": "cancelled"}
+
+    def make(self, **options):
+        options.setdefault("coalesce_seconds", 60)
+        tree = GoalTree(self.client, **options)
+        self.addCleanup(tree.close, 2)
+        return tree
+
+    def test_loaded_once_and_rolled_up(self):
+        """The hierarchy is fetched once; parents average their subgoals"""
+        goals = self.make()
+        tree = goals.get_hierarchy("root")
+        self.assertEqual(tree["rollup_progress"], 25.0)            # mean(mean(100, 0), 0)
+        self.assertEqual([g["id"] for g in tree["subgoals"][0]["subgoals"]], ["a1", "a2"])
+        goals.get_hierarchy("root")
+        goals.get_hierarchy("a")
+        self.client.get_hierarchy.assert_called_once_with("root")
+        self.assertEqual(goals.stats()["local_reads"], 2)
+
+    def test_progress_updates_coalesced(self):
+        """A burst of updates is applied locally at once and sent as one PUT"""
+        goals = self.make()
+        goals.load("root")
+        for pct in (10, 20, 40):
+            goals.update_progress("a2", pct, notes="styling" if pct == 20 else None)
+        self.assertEqual(goals.progress("a"), 70.0)
+        self.assertEqual(goals.progress("root"), 35.0)
+        self.client.update_progress.assert_not_called()
+
+        self.assertTrue(goals.flush(timeout=2))
+        self.client.update_progress.assert_called_once_with("a2", 40, notes="styling")
+        self.assertEqual(goals.stats()["coalesced"], 2)
+
+    def test_coalesce_window_elapses(self):
+        goals = self.make(coalesce_seconds=0.02)
+        goals.load("root")
+        goals.update_progress("b", 30)
+        deadline = time.time() + 2
+        while not self.client.update_progress.called and time.time() < deadline:
+            time.sleep(0.01)
+        self.client.update_progress.assert_called_once_with("b", 30, notes=None)
+
+    def test_complete_and_cancel(self):
+        """Completed subgoals count as 100, cancelled ones are left out"""
+        goals = self.make()
+        goals.load("root")
+        goals.update_progress("a2", 60)
+        goals.complete("a2")
+        self.assertEqual(goals.progress("a"), 100.0)
+        goals.cancel("b")
+        self.assertEqual(goals.progress("root"), 100.0)
+        goals.flush(timeout=2)
+        self.client.update_progress.assert_not_called()     # superseded by complete()
+        self.assertEqual(goals.get("b")["status"], "cancelled")
+
+    def test_complete_waits_for_put_in_flight(self):
+        """A progress PUT in flight cannot undo a later complete()"""
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        requests = []
+
+        def update_progress(goal_id, progress, notes=None):
+            requests.append("put")
+            gate.wait(2)
+            return {"id": goal_id, "progress": progress, "status": "active"}
+
+        def complete(goal_id, outcome=None):
+            requests.append("complete")
+            return {"id": goal_id, "status": "completed", "progress": 100}
+
+        self.client.update_progress.side_effect = update_progress
+        self.client.complete.side_effect = complete
+        goals = self.make(coalesce_seconds=0)
+        goals.load("root")
+        goals.update_progress("b", 30)
+        deadline = time.time() + 2
+        while not requests and time.time() < deadline:
+            time.sleep(0.01)
+
+        completer = threading.Thread(target=goals.complete, args=("b",))
+        completer.start()
+        completer.join(0.1)
+        self.assertTrue(completer.is_alive())          # waiting for the PUT
+        gate.set()
+        completer.join(2)
+        self.assertEqual(requests, ["put", "complete"])
+        self.assertEqual(goals.get("b")["status"], "completed")
+        self.assertEqual(goals.progress("b"), 100.0)
+
+    def test_add_subgoal_skips_parent_fetch(self):
+        """Subgoals of indexed goals are created directly and indexed"""
+        goals = self.make()
+        goals.load("root")
+        self.client.create.return_value = {"id": "b1", "title": "E2E", "progress": 0}
+        goals.add_subgoal("b", "E2E", description="Browser tests")
+        self.client.create.assert_called_once_with("agent_1", "E2E", description="Browser tests",
+                                                   parent_goal_id="b")
+        self.client.add_subgoal.assert_not_called()
+        goals.update_progress("b1", 50)
+        self.assertEqual(goals.progress("b"), 50.0)
+        self.assertEqual(goals.get_hierarchy("b")["subgoals"][0]["id"], "b1")
+
+    def test_failed_put_reported(self):
+        errors = []
+        self.client.update_progress.side_effect = RuntimeError("down")
+        goals = self.make(on_error=lambda goal_id, e: errors.append(goal_id))
+        goals.load("root")
+        goals.update_progress("b", 10)
+        self.assertTrue(goals.flush(timeout=2))
+        self.assertEqual(errors, ["b"])
+        self.assertEqual(goals.stats()["errors"], 1)
+
+    def test_load_agent_and_invalidate(self):
+        self.client.list.return_value = {"goals": [hierarchy()]}
+        goals = self.make()
+        roots = goals.load_agent("agent_1")
+        self.assertEqual([r["id"] for r in roots], ["root"])
+        self.client.list.assert_called_once_with("agent_1", status=None, include_subgoals=True, limit=20)
+        goals.invalidate("a")
+        self.assertIsNone(goals.get("a1"))
+        self.assertEqual(goals.progress("root"), 0.0)
+        goals.invalidate()
+        self.assertEqual(goals.stats()["goals"], 0)
+
+
+class TestGoalsClientTree(unittest.TestCase):
+
+    def test_goal_tree_uses_client(self):
+        client = GoalsClient(api_key="test-key")
+        with patch.object(client, '_request', return_value=hierarchy()) as mock_request:
+            with client.goal_tree() as goals:
+                goals.get_hierarchy("root")
+                goals.get_hierarchy("root")
+        mock_request.assert_called_once_with("GET", "/api/autonomous/goals/root/hierarchy")
+
+
+if __name__ == '__main__':
+    unittest.main()
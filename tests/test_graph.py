@@ -0,0 +1,130 @@
+"""
+Tests for the client-side relationship graph cache
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.graph import MemoryGraph
+from recallbricks.exceptions import NotFoundError
+
+
+# a - b - c - d, plus a - e; each memory lists incoming and outgoing edges
+RELATIONSHIPS = {
+    "a": [{"type": "related_to", "target_id": "b"}, {"type": "caused_by", "target_id": "e"}],
+    "b": [{"type": "related_to", "source_id": "a", "target_id": "b"},
+          {"type": "related_to", "target_id": "c"}],
+    "c": [{"type": "related_to", "source_id": "b", "target_id": "c"},
+          {"type": "related_to", "target_id": "d"}],
+    "d": [{"type": "related_to", "source_id": "c", "target_id": "d"}],
+    "e": [{"type": "caused_by", "source_id": "a", "target_id": "e"}],
+}
+
+
+class TestMemoryGraph(unittest.TestCase):
+    """Test MemoryGraph traversal and fetching"""
+
+    def setUp(self):
+        self.client = RecallBricks(api_key="test_key")
+        self.graph = MemoryGraph(self.client, ttl_seconds=60)
+
+    def fake_request(self, method, endpoint, **kwargs):
+        memory_id = endpoint.rsplit("/", 1)[-1]
+        if memory_id not in RELATIONSHIPS:
+            raise NotFoundError("Resource not found")
+        return {"memory_id": memory_id, "relationships": RELATIONSHIPS[memory_id]}
+
+    def test_k_hop_fetches_frontier(self):
+        """k_hop fetches only the nodes it needs to expand"""
+        with patch.object(self.client, '_request', side_effect=self.fake_request) as mock_request:
+            hops = self.graph.k_hop("a", k=2)
+
+        self.assertEqual(hops, {"a": 0, "b": 1, "e": 1, "c": 2})
+        fetched = sorted(call[0][1] for call in mock_request.call_args_list)
+        self.assertEqual(fetched, [
+            "/relationships/memory/a",
+            "/relationships/memory/b",
+            "/relationships/memory/e",
+        ])
+
+    def test_repeat_queries_are_local(self):
+        """Overlapping neighborhoods are not re-fetched"""
+        with patch.object(self.client, '_request', side_effect=self.fake_request):
+            self.graph.k_hop("a", k=2)
+
+        with patch.object(self.client, '_request', side_effect=self.fake_request) as mock_request:
+            self.assertEqual(sorted(self.graph.neighbors("b")), ["a", "c"])
+            self.graph.k_hop("a", k=1)
+
+        mock_request.assert_not_called()
+
+    def test_shortest_path(self):
+        """Shortest path is found across fetched nodes"""
+        with patch.object(self.client, '_request', side_effect=self.fake_request):
+            self.assertEqual(self.graph.shortest_path("e", "d"), ["e", "a", "b", "c", "d"])
+            self.assertIsNone(self.graph.shortest_path("e", "d", max_depth=2, fetch_missing=False))
+
+    def test_fetch_errors_are_tolerated(self):
+        """Nodes that cannot be fetched are treated as leaves"""
+        with patch.object(self.client, '_request', side_effect=self.fake_request):
+            self.assertEqual(self.graph.k_hop("missing", k=2), {"missing": 0})
+
+    def test_graph_context_ingestion(self):
+        """Graph context marks interior nodes as known"""
+        self.graph.add_graph_context("a", {
+            "nodes": [{"id": "a", "text": "root"}, {"id": "b", "text": "child"}],
+            "edges": [{"from": "a", "to": "b", "type": "related_to"}],
+        }, depth=1)
+
+        self.assertEqual(self.graph.node("a")["text"], "root")
+        self.assertEqual(self.graph.relationship_type("a", "b"), "related_to")
+        with patch.object(self.client, '_request', side_effect=self.fake_request) as mock_request:
+            self.assertEqual(self.graph.neighbors("a"), ["b"])
+        mock_request.assert_not_called()
+
+        # Nodes at the requested depth may have more relationships
+        with patch.object(self.client, '_request', side_effect=self.fake_request) as mock_request:
+            self.graph.neighbors("b")
+        mock_request.assert_called_once_with("GET", "/relationships/memory/b")
+
+    def test_edges_expire(self):
+        """Edges disappear after their TTL"""
+        graph = MemoryGraph(ttl_seconds=60)
+        graph.add_edge("x", "y", ttl_seconds=0.01)
+        graph.add_edge("x", "z")
+        graph.add_edge("x", "w", ttl_seconds=0)          # already expired, not the default
+        time.sleep(0.02)
+        self.assertEqual(graph.neighbors("x"), ["z"])
+        self.assertEqual(graph.edge_count, 1)
+
+    def test_to_csr(self):
+        """CSR export reflects edge direction"""
+        graph = MemoryGraph()
+        graph.add_edge("x", "y")
+        graph.add_edge("x", "z")
+        ids, indptr, indices = graph.to_csr()
+        self.assertEqual(ids, ["x", "y", "z"])
+        self.assertEqual(list(indptr), [0, 2, 2, 2])
+        self.assertEqual(list(indices), [1, 2])
+
+        _, indptr, indices = graph.to_csr(directed=False)
+        self.assertEqual(list(indptr), [0, 2, 3, 4])
+
+    def test_invalid_arguments(self):
+        """Bad arguments are rejected"""
+        with self.assertRaises(ValueError):
+            MemoryGraph(ttl_seconds=0)
+        with self.assertRaises(ValueError):
+            self.graph.k_hop("", k=1)
+        with self.assertRaises(ValueError):
+            self.graph.k_hop("a", k=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Tests for the buffered session-history writer
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import ContextClient
+from recallbricks.history import HistoryWriter
+
+
+class TestHistoryWriter(unittest.TestCase):
+    """Test batching, ordering and local reads"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.posted = []
+        self.client.add_to_history.side_effect = lambda session_id, entry: self.posted.append(
+            (session_id, entry["n"]))
+
+    def make(self, **options):
+        options.setdefault("flush_interval", 60)
+        writer = HistoryWriter(self.client, **options)
+        self.addCleanup(writer.close)
+        return writer
+
+    def test_buffers_until_turn_end(self):
+        """Nothing is sent until end of turn, then entries go in order"""
+        writer = self.make()
+        for n in range(5):
+            writer.append("sess_1", {"n": n})
+        self.assertEqual(self.posted, [])
+        self.assertEqual(writer.stats()["buffered"], 5)
+
+        writer.end_turn("sess_1")
+        self.assertTrue(writer.flush(timeout=2))
+        self.assertEqual(self.posted, [("sess_1", n) for n in range(5)])
+
+    def test_size_threshold(self):
+        """A full batch is sent without waiting for the interval"""
+        writer = self.make(max_batch=3)
+        for n in range(3):
+            writer.append("sess_1", {"n": n})
+        deadline = time.time() + 2
+        while len(self.posted) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.posted), 3)
+
+    def test_interval_flush(self):
+        """Entries are sent once the oldest has waited flush_interval"""
+        writer = self.make(flush_interval=0.05)
+        writer.append("sess_1", {"n": 0})
+        deadline = time.time() + 2
+        while not self.posted and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.posted, [("sess_1", 0)])
+
+    def test_sessions_ordered_independently(self):
+        """Each session keeps its order while sessions are sent concurrently"""
+        gate = threading.Event()
+
+        def add(session_id, entry):
+            if session_id == "slow":
+                gate.wait(2)
+            self.posted.append((session_id, entry["n"]))
+
+        self.client.add_to_history.side_effect = add
+        writer = self.make(max_batch=2)
+        for n in range(6):
+            writer.append("slow", {"n": n})
+            writer.append("fast", {"n": n})
+        self.assertTrue(writer.flush("fast", timeout=2))
+        gate.set()
+        self.assertTrue(writer.flush(timeout=2))
+        for session_id in ("slow", "fast"):
+            self.assertEqual([n for s, n in self.posted if s == session_id], list(range(6)))
+
+    def test_bulk_mode(self):
+        """bulk=True sends one request per batch"""
+        writer = self.make(bulk=True, max_batch=4)
+        for n in range(6):
+            writer.append("sess_1", {"n": n})
+        writer.flush(timeout=2)
+        batches = [[e["n"] for e in call.args[1]] for call in self.client.add_history_entries.call_args_list]
+        self.assertEqual(batches, [[0, 1, 2, 3], [4, 5]])
+        self.assertEqual(writer.stats()["requests"], 2)
+
+    def test_failed_send_is_retried_in_order(self):
+        """Entries after a failure are retried without reordering"""
+        failures = [RuntimeError("503")]
+
+        def add(session_id, entry):
+            if entry["n"] == 1 and failures:
+                raise failures.pop()
+            self.posted.append((session_id, entry["n"]))
+
+        errors = []
+        self.client.add_to_history.side_effect = add
+        writer = self.make(flush_interval=0.02, on_error=lambda s, e: errors.append(s))
+        for n in range(3):
+            writer.append("sess_1", {"n": n})
+        self.assertTrue(writer.flush(timeout=2))
+        self.assertEqual([n for _, n in self.posted], [0, 1, 2])
+        self.assertEqual(errors, ["sess_1"])
+
+    def test_recent_history_served_locally(self):
+        """get_history() answers from the ring buffer when it holds enough"""
+        writer = self.make(ring_size=3)
+        for n in range(5):
+            writer.append("sess_1", {"n": n})
+        result = writer.get_history("sess_1", limit=2)
+        self.assertEqual([e["n"] for e in result["entries"]], [3, 4])
+        self.client.get_history.assert_not_called()
+
+        self.client.get_history.return_value = {"entries": [{"n": n} for n in range(5)]}
+        writer.get_history("sess_1", limit=5)
+        self.client.get_history.assert_called_once_with("sess_1", limit=5)
+        self.assertEqual(len(self.posted), 5)               # flushed before reading
+        self.assertEqual([e["n"] for e in writer.get_history("sess_1", limit=3)["entries"]], [2, 3, 4])
+
+    def test_client_methods(self):
+        """ContextClient exposes the bulk endpoint and the writer"""
+        client = ContextClient(api_key="test-key")
+        with patch.object(client, '_request', return_value={"success": True}) as mock_request:
+            client.add_history_entries("sess_1", [{"action": "a"}])
+            with client.history_writer(bulk=True) as writer:
+                writer.append("sess_1", {"action": "b", "timestamp": "t"})
+        mock_request.assert_called_with(
+            "POST", "/api/autonomous/context/sess_1/history",
+            json={"entries": [{"action": "b", "timestamp": "t"}]}
+        )
+        with self.assertRaises(ValueError):
+            client.add_history_entries("sess_1", [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Tests for background jobs on slow endpoints
+"""
+
+import gc
+import threading
+import time
+import unittest
+from concurrent.futures import CancelledError, TimeoutError
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import (
+    GoalsClient,
+    MemoryTypesClient,
+    MetacognitionClient,
+    WorkingMemoryClient,
+)
+from recallbricks.jobs import JobRunner
+
+
+class TestJobRunner(unittest.TestCase):
+    """Test futures, caching, timeouts and cancellation"""
+
+    def setUp(self):
+        self.runner = JobRunner(max_workers=2, cache_ttl=60)
+        self.addCleanup(self.runner.close)
+
+    def test_result_and_callback(self):
+        done = threading.Event()
+        seen = []
+        func = MagicMock(return_value={"steps": []})
+        future = self.runner.submit(func, "goal_1", callback=lambda f: (seen.append(f.result()), done.set()))
+        self.assertEqual(future.result(timeout=2), {"steps": []})
+        self.assertTrue(done.wait(2))
+        self.assertEqual(seen, [{"steps": []}])
+        func.assert_called_once_with("goal_1")
+
+    def test_results_cached_by_inputs(self):
+        """The same call within the TTL is answered from cache"""
+        func = MagicMock(side_effect=lambda agent_id, days=7: {"agent": agent_id, "days": days})
+        self.runner.submit(func, "agent_1", days=7).result(timeout=2)
+        cached = self.runner.submit(func, "agent_1", days=7)
+        self.assertTrue(cached.done())
+        self.runner.submit(func, "agent_1", days=30).result(timeout=2)
+        self.runner.submit(func, "agent_1", days=7, use_cache=False).result(timeout=2)
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(self.runner.stats()["cache_hits"], 1)
+
+        self.runner.invalidate()
+        self.runner.submit(func, "agent_1", days=7).result(timeout=2)
+        self.assertEqual(func.call_count, 4)
+
+    def test_cache_expires(self):
+        func = MagicMock(return_value=1)
+        self.runner.submit(func).result(timeout=2)
+        with patch('recallbricks.cache.time.monotonic', return_value=time.monotonic() + 61):
+            self.runner.submit(func).result(timeout=2)
+        self.assertEqual(func.call_count, 2)
+
+    def test_identical_running_jobs_shared(self):
+        gate = threading.Event()
+        func = MagicMock(side_effect=lambda: gate.wait(2) and "done")
+        first = self.runner.submit(func)
+        second = self.runner.submit(func)
+        self.assertIs(first, second)
+        gate.set()
+        self.assertEqual(second.result(timeout=2), "done")
+        func.assert_called_once()
+
+    def test_failures_not_cached(self):
+        func = MagicMock(side_effect=[RuntimeError("503"), "ok"])
+        with self.assertRaises(RuntimeError):
+            self.runner.submit(func).result(timeout=2)
+        self.assertEqual(self.runner.submit(func).result(timeout=2), "ok")
+
+    def test_timeout(self):
+        """A job that overruns fails with TimeoutError and is not cached"""
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        func = MagicMock(side_effect=lambda: gate.wait(2))
+        future = self.runner.submit(func, timeout=0.05)
+        with self.assertRaises(TimeoutError):
+            future.result(timeout=2)
+        self.assertEqual(self.runner.stats()["timed_out"], 1)
+        self.assertEqual(self.runner.stats()["in_flight"], 0)
+
+    def test_cancel_queued_job(self):
+        """Cancelling a job that has not started means it never runs"""
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        blocker = MagicMock(side_effect=lambda n: gate.wait(2))
+        for n in range(2):
+            self.runner.submit(blocker, n)
+        queued = MagicMock(return_value="never")
+        future = self.runner.submit(queued)
+        self.assertTrue(future.cancel())
+        gate.set()
+        with self.assertRaises(CancelledError):
+            future.result(timeout=2)
+        self.runner.close()
+        queued.assert_not_called()
+        self.assertEqual(self.runner.stats()["cancelled"], 1)
+
+
+class TestClientJobs(unittest.TestCase):
+    """Test the *_async client methods"""
+
+    def test_async_methods(self):
+        runner = JobRunner()
+        self.addCleanup(runner.close)
+        # Read-only calls are cached; consolidations change state and are not
+        cases = [
+            (GoalsClient, lambda c: c.suggest_next_steps_async("goal_1"),
+             ("POST", "/api/autonomous/goals/goal_1/suggest"), 1),
+            (MetacognitionClient, lambda c: c.self_reflect_async("agent_1", "quality", "deep"),
+             ("POST", "/api/autonomous/metacognition/reflect"), 1),
+            (MetacognitionClient, lambda c: c.analyze_patterns_async("agent_1", days=30),
+             ("POST", "/api/autonomous/metacognition/analyze"), 1),
+            (MemoryTypesClient, lambda c: c.consolidate_semantic_async("agent_1"),
+             ("POST", "/api/autonomous/memory-types/consolidate"), 2),
+            (WorkingMemoryClient, lambda c: c.consolidate_async("agent_1"),
+             ("POST", "/api/autonomous/working-memory/consolidate"), 2),
+        ]
+        for client_class, call, expected, requests in cases:
+            client = client_class(api_key="test-key")
+            client.job_runner = runner
+            with patch.object(client, '_request', return_value={"ok": True}) as mock_request:
+                self.assertEqual(call(client).result(timeout=2), {"ok": True})
+                call(client).result(timeout=2)
+            self.assertEqual(mock_request.call_count, requests)
+            self.assertEqual(mock_request.call_args.args, expected)
+
+    def test_results_not_shared_with_later_clients(self):
+        """A client reusing a freed client's address does not get its cached results"""
+        runner = JobRunner()
+        self.addCleanup(runner.close)
+        # Every object at the same address, as when a freed client's memory is reused
+        with patch('recallbricks.jobs.id', return_value=1, create=True):
+            for _ in range(2):
+                client = GoalsClient(api_key="test-key")
+                client.job_runner = runner
+                with patch.object(client, '_request', return_value={}) as mock_request:
+                    client.suggest_next_steps_async("goal_1").result(timeout=2)
+                mock_request.assert_called_once()
+                del client
+                gc.collect()
+
+    def test_default_runner_and_validation(self):
+        client = GoalsClient(api_key="test-key")
+        with self.assertRaises(ValueError):
+            client.suggest_next_steps_async("")
+        with patch.object(client, '_request', return_value={}):
+            client.suggest_next_steps_async("goal_1").result(timeout=2)
+        self.assertIsInstance(client.job_runner, JobRunner)
+        self.assertIsNone(GoalsClient(api_key="test-key").job_runner)
+        client.job_runner.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
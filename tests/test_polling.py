@@ -0,0 +1,166 @@
+"""
+Tests for adaptive multi-agent trigger polling
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import ProspectiveMemoryClient
+from recallbricks.polling import TriggerPoller
+
+
+class TestTriggerPoller(unittest.TestCase):
+    """Test interval adaptation and dispatch"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.check_triggers.return_value = {"triggered": []}
+
+    def make(self, agent_ids=("agent_1",), **options):
+        options.setdefault("jitter", 0.0)
+        options.setdefault("base_interval", 10)
+        options.setdefault("min_interval", 1)
+        poller = TriggerPoller(self.client, agent_ids, max_interval=60, **options)
+        self.addCleanup(poller.stop)
+        return poller
+
+    def test_idle_agents_back_off(self):
+        """Idle checks double the interval up to max; activity resets it"""
+        poller = self.make()
+        for _ in range(4):
+            poller.check("agent_1")
+        self.assertEqual(poller.stats()["intervals"]["agent_1"], 60)
+
+        seen = []
+        poller.add_handler(lambda agent_id, memory: seen.append((agent_id, memory["id"])))
+        self.client.check_triggers.return_value = {"triggered": [{"id": "pm_1"}]}
+        poller.check("agent_1")
+        self.assertEqual(poller.stats()["intervals"]["agent_1"], 10)
+        self.assertEqual(seen, [("agent_1", "pm_1")])
+
+    def test_imminent_trigger_checked_early(self):
+        """A known trigger_at pulls the next check forward, bounded by min_interval"""
+        poller = self.make()
+        poller.check("agent_1")                         # next check in 20s
+        soon = datetime.now(timezone.utc) + timedelta(seconds=3)
+        now = time.monotonic()
+        poller.hint("agent_1", soon)
+        self.assertAlmostEqual(poller._agents["agent_1"].due - now, 3, delta=0.5)
+
+        poller.hint("agent_1", datetime.now(timezone.utc) - timedelta(seconds=5))
+        self.assertAlmostEqual(poller._agents["agent_1"].due - time.monotonic(), 1, delta=0.5)
+
+        self.client.check_triggers.return_value = {
+            "triggered": [], "next_trigger_at": (datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat()
+        }
+        poller.check("agent_1")
+        self.assertAlmostEqual(poller._agents["agent_1"].due - time.monotonic(), 5, delta=0.5)
+
+    def test_first_checks_are_spread(self):
+        """New agents are not all due at once"""
+        poller = self.make([f"agent_{i}" for i in range(200)])
+        offsets = [state.due - time.monotonic() for state in poller._agents.values()]
+        self.assertLess(min(offsets), 2)
+        self.assertGreater(max(offsets), 8)
+
+    def test_concurrency_cap(self):
+        """No more than max_workers checks run at once"""
+        lock = threading.Lock()
+        active, peak, done = [0], [0], threading.Event()
+
+        def check(agent_id):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            if self.client.check_triggers.call_count >= 12:
+                done.set()
+            return {"triggered": []}
+
+        self.client.check_triggers.side_effect = check
+        poller = TriggerPoller(self.client, [f"agent_{i}" for i in range(12)], base_interval=0.01,
+                               min_interval=0.01, max_interval=60, max_workers=3)
+        with poller:
+            self.assertTrue(done.wait(5))
+        self.assertLessEqual(peak[0], 3)
+        self.assertGreaterEqual(poller.stats()["checks"], 12)
+
+    def test_errors_back_off(self):
+        """A failing check is reported and the agent backs off"""
+        errors = []
+        self.client.check_triggers.side_effect = RuntimeError("down")
+        poller = self.make(on_error=lambda agent_id, e: errors.append(agent_id))
+        self.assertEqual(poller.check("agent_1"), [])
+        self.assertEqual(errors, ["agent_1"])
+        self.assertEqual(poller.stats()["intervals"]["agent_1"], 20)
+
+    def test_restart(self):
+        """A stopped poller polls again after start()"""
+        checked = threading.Event()
+        self.client.check_triggers.side_effect = lambda agent_id: checked.set() or {"triggered": []}
+        poller = self.make(base_interval=0.01, min_interval=0.01)
+        poller.start()
+        self.assertTrue(checked.wait(2))
+        poller.stop()
+
+        checked.clear()
+        poller.start()
+        self.assertTrue(checked.wait(2))
+
+    def test_submit_failure_reported(self):
+        """A check that cannot be scheduled is reported, and start() recovers"""
+        errors = []
+        poller = self.make(on_error=lambda agent_id, e: errors.append((agent_id, type(e))))
+        poller._agents["agent_1"].due = float("inf")
+        poller.start()
+        poller._executor.shutdown()
+        with poller._cond:
+            poller._schedule("agent_1", poller._agents["agent_1"], 0.0)
+        deadline = time.time() + 2
+        while not errors and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(errors, [("agent_1", RuntimeError)])
+        self.assertEqual(poller.stats()["errors"], 1)
+
+        poller.start()
+        deadline = time.time() + 2
+        while not poller.stats()["checks"] and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(poller.stats()["checks"], 1)
+
+    def test_validation(self):
+        """Inconsistent intervals are rejected"""
+        with self.assertRaises(ValueError):
+            TriggerPoller(self.client, base_interval=5, min_interval=10)
+        with self.assertRaises(ValueError):
+            TriggerPoller(self.client, backoff=0.5)
+
+
+class TestClientPolling(unittest.TestCase):
+    """Test ProspectiveMemoryClient.poll_triggers()"""
+
+    def test_create_hints_poller(self):
+        """Creating a time-based memory pulls its agent's next check forward"""
+        client = ProspectiveMemoryClient(api_key="test-key")
+        poller = client.poll_triggers(["agent_1"], start=False, base_interval=300, max_interval=600)
+        self.addCleanup(poller.stop)
+        poller._agents["agent_1"].due = time.monotonic() + 300
+        self.assertIs(client.trigger_poller, poller)
+
+        trigger_at = (datetime.now(timezone.utc) + timedelta(seconds=2)).isoformat()
+        with patch.object(client, '_request', return_value={"id": "pm_1"}):
+            client.create("agent_1", "standup", trigger_at=trigger_at)
+        self.assertLess(poller._agents["agent_1"].due - time.monotonic(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
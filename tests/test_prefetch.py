@@ -0,0 +1,191 @@
+"""
+Tests for the client read cache and predictive prefetching
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks, TTLCache, MemoryPrefetcher
+from recallbricks.exceptions import NotFoundError
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test TTLCache behaviour"""
+
+    def test_get_set(self):
+        """Values are returned until they expire"""
+        cache = TTLCache(max_size=10, ttl_seconds=60)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIn("a", cache)
+        self.assertIsNone(cache.get("missing"))
+
+    def test_expiry(self):
+        """Entries expire after their TTL"""
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("a", 1, ttl_seconds=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertNotIn("a", cache)
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first"""
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_stats(self):
+        """Hits and misses are counted"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+
+class TestClientReadCache(unittest.TestCase):
+    """Test the read cache wired into RecallBricks"""
+
+    def test_cache_disabled_by_default(self):
+        """No cache unless cache_ttl is given"""
+        self.assertIsNone(RecallBricks(api_key="test_key").cache)
+
+    def test_get_uses_cache(self):
+        """A second get() is served locally"""
+        client = RecallBricks(api_key="test_key", cache_ttl=60)
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {"id": "mem_1", "text": "hello"}
+            client.get("mem_1")
+            result = client.get("mem_1")
+
+        mock_request.assert_called_once()
+        self.assertEqual(result["text"], "hello")
+
+    def test_update_and_delete_invalidate(self):
+        """Writes drop the cached memory"""
+        client = RecallBricks(api_key="test_key", cache_ttl=60)
+        client.cache.set(("memory", "mem_1"), {"id": "mem_1"})
+        client.cache.set(("relationships", "mem_1"), {"relationships": []})
+
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {"id": "mem_1"}
+            client.update("mem_1", text="changed")
+            self.assertNotIn(("memory", "mem_1"), client.cache)
+            client.delete("mem_1")
+
+        self.assertNotIn(("relationships", "mem_1"), client.cache)
+
+    def test_cached_results_are_copies(self):
+        """Mutating a returned memory does not change the cached one"""
+        client = RecallBricks(api_key="test_key", cache_ttl=60)
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {"id": "mem_1", "tags": ["a"]}
+            client.get("mem_1")["tags"].append("fetched")
+            client.get("mem_1")["tags"].append("cached")
+            mock_request.return_value = {"relationships": [], "count": 0}
+            client.get_relationships("mem_1")["relationships"].append("x")
+            self.assertEqual(client.get_relationships("mem_1")["relationships"], [])
+            self.assertEqual(client.get("mem_1")["tags"], ["a"])
+
+    def test_write_invalidates_after_request(self):
+        """A copy cached while a write is in flight is dropped afterwards"""
+        client = RecallBricks(api_key="test_key", cache_ttl=60)
+
+        def racing_prefetch(method, endpoint, **kwargs):
+            client.cache.set(("memory", "mem_1"), {"id": "mem_1", "text": "stale"})
+            return {"id": "mem_1"}
+
+        with patch.object(client, '_request', side_effect=racing_prefetch):
+            client.update("mem_1", text="changed")
+            self.assertNotIn(("memory", "mem_1"), client.cache)
+            client.delete("mem_1")
+            self.assertNotIn(("memory", "mem_1"), client.cache)
+
+
+class TestMemoryPrefetcher(unittest.TestCase):
+    """Test MemoryPrefetcher"""
+
+    def setUp(self):
+        self.client = RecallBricks(api_key="test_key", cache_ttl=60)
+
+    def fake_request(self, method, endpoint, **kwargs):
+        if endpoint == "/memories/predict":
+            return {"predictions": [
+                {"id": "hi", "content": "a", "confidence_score": 0.9, "reasoning": ""},
+                {"id": "lo", "content": "b", "confidence_score": 0.2, "reasoning": ""},
+            ]}
+        if endpoint.startswith("/memories/"):
+            return {"id": endpoint.rsplit("/", 1)[-1], "text": "memory"}
+        if endpoint.startswith("/relationships/memory/"):
+            return {"relationships": [], "count": 0}
+        raise AssertionError(endpoint)
+
+    def test_requires_cache(self):
+        """Prefetching needs a client read cache"""
+        with self.assertRaises(ValueError):
+            MemoryPrefetcher(RecallBricks(api_key="test_key"))
+
+    def test_prefetch_warms_cache_above_threshold(self):
+        """Only confident predictions are fetched, with their relationships"""
+        with MemoryPrefetcher(self.client, min_confidence=0.5) as prefetcher:
+            with patch.object(self.client, '_request', side_effect=self.fake_request):
+                fetched = prefetcher.prefetch(context="auth work")
+
+            self.assertEqual(fetched, ["hi"])
+            self.assertIn(("memory", "hi"), self.client.cache)
+            self.assertIn(("relationships", "hi"), self.client.cache)
+            self.assertNotIn(("memory", "lo"), self.client.cache)
+            self.assertEqual(prefetcher.stats()["skipped"], 1)
+
+            # Subsequent get() does not hit the API
+            with patch.object(self.client, '_request') as mock_request:
+                self.client.get("hi")
+            mock_request.assert_not_called()
+
+    def test_schedule_runs_in_background(self):
+        """schedule() returns a future resolving to the prefetched ids"""
+        with MemoryPrefetcher(self.client, min_confidence=0.5, include_relationships=False) as prefetcher:
+            with patch.object(self.client, '_request', side_effect=self.fake_request):
+                future = prefetcher.schedule(recent_memory_ids=["x"])
+                self.assertEqual(future.result(timeout=5), ["hi"])
+
+    def test_warm_skips_cached_and_counts_errors(self):
+        """Cached memories are skipped and failures are counted"""
+        self.client.cache.set(("memory", "cached"), {"id": "cached"})
+
+        with MemoryPrefetcher(self.client, include_relationships=False) as prefetcher:
+            with patch.object(self.client, '_request') as mock_request:
+                mock_request.side_effect = NotFoundError("Resource not found")
+                fetched = prefetcher.warm(["cached", "missing"])
+
+            mock_request.assert_called_once()
+            self.assertEqual(fetched, [])
+            self.assertEqual(prefetcher.stats()["errors"], 1)
+
+    def test_bandwidth_bound(self):
+        """Requests beyond the burst are throttled to the configured rate"""
+        with MemoryPrefetcher(self.client, include_relationships=False,
+                              max_requests_per_second=50, max_workers=1) as prefetcher:
+            with patch.object(self.client, '_request', side_effect=self.fake_request):
+                start = time.monotonic()
+                prefetcher.warm([f"m{i}" for i in range(6)])
+                elapsed = time.monotonic() - start
+
+        # 1 token of burst, then 5 more at 50/s
+        self.assertGreaterEqual(elapsed, 0.09)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Tests for the semantic query cache
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.autonomous import MemoryTypesClient, SearchClient, WorkingMemoryClient
+from recallbricks.query_cache import SemanticQueryCache, normalize_query, simhash
+
+
+class TestNormalization(unittest.TestCase):
+    """Test query normalization and sketches"""
+
+    def test_equivalent_phrasings(self):
+        """Case, punctuation, stopwords, inflection and order are ignored"""
+        self.assertEqual(normalize_query("user's preferred editor"), "editor prefer user")
+        self.assertEqual(normalize_query("The editor the user prefers?"), "editor prefer user")
+        self.assertEqual(normalize_query("Editors, USERS"), normalize_query("user editor"))
+
+    def test_stopword_only_query(self):
+        """A query made only of stopwords is not reduced to nothing"""
+        self.assertEqual(normalize_query("Is it  to be"), "is it to be")
+
+    def test_question_words_kept(self):
+        """Queries differing only in their question word do not collide"""
+        self.assertNotEqual(normalize_query("when did the api deploy"),
+                            normalize_query("where did the api deploy"))
+        self.assertNotEqual(normalize_query("why did it fail"), normalize_query("how did it fail"))
+
+    def test_simhash_distance(self):
+        """Similar texts have close sketches"""
+        near = bin(simhash("deploy friday main branch") ^ simhash("deploy friday main branches")).count('1')
+        far = bin(simhash("deploy friday main branch") ^ simhash("favorite color blue")).count('1')
+        self.assertLess(near, far)
+        self.assertEqual(simhash("abc"), simhash("abc"))
+
+
+class TestSemanticQueryCache(unittest.TestCase):
+    """Test SemanticQueryCache lookups"""
+
+    def test_normalized_hit(self):
+        """Rephrased queries hit the same entry"""
+        cache = SemanticQueryCache()
+        cache.set("recall", "user's preferred editor", {"memories": []}, {"limit": 10})
+        self.assertEqual(cache.get("recall", "the editor the user prefers", {"limit": 10}),
+                         {"memories": []})
+        cache.set("recall", "when did the api deploy", {"memories": ["friday"]})
+        self.assertIsNone(cache.get("recall", "where did the api deploy"))
+
+    def test_hits_return_copies(self):
+        """Mutating a result does not change the cached entry"""
+        cache = SemanticQueryCache()
+        result = {"memories": [{"id": "1"}]}
+        cache.set("recall", "editor", result)
+        result["memories"].append({"id": "2"})
+        cache.get("recall", "editor")["memories"].clear()
+        self.assertEqual(cache.get("recall", "editor"), {"memories": [{"id": "1"}]})
+
+    def test_params_must_match(self):
+        """Different request parameters miss"""
+        cache = SemanticQueryCache()
+        cache.set("recall", "editor", {"memories": []}, {"limit": 10})
+        self.assertIsNone(cache.get("recall", "editor", {"limit": 5}))
+        self.assertIsNone(cache.get("other", "editor", {"limit": 10}))
+
+    def test_near_match(self):
+        """Sketch matching serves near-duplicates only when enabled"""
+        exact = SemanticQueryCache()
+        near = SemanticQueryCache(max_distance=10)
+        for cache in (exact, near):
+            cache.set("recall", "kubernetes deployment checklist", "result")
+
+        self.assertIsNone(exact.get("recall", "kubernets deployment checklist"))
+        self.assertEqual(near.get("recall", "kubernets deployment checklist"), "result")
+        self.assertIsNone(near.get("recall", "favorite ice cream flavor"))
+        self.assertEqual(near.stats()["near_hits"], 1)
+
+    def test_invalidate_namespace(self):
+        """invalidate() drops one namespace or everything"""
+        cache = SemanticQueryCache(max_distance=3)
+        cache.set("recall", "a b c", 1)
+        cache.set("semantic:agent", "a b c", 2)
+        cache.invalidate("recall")
+        self.assertIsNone(cache.get("recall", "a b c"))
+        self.assertEqual(cache.get("semantic:agent", "a b c"), 2)
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+    def test_stats(self):
+        """Hit rate counts exact and near hits"""
+        cache = SemanticQueryCache()
+        cache.get("recall", "x")
+        cache.set("recall", "x", 1)
+        cache.get("recall", "X!")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_validation(self):
+        """max_distance must fit in the sketch"""
+        with self.assertRaises(ValueError):
+            SemanticQueryCache(max_distance=65)
+
+
+class TestClientQueryCache(unittest.TestCase):
+    """Test query cache integration in the clients"""
+
+    def test_recall_served_from_cache(self):
+        """recall() serves rephrased queries locally until a write"""
+        cache = SemanticQueryCache()
+        client = RecallBricks(api_key="test-key", query_cache=cache)
+        response = {"memories": [{"id": "1"}], "count": 1}
+
+        with patch.object(client, '_request', return_value=response) as mock_request:
+            client.recall("user's preferred editor")
+            self.assertEqual(client.recall("The editor the user prefers?"), response)
+            self.assertEqual(mock_request.call_count, 1)
+
+            client.recall("user's preferred editor", limit=5)
+            self.assertEqual(mock_request.call_count, 2)
+
+            client.learn("The user switched to Neovim")
+            client.recall("user's preferred editor")
+            self.assertEqual(mock_request.call_count, 4)
+
+    def test_recall_without_cache(self):
+        """Without a query cache every recall() hits the API"""
+        client = RecallBricks(api_key="test-key")
+        with patch.object(client, '_request', return_value={"memories": []}) as mock_request:
+            client.recall("editor")
+            client.recall("editor")
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_semantic_served_from_cache(self):
+        """SearchClient.semantic() caches per agent"""
+        client = SearchClient(api_key="test-key", query_cache=SemanticQueryCache())
+        with patch.object(client, '_request', return_value={"results": []}) as mock_request:
+            client.semantic("agent_1", "auth patterns")
+            client.semantic("agent_1", "Auth pattern?")
+            client.semantic("agent_2", "auth patterns")
+            self.assertEqual(mock_request.call_count, 2)
+
+            client.invalidate_query_cache("agent_1")
+            client.semantic("agent_1", "auth patterns")
+            client.semantic("agent_2", "auth patterns")
+            self.assertEqual(mock_request.call_count, 3)
+
+    def test_memory_writes_invalidate_semantic(self):
+        """Memory-type and working-memory writes drop cached semantic() results"""
+        cache = SemanticQueryCache()
+        search = SearchClient(api_key="test-key", query_cache=cache)
+        types = MemoryTypesClient(api_key="test-key", query_cache=cache)
+        working = WorkingMemoryClient(api_key="test-key", query_cache=cache)
+        writes = [
+            lambda: types.store_semantic("agent_1", "TLS is required"),
+            lambda: types.consolidate_semantic("agent_1"),
+            lambda: working.store("agent_1", "scratch"),
+            lambda: working.update("w1", priority=0.9),
+            lambda: working.delete("w1"),
+            lambda: working.clear("agent_1"),
+            lambda: working.consolidate("agent_1"),
+        ]
+        with patch.object(search, '_request', return_value={"results": []}) as mock_request, \
+                patch.object(types, '_request', return_value={"id": "s1"}), \
+                patch.object(working, '_request', return_value={"id": "w1"}):
+            search.semantic("agent_1", "auth patterns")
+            for n, write in enumerate(writes, start=2):
+                write()
+                search.semantic("agent_1", "auth patterns")
+                self.assertEqual(mock_request.call_count, n)
+
+            search.semantic("agent_2", "auth patterns")
+            types.store_episodic("agent_1", "login failed")
+            search.semantic("agent_2", "auth patterns")
+            self.assertEqual(mock_request.call_count, len(writes) + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
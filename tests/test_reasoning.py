@@ -0,0 +1,204 @@
+"""
+Tests for the background reasoning-trace pipeline
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import MetacognitionClient
+from recallbricks.reasoning import ReasoningPipeline
+
+
+class TestReasoningPipeline(unittest.TestCase):
+    """Test batching, retries and overflow policies"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.sent = []
+        self.client.log_reasoning.side_effect = lambda agent_id, **entry: self.sent.append(
+            (agent_id, entry["step"]))
+
+    def make(self, **options):
+        options.setdefault("flush_interval", 60)
+        pipeline = ReasoningPipeline(self.client, **options)
+        self.addCleanup(pipeline.close, 2)
+        return pipeline
+
+    def blocked(self, **options):
+        """A pipeline whose worker is stuck sending agent 'busy'."""
+        gate = threading.Event()
+        started = threading.Event()
+
+        def log(agent_id, **entry):
+            if agent_id == "busy":
+                started.set()
+                gate.wait(5)
+            self.sent.append((agent_id, entry["step"]))
+
+        self.client.log_reasoning.side_effect = log
+        pipeline = self.make(max_batch=1, **options)
+        pipeline.log("busy", "s", "r")
+        self.assertTrue(started.wait(2))
+        self.addCleanup(gate.set)
+        return pipeline, gate
+
+    def test_log_does_not_block(self):
+        """log() returns before the step is sent; flush() sends in order"""
+        pipeline = self.make()
+        for n in range(5):
+            self.assertTrue(pipeline.log("agent_1", f"step_{n}", "thinking"))
+        self.assertEqual(self.sent, [])
+        self.assertTrue(pipeline.flush(timeout=2))
+        self.assertEqual(self.sent, [("agent_1", f"step_{n}") for n in range(5)])
+
+    def test_full_batch_sent_without_flush(self):
+        """A full batch goes out without waiting for flush_interval"""
+        pipeline = self.make(max_batch=3)
+        for n in range(3):
+            pipeline.log("agent_1", f"step_{n}", "thinking")
+        deadline = time.time() + 2
+        while len(self.sent) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.sent), 3)
+
+    def test_interval(self):
+        """Steps are sent after waiting flush_interval"""
+        pipeline = self.make(flush_interval=0.05)
+        pipeline.log("agent_1", "step", "thinking")
+        deadline = time.time() + 2
+        while not self.sent and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.sent, [("agent_1", "step")])
+
+    def test_bulk_batches_per_agent(self):
+        """bulk=True sends one request per agent batch"""
+        pipeline = self.make(bulk=True, max_batch=2)
+        for n in range(3):
+            pipeline.log("agent_1", f"a{n}", "r")
+            pipeline.log("agent_2", f"b{n}", "r")
+        pipeline.flush(timeout=2)
+        batches = sorted(
+            (call.args[0], [e["step"] for e in call.args[1]])
+            for call in self.client.log_reasoning_batch.call_args_list
+        )
+        self.assertEqual(batches, [("agent_1", ["a0", "a1"]), ("agent_1", ["a2"]),
+                                   ("agent_2", ["b0", "b1"]), ("agent_2", ["b2"])])
+
+    def test_retry_then_give_up(self):
+        """Failed sends are retried, then dropped and reported"""
+        attempts = []
+
+        def log(agent_id, **entry):
+            attempts.append(entry["step"])
+            if entry["step"] == "bad":
+                raise RuntimeError("503")
+            self.sent.append((agent_id, entry["step"]))
+
+        errors = []
+        self.client.log_reasoning.side_effect = log
+        pipeline = self.make(max_retries=2, retry_backoff=0.001,
+                             on_error=lambda agent_id, e: errors.append(agent_id))
+        pipeline.log("agent_1", "good", "r")
+        pipeline.log("agent_1", "bad", "r")
+        self.assertTrue(pipeline.flush(timeout=2))
+        self.assertEqual(attempts, ["good", "bad", "bad", "bad"])
+        self.assertEqual(errors, ["agent_1"])
+        stats = pipeline.stats()
+        self.assertEqual((stats["sent"], stats["failed"], stats["retries"]), (1, 1, 2))
+
+    def test_backoff_does_not_stall_other_agents(self):
+        """A failing agent waits out its backoff without holding up the others"""
+        def log(agent_id, **entry):
+            if agent_id == "failing":
+                raise RuntimeError("503")
+            self.sent.append((agent_id, entry["step"]))
+
+        self.client.log_reasoning.side_effect = log
+        pipeline = ReasoningPipeline(self.client, flush_interval=60, max_retries=1, retry_backoff=30)
+        self.addCleanup(pipeline.close, 0.1)
+        pipeline.log("failing", "s0", "r")
+        pipeline.log("failing", "s1", "r")
+        pipeline.log("healthy", "s0", "r")
+        self.assertTrue(pipeline.flush("healthy", timeout=2))
+        self.assertEqual(self.sent, [("healthy", "s0")])
+        self.assertFalse(pipeline.flush("failing", timeout=0.05))
+        self.assertEqual(self.client.log_reasoning.call_count, 2)   # s1 waits behind s0
+
+    def test_drop_oldest(self):
+        """A full queue discards its oldest step"""
+        pipeline, gate = self.blocked(max_queue=3)
+        for n in range(5):
+            self.assertTrue(pipeline.log("agent_1", f"step_{n}", "r"))
+        gate.set()
+        pipeline.flush(timeout=2)
+        self.assertEqual([s for a, s in self.sent if a == "agent_1"], ["step_2", "step_3", "step_4"])
+        self.assertEqual(pipeline.stats()["dropped"], 2)
+
+    def test_drop_newest(self):
+        """drop_newest rejects steps once the queue is full"""
+        pipeline, gate = self.blocked(max_queue=2, overflow="drop_newest")
+        results = [pipeline.log("agent_1", f"step_{n}", "r") for n in range(4)]
+        self.assertEqual(results, [True, True, False, False])
+
+    def test_sample(self):
+        """sample keeps only sample_rate of steps above high_water"""
+        pipeline, gate = self.blocked(max_queue=10, overflow="sample", high_water=0.5,
+                                      sample_rate=0.5)
+        with patch('recallbricks.reasoning.random.random', side_effect=[0.9, 0.1] * 10):
+            results = [pipeline.log("agent_1", f"step_{n}", "r") for n in range(12)]
+        self.assertEqual(results[:5], [True] * 5)
+        self.assertEqual(results[5:9], [False, True, False, True])
+        self.assertEqual(pipeline.stats()["sampled_out"], 4)
+        self.assertEqual(pipeline.stats()["queued"], 8)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            ReasoningPipeline(self.client, overflow="block")
+        pipeline = self.make()
+        with self.assertRaises(ValueError):
+            pipeline.log("agent_1", "", "r")
+
+
+class TestClientReasoningPipeline(unittest.TestCase):
+    """Test MetacognitionClient integration"""
+
+    def test_reads_flush_first(self):
+        """get_reasoning_trace() and analyze_patterns() see buffered steps"""
+        client = MetacognitionClient(api_key="test-key")
+        calls = []
+        with patch.object(client, '_request', side_effect=lambda method, endpoint, **kw: calls.append(
+                (method, endpoint)) or {}):
+            pipeline = client.buffer_reasoning(flush_interval=60)
+            pipeline.log("agent_1", "plan", "thinking")
+            client.get_reasoning_trace("agent_1")
+            pipeline.log("agent_1", "act", "thinking")
+            client.analyze_patterns("agent_1")
+            pipeline.close()
+        self.assertEqual(calls, [
+            ("POST", "/api/autonomous/metacognition/reasoning"),
+            ("GET", "/api/autonomous/metacognition/trace"),
+            ("POST", "/api/autonomous/metacognition/reasoning"),
+            ("POST", "/api/autonomous/metacognition/analyze"),
+        ])
+
+    def test_log_reasoning_batch(self):
+        client = MetacognitionClient(api_key="test-key")
+        with patch.object(client, '_request', return_value={}) as mock_request:
+            client.log_reasoning_batch("agent_1", [{"step": "plan", "reasoning": "r", "confidence": 2}])
+        mock_request.assert_called_once_with(
+            "POST", "/api/autonomous/metacognition/reasoning",
+            json={"agent_id": "agent_1",
+                  "entries": [{"step": "plan", "reasoning": "r", "confidence": 1.0}]}
+        )
+        with self.assertRaises(ValueError):
+            client.log_reasoning_batch("agent_1", [{"step": "plan"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
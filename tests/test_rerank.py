@@ -0,0 +1,94 @@
+"""
+Tests for local re-ranking with weight profiles
+"""
+
+import unittest
+from datetime import datetime, timezone
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if HAS_NUMPY:
+    from recallbricks.results import ResultSet
+    from recallbricks.rerank import Reranker, WeightProfile
+
+
+NOW = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+RESULTS = [
+    {"id": "old", "text": "old but relevant", "relevance_score": 0.9,
+     "helpfulness_boost": 0.05, "created_at": "2025-01-01T00:00:00Z"},
+    {"id": "new", "text": "new", "relevance_score": 0.6,
+     "helpfulness_boost": 0.3, "created_at": "2025-01-31T00:00:00Z"},
+    {"id": "used", "text": "heavily used", "relevance_score": 0.5, "usage_boost": 0.8,
+     "helpfulness_boost": 0.2, "created_at": "2025-01-24T00:00:00+00:00"},
+    {"id": "undated", "text": "no timestamp", "relevance_score": 0.4},
+]
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestReranker(unittest.TestCase):
+    """Test Reranker scoring and ranking"""
+
+    def setUp(self):
+        self.reranker = Reranker(ResultSet.from_dicts(RESULTS), now=NOW)
+
+    def test_ages_from_created_at(self):
+        """Ages are computed in days; missing timestamps count as new"""
+        np.testing.assert_allclose(self.reranker.age_days, [30.0, 0.0, 7.0, 0.0])
+
+    def test_default_profile_is_relevance_order(self):
+        """The default profile ranks by relevance only"""
+        ranked = self.reranker.rank(WeightProfile())
+        self.assertEqual(ranked.ids, ["old", "new", "used", "undated"])
+
+    def test_usage_weight(self):
+        """Weights blend score components"""
+        ranked = self.reranker.rank(WeightProfile(usage=1.0), top_k=1)
+        self.assertEqual(ranked.ids, ["used"])
+
+    def test_half_life_decay(self):
+        """Scores halve every half-life"""
+        scores = self.reranker.scores(WeightProfile(half_life_days=7.0))
+        self.assertAlmostEqual(scores[2], 0.25)
+        self.assertAlmostEqual(scores[0], 0.9 * 0.5 ** (30 / 7))
+        self.assertEqual(self.reranker.rank(WeightProfile(half_life_days=7.0)).ids[0], "new")
+
+    def test_thresholds_drop_results(self):
+        """Results below min_helpfulness are removed"""
+        ranked = self.reranker.rank(WeightProfile(min_helpfulness=0.1))
+        self.assertEqual(ranked.ids, ["new", "used"])
+        self.assertTrue(np.isneginf(self.reranker.scores(WeightProfile(min_relevance=0.5))[3]))
+
+    def test_rank_many_matches_rank(self):
+        """rank_many() gives the same order as ranking each profile alone"""
+        profiles = {
+            "fresh": WeightProfile(half_life_days=3.0),
+            "proven": "proven",
+            "plain": WeightProfile(),
+        }
+        ranked = self.reranker.rank_many(profiles, top_k=2)
+        for label, profile in profiles.items():
+            self.assertEqual(ranked[label].ids, self.reranker.rank(profile, top_k=2).ids)
+
+    def test_accepts_result_lists(self):
+        """Plain result dicts are accepted"""
+        self.assertEqual(len(Reranker(RESULTS, now=NOW)), 4)
+
+    def test_invalid_profiles(self):
+        """Unknown profile names and bad half-lives raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.reranker.rank("nonexistent")
+        with self.assertRaises(ValueError):
+            WeightProfile(half_life_days=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for columnar ResultSet
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from recallbricks import RecallBricks
+from recallbricks.types import WeightedSearchResult
+
+if HAS_NUMPY:
+    from recallbricks.results import ResultSet
+
+
+RESULTS = [
+    {"id": "a", "text": "alpha", "relevance_score": 0.9, "usage_boost": 0.1, "tags": ["x"]},
+    {"id": "b", "text": "beta", "relevance_score": 0.5, "usage_boost": 0.4, "helpfulness_boost": 0.3},
+    {"id": "c", "text": "gamma", "relevance_score": 0.7, "recency_boost": 0.2},
+]
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestResultSet(unittest.TestCase):
+    """Test ResultSet operations"""
+
+    def setUp(self):
+        self.results = ResultSet.from_dicts(RESULTS)
+
+    def test_iterates_as_weighted_results(self):
+        """Iteration and indexing yield WeightedSearchResult objects"""
+        items = list(self.results)
+        self.assertTrue(all(isinstance(r, WeightedSearchResult) for r in items))
+        self.assertEqual(items[0].tags, ["x"])
+        self.assertEqual(self.results[1].id, "b")
+        self.assertEqual(len(self.results), 3)
+
+    def test_columns_are_zero_copy(self):
+        """Columns are views into one contiguous block"""
+        column = self.results.column("relevance_score")
+        self.assertTrue(column.flags["C_CONTIGUOUS"])
+        self.assertTrue(np.shares_memory(column, self.results.to_numpy()["relevance_score"]))
+        np.testing.assert_allclose(column, [0.9, 0.5, 0.7])
+        with self.assertRaises(ValueError):
+            self.results.column("bogus")
+
+    def test_sort_and_top_k(self):
+        """Sorting and top-k are vectorized over columns or key arrays"""
+        self.assertEqual(self.results.sort_by("relevance_score").ids, ["a", "c", "b"])
+        self.assertEqual(self.results.sort_by("usage_boost", descending=False).ids, ["c", "a", "b"])
+        self.assertEqual(self.results.top_k(2).ids, ["a", "c"])
+        self.assertEqual(self.results.top_k(10).ids, ["a", "c", "b"])
+        self.assertEqual(len(self.results.top_k(0)), 0)
+
+        combined = self.results.combined_score({"usage_boost": 2.0})
+        self.assertEqual(self.results.top_k(1, combined).ids, ["b"])
+
+    def test_filter_and_where(self):
+        """Boolean masks and range filters select rows"""
+        self.assertEqual(self.results.where("relevance_score", min_value=0.6).ids, ["a", "c"])
+        self.assertEqual(self.results.where("usage_boost", max_value=0.2).ids, ["a", "c"])
+        mask = self.results.column("helpfulness_boost") > 0
+        self.assertEqual(self.results[mask].ids, ["b"])
+        self.assertEqual(self.results[1:].ids, ["b", "c"])
+        with self.assertRaises(ValueError):
+            self.results.filter([True])
+
+    def test_from_results_round_trip(self):
+        """Result objects convert to a ResultSet and back"""
+        objects = [WeightedSearchResult.from_dict(r) for r in RESULTS]
+        result_set = ResultSet.from_results(objects)
+        self.assertEqual(result_set.to_list(), objects)
+
+    def test_empty(self):
+        """Empty result sets behave"""
+        empty = ResultSet.from_dicts([])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(len(empty.top_k(5)), 0)
+        self.assertEqual(empty.column("usage_boost").shape, (0,))
+
+    def test_to_pandas(self):
+        """pandas export has id, text and score columns"""
+        try:
+            import pandas  # noqa: F401
+        except ImportError:
+            self.skipTest("pandas not installed")
+        df = self.results.to_pandas()
+        self.assertEqual(list(df["id"]), ["a", "b", "c"])
+        self.assertIn("recency_boost", df.columns)
+
+    def test_search_weighted_as_result_set(self):
+        """search_weighted can return a ResultSet"""
+        client = RecallBricks(api_key="test_key")
+        with patch.object(client, '_request') as mock_request:
+            mock_request.return_value = {"results": RESULTS}
+            results = client.search_weighted("query", as_result_set=True)
+
+        self.assertIsInstance(results, ResultSet)
+        self.assertEqual(results.ids, ["a", "b", "c"])
+
+
+if __name__ == '__main__':
+    unittest.main()
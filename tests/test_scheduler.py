@@ -0,0 +1,157 @@
+"""
+Tests for the local prospective-memory trigger scheduler
+"""
+
+import random
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import ProspectiveMemoryClient
+from recallbricks.scheduler import TimerWheel, TriggerScheduler
+from recallbricks.temporal import format_time
+
+
+def in_ms(ms):
+    return format_time(datetime.now(timezone.utc) + timedelta(milliseconds=ms))
+
+
+class TestTimerWheel(unittest.TestCase):
+    """Test the hierarchical timing wheel"""
+
+    def test_fires_on_deadline(self):
+        """Items fire exactly at their tick, across levels"""
+        wheel = TimerWheel(slots=4, levels=2)
+        wheel.advance(0)
+        wheel.add("soon", 3)
+        wheel.add("later", 13)
+        wheel.add("overflow", 40)
+        self.assertEqual(wheel.advance(2), [])
+        self.assertEqual(wheel.advance(3), ["soon"])
+        self.assertEqual(wheel.advance(12), [])
+        self.assertEqual(wheel.advance(13), ["later"])
+        self.assertEqual(wheel.advance(100), ["overflow"])
+        self.assertEqual(len(wheel), 0)
+
+    def test_matches_brute_force(self):
+        """Random schedules, removals and jumps fire like a sorted list would"""
+        rng = random.Random(7)
+        wheel = TimerWheel(slots=8, levels=3)
+        now = 1000
+        wheel.advance(now)
+        expected = {}
+        for step in range(400):
+            for _ in range(rng.randint(0, 3)):
+                item = f"i{step}-{rng.random()}"
+                deadline = now + rng.choice([0, 1, 5, 30, 300, 2000]) + rng.randint(0, 50)
+                wheel.add(item, deadline)
+                expected[item] = deadline
+            if expected and rng.random() < 0.2:
+                item = rng.choice(sorted(expected))
+                self.assertTrue(wheel.remove(item))
+                del expected[item]
+
+            # Deadlines already passed are due on the next advance
+            if expected:
+                self.assertLessEqual(wheel.next_deadline(), max(now + 1, min(expected.values())))
+            now += rng.choice([1, 3, 17, 250])
+            fired = wheel.advance(now)
+            due = {item for item, deadline in expected.items() if deadline <= now}
+            self.assertEqual(set(fired), due)
+            for item in due:
+                del expected[item]
+        self.assertEqual(len(wheel), len(expected))
+
+
+class TestTriggerScheduler(unittest.TestCase):
+    """Test local firing and polling"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_pending.return_value = {"memories": []}
+        self.client.check_triggers.return_value = {"triggered": []}
+
+    def test_fires_time_triggers_without_polling(self):
+        """Time-based memories fire locally at trigger_at"""
+        fired = []
+        done = threading.Event()
+        self.client.get_pending.return_value = {"memories": [
+            {"id": "pm_1", "content": "soon", "trigger_type": "time", "trigger_at": in_ms(50)},
+            {"id": "pm_2", "content": "much later", "trigger_type": "time", "trigger_at": in_ms(3_600_000)},
+        ]}
+
+        def handler(memory):
+            fired.append(memory)
+            done.set()
+
+        with TriggerScheduler(self.client, ["agent_1"], handlers=[handler], poll_interval=0.01) as scheduler:
+            self.assertTrue(done.wait(2))
+            time.sleep(0.05)
+            stats = scheduler.stats()
+
+        self.assertEqual([m["id"] for m in fired], ["pm_1"])
+        self.assertEqual(fired[0]["agent_id"], "agent_1")
+        self.assertLess(stats["max_lateness_ms"], 500)
+        self.assertEqual(stats["pending"], 1)
+        self.client.check_triggers.assert_not_called()
+
+    def test_polls_only_for_event_triggers(self):
+        """check_triggers() is called for agents with event memories and fires them"""
+        self.client.get_pending.side_effect = lambda agent_id, limit: {"memories": [
+            {"id": "pm_evt", "trigger_type": "event", "trigger_condition": "deploy.done"},
+        ]} if agent_id == "agent_evt" else {"memories": []}
+        self.client.check_triggers.return_value = {"triggered": [{"id": "pm_evt", "content": "notify"}]}
+        scheduler = TriggerScheduler(self.client, ["agent_evt", "agent_idle"])
+
+        fired = scheduler.poll()
+        self.client.check_triggers.assert_called_once_with("agent_evt")
+        self.assertEqual([m["id"] for m in fired], ["pm_evt"])
+        scheduler.poll()
+        self.assertEqual(self.client.check_triggers.call_count, 1)
+
+    def test_handler_errors_are_isolated(self):
+        """A failing handler does not stop others"""
+        errors, seen = [], []
+        scheduler = TriggerScheduler(self.client, ["agent_1"], on_error=errors.append,
+                                     handlers=[lambda m: 1 / 0, seen.append])
+        scheduler._dispatch([{"id": "pm_1"}])
+        self.assertEqual(seen, [{"id": "pm_1"}])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+
+    def test_client_keeps_scheduler_in_sync(self):
+        """create, reschedule, cancel and mark_completed update the schedule"""
+        client = ProspectiveMemoryClient(api_key="test-key")
+        with patch.object(client, '_request', return_value={"memories": []}):
+            scheduler = client.schedule_triggers(["agent_1"], start=False)
+        self.assertIs(client.trigger_scheduler, scheduler)
+
+        with patch.object(client, '_request', side_effect=[{"id": "pm_1"}, {"id": "pm_2"}]):
+            client.create("agent_1", "time", trigger_at="2030-01-01T00:00:00Z")
+            client.create("agent_1", "event", trigger_type="event", trigger_condition="x")
+        self.assertIn("pm_1", scheduler._wheel)
+        self.assertEqual(scheduler._polled, {"agent_1": {"pm_2"}})
+
+        with patch.object(client, '_request', return_value={}):
+            client.reschedule("pm_1", "2030-01-02T00:00:00Z")
+            pending = {m["id"]: m for m in scheduler.pending()}
+            self.assertEqual(pending["pm_1"]["trigger_at"], "2030-01-02T00:00:00Z")
+            client.cancel("pm_1")
+            client.mark_completed("pm_2")
+        self.assertEqual(scheduler.stats()["pending"], 0)
+        self.assertEqual(scheduler._polled, {})
+
+    def test_ignores_unwatched_agents(self):
+        """Memories for agents not watched are not scheduled"""
+        scheduler = TriggerScheduler(self.client, ["agent_1"])
+        scheduler.track({"id": "pm_x", "agent_id": "other", "trigger_at": in_ms(10)})
+        self.assertEqual(scheduler.pending(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Tests for streaming recall (recall_stream)
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, Mock
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks import RecallBricks
+from recallbricks.exceptions import APIError, ValidationError
+from recallbricks.streaming import RecallStream
+
+
+def ndjson_response(records):
+    """Build a mock streamed NDJSON response"""
+    response = Mock()
+    response.headers = {"Content-Type": "application/x-ndjson"}
+    response.iter_lines.return_value = [json.dumps(r) for r in records] + [""]
+    return response
+
+
+class TestRecallStream(unittest.TestCase):
+    """Test RecallBricks.recall_stream"""
+
+    def setUp(self):
+        self.client = RecallBricks(api_key="test_key")
+
+    def test_ndjson_stream(self):
+        """Memories are yielded in order and categories arrive at the end"""
+        response = ndjson_response([
+            {"type": "memory", "memory": {"id": "m1", "text": "one"}},
+            {"type": "memory", "memory": {"id": "m2", "text": "two"}},
+            {"type": "categories", "categories": {"Work": {"count": 2, "avg_score": 0.9, "summary": "s"}}},
+            {"type": "done", "total": 2},
+        ])
+
+        with patch.object(self.client, '_request', return_value=response) as mock_request:
+            stream = self.client.recall_stream("query", limit=2, organized=True)
+            mock_request.assert_not_called()  # lazy until iterated
+
+            first = next(stream)
+            self.assertEqual(first["id"], "m1")
+            self.assertIsNone(stream.categories)
+            rest = list(stream)
+
+        self.assertEqual([m["id"] for m in rest], ["m2"])
+        self.assertEqual(stream.categories["Work"]["count"], 2)
+        self.assertEqual(stream.total, 2)
+        kwargs = mock_request.call_args[1]
+        self.assertTrue(kwargs["stream"])
+        self.assertTrue(kwargs["json"]["stream"])
+        self.assertTrue(kwargs["json"]["organized"])
+        response.close.assert_called_once()
+
+    def test_plain_json_response(self):
+        """A server that ignores streaming still works"""
+        response = Mock()
+        response.headers = {"Content-Type": "application/json"}
+        response.content = b"{}"
+        response.json.return_value = {
+            "memories": [{"id": "m1"}],
+            "categories": {"Work": {"count": 1, "avg_score": 0.5, "summary": ""}},
+            "total": 1,
+        }
+
+        with patch.object(self.client, '_request', return_value=response):
+            result = self.client.recall_stream("query", organized=True).collect()
+
+        self.assertEqual(result["memories"], [{"id": "m1"}])
+        self.assertIn("Work", result["categories"])
+        self.assertEqual(result["total"], 1)
+
+    def test_stream_error_record(self):
+        """Error records in the stream raise APIError"""
+        response = ndjson_response([
+            {"type": "memory", "memory": {"id": "m1"}},
+            {"type": "error", "error": {"message": "backend failed", "code": "STREAM_ERROR"}},
+        ])
+        with patch.object(self.client, '_request', return_value=response):
+            stream = self.client.recall_stream("query")
+            next(stream)
+            with self.assertRaises(APIError):
+                next(stream)
+
+    def test_paged_fallback(self):
+        """Refused streaming falls back to offset pages with local category counts"""
+        pages = {
+            0: {"memories": [
+                {"id": "m1", "score": 0.8, "metadata": {"category": "Work"}},
+                {"id": "m2", "score": 0.6, "metadata": {"category": "Work"}},
+            ], "categories": {"Work": {"count": 2, "avg_score": 0.7, "summary": "work stuff"}}},
+            2: {"memories": [
+                {"id": "m3", "score": 1.0, "metadata": {"category": "Home"}},
+            ]},
+        }
+
+        def fake_request(method, endpoint, **kwargs):
+            if kwargs.get("stream"):
+                raise ValidationError("Unknown field: stream")
+            return pages[kwargs["json"]["offset"]]
+
+        with patch.object(self.client, '_request', side_effect=fake_request) as mock_request:
+            self.client.RECALL_PAGE_SIZE = 2
+            stream = self.client.recall_stream("query", limit=5, organized=True)
+            ids = [m["id"] for m in stream]
+
+        self.assertEqual(ids, ["m1", "m2", "m3"])
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(stream.total, 3)
+        self.assertEqual(stream.categories["Work"]["count"], 2)
+        self.assertAlmostEqual(stream.categories["Work"]["avg_score"], 0.7)
+        self.assertEqual(stream.categories["Work"]["summary"], "work stuff")
+        self.assertEqual(stream.categories["Home"]["count"], 1)
+
+    def test_paging_when_offset_ignored(self):
+        """A server that ignores offset yields each memory once and ends the paging"""
+        first_page = {"memories": [{"id": "m1"}, {"id": "m2"}]}
+        with patch.object(self.client, '_request', return_value=first_page) as mock_request:
+            stream = self.client.recall_stream("query", limit=10, page_size=2)
+            ids = [m["id"] for m in stream]
+
+        self.assertEqual(ids, ["m1", "m2"])
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(stream.total, 2)
+
+    def test_explicit_page_size(self):
+        """page_size skips the streaming attempt"""
+        with patch.object(self.client, '_request') as mock_request:
+            mock_request.return_value = {"memories": [{"id": "m1"}]}
+            memories = list(self.client.recall_stream("query", limit=10, page_size=5))
+
+        mock_request.assert_called_once()
+        self.assertEqual(mock_request.call_args[1]["json"]["limit"], 5)
+        self.assertEqual(memories, [{"id": "m1"}])
+
+    def test_other_errors_propagate(self):
+        """Errors unrelated to streaming support are raised"""
+        with patch.object(self.client, '_request') as mock_request:
+            mock_request.side_effect = APIError("Server error", status_code=500)
+            with self.assertRaises(APIError):
+                list(self.client.recall_stream("query"))
+
+    def test_validation(self):
+        """Arguments are validated eagerly"""
+        with self.assertRaises(ValueError):
+            self.client.recall_stream("")
+        with self.assertRaises(ValueError):
+            self.client.recall_stream("query", page_size=0)
+
+    def test_async_iteration(self):
+        """RecallStream works with async for"""
+        stream = RecallStream(iter([("memory", {"id": "a"}), ("total", 1), ("memory", {"id": "b"})]))
+
+        async def consume():
+            return [m["id"] async for m in stream]
+
+        self.assertEqual(asyncio.run(consume()), ["a", "b"])
+        self.assertEqual(stream.total, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
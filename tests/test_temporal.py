@@ -0,0 +1,145 @@
+"""
+Tests for windowed temporal scans
+"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import SearchClient
+from recallbricks.temporal import format_time, parse_time, scan_windows
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_memories(hours):
+    return [
+        {"id": f"m{i}", "created_at": format_time(START + timedelta(hours=h))}
+        for i, h in enumerate(hours)
+    ]
+
+
+class FakeTemporal:
+    """Serves temporal() from a fixed list, truncated to limit like the API."""
+
+    def __init__(self, memories):
+        self.memories = memories
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, agent_id, start_time=None, end_time=None, query=None, limit=20):
+        with self.lock:
+            self.calls.append((start_time, end_time))
+        start, end = parse_time(start_time), parse_time(end_time)
+        hits = [m for m in self.memories if start <= parse_time(m["created_at"]) <= end]
+        # Newest first, as a relevance-ordered API might return them
+        return {"results": list(reversed(hits))[:limit]}
+
+
+class TestTimeHelpers(unittest.TestCase):
+    """Test time parsing and formatting"""
+
+    def test_round_trip(self):
+        """Z suffixes and naive datetimes are treated as UTC"""
+        self.assertEqual(parse_time("2024-01-01T00:00:00Z"), START)
+        self.assertEqual(parse_time(datetime(2024, 1, 1)), START)
+        self.assertEqual(format_time(START), "2024-01-01T00:00:00Z")
+
+
+class TestTemporalScan(unittest.TestCase):
+    """Test SearchClient.temporal_scan()"""
+
+    def setUp(self):
+        self.client = SearchClient(api_key="test-key")
+
+    def test_scans_everything_in_order(self):
+        """Dense windows are subdivided until nothing is truncated"""
+        # 30 memories crammed into the first two days, 5 spread over the rest
+        memories = make_memories([i * 1.5 for i in range(30)] + [100, 200, 300, 400, 500])
+        fake = FakeTemporal(memories)
+
+        with patch.object(self.client, 'temporal', side_effect=fake):
+            scanned = list(self.client.temporal_scan(
+                "agent_1", "2024-01-01T00:00:00Z", START + timedelta(hours=720),
+                limit=5, windows=4
+            ))
+
+        self.assertEqual(sorted(m["id"] for m in scanned), sorted(m["id"] for m in memories))
+        timestamps = [m["created_at"] for m in scanned]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertGreater(len(fake.calls), 4)
+
+    def test_boundary_duplicates_are_dropped(self):
+        """A memory on a window boundary is yielded once"""
+        fake = FakeTemporal(make_memories([12]))
+        with patch.object(self.client, 'temporal', side_effect=fake):
+            scanned = list(self.client.temporal_scan(
+                "agent_1", START, START + timedelta(hours=24), windows=2
+            ))
+        self.assertEqual([m["id"] for m in scanned], ["m0"])
+
+    def test_min_window_stops_splitting(self):
+        """Windows at the minimum size are returned even if truncated"""
+        fake = FakeTemporal(make_memories([0] * 10))
+        with patch.object(self.client, 'temporal', side_effect=fake):
+            scanned = list(self.client.temporal_scan(
+                "agent_1", START, START + timedelta(minutes=2),
+                limit=3, windows=1, min_window_seconds=60
+            ))
+        self.assertEqual(len(scanned), 3)
+
+    def test_dense_windows_refined_concurrently(self):
+        """A full window is split as soon as it returns, not when the scan reaches it"""
+        gate = threading.Event()
+        self.addCleanup(gate.set)
+        refined = threading.Event()
+        second_half = START + timedelta(hours=12)
+
+        def fetch(window_start, window_end):
+            if window_start == START and window_end == second_half:
+                gate.wait(2)                  # first window is slow
+                return []
+            if window_start > second_half:   # refinement of the dense second window
+                refined.set()
+                return [{"id": format_time(window_start), "created_at": format_time(window_start)}]
+            return [{"id": str(n), "created_at": format_time(second_half)} for n in range(3)]
+
+        scan = scan_windows(fetch, START, START + timedelta(hours=24), limit=3, windows=2,
+                            min_window=timedelta(hours=6))
+        consumer = threading.Thread(target=list, args=(scan,))
+        consumer.start()
+        self.assertTrue(refined.wait(2))
+        gate.set()
+        consumer.join(2)
+
+    def test_failed_window(self):
+        """on_error reports a failed window and the scan continues"""
+        def fetch(window_start, window_end):
+            if window_start == START:
+                raise RuntimeError("503")
+            return [{"id": "late", "created_at": format_time(window_end)}]
+
+        errors = []
+        scanned = list(scan_windows(fetch, START, START + timedelta(hours=2), limit=5, windows=2,
+                                    on_error=lambda s, e, error: errors.append((s, str(error)))))
+        self.assertEqual([m["id"] for m in scanned], ["late"])
+        self.assertEqual(errors, [(START, "503")])
+        with self.assertRaises(RuntimeError):
+            list(scan_windows(fetch, START, START + timedelta(hours=2), limit=5, windows=2))
+
+    def test_validation(self):
+        """Empty ranges and missing agents are rejected up front"""
+        with self.assertRaises(ValueError):
+            self.client.temporal_scan("agent_1", START, START)
+        with self.assertRaises(ValueError):
+            self.client.temporal_scan("", START, START + timedelta(days=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+Tests for the local write-through working-memory tier
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recallbricks.autonomous import WorkingMemoryClient
+from recallbricks.working_tier import LocalWorkingMemory, TTLWheel
+
+
+class TestTTLWheel(unittest.TestCase):
+    """Test expiry scheduling"""
+
+    def test_expires_after_deadline(self):
+        """Items expire once their (rounded up) deadline passes"""
+        wheel = TTLWheel(tick=1.0)
+        wheel.advance(100.0)
+        wheel.add("a", 102.5)
+        wheel.add("b", 110.0)
+        self.assertEqual(wheel.advance(102.9), [])
+        self.assertEqual(wheel.advance(103.0), ["a"])
+        wheel.remove("b")
+        self.assertEqual(wheel.advance(500.0), [])
+        self.assertEqual(len(wheel), 0)
+
+    def test_sparse_jump(self):
+        """Long idle gaps do not walk every tick"""
+        wheel = TTLWheel(tick=0.001)
+        wheel.advance(0.0)
+        wheel.add("a", 5.0)
+        self.assertEqual(wheel.advance(10_000.0), ["a"])
+
+
+class TestLocalWorkingMemory(unittest.TestCase):
+    """Test local reads and write-through"""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.retrieve.return_value = {"memories": [
+            {"id": "srv_1", "content": "existing", "memory_type": "context", "priority": 0.6},
+        ]}
+        self.client.store.side_effect = lambda agent_id, content, **kw: {"id": f"srv_{content}"}
+
+    def make(self, **options):
+        options.setdefault("reconcile_interval", None)
+        tier = LocalWorkingMemory(self.client, "agent_1", **options)
+        self.addCleanup(tier.close)
+        return tier
+
+    def test_retrieve_is_local_and_ordered(self):
+        """retrieve() filters and orders by priority without API calls"""
+        tier = self.make()
+        tier.store("low", priority=0.1)
+        tier.store("task", memory_type="task", priority=0.9)
+        tier.store("high", priority=0.8)
+
+        result = tier.retrieve(limit=3)
+        self.assertEqual([m["content"] for m in result["memories"]], ["task", "high", "existing"])
+        self.assertEqual(result["count"], 3)
+        self.assertEqual([m["content"] for m in tier.retrieve(memory_type="task")["memories"]], ["task"])
+        self.assertEqual(len(tier.retrieve(min_priority=0.5)["memories"]), 3)
+        self.assertEqual(self.client.retrieve.call_count, 1)
+
+    def test_writes_go_through_in_order(self):
+        """Stores, updates and deletes reach the API with server IDs"""
+        tier = self.make()
+        stored = tier.store("note", priority=0.4, ttl_seconds=60)
+        self.assertTrue(stored["id"].startswith("local-"))
+        tier.update(stored["id"], priority=0.9)
+        tier.delete(stored["id"])
+        tier.flush(timeout=2)
+
+        self.client.store.assert_called_once_with(
+            "agent_1", "note", memory_type="context", priority=0.4, ttl_seconds=60, metadata=None
+        )
+        self.client.update.assert_called_once_with("srv_note", content=None, priority=0.9, metadata=None)
+        self.client.delete.assert_called_once_with("srv_note")
+        self.assertEqual(len(tier), 1)
+
+    def test_ttl_expiry(self):
+        """Entries disappear when their ttl_seconds elapse"""
+        with patch('recallbricks.working_tier.time.monotonic', return_value=1000.0):
+            tier = self.make()
+            tier.store("short", ttl_seconds=5)
+            self.assertEqual(len(tier), 2)
+        with patch('recallbricks.working_tier.time.monotonic', return_value=1006.0):
+            self.assertEqual([m["content"] for m in tier.retrieve()["memories"]], ["existing"])
+            self.assertEqual(tier.stats()["expired"], 1)
+
+    def test_priority_eviction(self):
+        """Over max_items the lowest-priority entries are dropped locally"""
+        tier = self.make(max_items=2)
+        tier.store("a", priority=0.9)
+        tier.store("b", priority=0.2)
+        self.assertEqual([m["content"] for m in tier.retrieve()["memories"]], ["a", "existing"])
+        self.assertEqual(tier.stats()["evicted"], 1)
+        tier.flush(timeout=2)
+        self.client.delete.assert_not_called()
+
+    def test_reconcile_keeps_ids_and_pending_writes(self):
+        """Reconciling adopts server state without losing caller-visible IDs"""
+        tier = self.make()
+        stored = tier.store("mine")
+        tier.flush(timeout=2)
+        server_state = {"memories": [
+            {"id": "srv_mine", "content": "mine", "memory_type": "context", "priority": 0.7},
+            {"id": "srv_2", "content": "from another process", "priority": 0.3},
+        ]}
+        gate = threading.Event()
+        self.client.retrieve.side_effect = lambda *a, **kw: gate.wait(2) and server_state
+
+        # Stored while the refresh is in flight, so missing from its snapshot
+        future = tier.reconcile()
+        tier.store("pending")
+        gate.set()
+        future.result(timeout=2)
+
+        contents = {m["content"]: m for m in tier.retrieve()["memories"]}
+        self.assertEqual(set(contents), {"mine", "from another process", "pending"})
+        self.assertEqual(contents["mine"]["id"], stored["id"])
+        self.assertEqual(contents["mine"]["priority"], 0.7)
+
+    def test_auto_consolidate(self):
+        """Crossing consolidate_size consolidates once and reconciles"""
+        tier = self.make(consolidate_size=3, consolidate_strategy="recency")
+        tier.store("one")
+        tier.store("two")
+        tier.store("three")
+        tier.flush(timeout=2)
+        self.client.consolidate.assert_called_once_with("agent_1", strategy="recency")
+        self.assertEqual(tier.stats()["consolidations"], 1)
+        self.assertEqual(self.client.retrieve.call_count, 2)
+
+    def test_auto_consolidate_cooldown(self):
+        """Entries the server keeps do not consolidate again on every read"""
+        with patch('recallbricks.working_tier.time.monotonic', return_value=0.0):
+            tier = self.make(consolidate_age_seconds=10, consolidate_cooldown=60)
+        with patch('recallbricks.working_tier.time.monotonic', return_value=20.0):
+            for _ in range(20):
+                tier.retrieve()
+                tier.flush(timeout=2)
+        self.assertEqual(self.client.consolidate.call_count, 1)
+        self.assertEqual(self.client.retrieve.call_count, 2)
+
+        with patch('recallbricks.working_tier.time.monotonic', return_value=81.0):
+            tier.retrieve()
+            tier.flush(timeout=2)
+        self.assertEqual(self.client.consolidate.call_count, 2)
+
+    def test_reconcile_interval(self):
+        """Reads past the interval schedule a background refresh"""
+        with patch('recallbricks.working_tier.time.monotonic', return_value=0.0):
+            tier = self.make(reconcile_interval=30)
+        with patch('recallbricks.working_tier.time.monotonic', return_value=10.0):
+            tier.retrieve()
+        tier.flush(timeout=2)
+        self.assertEqual(self.client.retrieve.call_count, 1)
+        with patch('recallbricks.working_tier.time.monotonic', return_value=31.0):
+            tier.retrieve()
+            tier.flush(timeout=2)
+        self.assertEqual(self.client.retrieve.call_count, 2)
+
+    def test_write_errors_reported(self):
+        """Failed background writes are counted and passed to on_error"""
+        errors = []
+        self.client.store.side_effect = RuntimeError("down")
+        tier = self.make(on_error=errors.append)
+        tier.store("lost")
+        tier.flush(timeout=2)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(tier.stats()["write_errors"], 1)
+
+    def test_client_local(self):
+        """WorkingMemoryClient.local() opens a tier over the client"""
+        client = WorkingMemoryClient(api_key="test-key")
+        with patch.object(client, '_request', return_value={"memories": []}) as mock_request:
+            with client.local("agent_1", reconcile_interval=None) as tier:
+                self.assertEqual(tier.retrieve()["count"], 0)
+        mock_request.assert_called_once_with(
+            "GET", "/api/autonomous/working-memory", params={"agent_id": "agent_1", "limit": 1000}
+        )
+        with self.assertRaises(ValueError):
+            client.local("")
+
+
+if __name__ == '__main__':
+    unittest.main()